@@ -6,7 +6,6 @@ import json
 import asyncio
 import logging
 from datetime import datetime
-import os
 import httpx
 
 logger = logging.getLogger(__name__)
@@ -31,12 +30,15 @@ from app.models.message import (
     MessageComplete,
     SendMessageRequest,
 )
+from app.api.routes.tasks import get_redis_client
+from app.utils.message_persistence import StreamedMessageWriter
+from app.utils.pagination import TOTAL_MODE_PATTERN, apply_cursors, count_total, keyset_sort, next_cursor
+from app.utils.http_clients import (
+    AGENT_CONTROL_TIMEOUT, AGENT_SERVICE, AGENT_SERVICE_URL, AGENT_STREAM_TIMEOUT, get_http_client
+)
 
 router = APIRouter()
 
-# Agent service URL
-AGENT_SERVICE_URL = os.getenv("AGENT_SERVICE_URL", "http://localhost:8083")
-
 
 # ============================================================================
 # Conversation Endpoints
@@ -90,8 +92,15 @@ async def list_conversations(
     skip: int = Query(0, ge=0),
     status: Optional[str] = Query(None, description="Filter by status (active, archived)"),
     sort_order: str = Query("desc", pattern="^(asc|desc)$"),
+    before: Optional[str] = Query(None, description="Cursor; only return conversations created before it"),
+    after: Optional[str] = Query(None, description="Cursor; only return conversations created after it"),
+    total_mode: str = Query("exact", pattern=TOTAL_MODE_PATTERN, description="How to compute total (exact, approximate, none)"),
 ):
-    """List conversations for a project"""
+    """
+    List conversations for a project
+
+    Pass next_cursor as `before` (desc) or `after` (asc) to get the next page.
+    """
     # Validate project exists
     project = await Project.get(project_id)
     if not project:
@@ -102,11 +111,11 @@ async def list_conversations(
     if status:
         query["status"] = status
 
-    # Execute query with pagination
+    # Execute query with keyset pagination
     sort_direction = 1 if sort_order.lower() == "asc" else -1
     conversations = await (
-        Conversation.find(query)
-        .sort([("created_at", sort_direction)])
+        Conversation.find(apply_cursors(query, before=before, after=after))
+        .sort(keyset_sort(sort_direction))
         .skip(skip)
         .limit(limit + 1)
         .to_list()
@@ -118,7 +127,7 @@ async def list_conversations(
         conversations = conversations[:limit]
 
     # Get total count
-    total = await Conversation.find(query).count()
+    total = await count_total(Conversation, query, total_mode)
 
     return ConversationList(
         conversations=[
@@ -137,6 +146,7 @@ async def list_conversations(
         ],
         has_more=has_more,
         total=total,
+        next_cursor=next_cursor(conversations, has_more),
     )
 
 
@@ -336,8 +346,15 @@ async def list_messages(
     limit: int = Query(50, ge=1, le=200),
     skip: int = Query(0, ge=0),
     sort_order: str = Query("asc", pattern="^(asc|desc)$"),
+    before: Optional[str] = Query(None, description="Cursor; only return messages created before it"),
+    after: Optional[str] = Query(None, description="Cursor; only return messages created after it"),
+    total_mode: str = Query("exact", pattern=TOTAL_MODE_PATTERN, description="How to compute total (exact, approximate, none)"),
 ):
-    """List messages in a conversation"""
+    """
+    List messages in a conversation
+
+    Pass next_cursor as `after` (asc) or `before` (desc) to get the next page.
+    """
     # Validate conversation exists
     conversation = await Conversation.get(conversation_id)
     if not conversation:
@@ -349,11 +366,12 @@ async def list_messages(
             detail="Conversation does not belong to the specified project"
         )
 
-    # Query messages
+    # Query messages with keyset pagination
+    query = {"conversation_id": conversation_id}
     sort_direction = 1 if sort_order.lower() == "asc" else -1
     messages = await (
-        Message.find({"conversation_id": conversation_id})
-        .sort([("created_at", sort_direction)])
+        Message.find(apply_cursors(query, before=before, after=after))
+        .sort(keyset_sort(sort_direction))
         .skip(skip)
         .limit(limit + 1)
         .to_list()
@@ -364,8 +382,11 @@ async def list_messages(
     if has_more:
         messages = messages[:limit]
 
-    # Get total count
-    total = await Message.find({"conversation_id": conversation_id}).count()
+    # Get total count; the conversation keeps a running message count
+    if total_mode == "approximate":
+        total = conversation.message_count
+    else:
+        total = await count_total(Message, query, total_mode)
 
     return MessageList(
         messages=[
@@ -387,6 +408,7 @@ async def list_messages(
         ],
         has_more=has_more,
         total=total,
+        next_cursor=next_cursor(messages, has_more),
     )
 
 
@@ -501,232 +523,214 @@ async def stream_message(
             })
         }
 
-        # Update message status to processing
-        await message.update({
-            "$set": {
-                "status": MessageStatus.PROCESSING,
-                "updated_at": datetime.utcnow(),
-            }
-        })
-
-        # Track content blocks for fused persistence
-        content_blocks = []
+        # Fused content blocks, persisted incrementally with a Redis write-ahead log
+        writer = StreamedMessageWriter(message_id, await get_redis_client())
         session_id = None
         last_persist_time = None
 
         async def persist_content_blocks():
-            """Persist current content_blocks to database"""
+            """Persist content_blocks changed since the last write"""
             nonlocal last_persist_time
-            await message.update({
-                "$set": {
-                    "content_blocks": content_blocks,
-                    "updated_at": datetime.utcnow(),
-                }
-            })
+            await writer.flush()
             last_persist_time = datetime.utcnow()
 
+        # Update message status to processing
+        await writer.start(
+            status=MessageStatus.PROCESSING.value,
+            updated_at=datetime.utcnow(),
+        )
+
         try:
-            # Call agent-service to process the message
-            async with httpx.AsyncClient(timeout=httpx.Timeout(300.0)) as client:
-                # Build agent config with workspace path
-                # Agent-service will create the workspace at this path on persistent volume
-                working_directory = f"/data/workspaces/{project_id}/{conversation_id}/work_dir"
-
-                agent_config = {
-                    "max_turns": 15,
-                    "working_directory": working_directory,
-                }
-
-                agent_request = {
-                    "content": user_content,
-                    "message_id": message_id,
-                    "project_id": project_id,
-                    "session_id": conversation.session_id,
-                    "agent_config": agent_config,
-                }
-
-                agent_url = f"{AGENT_SERVICE_URL}/conversations/{conversation_id}/messages"
-                logger.debug(f"Calling agent service: {agent_url}")
-
-                async with client.stream(
-                    "POST",
-                    agent_url,
-                    json=agent_request,
-                    headers={"Accept": "text/event-stream"},
-                ) as response:
-                    if response.status_code != 200:
-                        error_text = await response.aread()
-                        raise HTTPException(
-                            status_code=response.status_code,
-                            detail=f"Agent service error: {error_text.decode()}"
-                        )
-
-                    # Parse SSE stream from agent-service
-                    async for line in response.aiter_lines():
-                        if await request.is_disconnected():
-                            break
-
-                        if not line:
-                            continue
+            # Call agent-service to process the message over the shared keep-alive client
+            client = get_http_client(AGENT_SERVICE)
 
-                        # Parse SSE format
-                        if line.startswith("event:"):
-                            event_type = line[6:].strip()
-                        elif line.startswith("data:"):
-                            data_str = line[5:].strip()
-                            try:
-                                data = json.loads(data_str)
-                            except json.JSONDecodeError:
-                                continue
-
-                            # Process different event types
-                            # Build content_blocks for persistence while yielding events individually
-                            if event_type == "message_chunk":
-                                text = data.get("text", "")
-
-                                # Fuse consecutive text blocks for persistence
-                                if content_blocks and content_blocks[-1].get("type") == "text":
-                                    content_blocks[-1]["text"] += text
-                                else:
-                                    content_blocks.append({"type": "text", "text": text})
-
-                                # Persist with 1-second debounce
-                                if last_persist_time is None or (datetime.utcnow() - last_persist_time).total_seconds() >= 1.0:
-                                    await persist_content_blocks()
-
-                                # Forward to client (yield individual event for real-time UI)
-                                yield {
-                                    "event": "message_chunk",
-                                    "data": json.dumps({
-                                        "id": message_id,
-                                        "content_chunk": text,
-                                    })
-                                }
-
-                            elif event_type == "thinking":
-                                # Add thinking block for persistence
-                                content_blocks.append({
-                                    "type": "thinking",
-                                    "thinking": data.get("thinking", ""),
-                                    "signature": data.get("signature", ""),
-                                })
+            # Build agent config with workspace path
+            # Agent-service will create the workspace at this path on persistent volume
+            working_directory = f"/data/workspaces/{project_id}/{conversation_id}/work_dir"
 
-                                # Persist immediately
-                                await persist_content_blocks()
+            agent_config = {
+                "max_turns": 15,
+                "working_directory": working_directory,
+            }
 
-                                # Forward to client
-                                yield {
-                                    "event": "thinking",
-                                    "data": json.dumps(data)
-                                }
-
-                            elif event_type == "tool_use":
-                                # Add tool_use block with output=None (will be fused with tool_result)
-                                content_blocks.append({
-                                    "type": "tool_use",
-                                    "id": data.get("tool_id"),
-                                    "name": data.get("tool_name"),
-                                    "input": data.get("input", {}),
-                                    "output": None,
-                                    "is_error": False,
-                                    "active_description": data.get("active_description"),
-                                })
+            agent_request = {
+                "content": user_content,
+                "message_id": message_id,
+                "project_id": project_id,
+                "session_id": conversation.session_id,
+                "agent_config": agent_config,
+            }
 
-                                # Forward to client (yield separate event for real-time progress)
-                                yield {
-                                    "event": "tool_use",
-                                    "data": json.dumps(data)
-                                }
-
-                            elif event_type == "tool_result":
-                                # FUSE: Find matching tool_use block and update its output
-                                tool_id = data.get("tool_id")
-                                for block in content_blocks:
-                                    if block.get("type") == "tool_use" and block.get("id") == tool_id:
-                                        block["output"] = data.get("output")
-                                        block["is_error"] = data.get("is_error", False)
-                                        break
-
-                                # Persist immediately (tool_use now complete with result)
-                                await persist_content_blocks()
+            agent_url = f"/conversations/{conversation_id}/messages"
+            logger.debug(f"Calling agent service: {AGENT_SERVICE_URL}{agent_url}")
+
+            async with client.stream(
+                "POST",
+                agent_url,
+                json=agent_request,
+                headers={"Accept": "text/event-stream"},
+                timeout=AGENT_STREAM_TIMEOUT,
+            ) as response:
+                if response.status_code != 200:
+                    error_text = await response.aread()
+                    raise HTTPException(
+                        status_code=response.status_code,
+                        detail=f"Agent service error: {error_text.decode()}"
+                    )
+
+                # Parse SSE stream from agent-service
+                async for line in response.aiter_lines():
+                    if await request.is_disconnected():
+                        break
+
+                    if not line:
+                        continue
+
+                    # Parse SSE format
+                    if line.startswith("event:"):
+                        event_type = line[6:].strip()
+                    elif line.startswith("data:"):
+                        data_str = line[5:].strip()
+                        try:
+                            data = json.loads(data_str)
+                        except json.JSONDecodeError:
+                            continue
 
-                                # Forward to client (yield separate event for real-time progress)
-                                yield {
-                                    "event": "tool_result",
-                                    "data": json.dumps(data)
-                                }
-
-                            elif event_type == "result":
-                                session_id = data.get("session_id")
-
-                                # Store result data in metadata
-                                result_metadata = {
-                                    "duration_ms": data.get("duration_ms"),
-                                    "num_turns": data.get("num_turns"),
-                                    "is_error": data.get("is_error"),
-                                    "result": data.get("result"),
-                                }
-
-                                # PERSIST: Save fused content_blocks to database
-                                await message.update({
-                                    "$set": {
-                                        "content_blocks": content_blocks,
-                                        "status": MessageStatus.COMPLETED,
-                                        "metadata": {**message.metadata, **result_metadata},
-                                        "completed_at": datetime.utcnow(),
-                                        "updated_at": datetime.utcnow(),
-                                    }
-                                })
+                        # Process different event types
+                        # Build content_blocks for persistence while yielding events individually
+                        if event_type == "message_chunk":
+                            text = data.get("text", "")
 
-                                # Update conversation session_id
-                                if session_id:
-                                    await conversation.update({
-                                        "$set": {
-                                            "session_id": session_id,
-                                            "last_session_id": conversation.session_id,
-                                            "updated_at": datetime.utcnow(),
-                                        }
-                                    })
-
-                                yield {
-                                    "event": "message_complete",
-                                    "data": json.dumps({
-                                        "id": message_id,
-                                        "session_id": session_id,
-                                        "completed_at": datetime.utcnow().isoformat(),
-                                    })
-                                }
+                            # Fuse consecutive text blocks for persistence
+                            await writer.record({"op": "text", "text": text})
 
-                            elif event_type == "error":
-                                # Mark message as failed
-                                await message.update({
+                            # Persist with 1-second debounce
+                            if last_persist_time is None or (datetime.utcnow() - last_persist_time).total_seconds() >= 1.0:
+                                await persist_content_blocks()
+
+                            # Forward to client (yield individual event for real-time UI)
+                            yield {
+                                "event": "message_chunk",
+                                "data": json.dumps({
+                                    "id": message_id,
+                                    "content_chunk": text,
+                                })
+                            }
+
+                        elif event_type == "thinking":
+                            # Add thinking block for persistence
+                            await writer.record({"op": "block", "block": {
+                                "type": "thinking",
+                                "thinking": data.get("thinking", ""),
+                                "signature": data.get("signature", ""),
+                            }})
+
+                            # Persist immediately
+                            await persist_content_blocks()
+
+                            # Forward to client
+                            yield {
+                                "event": "thinking",
+                                "data": json.dumps(data)
+                            }
+
+                        elif event_type == "tool_use":
+                            # Add tool_use block with output=None (will be fused with tool_result)
+                            await writer.record({"op": "block", "block": {
+                                "type": "tool_use",
+                                "id": data.get("tool_id"),
+                                "name": data.get("tool_name"),
+                                "input": data.get("input", {}),
+                                "output": None,
+                                "is_error": False,
+                                "active_description": data.get("active_description"),
+                            }})
+
+                            # Forward to client (yield separate event for real-time progress)
+                            yield {
+                                "event": "tool_use",
+                                "data": json.dumps(data)
+                            }
+
+                        elif event_type == "tool_result":
+                            # FUSE: Find matching tool_use block and update its output
+                            await writer.record({
+                                "op": "tool_result",
+                                "tool_id": data.get("tool_id"),
+                                "output": data.get("output"),
+                                "is_error": data.get("is_error", False),
+                            })
+
+                            # Persist immediately (tool_use now complete with result)
+                            await persist_content_blocks()
+
+                            # Forward to client (yield separate event for real-time progress)
+                            yield {
+                                "event": "tool_result",
+                                "data": json.dumps(data)
+                            }
+
+                        elif event_type == "result":
+                            session_id = data.get("session_id")
+
+                            # Store result data in metadata
+                            result_metadata = {
+                                "duration_ms": data.get("duration_ms"),
+                                "num_turns": data.get("num_turns"),
+                                "is_error": data.get("is_error"),
+                                "result": data.get("result"),
+                            }
+
+                            # PERSIST: Final compacting write of the fused content_blocks
+                            await writer.finish(
+                                status=MessageStatus.COMPLETED.value,
+                                metadata={**message.metadata, **result_metadata},
+                                completed_at=datetime.utcnow(),
+                            )
+
+                            # Update conversation session_id
+                            if session_id:
+                                await conversation.update({
                                     "$set": {
-                                        "status": MessageStatus.FAILED,
-                                        "metadata": {
-                                            **message.metadata,
-                                            "error": data.get("error"),
-                                        },
+                                        "session_id": session_id,
+                                        "last_session_id": conversation.session_id,
                                         "updated_at": datetime.utcnow(),
                                     }
                                 })
 
-                                yield {
-                                    "event": "error",
-                                    "data": json.dumps(data)
-                                }
+                            yield {
+                                "event": "message_complete",
+                                "data": json.dumps({
+                                    "id": message_id,
+                                    "session_id": session_id,
+                                    "completed_at": datetime.utcnow().isoformat(),
+                                })
+                            }
+
+                        elif event_type == "error":
+                            # Mark message as failed, keeping the content received so far
+                            await writer.finish(
+                                status=MessageStatus.FAILED.value,
+                                metadata={
+                                    **message.metadata,
+                                    "error": data.get("error"),
+                                },
+                            )
+
+                            yield {
+                                "event": "error",
+                                "data": json.dumps(data)
+                            }
 
         except httpx.RequestError as e:
             # Handle connection errors to agent-service
-            await message.update({
-                "$set": {
-                    "status": MessageStatus.FAILED,
-                    "metadata": {
-                        **message.metadata,
-                        "error": f"Agent service connection error: {str(e)}",
-                    },
-                    "updated_at": datetime.utcnow(),
-                }
-            })
+            await writer.finish(
+                status=MessageStatus.FAILED.value,
+                metadata={
+                    **message.metadata,
+                    "error": f"Agent service connection error: {str(e)}",
+                },
+            )
 
             yield {
                 "event": "error",
@@ -739,16 +743,13 @@ async def stream_message(
 
         except Exception as e:
             # Handle unexpected errors
-            await message.update({
-                "$set": {
-                    "status": MessageStatus.FAILED,
-                    "metadata": {
-                        **message.metadata,
-                        "error": str(e),
-                    },
-                    "updated_at": datetime.utcnow(),
-                }
-            })
+            await writer.finish(
+                status=MessageStatus.FAILED.value,
+                metadata={
+                    **message.metadata,
+                    "error": str(e),
+                },
+            )
 
             yield {
                 "event": "error",
@@ -759,6 +760,10 @@ async def stream_message(
                 })
             }
 
+        finally:
+            # Client disconnected or the stream ended without a result: keep what was received
+            await writer.close()
+
     return EventSourceResponse(event_generator())
 
 
@@ -799,11 +804,11 @@ async def cancel_message(
 
     # Try to interrupt at agent-service
     try:
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
-            await client.post(
-                f"{AGENT_SERVICE_URL}/conversations/{conversation_id}/interrupt",
-                json={"message_id": message_id}
-            )
+        await get_http_client(AGENT_SERVICE).post(
+            f"/conversations/{conversation_id}/interrupt",
+            json={"message_id": message_id},
+            timeout=AGENT_CONTROL_TIMEOUT,
+        )
     except Exception as e:
         logger.warning(f"Failed to interrupt agent service for message {message_id}: {e}")
 
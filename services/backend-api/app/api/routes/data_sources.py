@@ -12,8 +12,9 @@ from pathlib import Path, PurePosixPath
 from botocore.exceptions import ClientError
 import logging
 import time
-from app.utils.mcp_tools import fetch_tools_from_mcp_server
+from app.utils.mcp_tools import fetch_tools_from_mcp_server, invalidate_mcp_server_caches
 from app.utils.s3_utils import get_s3_client, delete_folder_upload as s3_delete_folder_upload
+from app.utils.folder_files import delete_folder_files
 
 from app.models.data_source import (
     DataSource, DataSourceCreate, DataSourceUpdate, DataSourceResponse, DataSourceList, 
@@ -40,6 +41,12 @@ DB_MCP_SERVER_URL = os.getenv("DB_MCP_SERVER_URL", "")
 TOOLS_MCP_SERVER_URL = os.getenv("TOOLS_MCP_SERVER_URL", "")
 GITHUB_MCP_SERVER_URL = os.getenv("GITHUB_MCP_SERVER_URL", "https://api.githubcopilot.com/mcp/")
 
+
+async def invalidate_data_source_caches(project_id: str) -> None:
+    """Invalidate the data source caches of the internal MCP servers for a project"""
+    await invalidate_mcp_server_caches(project_id, [DB_MCP_SERVER_URL, TOOLS_MCP_SERVER_URL])
+
+
 # fetch_tools_from_mcp_server is now imported from app.utils.mcp_tools
 async def fetch_data_source_tools(project_id: str) -> List[ToolResponse]:
     """Fetch tools available for project's data sources from internal MCP servers
@@ -1276,6 +1283,7 @@ async def create_data_source(project_id: str, data_source: DataSourceCreate):
     
     # Save to database
     await new_data_source.insert()
+    await invalidate_data_source_caches(project_id)
     
     # Format the response
     return DataSourceResponse(
@@ -1460,6 +1468,7 @@ async def update_data_source(project_id: str, data_source_id: str, data_source_u
         
         # Refresh the data source with latest data
         data_source = await DataSource.get(data_source_id)
+        await invalidate_data_source_caches(project_id)
     
     return DataSourceResponse(
         id=data_source.id,
@@ -1942,7 +1951,9 @@ async def delete_data_source(project_id: str, data_source_id: str, delete_s3_obj
                 await s3_delete_folder_upload(project_id, folder_upload_id)
                 logger.info(f"Deleted S3 files for folder upload {folder_upload_id}")
 
-                # Delete the FolderUpload document
+                # Delete the file entries and the FolderUpload document
+                deleted_files = await delete_folder_files(folder_upload_id)
+                logger.info(f"Deleted {deleted_files} file entries of folder upload {folder_upload_id}")
                 folder_upload = await FolderUpload.find_one({"_id": folder_upload_id})
                 if folder_upload:
                     await folder_upload.delete()
@@ -1970,4 +1981,5 @@ async def delete_data_source(project_id: str, data_source_id: str, delete_s3_obj
             # If not forcing deletion, re-raise the exception
             raise
     
+    await invalidate_data_source_caches(project_id)
     return result
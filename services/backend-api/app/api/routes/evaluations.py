@@ -536,6 +536,7 @@ async def run_evaluation(
         completed_test_cases=0,
         failed_test_cases=0,
         overall_score=None,
+        max_concurrency=run_data.max_concurrency,
         started_at=datetime.utcnow()
     )
     
@@ -573,6 +574,8 @@ async def run_evaluation(
         completed_test_cases=evaluation_run.completed_test_cases,
         failed_test_cases=evaluation_run.failed_test_cases,
         overall_score=evaluation_run.overall_score,
+        max_concurrency=evaluation_run.max_concurrency,
+        metrics=evaluation_run.metrics,
         error_message=evaluation_run.error_message,
         started_at=evaluation_run.started_at.isoformat() if evaluation_run.started_at else None,
         completed_at=evaluation_run.completed_at.isoformat() if evaluation_run.completed_at else None,
@@ -631,6 +634,8 @@ async def get_evaluation_run(
         completed_test_cases=evaluation_run.completed_test_cases,
         failed_test_cases=evaluation_run.failed_test_cases,
         overall_score=evaluation_run.overall_score,
+        max_concurrency=evaluation_run.max_concurrency,
+        metrics=evaluation_run.metrics,
         error_message=evaluation_run.error_message,
         started_at=evaluation_run.started_at.isoformat() if evaluation_run.started_at else None,
         completed_at=evaluation_run.completed_at.isoformat() if evaluation_run.completed_at else None,
@@ -700,6 +705,8 @@ async def list_evaluation_runs(
             completed_test_cases=run.completed_test_cases,
             failed_test_cases=run.failed_test_cases,
             overall_score=run.overall_score,
+            max_concurrency=run.max_concurrency,
+            metrics=run.metrics,
             error_message=run.error_message,
             started_at=run.started_at.isoformat() if run.started_at else None,
             completed_at=run.completed_at.isoformat() if run.completed_at else None,
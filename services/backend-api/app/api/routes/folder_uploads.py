@@ -5,9 +5,11 @@ Provides endpoints for uploading folder hierarchies as data sources.
 Supports init/upload/complete workflow for large folder uploads.
 """
 from fastapi import APIRouter, HTTPException, status, File, UploadFile, Form, Query
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import os
+import re
 import uuid
+import asyncio
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
@@ -16,7 +18,7 @@ from botocore.exceptions import ClientError
 from app.models.folder_upload import (
     FolderUpload,
     FolderUploadStatus,
-    FolderFileEntry,
+    FolderFile,
     FolderUploadInitRequest,
     FolderUploadInitResponse,
     FolderFileUploadRequest,
@@ -36,6 +38,8 @@ from app.models.project import Project
 from app.utils.file_validation import (
     validate_folder_structure,
     validate_file,
+    validate_file_extension,
+    validate_file_size,
     validate_relative_path,
     get_content_type,
     is_preview_supported,
@@ -47,6 +51,8 @@ from app.utils.file_validation import (
     MAX_FILES_PER_FOLDER,
 )
 from app.utils.s3_utils import (
+    abort_presigned_multipart_upload,
+    create_presigned_folder_file_upload,
     upload_folder_file,
     upload_folder_manifest,
     generate_presigned_download_url,
@@ -54,6 +60,18 @@ from app.utils.s3_utils import (
     delete_folder_upload as s3_delete_folder_upload,
     get_folder_upload_prefix,
     get_folder_file_s3_key,
+    PRESIGNED_URL_EXPIRATION,
+)
+from app.utils.folder_files import (
+    add_folder_files,
+    decode_path_cursor,
+    encode_path_cursor,
+    list_subdirectories,
+    migrate_embedded_files,
+    path_query,
+    path_totals,
+    remove_folder_file,
+    verify_direct_upload,
 )
 
 # Configure logging
@@ -61,13 +79,16 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["folder-uploads"])
 
+# Files of one batch streamed to S3 at the same time
+FOLDER_UPLOAD_CONCURRENCY = int(os.getenv("FOLDER_UPLOAD_CONCURRENCY", "8"))
+
 
-def build_file_tree(files: List[FolderFileEntry]) -> Dict[str, Any]:
+def build_file_tree(files: List[FolderFile]) -> Dict[str, Any]:
     """
     Build a tree structure from a list of files for the file browser UI.
 
     Args:
-        files: List of FolderFileEntry objects
+        files: List of FolderFile objects
 
     Returns:
         Tree structure dict with nested directories and files
@@ -104,6 +125,69 @@ def build_file_tree(files: List[FolderFileEntry]) -> Dict[str, Any]:
     return tree
 
 
+def parse_file_manifest(file_manifest: str, category: str) -> List[Dict[str, Any]]:
+    """
+    Parse and validate the file manifest of a direct upload.
+
+    Args:
+        file_manifest: JSON array of {relative_path, file_size, checksum}
+        category: Category (document, code, data) for extension validation
+
+    Returns:
+        Manifest entries with normalized relative paths
+    """
+    import json
+
+    try:
+        entries = json.loads(file_manifest)
+        if not isinstance(entries, list) or not all(isinstance(entry, dict) for entry in entries):
+            raise ValueError("file_manifest must be a JSON array of objects")
+        for entry in entries:
+            entry["relative_path"] = str(entry.get("relative_path", "")).strip("/")
+            entry["file_size"] = int(entry.get("file_size", 0))
+    except (json.JSONDecodeError, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid file_manifest JSON format",
+        )
+
+    structure_result = validate_folder_structure(entries)
+    if not structure_result.valid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": structure_result.error, **structure_result.details}
+            if structure_result.details else structure_result.error,
+        )
+
+    seen_paths = set()
+    for entry in entries:
+        relative_path = entry["relative_path"]
+        if relative_path in seen_paths:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Duplicate path in file_manifest: {relative_path}",
+            )
+        seen_paths.add(relative_path)
+
+        file_result = validate_file_extension(os.path.basename(relative_path), category)
+        if not file_result.valid:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{relative_path}: {file_result.error}",
+            )
+
+        checksum = entry.get("checksum")
+        if checksum is not None:
+            if not isinstance(checksum, str) or not re.fullmatch(r"[0-9a-fA-F]{64}", checksum):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"{relative_path}: checksum must be a hex SHA-256 digest",
+                )
+            entry["checksum"] = checksum.lower()
+
+    return entries
+
+
 @router.post(
     "/projects/{project_id}/data-sources/folder-upload/init",
     response_model=FolderUploadInitResponse,
@@ -118,6 +202,7 @@ async def init_folder_upload(
     total_size: int = Form(..., ge=1, le=MAX_FOLDER_SIZE),
     max_depth: int = Form(..., ge=0, le=MAX_FOLDER_DEPTH),
     description: Optional[str] = Form(default=None),
+    file_manifest: Optional[str] = Form(default=None),  # JSON array of files
 ):
     """
     Initialize a folder upload session.
@@ -125,6 +210,11 @@ async def init_folder_upload(
     Creates a FolderUpload document and returns an upload_id for subsequent
     file upload requests. Validates size and depth limits.
 
+    With a file_manifest the upload is direct: the response carries a presigned
+    S3 upload (a PUT URL, or multipart part URLs for large files) for every
+    file, the client uploads straight to S3 and then calls complete, which
+    verifies the stored files. File bytes never pass through the API.
+
     Args:
         project_id: The project ID
         name: User-friendly name for the data source
@@ -134,9 +224,12 @@ async def init_folder_upload(
         total_size: Expected total size in bytes
         max_depth: Maximum directory depth
         description: Optional description
+        file_manifest: Optional JSON array of {relative_path, file_size, checksum}
+            (checksum: optional hex SHA-256) for a direct upload
 
     Returns:
-        FolderUploadInitResponse with upload_id and s3_prefix
+        FolderUploadInitResponse with upload_id and s3_prefix, plus the
+        presigned uploads for a direct upload
     """
     # Validate project exists
     project = await Project.find_one({"_id": project_id})
@@ -173,12 +266,38 @@ async def init_folder_upload(
             detail=f"Folder contains more than {MAX_FILES_PER_FOLDER} files",
         )
 
+    manifest = parse_file_manifest(file_manifest, category) if file_manifest else None
+
     # Create upload ID
     upload_id = str(uuid.uuid4())
 
     # Generate S3 prefix
     s3_prefix = get_folder_upload_prefix(project_id, upload_id)
 
+    # Presign every file of a direct upload; creating multipart uploads hits S3
+    presigned_uploads = None
+    if manifest:
+        presigned_uploads = await asyncio.gather(*(
+            create_presigned_folder_file_upload(
+                project_id=project_id,
+                upload_id=upload_id,
+                relative_path=entry["relative_path"],
+                file_size=entry["file_size"],
+                content_type=get_content_type(os.path.basename(entry["relative_path"])),
+                checksum=entry.get("checksum"),
+            )
+            for entry in manifest
+        ), return_exceptions=True)
+        errors = [result for result in presigned_uploads if isinstance(result, BaseException)]
+        if errors:
+            # Nothing refers to the multipart uploads already created, so they would linger in S3
+            await asyncio.gather(*(
+                abort_presigned_multipart_upload(result["s3_key"], result["s3_upload_id"])
+                for result in presigned_uploads
+                if not isinstance(result, BaseException) and result["method"] == "multipart"
+            ))
+            raise errors[0]
+
     # Create FolderUpload document
     folder_upload = FolderUpload(
         id=upload_id,
@@ -186,19 +305,39 @@ async def init_folder_upload(
         name=name,
         root_folder_name=root_folder_name,
         category=category,
-        total_files=total_files,
-        total_size=total_size,
-        max_depth=max_depth,
+        expected_files=len(manifest) if manifest else total_files,
+        expected_size=sum(entry["file_size"] for entry in manifest) if manifest else total_size,
         status=FolderUploadStatus.UPLOADING,
         s3_prefix=s3_prefix,
-        files=[],
+        direct_upload=manifest is not None,
     )
 
     await folder_upload.insert()
 
+    # Direct uploads record their files now; totals are counted at completion
+    if manifest:
+        await FolderFile.insert_many([
+            FolderFile(
+                upload_id=upload_id,
+                relative_path=entry["relative_path"],
+                filename=os.path.basename(entry["relative_path"]),
+                file_extension=Path(entry["relative_path"]).suffix.lower(),
+                file_size=entry["file_size"],
+                content_type=get_content_type(os.path.basename(entry["relative_path"])),
+                s3_key=presigned["s3_key"],
+                s3_url=presigned["s3_url"],
+                depth=calculate_depth(entry["relative_path"]),
+                parent_path=get_parent_path(entry["relative_path"]),
+                # Only single PUTs have their checksum checked by S3
+                checksum=entry.get("checksum") if presigned["method"] == "put" else None,
+                multipart_upload_id=presigned.get("s3_upload_id"),
+            )
+            for entry, presigned in zip(manifest, presigned_uploads)
+        ])
+
     logger.info(
-        f"Initialized folder upload {upload_id} for project {project_id}: "
-        f"{total_files} files, {total_size} bytes"
+        f"Initialized {'direct ' if manifest else ''}folder upload {upload_id} for project {project_id}: "
+        f"{folder_upload.expected_files} files, {folder_upload.expected_size} bytes"
     )
 
     return FolderUploadInitResponse(
@@ -206,7 +345,16 @@ async def init_folder_upload(
         project_id=project_id,
         s3_prefix=s3_prefix,
         status="uploading",
-        message=f"Folder upload initialized. Upload your files to complete.",
+        message=(
+            "Folder upload initialized. Upload each file to its presigned URL, then complete."
+            if manifest else
+            "Folder upload initialized. Upload your files to complete."
+        ),
+        files=[
+            {"relative_path": entry["relative_path"], **presigned}
+            for entry, presigned in zip(manifest, presigned_uploads)
+        ] if manifest else None,
+        expires_in=PRESIGNED_URL_EXPIRATION if manifest else None,
     )
 
 
@@ -294,61 +442,56 @@ async def upload_folder_files(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Folder upload is not in uploading state (current: {folder_upload.status})",
         )
+    if folder_upload.direct_upload:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Files of a direct folder upload are uploaded to their presigned URLs",
+        )
+    await migrate_embedded_files(folder_upload)
 
-    results = []
-    files_uploaded = 0
-    files_failed = 0
-    total_size_uploaded = 0
-    new_file_entries = []
+    semaphore = asyncio.Semaphore(FOLDER_UPLOAD_CONCURRENCY)
 
-    for i, (file, relative_path) in enumerate(zip(files, paths)):
+    async def upload_one(file: UploadFile, relative_path: str) -> Tuple[Dict[str, Any], Optional[FolderFile]]:
         try:
             # Validate relative path
             path_result = validate_relative_path(relative_path)
             if not path_result.valid:
-                results.append(
-                    {
-                        "path": relative_path,
-                        "status": "error",
-                        "error": path_result.error,
-                    }
-                )
-                files_failed += 1
-                continue
-
-            # Read file content
-            file_data = await file.read()
-            file_size = len(file_data)
+                return {"path": relative_path, "status": "error", "error": path_result.error}, None
 
-            # Validate file
+            # Validate file; the upload is already spooled, so its size is usually known up front
             filename = os.path.basename(relative_path)
-            file_result = validate_file(filename, file_size, folder_upload.category)
+            if file.size is not None:
+                file_result = validate_file(filename, file.size, folder_upload.category)
+            else:
+                file_result = validate_file_extension(filename, folder_upload.category)
             if not file_result.valid:
-                results.append(
-                    {
-                        "path": relative_path,
-                        "status": "error",
-                        "error": file_result.error,
-                    }
-                )
-                files_failed += 1
-                continue
+                return {"path": relative_path, "status": "error", "error": file_result.error}, None
 
             # Determine content type
             content_type = get_content_type(filename)
 
-            # Upload to S3
-            s3_result = await upload_folder_file(
-                file_data=file_data,
-                project_id=project_id,
-                upload_id=upload_id,
-                relative_path=relative_path,
-                content_type=content_type,
-            )
+            # Stream to S3
+            async with semaphore:
+                s3_result = await upload_folder_file(
+                    file=file,
+                    project_id=project_id,
+                    upload_id=upload_id,
+                    relative_path=relative_path,
+                    content_type=content_type,
+                    max_size=MAX_FILE_SIZE,
+                )
+            file_size = s3_result["file_size"]
+
+            if file.size is None:
+                file_result = validate_file_size(file_size)
+                if not file_result.valid:
+                    await s3_delete_folder_file(project_id, upload_id, relative_path)
+                    return {"path": relative_path, "status": "error", "error": file_result.error}, None
 
             # Create file entry
-            file_entry = FolderFileEntry(
+            file_entry = FolderFile(
                 id=str(uuid.uuid4()),
+                upload_id=upload_id,
                 relative_path=relative_path,
                 filename=filename,
                 file_extension=Path(filename).suffix.lower(),
@@ -361,37 +504,39 @@ async def upload_folder_files(
                 checksum=s3_result.get("checksum"),
             )
 
-            new_file_entries.append(file_entry)
-            files_uploaded += 1
-            total_size_uploaded += file_size
-
-            results.append(
-                {
-                    "path": relative_path,
-                    "status": "success",
-                    "file_id": file_entry.id,
-                    "size": file_size,
-                }
-            )
+            return {
+                "path": relative_path,
+                "status": "success",
+                "file_id": file_entry.id,
+                "size": file_size,
+            }, file_entry
 
+        except ValueError as e:
+            return {"path": relative_path, "status": "error", "error": str(e)}, None
         except ClientError as e:
             logger.error(f"S3 error uploading file {relative_path}: {str(e)}")
-            results.append(
-                {"path": relative_path, "status": "error", "error": "Failed to upload file to storage"}
-            )
-            files_failed += 1
+            return {"path": relative_path, "status": "error", "error": "Failed to upload file to storage"}, None
         except Exception as e:
             logger.error(f"Error uploading file {relative_path}: {str(e)}", exc_info=True)
-            results.append(
-                {"path": relative_path, "status": "error", "error": "Internal server error during upload"}
-            )
-            files_failed += 1
+            return {"path": relative_path, "status": "error", "error": "Internal server error during upload"}, None
 
-    # Update folder upload with new files
-    if new_file_entries:
-        folder_upload.files.extend(new_file_entries)
-        folder_upload.updated_at = datetime.now(timezone.utc)
-        await folder_upload.save()
+    # Upload files concurrently; results keep the request order
+    outcomes = await asyncio.gather(
+        *(upload_one(file, relative_path) for file, relative_path in zip(files, paths))
+    )
+
+    results = [result for result, _ in outcomes]
+    new_file_entries = [entry for _, entry in outcomes if entry is not None]
+    files_uploaded = len(new_file_entries)
+    files_failed = len(results) - files_uploaded
+    total_size_uploaded = sum(entry.file_size for entry in new_file_entries)
+
+    # Store the file entries and bump the upload's totals
+    await add_folder_files(folder_upload, new_file_entries)
+    # Replacing an existing path keeps that entry's ID
+    for result, entry in outcomes:
+        if entry is not None:
+            result["file_id"] = entry.id
 
     logger.info(
         f"Uploaded {files_uploaded} files to folder upload {upload_id}, "
@@ -446,28 +591,70 @@ async def complete_folder_upload(
             detail=f"Folder upload is not in uploading state (current: {folder_upload.status})",
         )
 
-    if not folder_upload.files:
+    await migrate_embedded_files(folder_upload)
+
+    if not await FolderFile.find_one({"upload_id": upload_id}):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No files were uploaded. Upload files before completing.",
         )
 
-    # Update folder upload status
-    folder_upload.status = FolderUploadStatus.PROCESSING
-    await folder_upload.save()
+    # Claim the upload; a concurrent complete request sees it as processing
+    claimed = await FolderUpload.get_motor_collection().update_one(
+        {"_id": upload_id, "status": FolderUploadStatus.UPLOADING.value},
+        {"$set": {"status": FolderUploadStatus.PROCESSING.value}},
+    )
+    if not claimed.modified_count:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Folder upload is not in uploading state",
+        )
 
-    try:
-        # Calculate actual totals
-        actual_total_files = len(folder_upload.files)
-        actual_total_size = sum(f.file_size for f in folder_upload.files)
-        actual_max_depth = max(f.depth for f in folder_upload.files) if folder_upload.files else 0
+    # Direct uploads: check what the client stored in S3; it may retry after fixing files
+    if folder_upload.direct_upload:
+        try:
+            problems = await verify_direct_upload(folder_upload)
+        except Exception as e:
+            logger.error(f"Error verifying direct folder upload {upload_id}: {str(e)}")
+            problems = None
+        if problems != []:
+            await FolderUpload.get_motor_collection().update_one(
+                {"_id": upload_id},
+                {"$set": {"status": FolderUploadStatus.UPLOADING.value}},
+            )
+        if problems is None:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to verify uploaded files. Please try again.",
+            )
+        if problems:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "error": f"{len(problems)} file(s) failed verification",
+                    "invalid_files": problems,
+                },
+            )
 
-        # Update folder upload with actual values
-        folder_upload.total_files = actual_total_files
-        folder_upload.total_size = actual_total_size
-        folder_upload.max_depth = actual_max_depth
+    try:
+        # Build the manifest from the file entries in path order
+        manifest_files = []
+        actual_total_size = 0
+        actual_max_depth = 0
+        async for f in FolderFile.find({"upload_id": upload_id}).sort("relative_path"):
+            manifest_files.append({
+                "id": f.id,
+                "relative_path": f.relative_path,
+                "filename": f.filename,
+                "s3_key": f.s3_key,
+                "size": f.file_size,
+                "content_type": f.content_type,
+                "checksum": f.checksum,
+            })
+            actual_total_size += f.file_size
+            actual_max_depth = max(actual_max_depth, f.depth)
+        actual_total_files = len(manifest_files)
 
-        # Create manifest
         manifest_data = {
             "version": "1.0",
             "upload_id": upload_id,
@@ -478,18 +665,7 @@ async def complete_folder_upload(
             "total_files": actual_total_files,
             "total_size": actual_total_size,
             "max_depth": actual_max_depth,
-            "files": [
-                {
-                    "id": f.id,
-                    "relative_path": f.relative_path,
-                    "filename": f.filename,
-                    "s3_key": f.s3_key,
-                    "size": f.file_size,
-                    "content_type": f.content_type,
-                    "checksum": f.checksum,
-                }
-                for f in folder_upload.files
-            ],
+            "files": manifest_files,
         }
 
         # Upload manifest to S3
@@ -517,11 +693,18 @@ async def complete_folder_upload(
 
         await data_source.insert()
 
-        # Update folder upload with data source ID and status
-        folder_upload.data_source_id = data_source_id
-        folder_upload.status = FolderUploadStatus.READY
-        folder_upload.updated_at = datetime.now(timezone.utc)
-        await folder_upload.save()
+        # Update folder upload with data source ID, status and the recounted totals
+        await FolderUpload.get_motor_collection().update_one(
+            {"_id": upload_id},
+            {"$set": {
+                "data_source_id": data_source_id,
+                "status": FolderUploadStatus.READY.value,
+                "total_files": actual_total_files,
+                "total_size": actual_total_size,
+                "max_depth": actual_max_depth,
+                "updated_at": datetime.now(timezone.utc),
+            }}
+        )
 
         logger.info(
             f"Completed folder upload {upload_id} -> data source {data_source_id}: "
@@ -539,9 +722,14 @@ async def complete_folder_upload(
 
     except Exception as e:
         # Mark as error
-        folder_upload.status = FolderUploadStatus.ERROR
-        folder_upload.error_message = "Upload completion failed. Please try again or contact support."
-        await folder_upload.save()
+        await FolderUpload.get_motor_collection().update_one(
+            {"_id": upload_id},
+            {"$set": {
+                "status": FolderUploadStatus.ERROR.value,
+                "error_message": "Upload completion failed. Please try again or contact support.",
+                "updated_at": datetime.now(timezone.utc),
+            }}
+        )
 
         logger.error(f"Error completing folder upload {upload_id}: {str(e)}")
         raise HTTPException(
@@ -559,17 +747,25 @@ async def list_folder_files(
     data_source_id: str,
     path: Optional[str] = Query(default=None, description="Filter by directory path"),
     include_tree: bool = Query(default=True, description="Include tree structure"),
+    recursive: bool = Query(default=True, description="Include files in subdirectories"),
+    limit: int = Query(default=MAX_FILES_PER_FOLDER, ge=1, le=MAX_FILES_PER_FOLDER, description="Page size"),
+    after: Optional[str] = Query(default=None, description="Cursor from a previous page"),
 ):
     """
     List files in a folder upload data source.
 
-    Returns files with optional tree structure for the file browser UI.
+    Returns a page of files in path order with optional tree structure for the
+    file browser UI. Totals cover every file under the requested path.
 
     Args:
         project_id: The project ID
         data_source_id: The data source ID
         path: Optional path prefix to filter files
         include_tree: Whether to include tree structure
+        recursive: Whether to include files below subdirectories of path;
+            otherwise only direct children are listed, plus their subdirectory names
+        limit: Maximum number of files to return
+        after: next_cursor of the previous page
 
     Returns:
         FolderFileListResponse with files and optional tree
@@ -599,11 +795,24 @@ async def list_folder_files(
             detail=f"Folder upload {upload_id} not found",
         )
 
-    # Filter files by path if specified
-    files = folder_upload.files
-    if path:
-        path_normalized = path.rstrip("/")
-        files = [f for f in files if f.relative_path.startswith(path_normalized + "/") or f.relative_path == path_normalized]
+    await migrate_embedded_files(folder_upload)
+
+    # Filter files by path server-side
+    query = path_query(upload_id, path, recursive)
+    page_query = query
+    if after:
+        page_query = {"$and": [query, {"relative_path": {"$gt": decode_path_cursor(after)}}]}
+
+    files = await FolderFile.find(page_query).sort("relative_path").limit(limit + 1).to_list()
+    has_more = len(files) > limit
+    files = files[:limit]
+
+    if path or not recursive:
+        total_files, total_size = await path_totals(query)
+    else:
+        total_files, total_size = folder_upload.total_files, folder_upload.total_size
+
+    directories = None if recursive else await list_subdirectories(upload_id, path)
 
     # Build response
     files_data = [
@@ -629,10 +838,13 @@ async def list_folder_files(
         data_source_id=data_source_id,
         upload_id=upload_id,
         root_folder_name=folder_upload.root_folder_name,
-        total_files=len(files),
-        total_size=sum(f.file_size for f in files),
+        total_files=total_files,
+        total_size=total_size,
         files=files_data,
+        directories=directories,
         tree=tree,
+        has_more=has_more,
+        next_cursor=encode_path_cursor(files[-1].relative_path) if has_more else None,
     )
 
 
@@ -683,8 +895,10 @@ async def get_folder_file(
             detail=f"Folder upload {upload_id} not found",
         )
 
+    await migrate_embedded_files(folder_upload)
+
     # Find the file
-    file_entry = next((f for f in folder_upload.files if f.id == file_id), None)
+    file_entry = await FolderFile.find_one({"_id": file_id, "upload_id": upload_id})
     if not file_entry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -755,8 +969,10 @@ async def delete_folder_file(
             detail=f"Folder upload {upload_id} not found",
         )
 
+    await migrate_embedded_files(folder_upload)
+
     # Find the file
-    file_entry = next((f for f in folder_upload.files if f.id == file_id), None)
+    file_entry = await FolderFile.find_one({"_id": file_id, "upload_id": upload_id})
     if not file_entry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -764,11 +980,11 @@ async def delete_folder_file(
         )
 
     # Remove from DB first to prevent race conditions
-    folder_upload.files = [f for f in folder_upload.files if f.id != file_id]
-    folder_upload.total_files = len(folder_upload.files)
-    folder_upload.total_size = sum(f.file_size for f in folder_upload.files)
-    folder_upload.updated_at = datetime.now(timezone.utc)
-    await folder_upload.save()
+    if not await remove_folder_file(folder_upload, file_entry):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"File {file_id} not found",
+        )
 
     # Update data source configuration
     data_source.configuration["total_files"] = folder_upload.total_files
@@ -816,6 +1032,7 @@ async def get_folder_upload(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Folder upload {upload_id} not found",
         )
+    await migrate_embedded_files(folder_upload)
 
     return FolderUploadResponse(
         id=folder_upload.id,
@@ -824,8 +1041,8 @@ async def get_folder_upload(
         name=folder_upload.name,
         root_folder_name=folder_upload.root_folder_name,
         category=folder_upload.category,
-        total_files=len(folder_upload.files),
-        total_size=sum(f.file_size for f in folder_upload.files),
+        total_files=folder_upload.total_files,
+        total_size=folder_upload.total_size,
         max_depth=folder_upload.max_depth,
         status=folder_upload.status.value,
         created_at=folder_upload.created_at.isoformat(),
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, HTTPException, status, Depends, BackgroundTasks
 from typing import List
 from app.models.project import Project, ProjectCreate, ProjectUpdate, ProjectResponse, ProjectList
-from app.utils.project_cleanup import cascade_delete_project_resources
+from app.utils.project_cleanup import cascade_delete_project_resources, start_project_deletion
 from datetime import datetime
 
 router = APIRouter()
@@ -160,8 +160,11 @@ async def delete_project(
     - MCP Gateways and tools
     - Evaluations and runs
     - Training jobs
-    - Data sources
+    - Data sources and folder uploads
+    - Conversations and messages
     - Workzone invocations
+
+    Progress is recorded, so a cleanup interrupted by a restart is resumed.
     """
     # First find the project
     project = await Project.get(project_id)
@@ -178,6 +181,9 @@ async def delete_project(
             detail=f"Project with ID {project_id} does not belong to organization {organization_id}"
         )
     
+    # Record the pending cleanup, so it is resumed if this process stops before it finishes
+    await start_project_deletion(project_id)
+
     # Delete the project document first
     await project.delete()
     
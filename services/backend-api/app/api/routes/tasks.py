@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query, Request
 from fastapi.responses import JSONResponse, StreamingResponse
@@ -27,7 +27,13 @@ from app.models.tasks import (
     TaskRole, TaskStatus, TaskChunk, TaskComplete, TaskFeedback
 )
 from app.utils.rabbitmq_client import queue_agent_task
+from app.utils.pagination import apply_cursors, keyset_sort, next_cursor
 from app.utils.task_limits import active_task_details
+from app.utils.task_stream import (
+    TASK_STREAM_FALLBACK_POLL_SECONDS, TASK_STREAM_HEARTBEAT_SECONDS, TASK_STREAM_RECONCILE_SECONDS, TASK_UPDATE_MESSAGE_TYPE,
+    TERMINAL_TASK_STATUSES, apply_content_delta, content_delta, get_task_stream_status,
+    publish_task_update, task_stream_hub, utf16_len
+)
 
 router = APIRouter()
 
@@ -228,7 +234,9 @@ async def get_tasks(
     limit: int = Query(10, ge=1, le=100),
     skip: int = Query(0, ge=0, description="Number of items to skip for pagination"),
     sort_order: str = Query("desc", regex="^(asc|desc)$"),
-    status: Optional[list[str]] = Query(None, description="Filter tasks by status (e.g. 'queued', 'processing', 'completed', 'failed')")
+    status: Optional[list[str]] = Query(None, description="Filter tasks by status (e.g. 'queued', 'processing', 'completed', 'failed')"),
+    before: Optional[str] = Query(None, description="Cursor; only return tasks created before it"),
+    after: Optional[str] = Query(None, description="Cursor; only return tasks created after it")
 ):
     """
     Get tasks from an agent
@@ -239,6 +247,8 @@ async def get_tasks(
         limit: Maximum number of tasks to return (1-100)
         sort_order: Sort direction ('asc' for oldest to newest, 'desc' for newest to oldest)
         status: Optional list of statuses to filter tasks by
+        before: Cursor for the next page when sorting desc (next_cursor of the previous page)
+        after: Cursor for the next page when sorting asc (next_cursor of the previous page)
     """
     agent = await Agent.get(agent_id)
     if not agent:
@@ -257,10 +267,12 @@ async def get_tasks(
         if valid_statuses:
             query["status"] = {"$in": valid_statuses}
     
-    # Get tasks for this agent with pagination support
-    # Sort by creation date (default: oldest to newest)
+    # Keyset pagination; skip is still honoured for older clients but scans skipped tasks
+    query = apply_cursors(query, before=before, after=after)
+    
+    # Sort by creation date (default: newest to oldest), served by the agent_id/created_at index
     sort_direction = 1 if sort_order.lower() == "asc" else -1
-    tasks = await Task.find(query).sort([("created_at", sort_direction)]).skip(skip).limit(limit + 1).to_list()
+    tasks = await Task.find(query).sort(keyset_sort(sort_direction)).skip(skip).limit(limit + 1).to_list()
     
     # Check if there are more tasks
     has_more = len(tasks) > limit
@@ -283,7 +295,7 @@ async def get_tasks(
         ) for task in tasks
     ]
     
-    return TaskList(tasks=task_responses, has_more=has_more)
+    return TaskList(tasks=task_responses, has_more=has_more, next_cursor=next_cursor(tasks, has_more))
 
 @router.get("/projects/{project_id}/agents/{agent_id}/tasks/{task_id}", response_model=TaskResponse)
 async def get_task(project_id: str, agent_id: str, task_id: str):
@@ -366,12 +378,25 @@ async def update_task(
     # Update timestamp
     update_data['updated_at'] = datetime.utcnow()
     
+    previous_content = task.content
+
     # Update the task
     if update_data:
         await task.update({"$set": update_data})
         # Apply updates to the local object to reflect the database state
         for key, value in update_data.items():
             setattr(task, key, value)
+
+    # Push the change to clients streaming this task
+    if task.role == TaskRole.ASSISTANT and ('content' in update_data or 'status' in update_data):
+        await publish_task_update(
+            await get_redis_client(),
+            task_id,
+            old_content=previous_content,
+            new_content=update_data.get('content'),
+            status=update_data['status'].value if 'status' in update_data else None,
+            completed_at=update_data.get('completed_at')
+        )
     
     # Return the updated task
     return TaskResponse(
@@ -503,114 +528,165 @@ async def stream_specific_task(request: Request, project_id: str, agent_id: str,
                 "role": "assistant"
             })
         }
-        
-        # Get Redis client for streaming
-        redis_client = await get_redis_client()
-        
-        # Poll both Redis streams and database for updates
-        poll_interval = 0.5  # seconds
-        max_poll_time = 120  # seconds (2 minutes timeout)
-        total_poll_time = 0
-        last_content = None  # Track last sent content
-        last_redis_id = "0"  # Track last Redis stream message ID
-        
-        while total_poll_time < max_poll_time:
-            if await request.is_disconnected():
-                print(f"Client disconnected while streaming task {task_id}")
-                break
-                
-            # Check Redis stream for Claude Code messages if Redis is available
-            if redis_client:
-                try:
-                    stream_key = f"task_stream:{task_id}"
-                    # Read new messages from Redis stream
-                    streams = await redis_client.xread({stream_key: last_redis_id}, count=10, block=100)
-                    
-                    for stream_name, messages in streams:
-                        for message_id, fields in messages:
-                            # Update last processed Redis message ID
-                            last_redis_id = message_id
-                            
-                            # Parse the Redis stream message with structured data
-                            message_type = fields.get("message_type", "")
-                            timestamp = fields.get("timestamp", "")
-                            raw_message = fields.get("message", "")
-                            structured_data_str = fields.get("structured_data", "{}")
-                            
-                            # Parse structured data
-                            try:
-                                structured_data = json.loads(structured_data_str) if structured_data_str else {}
-                            except json.JSONDecodeError:
-                                structured_data = {}
-                            
-                            # Send Claude Code streaming events with both formats
-                            yield {
-                                "event": "claude_code_message",
-                                "data": json.dumps({
-                                    "id": task_id,
-                                    "message_id": message_id,
-                                    "message_type": message_type,
-                                    "message": raw_message,
-                                    "timestamp": timestamp,
-                                    "structured_data": structured_data
-                                })
-                            }
-                            
-                except Exception as e:
-                    # Redis error - continue with database polling only
-                    print(f"Redis streaming error for task {task_id}: {e}")
-                
-            # Get the latest version of the task from the database
-            current_msg = await Task.get(task_id)
-            if not current_msg:
-                print(f"Task {task_id} no longer exists")
-                break
 
-            # Get current content
-            current_content = current_msg.content or ""
-            
-            # Only send updates if content has changed
-            if current_content != last_content:
-                # Send the entire current content as one chunk
-                yield {
-                    "event": "message_chunk",
-                    "data": json.dumps({
-                        "id": task_id,
-                        "content_chunk": current_content
-                    })
-                }
-                # Update the last sent content
-                last_content = current_content
-            
-            # If task is complete, send completion event and stop polling
-            if current_msg.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
-                # Send completion event
-                yield {
-                    "event": "message_complete",
-                    "data": json.dumps({
-                        "id": task_id,
-                        "status": current_msg.status.value,
-                        "completed_at": current_msg.completed_at.isoformat() if current_msg.completed_at else datetime.utcnow().isoformat()
-                    })
-                }
-                break
-            
-            # Wait before polling again
-            await asyncio.sleep(poll_interval)
-            total_poll_time += poll_interval
-        
-        # If we reached the timeout without completion, send a timeout event
-        if total_poll_time >= max_poll_time:
-            print(f"Timeout reached while streaming task {task_id}")
-            yield {
-                "event": "task_timeout",
+        # Content the client has been sent so far; updates are sent as deltas against it
+        sent_content = ""
+
+        def content_event(content: str) -> Optional[Dict[str, Any]]:
+            nonlocal sent_content
+            offset, delta = content_delta(sent_content, content)
+            if offset == utf16_len(sent_content) and not delta:
+                return None
+            sent_content = content
+            return {
+                "event": "message_chunk",
                 "data": json.dumps({
                     "id": task_id,
-                    "task": "Response generation timed out"
+                    "offset": offset,
+                    "content_delta": delta
+                })
+            }
+
+        def complete_event(status: str, completed_at: Optional[str]) -> Dict[str, Any]:
+            return {
+                "event": "message_complete",
+                "data": json.dumps({
+                    "id": task_id,
+                    "status": status,
+                    "completed_at": completed_at or datetime.utcnow().isoformat()
                 })
             }
-    
-    return EventSourceResponse(event_generator())
+
+        async def reconcile() -> Tuple[List[Dict[str, Any]], bool]:
+            """Re-read the task from Mongo; returns the events to send and whether streaming is over."""
+            current = await Task.get(task_id)
+            if not current:
+                print(f"Task {task_id} no longer exists")
+                return [], True
+
+            events = []
+            event = content_event(current.content or "")
+            if event:
+                events.append(event)
+            if current.status.value in TERMINAL_TASK_STATUSES:
+                completed_at = current.completed_at.isoformat() if current.completed_at else None
+                events.append(complete_event(current.status.value, completed_at))
+                return events, True
+            return events, False
+
+        # Finished tasks are answered from Mongo without touching the stream
+        if task.status.value in TERMINAL_TASK_STATUSES:
+            events, _ = await reconcile()
+            for event in events:
+                yield event
+            return
+
+        redis_client = await get_redis_client()
+        subscription = None
+        if redis_client:
+            try:
+                subscription = await task_stream_hub.subscribe(redis_client, task_id)
+            except Exception as e:
+                # Redis error - fall back to reading the task from the database
+                print(f"Redis streaming error for task {task_id}: {e}")
+
+        if subscription is None:
+            # Without Redis there is nothing to block on; fall back to polling the task
+            sent_events, _ = await reconcile()
+            for event in sent_events:
+                yield event
+
+        loop = asyncio.get_running_loop()
+        last_reconciled = loop.time()
+
+        try:
+            while True:
+                if await request.is_disconnected():
+                    print(f"Client disconnected while streaming task {task_id}")
+                    break
+
+                if subscription is None:
+                    await asyncio.sleep(TASK_STREAM_FALLBACK_POLL_SECONDS)
+                    events, finished = await reconcile()
+                    for event in events:
+                        yield event
+                    if finished:
+                        break
+                    continue
+
+                entries = await subscription.next_entries(TASK_STREAM_HEARTBEAT_SECONDS)
+
+                if not entries:
+                    # Idle: check the status key, and Mongo now and then in case an update was missed
+                    stream_status = await get_task_stream_status(redis_client, task_id)
+                    finished_in_redis = stream_status and stream_status.get("status") in TERMINAL_TASK_STATUSES
+                    if finished_in_redis or loop.time() - last_reconciled >= TASK_STREAM_RECONCILE_SECONDS:
+                        last_reconciled = loop.time()
+                        events, finished = await reconcile()
+                        for event in events:
+                            yield event
+                        if finished:
+                            break
+                    continue
+
+                finished = False
+                for message_id, fields in entries:
+                    message_type = fields.get("message_type", "")
+
+                    if message_type == TASK_UPDATE_MESSAGE_TYPE:
+                        if "content_offset" in fields:
+                            offset = int(fields["content_offset"])
+                            if offset > utf16_len(sent_content):
+                                # Missed earlier updates (e.g. trimmed stream); resync from the database
+                                events, finished = await reconcile()
+                                for event in events:
+                                    yield event
+                                if finished:
+                                    break
+                                continue
+                            event = content_event(apply_content_delta(sent_content, offset, fields.get("content_delta", "")))
+                            if event:
+                                yield event
+
+                        status = fields.get("status")
+                        if status in TERMINAL_TASK_STATUSES:
+                            yield complete_event(status, fields.get("completed_at"))
+                            finished = True
+                            break
+                        continue
+
+                    # Parse the Redis stream message with structured data
+                    timestamp = fields.get("timestamp", "")
+                    raw_message = fields.get("message", "")
+                    structured_data_str = fields.get("structured_data", "{}")
+
+                    # Parse structured data
+                    try:
+                        structured_data = json.loads(structured_data_str) if structured_data_str else {}
+                    except json.JSONDecodeError:
+                        structured_data = {}
+
+                    # Send Claude Code streaming events with both formats
+                    yield {
+                        "event": "claude_code_message",
+                        "data": json.dumps({
+                            "id": task_id,
+                            "message_id": message_id,
+                            "message_type": message_type,
+                            "message": raw_message,
+                            "timestamp": timestamp,
+                            "structured_data": structured_data
+                        })
+                    }
+
+                if finished:
+                    break
+        finally:
+            if subscription is not None:
+                task_stream_hub.unsubscribe(subscription)
+
+    # Keep-alive pings replace the old fixed timeout; the stream ends when the task does
+    return EventSourceResponse(event_generator(), ping=TASK_STREAM_HEARTBEAT_SECONDS)
 
 @router.post("/projects/{project_id}/agents/{agent_id}/tasks/{task_id}/feedback", response_model=TaskResponse)
 async def submit_task_feedback(project_id: str, agent_id: str, task_id: str, feedback_data: TaskFeedback):
@@ -696,6 +772,14 @@ async def cancel_task(project_id: str, agent_id: str, task_id: str):
     # Apply updates to the local object to reflect the database state
     for key, value in update_data.items():
         setattr(task, key, value)
+
+    if task.role == TaskRole.ASSISTANT:
+        await publish_task_update(
+            await get_redis_client(),
+            task_id,
+            status=TaskStatus.CANCELLED.value,
+            completed_at=update_data['completed_at']
+        )
     
     # If there's a related task (assistant task), cancel it too
     if task.related_task_id:
@@ -712,6 +796,13 @@ async def cancel_task(project_id: str, agent_id: str, task_id: str):
             related_task.metadata['cancellation_reason'] = 'Related task was cancelled'
             related_update_data['metadata'] = related_task.metadata
             await related_task.update({"$set": related_update_data})
+            if related_task.role == TaskRole.ASSISTANT:
+                await publish_task_update(
+                    await get_redis_client(),
+                    str(related_task.id),
+                    status=TaskStatus.CANCELLED.value,
+                    completed_at=related_update_data['completed_at']
+                )
     
     # Return the cancelled task
     return TaskResponse(
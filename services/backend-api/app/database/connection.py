@@ -6,20 +6,20 @@ from typing import Optional, Dict, Any, Tuple
 from urllib.parse import urlparse
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
-from app.models.project import Project
+from app.models.project import Project, ProjectDeletion
 from app.models.data_source import DataSource
 from app.models.agent import Agent
 from app.models.tasks import Task
 from app.models.training import Training
 from app.models.tool import Tool
 from app.models.evaluation import Evaluation, EvaluationRun
-from app.models.mcp_gateway import MCPGateway, MCPTool
+from app.models.mcp_gateway import MCPGateway, MCPTool, ToolInvocation
 from app.models.playground import Playground, PlaygroundInvocation
 from app.models.workzone import Workzone, WorkzoneInvocation
 from app.models.env_variable import EnvVariable
 from app.models.conversation import Conversation
 from app.models.message import Message
-from app.models.folder_upload import FolderUpload
+from app.models.folder_upload import FolderUpload, FolderFile
 
 logger = logging.getLogger(__name__)
 
@@ -157,6 +157,7 @@ async def connect_to_mongo():
                 EvaluationRun,
                 MCPGateway,
                 MCPTool,
+                ToolInvocation,
                 Playground,
                 PlaygroundInvocation,
                 Workzone,
@@ -164,7 +165,9 @@ async def connect_to_mongo():
                 EnvVariable,
                 Conversation,
                 Message,
-                FolderUpload
+                FolderUpload,
+                FolderFile,
+                ProjectDeletion
             ]
         )
         
@@ -1,21 +1,62 @@
+import asyncio
+import logging
 import uvicorn
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.api.routes import api_router
 from app.database.connection import connect_to_mongo, close_mongo_connection
-from app.utils.rabbitmq_client import initialize_rabbitmq_queues, close_rabbitmq_connection
+from app.utils.rabbitmq_client import initialize_rabbitmq_queues, close_rabbitmq_connection, get_rabbitmq_stats
+from app.utils.message_persistence import MESSAGE_WAL_LEASE_SECONDS, recover_interrupted_messages
+from app.api.routes.tasks import get_redis_client
+from app.utils.http_clients import start_http_clients, close_http_clients, get_http_pool_stats
+from app.utils.project_cleanup import PROJECT_DELETION_LEASE_SECONDS, resume_project_deletions
+
+logger = logging.getLogger(__name__)
+
+
+async def _recover_interrupted_messages():
+    """Replay message write-ahead logs left by a previous process."""
+    # The second pass picks up logs whose lease had not yet expired at startup
+    for delay in (0, MESSAGE_WAL_LEASE_SECONDS):
+        await asyncio.sleep(delay)
+        try:
+            recovered = await recover_interrupted_messages(await get_redis_client())
+            if recovered:
+                logger.info(f"Recovered {recovered} interrupted streaming messages")
+        except Exception as e:
+            logger.error(f"Failed to recover interrupted streaming messages: {e}")
+
+async def _resume_project_deletions():
+    """Finish cascade deletions of projects left incomplete by a previous process."""
+    # The second pass picks up deletions whose lease had not yet expired at startup
+    for delay in (0, PROJECT_DELETION_LEASE_SECONDS):
+        await asyncio.sleep(delay)
+        try:
+            resumed = await resume_project_deletions()
+            if resumed:
+                logger.info(f"Resumed {resumed} project deletions")
+        except Exception as e:
+            logger.error(f"Failed to resume project deletions: {e}")
 
 # Define lifespan context manager for database and RabbitMQ connections
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: connect to database and initialize RabbitMQ queues
     await connect_to_mongo()
-    initialize_rabbitmq_queues()
+    await initialize_rabbitmq_queues()
+    start_http_clients()
+    # Runs in the background so startup does not wait on Redis
+    recovery_task = asyncio.create_task(_recover_interrupted_messages())
+    deletion_task = asyncio.create_task(_resume_project_deletions())
     yield
-    # Shutdown: close database and RabbitMQ connections
+    recovery_task.cancel()
+    deletion_task.cancel()
+    # Shutdown: close database, RabbitMQ and downstream HTTP connections
+    # RabbitMQ first: messages left in its outbox are marked failed in Mongo
+    await close_rabbitmq_connection()
     await close_mongo_connection()
-    close_rabbitmq_connection()
+    await close_http_clients()
 
 app = FastAPI(
     title="Project Management API",
@@ -38,7 +79,11 @@ app.include_router(api_router)
 
 @app.get("/", tags=["Health"])
 async def root():
-    return {"message": "Project Management API is running"}
+    return {
+        "message": "Project Management API is running",
+        "http_pools": get_http_pool_stats(),
+        "rabbitmq": get_rabbitmq_stats()
+    }
 
 if __name__ == "__main__":
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
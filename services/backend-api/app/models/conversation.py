@@ -3,6 +3,7 @@ from typing import Optional, Dict, Any, List
 from enum import Enum
 from datetime import datetime
 from pydantic import BaseModel as PydanticBaseModel, Field
+from pymongo import IndexModel
 from beanie import Indexed
 from app.models.base import BaseModel
 
@@ -32,6 +33,17 @@ class Conversation(BaseModel):
 
     class Settings:
         name = "conversations"
+        indexes = [
+            # Conversation list per project (optionally by status), newest first
+            IndexModel(
+                [("project_id", 1), ("created_at", -1), ("_id", -1)],
+                name="project_created_at"
+            ),
+            IndexModel(
+                [("project_id", 1), ("status", 1), ("created_at", -1), ("_id", -1)],
+                name="project_status_created_at"
+            ),
+        ]
 
     class Config:
         populate_by_name = True
@@ -75,7 +87,8 @@ class ConversationList(PydanticBaseModel):
     """Schema for list of Conversations"""
     conversations: List[ConversationResponse]
     has_more: bool = False
-    total: int = 0
+    total: Optional[int] = 0  # None when the total was not requested
+    next_cursor: Optional[str] = None  # Pass as before/after to fetch the next page
 
 
 class ConversationUpdate(PydanticBaseModel):
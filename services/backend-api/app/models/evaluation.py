@@ -181,6 +181,19 @@ class TestCaseResult(PydanticBaseModel):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
+class EvaluationRunMetrics(PydanticBaseModel):
+    """Schema for the throughput and latency summary of an evaluation run"""
+    max_concurrency: int  # Test cases allowed in flight at once
+    startup_seconds: Optional[float] = None  # Run start until the first target tasks were queued
+    duration_seconds: Optional[float] = None  # Run start until the run finished
+    finished_test_cases: int = 0
+    test_cases_per_minute: Optional[float] = None
+    avg_latency_seconds: Optional[float] = None  # Per test case, target queued until graded
+    p50_latency_seconds: Optional[float] = None
+    p95_latency_seconds: Optional[float] = None
+    avg_target_seconds: Optional[float] = None  # Target task queued until completed
+    avg_grader_seconds: Optional[float] = None  # Grader task queued until completed
+
 class EvaluationRun(BaseModel):
     """Model for tracking evaluation execution"""
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), alias="_id")
@@ -195,6 +208,8 @@ class EvaluationRun(BaseModel):
     completed_test_cases: int = Field(default=0)
     failed_test_cases: int = Field(default=0)
     overall_score: Optional[float] = Field(None, description="Overall evaluation score (0.0 to 1.0)")
+    max_concurrency: Optional[int] = Field(None, description="Test cases run at once (defaults to EVALUATION_MAX_CONCURRENCY)")
+    metrics: Optional[Dict[str, Any]] = Field(None, description="Throughput and latency summary, set when the run finishes")
     error_message: Optional[str] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
@@ -207,7 +222,8 @@ class EvaluationRun(BaseModel):
 
 class EvaluationRunCreate(PydanticBaseModel):
     """Schema for creating an evaluation run"""
-    pass  # No additional fields needed - all info comes from the evaluation
+    # Everything else comes from the evaluation
+    max_concurrency: Optional[int] = Field(None, ge=1, le=100, description="Test cases run at once")
 
 class EvaluationRunResponse(PydanticBaseModel):
     """Schema for evaluation run response"""
@@ -223,6 +239,8 @@ class EvaluationRunResponse(PydanticBaseModel):
     completed_test_cases: int
     failed_test_cases: int
     overall_score: Optional[float]
+    max_concurrency: Optional[int] = None
+    metrics: Optional[EvaluationRunMetrics] = None
     error_message: Optional[str]
     started_at: Optional[str]
     completed_at: Optional[str]
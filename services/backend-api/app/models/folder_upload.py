@@ -2,13 +2,15 @@
 Folder Upload Model
 
 Represents folder hierarchies uploaded as data sources.
-Stores individual file entries with their paths and metadata.
+File entries live in their own collection (FolderFile), indexed for path
+lookups and directory listings, while FolderUpload keeps running totals.
 """
 import uuid
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 from enum import Enum
 from pydantic import BaseModel as PydanticBaseModel, Field
+from pymongo import IndexModel
 from app.models.base import BaseModel
 from beanie import Indexed
 
@@ -22,7 +24,7 @@ class FolderUploadStatus(str, Enum):
 
 
 class FolderFileEntry(PydanticBaseModel):
-    """Individual file within a folder upload"""
+    """Individual file embedded in a legacy FolderUpload document (see FolderFile)"""
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     relative_path: str  # e.g., "src/components/Button.tsx"
     filename: str  # e.g., "Button.tsx"
@@ -55,6 +57,43 @@ class FolderFileEntry(PydanticBaseModel):
         }
 
 
+class FolderFile(BaseModel):
+    """Individual file within a folder upload"""
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()), alias="_id")
+    upload_id: str
+    relative_path: str  # e.g., "src/components/Button.tsx"
+    filename: str  # e.g., "Button.tsx"
+    file_extension: str  # e.g., ".tsx"
+    file_size: int  # bytes
+    content_type: str  # MIME type
+    s3_key: str  # Full S3 key
+    s3_url: str  # S3 URL for access
+    depth: int  # Directory depth (0-9)
+    parent_path: str  # e.g., "src/components" or "" for root
+    checksum: Optional[str] = None  # SHA-256 hash
+    multipart_upload_id: Optional[str] = None  # Open S3 multipart upload of a direct upload
+
+    class Settings:
+        name = "folder_files"
+        indexes = [
+            # Path lookups and prefix queries; one entry per path
+            IndexModel(
+                [("upload_id", 1), ("relative_path", 1)],
+                name="upload_relative_path",
+                unique=True
+            ),
+            # Directory listings in path order
+            IndexModel(
+                [("upload_id", 1), ("parent_path", 1), ("relative_path", 1)],
+                name="upload_parent_path"
+            ),
+        ]
+
+    class Config:
+        populate_by_name = True
+        arbitrary_types_allowed = True
+
+
 class FolderUpload(BaseModel):
     """Folder upload document model - represents entire folder hierarchy"""
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), alias="_id")
@@ -63,12 +102,16 @@ class FolderUpload(BaseModel):
     name: str  # User-friendly name
     root_folder_name: str  # Original uploaded folder name
     category: str = "document"  # document, code, or data
-    total_files: int = 0
-    total_size: int = 0  # Total bytes
+    total_files: int = 0  # Files uploaded so far, maintained with $inc
+    total_size: int = 0  # Total bytes uploaded so far, maintained with $inc
     max_depth: int = 0  # Deepest level in hierarchy
+    expected_files: Optional[int] = None  # Declared at init
+    expected_size: Optional[int] = None  # Declared at init
+    # Legacy embedded entries, moved to the folder_files collection on first access
     files: List[FolderFileEntry] = Field(default_factory=list)
     status: FolderUploadStatus = FolderUploadStatus.UPLOADING
     s3_prefix: str = ""  # e.g., "artifacts/{project_id}/folders/{upload_id}/"
+    direct_upload: bool = False  # Clients upload files straight to S3 with presigned URLs
     error_message: Optional[str] = None
 
     class Settings:
@@ -108,7 +151,8 @@ class FolderUploadInitRequest(PydanticBaseModel):
     max_depth: int = Field(..., ge=0, le=10)
     file_manifest: List[Dict[str, Any]] = Field(
         default_factory=list,
-        description="Optional list of files with relative_path and file_size"
+        description="Optional list of files with relative_path, file_size and checksum; "
+                    "presigned URLs are returned to upload each file directly to S3"
     )
 
 
@@ -119,6 +163,8 @@ class FolderUploadInitResponse(PydanticBaseModel):
     s3_prefix: str
     status: str
     message: str
+    files: Optional[List[Dict[str, Any]]] = None  # Presigned upload per file, for direct uploads
+    expires_in: Optional[int] = None  # Seconds until the presigned URLs expire
 
 
 class FolderFileUploadRequest(PydanticBaseModel):
@@ -155,10 +201,13 @@ class FolderFileListResponse(PydanticBaseModel):
     data_source_id: str
     upload_id: str
     root_folder_name: str
-    total_files: int
+    total_files: int  # All files under the requested path, not just this page
     total_size: int
     files: List[Dict[str, Any]]
-    tree: Optional[Dict[str, Any]] = None  # Tree structure for UI
+    directories: Optional[List[str]] = None  # Subdirectories, for non-recursive listings
+    tree: Optional[Dict[str, Any]] = None  # Tree structure for UI (files of this page)
+    has_more: bool = False
+    next_cursor: Optional[str] = None  # Pass as `after` to get the next page
 
 
 class FolderFileResponse(PydanticBaseModel):
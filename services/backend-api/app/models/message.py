@@ -3,6 +3,7 @@ from typing import Optional, Dict, Any, List, Union, Literal
 from enum import Enum
 from datetime import datetime
 from pydantic import BaseModel as PydanticBaseModel, Field
+from pymongo import IndexModel
 from beanie import Indexed
 from app.models.base import BaseModel
 
@@ -81,6 +82,13 @@ class Message(BaseModel):
 
     class Settings:
         name = "messages"
+        indexes = [
+            # Messages of a conversation in order, with created_at+_id keyset pagination
+            IndexModel(
+                [("conversation_id", 1), ("created_at", 1), ("_id", 1)],
+                name="conversation_created_at"
+            ),
+        ]
 
     class Config:
         populate_by_name = True
@@ -130,7 +138,8 @@ class MessageList(PydanticBaseModel):
     """Schema for list of Messages"""
     messages: List[MessageResponse]
     has_more: bool = False
-    total: int = 0
+    total: Optional[int] = 0  # None when the total was not requested
+    next_cursor: Optional[str] = None  # Pass as before/after to fetch the next page
 
 
 class MessageChunk(PydanticBaseModel):
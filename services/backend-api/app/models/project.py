@@ -1,5 +1,7 @@
 import uuid
-from typing import Optional, List
+from datetime import datetime
+from enum import Enum
+from typing import Optional, List, Dict, Any
 from pydantic import BaseModel as PydanticBaseModel, Field, field_validator
 from app.models.base import BaseModel
 
@@ -79,6 +81,30 @@ class Project(BaseModel):
             }
         }
 
+class ProjectDeletionStatus(str, Enum):
+    """Enum for project deletion status"""
+    RUNNING = "running"
+    PARTIAL = "partial"  # Some steps failed; retried on the next attempt
+    COMPLETED = "completed"
+
+
+class ProjectDeletion(BaseModel):
+    """Progress of the cascade deletion of a deleted project's resources"""
+    id: str = Field(..., alias="_id")  # The deleted project's ID
+    status: ProjectDeletionStatus = ProjectDeletionStatus.RUNNING
+    steps: Dict[str, Dict[str, Any]] = Field(default_factory=dict)  # Finished steps: name -> {deleted, completed_at}
+    errors: List[str] = Field(default_factory=list)  # Errors of the latest attempt
+    attempts: int = 0
+    lease_expires_at: Optional[datetime] = None  # Set while a process is working on it
+    completed_at: Optional[datetime] = None
+
+    class Settings:
+        name = "project_deletions"
+
+    class Config:
+        populate_by_name = True
+        arbitrary_types_allowed = True
+
 class ProjectResponse(PydanticBaseModel):
     """Schema for project response"""
     id: str
@@ -3,6 +3,7 @@ from typing import Optional, List, Dict, Any, Union
 from enum import Enum
 from datetime import datetime
 from pydantic import BaseModel as PydanticBaseModel, Field, validator
+from pymongo import IndexModel
 from app.models.base import BaseModel
 from beanie import Indexed
 
@@ -39,6 +40,22 @@ class Task(BaseModel):
     
     class Settings:
         name = "tasks"
+        indexes = [
+            # Task list per agent, newest first, with created_at+_id keyset pagination
+            IndexModel(
+                [("agent_id", 1), ("created_at", -1), ("_id", -1)],
+                name="agent_created_at"
+            ),
+            IndexModel(
+                [("project_id", 1), ("agent_id", 1), ("created_at", -1)],
+                name="project_agent_created_at"
+            ),
+            # Active task counts on every task submit
+            IndexModel(
+                [("agent_id", 1), ("status", 1), ("role", 1)],
+                name="agent_status_role"
+            ),
+        ]
         
     class Config:
         populate_by_name = True
@@ -85,6 +102,7 @@ class TaskList(PydanticBaseModel):
     """Schema for list of Tasks"""
     tasks: List[TaskResponse]
     has_more: bool = False
+    next_cursor: Optional[str] = None  # Pass as before/after to fetch the next page
 
 class TaskChunk(PydanticBaseModel):
     """Schema for task chunk in streaming response"""
@@ -1,23 +1,51 @@
 """
 Evaluation orchestration utilities for Phase 2 execution.
-Handles background task execution, polling, and result aggregation.
+Handles background task execution, completion tracking, and result aggregation.
+
+The orchestrator waits on the shared task completions stream in Redis and
+fetches the tasks that finished with a single $in query, instead of reading
+every outstanding task each second. Test case results are updated positionally
+and written in batches.
+
+All target tasks are inserted up front with insert_many, but at most
+max_concurrency test cases are in flight at once: target tasks are published
+in batches on a confirm channel as earlier test cases finish.
 """
 
 import asyncio
 import json
+import os
 import re
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Any, Set, Tuple
 from fastapi import HTTPException
 import logging
 
-from app.models.evaluation import EvaluationRun, EvaluationRunStatus, TestCaseRunStatus
+from pymongo import UpdateOne
+
+from app.models.evaluation import EvaluationRun, EvaluationRunMetrics, EvaluationRunStatus, TestCaseRunStatus
 from app.models.tasks import Task, TaskRole, TaskStatus
 from app.models.agent import Agent
-from app.utils.rabbitmq_client import queue_agent_task
+from app.utils.rabbitmq_client import queue_agent_tasks
+from app.utils.task_stream import TERMINAL_TASK_STATUSES, latest_task_completion_id, read_task_completions
 
 logger = logging.getLogger(__name__)
 
+# Maximum run time of an evaluation
+EVALUATION_TIMEOUT_SECONDS = int(os.getenv("EVALUATION_TIMEOUT_SECONDS", "3600"))
+# How often all outstanding tasks are re-read from Mongo in case a completion event was missed
+EVALUATION_RECONCILE_SECONDS = int(os.getenv("EVALUATION_RECONCILE_SECONDS", "30"))
+# Mongo polling interval used only when Redis is unavailable
+EVALUATION_POLL_SECONDS = float(os.getenv("EVALUATION_POLL_SECONDS", "1"))
+# Test case updates are written once this many test cases have pending changes
+EVALUATION_WRITE_BATCH_SIZE = int(os.getenv("EVALUATION_WRITE_BATCH_SIZE", "100"))
+# Test cases in flight at once when the run does not set max_concurrency
+EVALUATION_MAX_CONCURRENCY = int(os.getenv("EVALUATION_MAX_CONCURRENCY", "10"))
+
+TARGET_PHASE = "target"
+GRADER_PHASE = "grader"
+
 class EvaluationOrchestrator:
     """Orchestrates evaluation execution with parallel task processing"""
     
@@ -25,222 +53,330 @@ class EvaluationOrchestrator:
         self.evaluation_run = evaluation_run
         self.test_cases = evaluation_test_cases
         self.criteria = criteria
+        self._test_cases_by_id = {tc.get("id"): tc for tc in reversed(evaluation_test_cases)}
         self.target_tasks: Dict[str, str] = {}  # test_case_id -> task_id
         self.grader_tasks: Dict[str, str] = {}  # test_case_id -> task_id
+        # Tasks not finished yet: task_id -> (test_case_id, phase)
+        self._outstanding: Dict[str, Tuple[str, str]] = {}
+        # Test case results by id; the same dicts as in evaluation_run.test_case_results
+        self._results: Dict[str, Dict[str, Any]] = {
+            result["test_case_id"]: result for result in evaluation_run.test_case_results
+        }
+        # Changed fields per test case not written yet
+        self._pending_updates: Dict[str, Dict[str, Any]] = {}
+        self._redis = None
+        self._completions_cursor = "0-0"
+        self.max_concurrency = evaluation_run.max_concurrency or EVALUATION_MAX_CONCURRENCY
+        # Target tasks inserted but not published yet: (test_case_id, user_task, assistant_task)
+        self._pending_targets: Deque[Tuple[str, Task, Task]] = deque()
+        # Test cases published and not finished yet
+        self._in_flight: Set[str] = set()
+        # Loop times per test case: "queued", "target_done", "grader_queued", "done"
+        self._timings: Dict[str, Dict[str, float]] = {}
+        self._started = 0.0
+        self._first_queued: Optional[float] = None
         
     async def start_evaluation(self):
         """Start the evaluation execution process"""
         try:
-            logger.info(f"Starting evaluation run {self.evaluation_run.id}")
+            logger.info(f"Starting evaluation run {self.evaluation_run.id} "
+                       f"with up to {self.max_concurrency} test cases in flight")
+            self._started = asyncio.get_running_loop().time()
             
             # Update status to running
             self.evaluation_run.status = EvaluationRunStatus.RUNNING
             await self.evaluation_run.update({"$set": {"status": self.evaluation_run.status.value}})
             
+            # Remember the position in the completions stream before any task can finish
+            await self._open_completions_stream()
+            
             # Start target agent tasks for all test cases
             await self._create_target_tasks()
+            await self._flush_test_case_updates()
             
-            # Start polling for completion
-            await self._poll_and_process_results()
+            # Process task completions as they happen
+            await self._process_results()
             
         except Exception as e:
             logger.error(f"Error in evaluation orchestration: {e}")
             await self._mark_evaluation_failed(str(e))
     
     async def _create_target_tasks(self):
-        """Create tasks for the target agent for all test cases"""
+        """Insert target tasks for all test cases and queue the first batch"""
         logger.info(f"Creating target tasks for {len(self.test_cases)} test cases")
         
+        pending = []
         for i, test_case in enumerate(self.test_cases):
             test_case_id = test_case.get("id", f"tc_{i}")
-            task_content = test_case["task"]
-            
-            try:
-                # Create user task for target agent
-                user_task = Task(
-                    agent_id=self.evaluation_run.target_agent_id,
-                    project_id=self.evaluation_run.project_id,
-                    role=TaskRole.USER,
-                    content=task_content,
-                    status=TaskStatus.QUEUED,
-                    metadata={"evaluation_run_id": str(self.evaluation_run.id), "test_case_id": test_case_id}
-                )
-                await user_task.save()
-                
-                # Create assistant task
-                assistant_task = Task(
-                    agent_id=self.evaluation_run.target_agent_id,
-                    project_id=self.evaluation_run.project_id,
-                    role=TaskRole.ASSISTANT,
-                    content="",
-                    status=TaskStatus.QUEUED,
-                    related_task_id=str(user_task.id),
-                    metadata={"evaluation_run_id": str(self.evaluation_run.id), "test_case_id": test_case_id}
-                )
-                await assistant_task.save()
-                
-                # Store task ID for tracking
-                self.target_tasks[test_case_id] = str(assistant_task.id)
-                
-                # Update test case status
-                await self._update_test_case_status(test_case_id, TestCaseRunStatus.RUNNING_TARGET, 
-                                                  target_task_id=str(assistant_task.id))
-                
-                # Queue the task for processing
-                await queue_agent_task(
-                    task_id=str(user_task.id),
-                    assistant_task_id=str(assistant_task.id),
-                    agent_id=self.evaluation_run.target_agent_id,
-                    project_id=self.evaluation_run.project_id,
-                    content=task_content,
-                    metadata={"evaluation_run_id": str(self.evaluation_run.id), "test_case_id": test_case_id}
-                )
-                
-                logger.info(f"Created target task {assistant_task.id} for test case {test_case_id}")
-                
-            except Exception as e:
-                logger.error(f"Error creating target task for test case {test_case_id}: {e}")
-                await self._update_test_case_status(test_case_id, TestCaseRunStatus.FAILED, 
+            user_task, assistant_task = self._build_task_pair(
+                self.evaluation_run.target_agent_id,
+                self.evaluation_run.project_id,
+                test_case_id,
+                test_case["task"]
+            )
+            pending.append((test_case_id, user_task, assistant_task))
+        
+        if not pending:
+            return
+        
+        try:
+            await Task.insert_many([task for _, user_task, assistant_task in pending
+                                    for task in (user_task, assistant_task)])
+        except Exception as e:
+            logger.error(f"Error creating target tasks for evaluation run {self.evaluation_run.id}: {e}")
+            for test_case_id, _, _ in pending:
+                await self._update_test_case_status(test_case_id, TestCaseRunStatus.FAILED,
                                                   error_message=f"Failed to create target task: {str(e)}")
+            return
+        
+        for test_case_id, _, assistant_task in pending:
+            # Store task ID for tracking
+            self.target_tasks[test_case_id] = str(assistant_task.id)
+            await self._update_test_case_status(test_case_id, TestCaseRunStatus.PENDING,
+                                              target_task_id=str(assistant_task.id))
+        
+        self._pending_targets.extend(pending)
+        await self._dispatch_pending_targets()
+    
+    async def _dispatch_pending_targets(self):
+        """Queue inserted target tasks while the concurrency budget allows"""
+        batch = []
+        while self._pending_targets and len(self._in_flight) + len(batch) < self.max_concurrency:
+            batch.append(self._pending_targets.popleft())
+        if not batch:
+            return
+        
+        now = asyncio.get_running_loop().time()
+        if self._first_queued is None:
+            self._first_queued = now
+        for test_case_id, _, _ in batch:
+            self._in_flight.add(test_case_id)
+            self._timings[test_case_id] = {"queued": now}
+            await self._update_test_case_status(test_case_id, TestCaseRunStatus.RUNNING_TARGET,
+                                              started_at=datetime.utcnow())
+        
+        await self._queue_tasks(batch, TARGET_PHASE)
     
-    async def _poll_and_process_results(self):
-        """Poll for task completion and process results"""
-        max_polls = 3600  # 1 hour with 1-second intervals
-        poll_count = 0
+    def _build_task_pair(self, agent_id: str, project_id: str, test_case_id: str, content: str) -> Tuple[Task, Task]:
+        """Build the user task and the assistant task to be filled for one test case"""
+        metadata = {"evaluation_run_id": str(self.evaluation_run.id), "test_case_id": test_case_id}
+        user_task = Task(
+            agent_id=agent_id,
+            project_id=project_id,
+            role=TaskRole.USER,
+            content=content,
+            status=TaskStatus.QUEUED,
+            metadata=dict(metadata)
+        )
+        assistant_task = Task(
+            agent_id=agent_id,
+            project_id=project_id,
+            role=TaskRole.ASSISTANT,
+            content="",
+            status=TaskStatus.QUEUED,
+            related_task_id=str(user_task.id),
+            metadata=dict(metadata)
+        )
+        return user_task, assistant_task
+    
+    async def _queue_tasks(self, batch: List[Tuple[str, Task, Task]], phase: str):
+        """Publish a batch of inserted tasks and track the ones that were queued"""
+        failed = await queue_agent_tasks([
+            {
+                "task_id": str(user_task.id),
+                "assistant_task_id": str(assistant_task.id),
+                "agent_id": user_task.agent_id,
+                "project_id": user_task.project_id,
+                "content": user_task.content,
+                "metadata": {"evaluation_run_id": str(self.evaluation_run.id), "test_case_id": test_case_id}
+            }
+            for test_case_id, user_task, assistant_task in batch
+        ])
+        
+        for test_case_id, _, assistant_task in batch:
+            task_id = str(assistant_task.id)
+            if task_id in failed:
+                logger.error(f"Error queueing {phase} task {task_id} for test case {test_case_id}: {failed[task_id]}")
+                await self._update_test_case_status(test_case_id, TestCaseRunStatus.FAILED,
+                                                  error_message=f"Failed to create {phase} task: {failed[task_id]}")
+            else:
+                # Track completion once the task is queued
+                self._outstanding[task_id] = (test_case_id, phase)
         
-        while poll_count < max_polls:
+        logger.info(f"Queued {len(batch) - len(failed)} {phase} tasks for evaluation run {self.evaluation_run.id}")
+    
+    async def _open_completions_stream(self):
+        """Start following the task completions stream, if Redis is available"""
+        # Import here to avoid circular imports
+        from app.api.routes.tasks import get_redis_client
+        
+        try:
+            self._redis = await get_redis_client()
+            if self._redis is not None:
+                self._completions_cursor = await latest_task_completion_id(self._redis)
+        except Exception as e:
+            logger.warning(f"Task completion events unavailable, polling instead: {e}")
+            self._redis = None
+    
+    async def _process_results(self):
+        """Process task completions until every test case is finished"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + EVALUATION_TIMEOUT_SECONDS
+        # None means every outstanding task is checked
+        finished: Optional[Set[str]] = None
+        
+        while True:
             try:
-                # Check target task completion
-                await self._check_target_task_completion()
-                
-                # Check grader task completion
-                await self._check_grader_task_completion()
+                await self._process_finished_tasks(finished)
+                await self._dispatch_pending_targets()
+                await self._flush_test_case_updates()
                 
                 # Check if evaluation is complete
                 if await self._is_evaluation_complete():
                     await self._finalize_evaluation()
-                    break
+                    return
+                
+                if loop.time() >= deadline:
+                    await self._mark_evaluation_failed("Evaluation timed out")
+                    return
                 
-                # Wait before next poll
-                await asyncio.sleep(1)
-                poll_count += 1
+                finished = await self._wait_for_finished_tasks(deadline)
                 
             except Exception as e:
-                logger.error(f"Error in polling loop: {e}")
+                logger.error(f"Error processing evaluation results: {e}")
                 await self._mark_evaluation_failed(str(e))
-                break
+                return
+    
+    async def _wait_for_finished_tasks(self, deadline: float) -> Optional[Set[str]]:
+        """
+        Wait until outstanding tasks finish.
+        
+        Returns:
+            IDs of the finished tasks, or None when all outstanding tasks should be
+            re-checked (reconcile interval elapsed, or Redis is unavailable)
+        """
+        if self._redis is None:
+            await asyncio.sleep(EVALUATION_POLL_SECONDS)
+            return None
+        
+        loop = asyncio.get_running_loop()
+        reconcile_at = min(loop.time() + EVALUATION_RECONCILE_SECONDS, deadline)
+        
+        while loop.time() < reconcile_at:
+            try:
+                self._completions_cursor, completions = await read_task_completions(
+                    self._redis, self._completions_cursor
+                )
+            except Exception as e:
+                logger.warning(f"Failed to read task completions, re-checking tasks: {e}")
+                await asyncio.sleep(EVALUATION_POLL_SECONDS)
+                return None
+            
+            finished = {task_id for task_id in completions if task_id in self._outstanding}
+            if finished:
+                return finished
         
-        if poll_count >= max_polls:
-            await self._mark_evaluation_failed("Evaluation timed out")
+        return None
     
-    async def _check_target_task_completion(self):
-        """Check for completed target agent tasks"""
-        for test_case_id, task_id in self.target_tasks.items():
-            if not task_id:
-                continue
-                
-            # Get current test case status
-            current_result = await self._get_test_case_result(test_case_id)
-            if current_result["status"] != TestCaseRunStatus.RUNNING_TARGET.value:
-                continue
+    async def _process_finished_tasks(self, task_ids: Optional[Set[str]]):
+        """Fetch finished target and grader tasks in one query and advance their test cases"""
+        if task_ids is None:
+            task_ids = set(self._outstanding)
+        task_ids = [task_id for task_id in task_ids if task_id in self._outstanding]
+        if not task_ids:
+            return
+        
+        tasks = await Task.find({
+            "_id": {"$in": task_ids},
+            "status": {"$in": list(TERMINAL_TASK_STATUSES)}
+        }).to_list()
+        
+        now = asyncio.get_running_loop().time()
+        completed_targets = []
+        for task in tasks:
+            test_case_id, phase = self._outstanding.pop(str(task.id))
             
-            # Check if task is completed
-            task = await Task.get(task_id)
-            if task and task.status == TaskStatus.COMPLETED:
-                logger.info(f"Target task {task_id} completed for test case {test_case_id}")
+            if task.status != TaskStatus.COMPLETED:
+                logger.info(f"{phase.capitalize()} task {task.id} {task.status.value} for test case {test_case_id}")
+                await self._update_test_case_status(test_case_id, TestCaseRunStatus.FAILED,
+                                                  error_message=f"{phase.capitalize()} task {task.status.value}")
+            elif phase == TARGET_PHASE:
+                logger.info(f"Target task {task.id} completed for test case {test_case_id}")
+                self._timings.get(test_case_id, {})["target_done"] = now
+                completed_targets.append((test_case_id, task.content))
+            else:
+                logger.info(f"Grader task {task.id} completed for test case {test_case_id}")
+                
+                # Parse score from grader response
+                score = self._parse_score_from_response(task.content)
                 
-                # Create grader task
-                await self._create_grader_task(test_case_id, task.content)
+                # Update test case as completed
+                await self._update_test_case_status(test_case_id, TestCaseRunStatus.COMPLETED,
+                                                  grader_response=task.content,
+                                                  score=score,
+                                                  completed_at=datetime.utcnow())
+        
+        # Create grader tasks
+        await self._create_grader_tasks(completed_targets)
     
-    async def _create_grader_task(self, test_case_id: str, target_response: str):
-        """Create grading task for a completed target response"""
-        try:
-            # Find the test case
-            test_case = next((tc for tc in self.test_cases if tc.get("id") == test_case_id), None)
-            if not test_case:
-                raise ValueError(f"Test case {test_case_id} not found")
-            
-            # Create grading prompt
-            grading_prompt = self._create_grading_prompt(
-                task=test_case["task"],
-                expected_output=test_case["expected_output"],
-                actual_output=target_response,
-                evaluation_guideline=test_case["evaluation_guideline"],
-                criteria=self.criteria
-            )
-            
-            # Create user task for grading agent
-            user_task = Task(
-                agent_id=self.evaluation_run.grading_agent_id,
-                project_id=self.evaluation_run.grading_agent_project_id,
-                role=TaskRole.USER,
-                content=grading_prompt,
-                status=TaskStatus.QUEUED,
-                metadata={"evaluation_run_id": str(self.evaluation_run.id), "test_case_id": test_case_id}
-            )
-            await user_task.save()
+    async def _create_grader_tasks(self, completed_targets: List[Tuple[str, str]]):
+        """Create and queue grading tasks for completed target responses in one batch"""
+        batch = []
+        for test_case_id, target_response in completed_targets:
+            try:
+                # Find the test case
+                test_case = self._test_cases_by_id.get(test_case_id)
+                if not test_case:
+                    raise ValueError(f"Test case {test_case_id} not found")
+                
+                # Create grading prompt
+                grading_prompt = self._create_grading_prompt(
+                    task=test_case["task"],
+                    expected_output=test_case["expected_output"],
+                    actual_output=target_response,
+                    evaluation_guideline=test_case["evaluation_guideline"],
+                    criteria=self.criteria
+                )
+            except Exception as e:
+                logger.error(f"Error creating grader task for test case {test_case_id}: {e}")
+                await self._update_test_case_status(test_case_id, TestCaseRunStatus.FAILED,
+                                                  error_message=f"Failed to create grader task: {str(e)}")
+                continue
             
-            # Create assistant task
-            assistant_task = Task(
-                agent_id=self.evaluation_run.grading_agent_id,
-                project_id=self.evaluation_run.grading_agent_project_id,
-                role=TaskRole.ASSISTANT,
-                content="",
-                status=TaskStatus.QUEUED,
-                related_task_id=str(user_task.id),
-                metadata={"evaluation_run_id": str(self.evaluation_run.id), "test_case_id": test_case_id}
+            user_task, assistant_task = self._build_task_pair(
+                self.evaluation_run.grading_agent_id,
+                self.evaluation_run.grading_agent_project_id,
+                test_case_id,
+                grading_prompt
             )
-            await assistant_task.save()
-            
+            batch.append((test_case_id, user_task, assistant_task, target_response))
+        
+        if not batch:
+            return
+        
+        try:
+            await Task.insert_many([task for _, user_task, assistant_task, _ in batch
+                                    for task in (user_task, assistant_task)])
+        except Exception as e:
+            logger.error(f"Error creating grader tasks for evaluation run {self.evaluation_run.id}: {e}")
+            for test_case_id, _, _, target_response in batch:
+                await self._update_test_case_status(test_case_id, TestCaseRunStatus.FAILED,
+                                                  target_response=target_response,
+                                                  error_message=f"Failed to create grader task: {str(e)}")
+            return
+        
+        now = asyncio.get_running_loop().time()
+        for test_case_id, _, assistant_task, target_response in batch:
             # Store grader task ID
             self.grader_tasks[test_case_id] = str(assistant_task.id)
+            self._timings.get(test_case_id, {})["grader_queued"] = now
             
             # Update test case status
             await self._update_test_case_status(test_case_id, TestCaseRunStatus.RUNNING_GRADER,
                                               target_response=target_response,
                                               grader_task_id=str(assistant_task.id))
-            
-            # Queue the grading task
-            await queue_agent_task(
-                task_id=str(user_task.id),
-                assistant_task_id=str(assistant_task.id),
-                agent_id=self.evaluation_run.grading_agent_id,
-                project_id=self.evaluation_run.grading_agent_project_id,
-                content=grading_prompt,
-                metadata={"evaluation_run_id": str(self.evaluation_run.id), "test_case_id": test_case_id}
-            )
-            
-            logger.info(f"Created grader task {assistant_task.id} for test case {test_case_id}")
-            
-        except Exception as e:
-            logger.error(f"Error creating grader task for test case {test_case_id}: {e}")
-            await self._update_test_case_status(test_case_id, TestCaseRunStatus.FAILED,
-                                              error_message=f"Failed to create grader task: {str(e)}")
-    
-    async def _check_grader_task_completion(self):
-        """Check for completed grader tasks"""
-        for test_case_id, task_id in self.grader_tasks.items():
-            if not task_id:
-                continue
-                
-            # Get current test case status
-            current_result = await self._get_test_case_result(test_case_id)
-            if current_result["status"] != TestCaseRunStatus.RUNNING_GRADER.value:
-                continue
-            
-            # Check if grader task is completed
-            task = await Task.get(task_id)
-            if task and task.status == TaskStatus.COMPLETED:
-                logger.info(f"Grader task {task_id} completed for test case {test_case_id}")
-                
-                # Parse score from grader response
-                score = self._parse_score_from_response(task.content)
-                
-                # Update test case as completed
-                await self._update_test_case_status(test_case_id, TestCaseRunStatus.COMPLETED,
-                                                  grader_response=task.content,
-                                                  score=score,
-                                                  completed_at=datetime.utcnow())
+        
+        await self._queue_tasks([entry[:3] for entry in batch], GRADER_PHASE)
     
     def _create_grading_prompt(self, task: str, expected_output: str, actual_output: str, 
                              evaluation_guideline: str, criteria: str) -> str:
@@ -303,30 +439,40 @@ Please provide your evaluation now."""
             return None
     
     async def _update_test_case_status(self, test_case_id: str, status: TestCaseRunStatus, **kwargs):
-        """Update test case status in the evaluation run"""
-        # Find and update the test case result
-        for i, result in enumerate(self.evaluation_run.test_case_results):
-            if result["test_case_id"] == test_case_id:
-                self.evaluation_run.test_case_results[i]["status"] = status.value
-                
-                # Update additional fields
-                for key, value in kwargs.items():
-                    if value is not None:
-                        if key == "completed_at" and isinstance(value, datetime):
-                            self.evaluation_run.test_case_results[i][key] = value
-                        else:
-                            self.evaluation_run.test_case_results[i][key] = value
-                
-                # Update the database
-                await self.evaluation_run.update({"$set": {"test_case_results": self.evaluation_run.test_case_results}})
-                break
+        """Update a test case result in memory and queue the change for the next bulk write"""
+        # A finished test case frees its slot in the concurrency budget
+        if status in (TestCaseRunStatus.COMPLETED, TestCaseRunStatus.FAILED) and test_case_id in self._in_flight:
+            self._in_flight.discard(test_case_id)
+            self._timings[test_case_id]["done"] = asyncio.get_running_loop().time()
+        
+        result = self._results.get(test_case_id)
+        if result is None:
+            return
+        
+        # None values leave existing fields untouched
+        fields = {"status": status.value}
+        fields.update({key: value for key, value in kwargs.items() if value is not None})
+        
+        result.update(fields)
+        self._pending_updates.setdefault(test_case_id, {}).update(fields)
+        
+        if len(self._pending_updates) >= EVALUATION_WRITE_BATCH_SIZE:
+            await self._flush_test_case_updates()
     
-    async def _get_test_case_result(self, test_case_id: str) -> Dict[str, Any]:
-        """Get current test case result"""
-        for result in self.evaluation_run.test_case_results:
-            if result["test_case_id"] == test_case_id:
-                return result
-        return {}
+    async def _flush_test_case_updates(self):
+        """Write pending test case changes with one positional update per test case"""
+        if not self._pending_updates:
+            return
+        
+        pending, self._pending_updates = self._pending_updates, {}
+        operations = [
+            UpdateOne(
+                {"_id": self.evaluation_run.id, "test_case_results.test_case_id": test_case_id},
+                {"$set": {f"test_case_results.$.{key}": value for key, value in fields.items()}}
+            )
+            for test_case_id, fields in pending.items()
+        ]
+        await EvaluationRun.get_motor_collection().bulk_write(operations, ordered=False)
     
     async def _is_evaluation_complete(self) -> bool:
         """Check if all test cases are completed or failed"""
@@ -338,6 +484,8 @@ Please provide your evaluation now."""
     
     async def _finalize_evaluation(self):
         """Calculate final scores and mark evaluation as complete"""
+        await self._flush_test_case_updates()
+        
         completed_count = 0
         failed_count = 0
         total_score = 0.0
@@ -360,6 +508,7 @@ Please provide your evaluation now."""
         self.evaluation_run.completed_test_cases = completed_count
         self.evaluation_run.failed_test_cases = failed_count
         self.evaluation_run.overall_score = overall_score
+        self.evaluation_run.metrics = self._run_metrics()
         self.evaluation_run.completed_at = datetime.utcnow()
         
         await self.evaluation_run.update({"$set": {
@@ -367,26 +516,91 @@ Please provide your evaluation now."""
             "completed_test_cases": completed_count,
             "failed_test_cases": failed_count,
             "overall_score": overall_score,
+            "metrics": self.evaluation_run.metrics,
             "completed_at": self.evaluation_run.completed_at
         }})
         
         logger.info(f"Evaluation run {self.evaluation_run.id} completed. Score: {overall_score}, "
-                   f"Completed: {completed_count}, Failed: {failed_count}")
+                   f"Completed: {completed_count}, Failed: {failed_count}, Metrics: {self.evaluation_run.metrics}")
     
     async def _mark_evaluation_failed(self, error_message: str):
         """Mark evaluation as failed"""
+        try:
+            await self._flush_test_case_updates()
+        except Exception as e:
+            logger.error(f"Failed to write test case results for evaluation run {self.evaluation_run.id}: {e}")
+        
+        try:
+            await self._cancel_pending_targets()
+        except Exception as e:
+            logger.error(f"Failed to cancel unqueued tasks for evaluation run {self.evaluation_run.id}: {e}")
+        
         self.evaluation_run.status = EvaluationRunStatus.FAILED
         self.evaluation_run.error_message = error_message
+        self.evaluation_run.metrics = self._run_metrics()
         self.evaluation_run.completed_at = datetime.utcnow()
         
         await self.evaluation_run.update({"$set": {
             "status": self.evaluation_run.status.value,
             "error_message": error_message,
+            "metrics": self.evaluation_run.metrics,
             "completed_at": self.evaluation_run.completed_at
         }})
         
         logger.error(f"Evaluation run {self.evaluation_run.id} failed: {error_message}")
 
+    
+    async def _cancel_pending_targets(self):
+        """Cancel inserted target tasks that were never queued, so they do not count as active"""
+        if not self._pending_targets:
+            return
+        
+        task_ids = [str(task.id) for _, user_task, assistant_task in self._pending_targets
+                    for task in (user_task, assistant_task)]
+        self._pending_targets.clear()
+        await Task.get_motor_collection().update_many(
+            {"_id": {"$in": task_ids}},
+            {"$set": {"status": TaskStatus.CANCELLED.value, "updated_at": datetime.utcnow()}}
+        )
+    
+    def _run_metrics(self) -> Dict[str, Any]:
+        """Summarize throughput and per test case latency of this run"""
+        now = asyncio.get_running_loop().time()
+        duration = now - self._started
+        
+        latencies = []
+        target_latencies = []
+        grader_latencies = []
+        for timing in self._timings.values():
+            if "done" in timing:
+                latencies.append(timing["done"] - timing["queued"])
+            if "target_done" in timing:
+                target_latencies.append(timing["target_done"] - timing["queued"])
+            if "grader_queued" in timing and "done" in timing:
+                grader_latencies.append(timing["done"] - timing["grader_queued"])
+        latencies.sort()
+        
+        def average(values: List[float]) -> Optional[float]:
+            return round(sum(values) / len(values), 3) if values else None
+        
+        def percentile(values: List[float], fraction: float) -> Optional[float]:
+            if not values:
+                return None
+            return round(values[min(len(values) - 1, int(fraction * len(values)))], 3)
+        
+        return EvaluationRunMetrics(
+            max_concurrency=self.max_concurrency,
+            startup_seconds=round(self._first_queued - self._started, 3) if self._first_queued is not None else None,
+            duration_seconds=round(duration, 3),
+            finished_test_cases=len(latencies),
+            test_cases_per_minute=round(len(latencies) * 60 / duration, 3) if duration > 0 else None,
+            avg_latency_seconds=average(latencies),
+            p50_latency_seconds=percentile(latencies, 0.5),
+            p95_latency_seconds=percentile(latencies, 0.95),
+            avg_target_seconds=average(target_latencies),
+            avg_grader_seconds=average(grader_latencies)
+        ).model_dump()
+
 
 async def start_evaluation_orchestration(evaluation_run_id: str):
     """Start evaluation orchestration in the background"""
@@ -0,0 +1,287 @@
+"""
+Storage of folder upload file entries.
+
+Each file of a folder upload is a document in the folder_files collection,
+unique per (upload_id, relative_path). FolderUpload keeps total_files and
+total_size current with $inc as entries are added or removed, so lookups,
+listings and totals never load or rewrite every entry of a folder.
+
+Uploads created before this layout keep their entries embedded in
+FolderUpload.files until first accessed, when migrate_embedded_files moves
+them over.
+
+Direct uploads create their entries at init from the declared manifest;
+verify_direct_upload checks them against what the client stored in S3.
+"""
+import asyncio
+import base64
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
+
+from app.models.folder_upload import FolderFile, FolderUpload
+from app.utils.s3_utils import complete_presigned_multipart_upload, list_folder_files
+
+logger = logging.getLogger(__name__)
+
+# Mongo error code for duplicate keys
+DUPLICATE_KEY_ERROR = 11000
+
+
+def encode_path_cursor(relative_path: str) -> str:
+    """Build an opaque cursor pointing after a file path."""
+    return base64.urlsafe_b64encode(relative_path.encode()).decode().rstrip("=")
+
+
+def decode_path_cursor(cursor: str) -> str:
+    """Decode a path cursor; raises a 400 if it is malformed."""
+    try:
+        return base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def path_query(upload_id: str, path: Optional[str] = None, recursive: bool = True) -> Dict[str, Any]:
+    """
+    Filter for the files of an upload under a directory path.
+
+    Args:
+        upload_id: The folder upload ID
+        path: Directory (or file) path; None or "" for the whole upload
+        recursive: Include files in subdirectories; otherwise only direct children
+
+    Returns:
+        A Mongo filter served by the upload_relative_path or upload_parent_path index
+    """
+    path = (path or "").strip("/")
+    if not recursive:
+        return {"upload_id": upload_id, "parent_path": path}
+    if not path:
+        return {"upload_id": upload_id}
+    # Anchored prefix regexes use the index
+    return {"upload_id": upload_id, "$or": [
+        {"relative_path": path},
+        {"relative_path": {"$regex": f"^{re.escape(path)}/"}},
+    ]}
+
+
+async def path_totals(query: Dict[str, Any]) -> Tuple[int, int]:
+    """Number of files and total bytes matching a filter."""
+    results = await FolderFile.get_motor_collection().aggregate([
+        {"$match": query},
+        {"$group": {"_id": None, "count": {"$sum": 1}, "size": {"$sum": "$file_size"}}},
+    ]).to_list(length=1)
+    if not results:
+        return 0, 0
+    return results[0]["count"], results[0]["size"]
+
+
+async def list_subdirectories(upload_id: str, path: Optional[str] = None) -> List[str]:
+    """Names of the directories directly below a path."""
+    path = (path or "").strip("/")
+    query: Dict[str, Any] = {"upload_id": upload_id}
+    query["parent_path"] = {"$regex": f"^{re.escape(path)}/"} if path else {"$ne": ""}
+    parents = await FolderFile.get_motor_collection().distinct("parent_path", query)
+
+    offset = len(path) + 1 if path else 0
+    return sorted({parent[offset:].split("/", 1)[0] for parent in parents})
+
+
+async def migrate_embedded_files(folder_upload: FolderUpload) -> None:
+    """Move file entries embedded in a legacy FolderUpload into folder_files."""
+    if not folder_upload.files:
+        return
+
+    # Legacy uploads could hold the same path twice; the last upload won in S3
+    latest = {entry.relative_path: entry for entry in folder_upload.files}
+    documents = [
+        FolderFile(
+            id=entry.id,
+            upload_id=folder_upload.id,
+            relative_path=entry.relative_path,
+            filename=entry.filename,
+            file_extension=entry.file_extension,
+            file_size=entry.file_size,
+            content_type=entry.content_type,
+            s3_key=entry.s3_key,
+            s3_url=entry.s3_url,
+            depth=entry.depth,
+            parent_path=entry.parent_path,
+            checksum=entry.checksum,
+            created_at=entry.created_at,
+            updated_at=entry.created_at,
+        )
+        for entry in latest.values()
+    ]
+
+    try:
+        await FolderFile.insert_many(documents, ordered=False)
+    except BulkWriteError as e:
+        # Another request migrated the same upload concurrently
+        if any(error.get("code") != DUPLICATE_KEY_ERROR for error in e.details.get("writeErrors", [])):
+            raise
+
+    folder_upload.files = []
+    folder_upload.total_files = len(documents)
+    folder_upload.total_size = sum(document.file_size for document in documents)
+    folder_upload.max_depth = max(document.depth for document in documents)
+    await FolderUpload.get_motor_collection().update_one(
+        {"_id": folder_upload.id},
+        {"$set": {
+            "files": [],
+            "total_files": folder_upload.total_files,
+            "total_size": folder_upload.total_size,
+            "max_depth": folder_upload.max_depth,
+        }}
+    )
+    logger.info(f"Moved {len(documents)} embedded file entries of folder upload {folder_upload.id} to folder_files")
+
+
+async def add_folder_files(folder_upload: FolderUpload, entries: List[FolderFile]) -> None:
+    """
+    Store new file entries, replacing entries with the same path, and update the upload's totals.
+
+    Every entry is upserted by (upload_id, relative_path), so a replaced path is
+    never missing from listings and concurrent batches carrying the same path
+    both succeed, the later write winning. A replaced entry keeps its ID, which
+    is set on the given entry.
+
+    Args:
+        folder_upload: The folder upload the files belong to
+        entries: New entries; for a path given twice the last one is kept
+    """
+    entries = list({entry.relative_path: entry for entry in entries}.values())
+    if not entries:
+        return
+
+    collection = FolderFile.get_motor_collection()
+
+    async def store(entry: FolderFile) -> Optional[Dict[str, Any]]:
+        document = entry.model_dump(by_alias=True)
+        entry_id = document.pop("_id")
+        created_at = document.pop("created_at")
+        previous = await collection.find_one_and_update(
+            {"upload_id": entry.upload_id, "relative_path": entry.relative_path},
+            {"$set": document, "$setOnInsert": {"_id": entry_id, "created_at": created_at}},
+            projection={"file_size": 1},
+            upsert=True,
+            return_document=ReturnDocument.BEFORE,
+        )
+        if previous:
+            entry.id = previous["_id"]
+        return previous
+
+    results = await asyncio.gather(*(store(entry) for entry in entries), return_exceptions=True)
+    # Totals count every entry that was stored, even when others failed
+    errors = [result for result in results if isinstance(result, BaseException)]
+    stored = [entry for entry, result in zip(entries, results) if not isinstance(result, BaseException)]
+    replaced = [result for result in results if isinstance(result, dict)]
+
+    if stored:
+        await _update_totals(folder_upload, stored, replaced)
+    if errors:
+        raise errors[0]
+
+
+async def _update_totals(folder_upload: FolderUpload, stored: List[FolderFile], replaced: List[Dict[str, Any]]) -> None:
+    """Add stored entries to the upload's totals, less the entries they replaced."""
+    updated = await FolderUpload.get_motor_collection().find_one_and_update(
+        {"_id": folder_upload.id},
+        {
+            "$inc": {
+                "total_files": len(stored) - len(replaced),
+                "total_size": sum(entry.file_size for entry in stored) - sum(document["file_size"] for document in replaced),
+            },
+            "$max": {"max_depth": max(entry.depth for entry in stored)},
+            "$set": {"updated_at": datetime.now(timezone.utc)},
+        },
+        projection={"total_files": 1, "total_size": 1, "max_depth": 1},
+        return_document=ReturnDocument.AFTER,
+    )
+    if updated:
+        folder_upload.total_files = updated["total_files"]
+        folder_upload.total_size = updated["total_size"]
+        folder_upload.max_depth = updated["max_depth"]
+
+
+async def remove_folder_file(folder_upload: FolderUpload, file_entry: FolderFile) -> bool:
+    """
+    Delete a file entry and update the upload's totals.
+
+    Returns:
+        False if the entry was already deleted by another request
+    """
+    result = await FolderFile.get_motor_collection().delete_one({"_id": file_entry.id})
+    if not result.deleted_count:
+        return False
+
+    updated = await FolderUpload.get_motor_collection().find_one_and_update(
+        {"_id": folder_upload.id},
+        {
+            "$inc": {"total_files": -1, "total_size": -file_entry.file_size},
+            "$set": {"updated_at": datetime.now(timezone.utc)},
+        },
+        projection={"total_files": 1, "total_size": 1},
+        return_document=ReturnDocument.AFTER,
+    )
+    if updated:
+        folder_upload.total_files = updated["total_files"]
+        folder_upload.total_size = updated["total_size"]
+    return True
+
+
+async def delete_folder_files(upload_id: str) -> int:
+    """Delete all file entries of an upload; returns the number deleted."""
+    result = await FolderFile.get_motor_collection().delete_many({"upload_id": upload_id})
+    return result.deleted_count
+
+
+async def verify_direct_upload(folder_upload: FolderUpload) -> List[Dict[str, str]]:
+    """
+    Check the files of a direct upload against S3.
+
+    Open multipart uploads are completed first, but only once all their parts
+    are there; incomplete ones stay open for the client to finish. Then one
+    listing of the upload's prefix gives the stored size of every file.
+    Checksums need no per-file HEAD: S3 only accepts a presigned PUT whose body
+    matches the signed checksum, and multipart files are recorded without one.
+
+    Returns:
+        Problems as {"path", "error"}; empty when every file is stored with its declared size
+    """
+    entries = await FolderFile.find({"upload_id": folder_upload.id}).to_list()
+
+    multipart = [entry for entry in entries if entry.multipart_upload_id]
+    if multipart:
+        completed = await asyncio.gather(*(
+            complete_presigned_multipart_upload(entry.s3_key, entry.multipart_upload_id, entry.file_size)
+            for entry in multipart
+        ))
+        completed_ids = [entry.id for entry, done in zip(multipart, completed) if done]
+        if completed_ids:
+            await FolderFile.get_motor_collection().update_many(
+                {"_id": {"$in": completed_ids}},
+                {"$set": {"multipart_upload_id": None}}
+            )
+
+    stored = {
+        obj["s3_key"]: obj["size"]
+        for obj in await list_folder_files(folder_upload.project_id, folder_upload.id)
+    }
+
+    problems = []
+    for entry in entries:
+        size = stored.get(entry.s3_key)
+        if size is None:
+            problems.append({"path": entry.relative_path, "error": "File was not uploaded"})
+        elif size != entry.file_size:
+            problems.append({
+                "path": entry.relative_path,
+                "error": f"Uploaded {size} bytes, expected {entry.file_size}",
+            })
+    return problems
@@ -0,0 +1,117 @@
+"""
+Shared HTTP clients for downstream services.
+
+One httpx.AsyncClient per downstream service is created in the FastAPI lifespan
+and reused by every request, so chat turns and cache invalidations reuse
+keep-alive connections instead of paying for a new pool, DNS lookup and TCP/TLS
+handshake each time. Timeouts are set per call, since a streaming agent turn
+and a cache invalidation have very different budgets.
+"""
+import logging
+import os
+from typing import Any, Dict
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    # HTTP/2 needs the h2 package; clients fall back to HTTP/1.1 keep-alive
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+AGENT_SERVICE_URL = os.getenv("AGENT_SERVICE_URL", "http://localhost:8083")
+
+# Pool sizing applied to each downstream client
+HTTP_POOL_MAX_CONNECTIONS = int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", "100"))
+HTTP_POOL_MAX_KEEPALIVE = int(os.getenv("HTTP_POOL_MAX_KEEPALIVE", "20"))
+HTTP_POOL_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_POOL_KEEPALIVE_EXPIRY", "30"))  # seconds
+
+# Per-route timeouts
+# A streamed agent turn may stay silent for a long time while tools run
+AGENT_STREAM_TIMEOUT = httpx.Timeout(connect=5.0, read=300.0, write=30.0, pool=10.0)
+AGENT_CONTROL_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+AGENT_SERVICE = "agent_service"
+MCP_SERVERS = "mcp_servers"
+
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def _create_client(base_url: str = "") -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=base_url,
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=HTTP_POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_POOL_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_POOL_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(30.0, connect=5.0),
+    )
+
+
+def start_http_clients() -> None:
+    """Create the shared downstream clients. Called from the application lifespan."""
+    _clients.setdefault(AGENT_SERVICE, _create_client(AGENT_SERVICE_URL))
+    # Internal MCP servers live on several hosts; the pool keeps connections per host
+    _clients.setdefault(MCP_SERVERS, _create_client())
+    logger.info(f"Started shared HTTP clients: {list(_clients)} (http2={HTTP2_AVAILABLE})")
+
+
+def get_http_client(service: str) -> httpx.AsyncClient:
+    """
+    Get the shared client for a downstream service.
+
+    Clients are created on first use if the lifespan has not started them
+    (e.g. in scripts or tests that use the routes directly).
+    """
+    client = _clients.get(service)
+    if client is None or client.is_closed:
+        start_http_clients()
+        client = _clients[service]
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close all shared clients. Called from the application lifespan."""
+    for service, client in list(_clients.items()):
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"Error closing HTTP client for {service}: {e}")
+    _clients.clear()
+
+
+def _pool_stats(client: httpx.AsyncClient) -> Dict[str, Any]:
+    # httpx does not expose pool metrics publicly; read them from the httpcore pool
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = list(getattr(pool, "connections", []) or [])
+
+    stats: Dict[str, Any] = {
+        "connections": len(connections),
+        "idle": sum(1 for connection in connections if connection.is_idle()),
+        "http2": sum(1 for connection in connections if "HTTP/2" in repr(connection)),
+        "max_connections": HTTP_POOL_MAX_CONNECTIONS,
+        "max_keepalive_connections": HTTP_POOL_MAX_KEEPALIVE,
+    }
+    stats["active"] = stats["connections"] - stats["idle"]
+
+    waiting = getattr(pool, "_requests", None)
+    if waiting is not None:
+        stats["requests_in_pool"] = len(waiting)
+    return stats
+
+
+def get_http_pool_stats() -> Dict[str, Any]:
+    """Connection pool usage per downstream service."""
+    stats: Dict[str, Any] = {}
+    for service, client in _clients.items():
+        try:
+            stats[service] = _pool_stats(client)
+        except Exception as e:
+            stats[service] = {"error": str(e)}
+    return stats
+
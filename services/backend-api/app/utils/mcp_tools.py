@@ -3,9 +3,12 @@ Utility functions for working with MCP servers and tools.
 This module provides shared functionality for connecting to and fetching tools from MCP servers.
 """
 from typing import List, Dict, Any, Optional
+import asyncio
 import logging
 from langchain_mcp_adapters.client import MultiServerMCPClient
 
+from app.utils.http_clients import MCP_SERVERS, get_http_client
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -73,3 +76,36 @@ async def fetch_tools_from_mcp_server(
     except Exception as e:
         logger.error(f"Error fetching tools from {server_name}: {str(e)}")
         return []
+
+
+async def invalidate_mcp_server_caches(project_id: str, server_urls: List[str], timeout: float = 2.0) -> None:
+    """Ask internal MCP servers to drop their cached data sources for a project
+
+    MCP servers cache each project's data sources for a short TTL. Calling this
+    after a data source changes makes the change visible immediately instead of
+    after the TTL expires. Failures are logged and otherwise ignored.
+
+    Parameters
+    ----------
+    project_id : str
+        The project whose cached data sources should be invalidated
+    server_urls : List[str]
+        Base URLs of the MCP servers to notify; empty entries are skipped
+    timeout : float
+        Per-request timeout in seconds
+    """
+    server_urls = [url.rstrip("/") for url in server_urls if url]
+    if not server_urls:
+        return
+
+    client = get_http_client(MCP_SERVERS)
+    results = await asyncio.gather(
+        *(client.post(f"{url}/cache/invalidate/{project_id}", timeout=timeout) for url in server_urls),
+        return_exceptions=True
+    )
+
+    for url, result in zip(server_urls, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to invalidate MCP cache at {url} for project {project_id}: {result}")
+        elif result.status_code != 200:
+            logger.warning(f"MCP cache invalidation at {url} for project {project_id} returned {result.status_code}")
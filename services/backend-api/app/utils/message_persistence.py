@@ -0,0 +1,281 @@
+"""
+Incremental persistence of streamed assistant messages.
+
+While a response streams, content blocks are written to Mongo as deltas: new
+blocks are $push-ed and blocks that changed since the last flush (the growing
+tail text block, a tool_use receiving its result) are $set by index. A final
+write stores the complete array when the stream ends.
+
+Every stream event is first appended to a write-ahead log in Redis. The Mongo
+document records how many events it reflects (`stream_wal_applied`), so after
+a backend restart the events received since the last flush can be replayed
+onto the stored blocks.
+"""
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+from app.models.message import Message, MessageStatus
+
+logger = logging.getLogger(__name__)
+
+# How long a write-ahead log is kept if its stream never finishes
+MESSAGE_WAL_TTL_SECONDS = int(os.getenv("MESSAGE_WAL_TTL_SECONDS", "86400"))
+# Lease held by the process streaming a message; logs without a lease are recovered
+MESSAGE_WAL_LEASE_SECONDS = int(os.getenv("MESSAGE_WAL_LEASE_SECONDS", "60"))
+
+ACTIVE_MESSAGE_STATUSES = (MessageStatus.PENDING.value, MessageStatus.PROCESSING.value)
+
+
+def message_wal_key(message_id: str) -> str:
+    return f"message_wal:{message_id}"
+
+
+def message_wal_lease_key(message_id: str) -> str:
+    return f"message_wal_lease:{message_id}"
+
+
+def apply_stream_event(content_blocks: List[Dict[str, Any]], event: Dict[str, Any]) -> Set[int]:
+    """
+    Apply one stream event to a content_blocks array in place.
+
+    Events are {"op": "text", "text"}, {"op": "block", "block"} or
+    {"op": "tool_result", "tool_id", "output", "is_error"}.
+
+    Returns:
+        Indexes of the blocks that were added or changed
+    """
+    op = event.get("op")
+
+    if op == "text":
+        # Fuse consecutive text blocks
+        if content_blocks and content_blocks[-1].get("type") == "text":
+            content_blocks[-1]["text"] += event.get("text", "")
+        else:
+            content_blocks.append({"type": "text", "text": event.get("text", "")})
+        return {len(content_blocks) - 1}
+
+    if op == "block":
+        content_blocks.append(event["block"])
+        return {len(content_blocks) - 1}
+
+    if op == "tool_result":
+        # Fuse the result into the matching tool_use block
+        for index, block in enumerate(content_blocks):
+            if block.get("type") == "tool_use" and block.get("id") == event.get("tool_id"):
+                block["output"] = event.get("output")
+                block["is_error"] = event.get("is_error", False)
+                return {index}
+        return set()
+
+    logger.warning(f"Ignoring unknown message stream event: {op}")
+    return set()
+
+
+class StreamedMessageWriter:
+    """Builds the content blocks of a streaming message and persists them incrementally."""
+
+    def __init__(self, message_id: str, redis_client: Optional[Any] = None):
+        """
+        Args:
+            message_id: ID of the assistant message being streamed
+            redis_client: Client for the write-ahead log (None disables it)
+        """
+        self.message_id = message_id
+        self.content_blocks: List[Dict[str, Any]] = []
+        self._redis = redis_client
+        self._persisted_count = 0
+        self._dirty: Set[int] = set()
+        self._applied = 0
+        self._lease_task: Optional[asyncio.Task] = None
+        self._finished = False
+
+    async def start(self, **fields: Any) -> None:
+        """Reset the stored blocks, set `fields` on the message and open the write-ahead log."""
+        await Message.get_motor_collection().update_one(
+            {"_id": self.message_id},
+            {"$set": {"content_blocks": [], "stream_wal_applied": 0, **fields}}
+        )
+
+        if self._redis is None:
+            return
+
+        try:
+            await self._redis.delete(message_wal_key(self.message_id))
+            await self._redis.set(message_wal_lease_key(self.message_id), "streaming", ex=MESSAGE_WAL_LEASE_SECONDS)
+            self._lease_task = asyncio.create_task(self._refresh_lease())
+        except Exception as e:
+            logger.warning(f"Write-ahead log disabled for message {self.message_id}: {e}")
+            self._redis = None
+
+    async def _refresh_lease(self) -> None:
+        while True:
+            await asyncio.sleep(MESSAGE_WAL_LEASE_SECONDS / 3)
+            try:
+                await self._redis.set(message_wal_lease_key(self.message_id), "streaming", ex=MESSAGE_WAL_LEASE_SECONDS)
+            except Exception as e:
+                logger.warning(f"Failed to refresh write-ahead log lease for message {self.message_id}: {e}")
+
+    async def record(self, event: Dict[str, Any]) -> None:
+        """Log a stream event to the write-ahead log, then apply it to the blocks."""
+        if self._redis is not None:
+            entry = json.dumps({"seq": self._applied, **event})
+            key = message_wal_key(self.message_id)
+            try:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    pipe.rpush(key, entry)
+                    pipe.expire(key, MESSAGE_WAL_TTL_SECONDS)
+                    await pipe.execute()
+            except Exception as e:
+                # A log with gaps cannot be replayed; recovery stops at the first missing seq
+                logger.warning(f"Write-ahead log disabled for message {self.message_id}: {e}")
+                await self._close_wal(delete=True)
+
+        self._dirty |= apply_stream_event(self.content_blocks, event)
+        self._applied += 1
+
+    async def flush(self) -> None:
+        """
+        Write blocks changed since the last flush in a single update.
+
+        New blocks are pushed; when existing blocks changed too, everything is
+        $set by index instead, because one update cannot $set and $push the
+        same array.
+        """
+        if not self._dirty:
+            return
+
+        changed = sorted(self._dirty)
+        set_fields: Dict[str, Any] = {
+            "stream_wal_applied": self._applied,
+            "updated_at": datetime.utcnow(),
+        }
+
+        if changed[0] >= self._persisted_count:
+            update = {
+                "$push": {"content_blocks": {"$each": [self.content_blocks[i] for i in changed]}},
+                "$set": set_fields,
+            }
+        else:
+            for index in changed:
+                set_fields[f"content_blocks.{index}"] = self.content_blocks[index]
+            update = {"$set": set_fields}
+
+        await Message.get_motor_collection().update_one({"_id": self.message_id}, update)
+        self._persisted_count = len(self.content_blocks)
+        self._dirty.clear()
+
+    async def finish(self, **fields: Any) -> None:
+        """Write the complete blocks together with `fields` and drop the write-ahead log."""
+        await Message.get_motor_collection().update_one(
+            {"_id": self.message_id},
+            {
+                "$set": {"content_blocks": self.content_blocks, "updated_at": datetime.utcnow(), **fields},
+                "$unset": {"stream_wal_applied": ""},
+            }
+        )
+        self._persisted_count = len(self.content_blocks)
+        self._dirty.clear()
+        self._finished = True
+        await self._close_wal(delete=True)
+
+    async def close(self) -> None:
+        """
+        Release the stream without a status change.
+
+        If finish() was not called, the blocks received so far are written
+        and the log is dropped, since nothing is lost.
+        """
+        if self._finished:
+            return
+        try:
+            await self.finish()
+        except Exception as e:
+            # Keep the log so the content can be recovered later
+            logger.warning(f"Failed to persist message {self.message_id} on close: {e}")
+            await self._close_wal(delete=False)
+
+    async def _close_wal(self, delete: bool) -> None:
+        if self._lease_task is not None:
+            self._lease_task.cancel()
+            self._lease_task = None
+
+        if self._redis is None:
+            return
+
+        redis_client, self._redis = self._redis, None
+        if not delete:
+            return
+        try:
+            await redis_client.delete(message_wal_key(self.message_id), message_wal_lease_key(self.message_id))
+        except Exception as e:
+            logger.warning(f"Failed to delete write-ahead log for message {self.message_id}: {e}")
+
+
+async def recover_interrupted_messages(redis_client: Any) -> int:
+    """
+    Replay write-ahead logs left by streams whose backend process died.
+
+    Logs still held by a live stream (lease present) are skipped. Recovered
+    messages get the replayed blocks and are marked failed, since the agent
+    response cannot be resumed.
+
+    Returns:
+        Number of messages recovered
+    """
+    if redis_client is None:
+        return 0
+
+    recovered = 0
+    collection = Message.get_motor_collection()
+
+    async for key in redis_client.scan_iter(match=message_wal_key("*"), count=100):
+        message_id = key.split(":", 1)[1]
+        lease_key = message_wal_lease_key(message_id)
+
+        # Claim the log; fails if a stream or another replica holds it
+        if not await redis_client.set(lease_key, "recovering", nx=True, ex=MESSAGE_WAL_LEASE_SECONDS):
+            continue
+
+        try:
+            document = await collection.find_one(
+                {"_id": message_id},
+                {"content_blocks": 1, "status": 1, "stream_wal_applied": 1}
+            )
+            if document and document.get("status") in ACTIVE_MESSAGE_STATUSES:
+                content_blocks = document.get("content_blocks") or []
+                applied = document.get("stream_wal_applied", 0)
+
+                for raw_entry in await redis_client.lrange(key, 0, -1):
+                    entry = json.loads(raw_entry)
+                    if entry["seq"] < applied:
+                        continue
+                    if entry["seq"] != applied:
+                        logger.warning(f"Write-ahead log for message {message_id} has a gap at {applied}")
+                        break
+                    apply_stream_event(content_blocks, entry)
+                    applied += 1
+
+                await collection.update_one(
+                    {"_id": message_id},
+                    {
+                        "$set": {
+                            "content_blocks": content_blocks,
+                            "status": MessageStatus.FAILED.value,
+                            "metadata.error": "Response interrupted by a backend restart",
+                            "updated_at": datetime.utcnow(),
+                        },
+                        "$unset": {"stream_wal_applied": ""},
+                    }
+                )
+                recovered += 1
+                logger.info(f"Recovered {applied} stream events for interrupted message {message_id}")
+
+            await redis_client.delete(key, lease_key)
+        except Exception as e:
+            logger.error(f"Failed to recover message {message_id} from write-ahead log: {e}")
+
+    return recovered
@@ -0,0 +1,94 @@
+"""
+Keyset pagination over (created_at, _id).
+
+List endpoints page with opaque cursors instead of skip: a cursor encodes the
+created_at and id of the last item of a page, and the next page is everything
+strictly before or after it. Combined with compound indexes ending in
+created_at/_id, deep pages cost the same as the first one.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+
+# Approximate totals stop counting at this many documents
+APPROXIMATE_TOTAL_LIMIT = 1000
+
+# Values of the total_mode query parameter
+TOTAL_MODE_PATTERN = "^(exact|approximate|none)$"
+
+
+def encode_cursor(created_at: datetime, document_id: Any) -> str:
+    """Build an opaque cursor pointing at a document."""
+    payload = json.dumps({"created_at": created_at.isoformat(), "id": str(document_id)})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor into (created_at, id); raises a 400 if it is malformed."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return datetime.fromisoformat(payload["created_at"]), str(payload["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def apply_cursors(query: Dict[str, Any], before: Optional[str] = None, after: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Restrict a Mongo filter to documents before and/or after the given cursors.
+
+    Args:
+        query: Base filter (must not already use $and)
+        before: Only documents older than this cursor
+        after: Only documents newer than this cursor
+
+    Returns:
+        A new filter
+    """
+    conditions = []
+    for cursor, operator in ((before, "$lt"), (after, "$gt")):
+        if not cursor:
+            continue
+        created_at, document_id = decode_cursor(cursor)
+        conditions.append({"$or": [
+            {"created_at": {operator: created_at}},
+            {"created_at": created_at, "_id": {operator: document_id}},
+        ]})
+
+    if not conditions:
+        return query
+    return {**query, "$and": conditions}
+
+
+def keyset_sort(direction: int) -> List[Tuple[str, int]]:
+    """Sort matching the cursor order; _id breaks created_at ties."""
+    return [("created_at", direction), ("_id", direction)]
+
+
+def next_cursor(documents: Sequence[Any], has_more: bool) -> Optional[str]:
+    """Cursor of the last document of a page, or None on the last page."""
+    if not has_more or not documents:
+        return None
+    last = documents[-1]
+    return encode_cursor(last.created_at, last.id)
+
+
+async def count_total(model: Any, query: Dict[str, Any], total_mode: str) -> Optional[int]:
+    """
+    Count the documents matching a list filter.
+
+    Args:
+        model: Beanie document class
+        query: Filter without cursor bounds
+        total_mode: "exact", "approximate" (stops at APPROXIMATE_TOTAL_LIMIT) or "none"
+
+    Returns:
+        The count, or None when total_mode is "none"
+    """
+    if total_mode == "none":
+        return None
+    if total_mode == "approximate":
+        return await model.get_motor_collection().count_documents(query, limit=APPROXIMATE_TOTAL_LIMIT)
+    return await model.find(query).count()
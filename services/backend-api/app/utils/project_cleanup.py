@@ -3,11 +3,26 @@ Project cleanup utilities for cascade deletion of project resources.
 
 This module handles the deletion of all resources associated with a project,
 including S3 objects and database documents.
+
+Deletion runs in stages. The steps of a stage touch independent collections
+(or S3 prefixes) and run concurrently; a stage starts only once the previous
+one finished, so child documents are deleted while the parent ids used to
+find them still exist. Parent ids are read with _id-only queries.
+
+Progress is recorded on the project's ProjectDeletion document: every
+finished step is stored there and skipped by later attempts. Each step
+deletes by filter, so repeating one is harmless. An attempt interrupted by a
+restart, or one that stopped at a failed step, is picked up again by
+resume_project_deletions when the service starts.
 """
 import os
+import asyncio
 import logging
-from typing import Dict, Any
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable, Awaitable
+from datetime import datetime, timedelta
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
 from app.models.agent import Agent
 from app.models.tasks import Task
@@ -18,29 +33,206 @@ from app.models.data_source import DataSource
 from app.models.playground import Playground, PlaygroundInvocation
 from app.models.workzone import WorkzoneInvocation
 from app.models.mcp_gateway import MCPGateway, MCPTool, ToolInvocation
+from app.models.conversation import Conversation
+from app.models.message import Message
+from app.models.folder_upload import FolderUpload, FolderFile
+from app.models.project import ProjectDeletion, ProjectDeletionStatus
 from app.utils.s3_utils import delete_objects_by_prefix
 
 logger = logging.getLogger(__name__)
 
+# How long an attempt owns a project deletion before another process may take it over
+PROJECT_DELETION_LEASE_SECONDS = int(os.getenv("PROJECT_DELETION_LEASE_SECONDS", "600"))
+
+# Attempts after which a deletion that keeps failing is no longer resumed
+PROJECT_DELETION_MAX_ATTEMPTS = int(os.getenv("PROJECT_DELETION_MAX_ATTEMPTS", "5"))
+
+
+async def _ids(model, query: Dict[str, Any]) -> List[str]:
+    """IDs of the documents matching a query, without loading the documents."""
+    return await model.get_motor_collection().distinct("_id", query)
+
+
+async def _delete(model, query: Dict[str, Any]) -> int:
+    result = await model.get_motor_collection().delete_many(query)
+    return result.deleted_count
+
+
+async def _delete_s3_prefix(bucket: str, prefix: str) -> int:
+    logger.info(f"Deleting S3 objects: s3://{bucket}/{prefix}")
+    result = await delete_objects_by_prefix(bucket, prefix)
+    if result["errors"]:
+        raise Exception(
+            f"{result['failed_count']} objects not deleted from s3://{bucket}/{prefix}: "
+            f"{'; '.join(result['errors'][:5])}"
+        )
+    return result["deleted_count"]
+
+
+async def _delete_audit_trails(project_id: str) -> int:
+    """Audit trails: s3://{TASK_AUDIT_TRAIL_S3_BUCKET_NAME}/{project_id.lower()}/"""
+    audit_bucket = os.environ.get('TASK_AUDIT_TRAIL_S3_BUCKET_NAME', 'chicory-agents-audit-trails')
+    return await _delete_s3_prefix(audit_bucket, f"{project_id.lower()}/")
+
+
+async def _delete_artifacts(project_id: str) -> int:
+    """Artifacts: s3://{S3_BUCKET_NAME}/artifacts/{project_id}/"""
+    s3_bucket = os.environ.get('S3_BUCKET_NAME')
+    if not s3_bucket:
+        logger.warning("S3_BUCKET_NAME not set, skipping artifacts deletion")
+        return 0
+    return await _delete_s3_prefix(s3_bucket, f"artifacts/{project_id}/")
+
+
+async def _delete_tool_invocations(project_id: str) -> int:
+    gateway_ids = await _ids(MCPGateway, {"project_id": project_id})
+    if not gateway_ids:
+        return 0
+    tool_ids = await _ids(MCPTool, {"gateway_id": {"$in": gateway_ids}})
+    if not tool_ids:
+        return 0
+    return await _delete(ToolInvocation, {"tool_id": {"$in": tool_ids}})
+
+
+async def _delete_mcp_tools(project_id: str) -> int:
+    gateway_ids = await _ids(MCPGateway, {"project_id": project_id})
+    if not gateway_ids:
+        return 0
+    return await _delete(MCPTool, {"gateway_id": {"$in": gateway_ids}})
+
+
+async def _delete_playground_invocations(project_id: str) -> int:
+    playground_ids = await _ids(Playground, {"project_id": project_id})
+    if not playground_ids:
+        return 0
+    return await _delete(PlaygroundInvocation, {"playground_id": {"$in": playground_ids}})
+
+
+async def _delete_tools(project_id: str) -> int:
+    agent_ids = await _ids(Agent, {"project_id": project_id})
+    if not agent_ids:
+        return 0
+    return await _delete(Tool, {"agent_id": {"$in": agent_ids}})
+
+
+async def _delete_messages(project_id: str) -> int:
+    # Through conversations, since messages are indexed by conversation_id
+    conversation_ids = await _ids(Conversation, {"project_id": project_id})
+    if not conversation_ids:
+        return 0
+    return await _delete(Message, {"conversation_id": {"$in": conversation_ids}})
+
+
+async def _delete_folder_files(project_id: str) -> int:
+    upload_ids = await _ids(FolderUpload, {"project_id": project_id})
+    if not upload_ids:
+        return 0
+    return await _delete(FolderFile, {"upload_id": {"$in": upload_ids}})
+
+
+def _delete_by_project(model) -> Callable[[str], Awaitable[int]]:
+    async def delete(project_id: str) -> int:
+        return await _delete(model, {"project_id": project_id})
+    return delete
+
+
+# Deletion steps by stage; a step may read ids from collections deleted in later stages
+DELETION_STAGES: List[Dict[str, Callable[[str], Awaitable[int]]]] = [
+    {
+        "s3_audit_trails": _delete_audit_trails,
+        "s3_artifacts": _delete_artifacts,
+        "tool_invocations": _delete_tool_invocations,
+        "playground_invocations": _delete_playground_invocations,
+        # Workzones are org-level, only delete invocations
+        "workzone_invocations": _delete_by_project(WorkzoneInvocation),
+        "tasks": _delete_by_project(Task),
+        "tools": _delete_tools,
+        "evaluation_runs": _delete_by_project(EvaluationRun),
+        "evaluations": _delete_by_project(Evaluation),
+        "training_jobs": _delete_by_project(Training),
+        "data_sources": _delete_by_project(DataSource),
+        "messages": _delete_messages,
+        "folder_files": _delete_folder_files,
+    },
+    {
+        "mcp_tools": _delete_mcp_tools,
+        "playgrounds": _delete_by_project(Playground),
+        "agents": _delete_by_project(Agent),
+        "conversations": _delete_by_project(Conversation),
+        "folder_uploads": _delete_by_project(FolderUpload),
+    },
+    {
+        "mcp_gateways": _delete_by_project(MCPGateway),
+    },
+]
+
+
+async def start_project_deletion(project_id: str) -> None:
+    """
+    Record that a project's resources are to be deleted.
+
+    Called before the project document is deleted, so the cleanup is resumed
+    even if the process stops before the background task runs.
+    """
+    await ProjectDeletion.get_motor_collection().update_one(
+        {"_id": project_id},
+        {"$setOnInsert": {
+            "status": ProjectDeletionStatus.RUNNING.value,
+            "steps": {},
+            "errors": [],
+            "attempts": 0,
+            "lease_expires_at": None,
+            "completed_at": None,
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+        }},
+        upsert=True
+    )
+
+
+async def _claim_project_deletion(project_id: str) -> Optional[Dict[str, Any]]:
+    """Take the lease on a project deletion; None if it is done or another process holds it."""
+    now = datetime.utcnow()
+    try:
+        return await ProjectDeletion.get_motor_collection().find_one_and_update(
+            {
+                "_id": project_id,
+                "status": {"$ne": ProjectDeletionStatus.COMPLETED.value},
+                "$or": [{"lease_expires_at": None}, {"lease_expires_at": {"$lt": now}}],
+            },
+            {
+                "$set": {
+                    "status": ProjectDeletionStatus.RUNNING.value,
+                    "errors": [],
+                    "lease_expires_at": now + timedelta(seconds=PROJECT_DELETION_LEASE_SECONDS),
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": 1},
+                "$setOnInsert": {"steps": {}, "completed_at": None, "created_at": now},
+            },
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+    except DuplicateKeyError:
+        return None
+
 
 async def cascade_delete_project_resources(project_id: str) -> Dict[str, Any]:
     """
     Delete all resources associated with a project.
-    
-    This function runs as a background task after the project document is deleted.
-    It handles:
+
+    This function runs as a background task after the project document is deleted,
+    and again at startup for deletions that did not finish. It handles:
     1. S3 objects under the project prefix (audit trails, uploaded files)
     2. All database documents associated with the project
-    
+
     Args:
         project_id: The ID of the project to clean up
-        
+
     Returns:
         Dict with deletion results and any errors
     """
-    logger.info(f"Starting cascade deletion for project {project_id}")
     started_at = datetime.utcnow()
-    
     results = {
         "project_id": project_id,
         "started_at": started_at.isoformat(),
@@ -48,283 +240,87 @@ async def cascade_delete_project_resources(project_id: str) -> Dict[str, Any]:
         "db_deletions": {},
         "errors": []
     }
-    
-    # 1. Delete S3 objects under project prefix
-    try:
-        s3_result = await _delete_project_s3_objects(project_id)
-        results["s3_deletion"] = s3_result
-        logger.info(f"S3 cleanup for project {project_id}: {s3_result}")
-    except Exception as e:
-        error_msg = f"S3 cleanup failed: {str(e)}"
-        logger.error(f"Project {project_id}: {error_msg}")
-        results["errors"].append(error_msg)
-    
-    # 2. Delete database resources in order (leaf to parent)
-    db_deletions = await _delete_project_db_resources(project_id)
-    results["db_deletions"] = db_deletions["deletions"]
-    results["errors"].extend(db_deletions["errors"])
-    
+
+    deletion = await _claim_project_deletion(project_id)
+    if deletion is None:
+        logger.info(f"Cascade deletion for project {project_id} is finished or in progress elsewhere")
+        results["status"] = "skipped"
+        return results
+
+    logger.info(f"Starting cascade deletion for project {project_id} (attempt {deletion['attempts']})")
+    collection = ProjectDeletion.get_motor_collection()
+    finished = dict(deletion.get("steps") or {})
+
+    async def run_step(name: str, step: Callable[[str], Awaitable[int]]) -> None:
+        try:
+            deleted = await step(project_id)
+        except Exception as e:
+            error_msg = f"{name} deletion failed: {str(e)}"
+            logger.error(f"Project {project_id}: {error_msg}")
+            results["errors"].append(error_msg)
+            return
+
+        finished[name] = {"deleted": deleted, "completed_at": datetime.utcnow()}
+        await collection.update_one(
+            {"_id": project_id},
+            {"$set": {f"steps.{name}": finished[name], "updated_at": datetime.utcnow()}}
+        )
+        logger.info(f"Project {project_id}: deleted {deleted} {name}")
+
+    for stage in DELETION_STAGES:
+        pending = {name: step for name, step in stage.items() if name not in finished}
+        await asyncio.gather(*(run_step(name, step) for name, step in pending.items()))
+        if results["errors"]:
+            # Later stages delete the parents needed to find what is left
+            break
+        await collection.update_one(
+            {"_id": project_id},
+            {"$set": {"lease_expires_at": datetime.utcnow() + timedelta(seconds=PROJECT_DELETION_LEASE_SECONDS)}}
+        )
+
+    for name, step_result in finished.items():
+        section = "s3_deletion" if name.startswith("s3_") else "db_deletions"
+        results[section][name] = step_result["deleted"]
+
     # Finalize results
     completed_at = datetime.utcnow()
     results["completed_at"] = completed_at.isoformat()
     results["duration_seconds"] = (completed_at - started_at).total_seconds()
-    results["status"] = "completed" if not results["errors"] else "partial"
-    
-    logger.info(f"Cascade deletion for project {project_id} completed in {results['duration_seconds']:.2f}s with status: {results['status']}")
-    
-    return results
+    status = ProjectDeletionStatus.PARTIAL if results["errors"] else ProjectDeletionStatus.COMPLETED
+    results["status"] = status.value
 
+    await collection.update_one(
+        {"_id": project_id},
+        {"$set": {
+            "status": status.value,
+            "errors": results["errors"],
+            "lease_expires_at": None,
+            "completed_at": completed_at if status == ProjectDeletionStatus.COMPLETED else None,
+            "updated_at": completed_at,
+        }}
+    )
+
+    logger.info(f"Cascade deletion for project {project_id} completed in {results['duration_seconds']:.2f}s with status: {results['status']}")
 
-async def _delete_project_s3_objects(project_id: str) -> Dict[str, Any]:
-    """
-    Delete all S3 objects under the project prefixes.
-    
-    Deletes objects at:
-    - s3://{TASK_AUDIT_TRAIL_S3_BUCKET_NAME}/{project_id.lower()}/  (audit trails)
-    - s3://{S3_BUCKET_NAME}/artifacts/{project_id}/  (artifacts)
-    
-    Args:
-        project_id: The project ID
-        
-    Returns:
-        Dict with deletion counts and status per prefix
-    """
-    results = {
-        "audit_trails": {},
-        "artifacts": {},
-        "total_deleted": 0,
-        "total_failed": 0,
-        "errors": []
-    }
-    
-    # 1. Delete audit trails: s3://{audit_bucket}/{project_id.lower()}/
-    audit_bucket = os.environ.get('TASK_AUDIT_TRAIL_S3_BUCKET_NAME', 'chicory-agents-audit-trails')
-    audit_prefix = f"{project_id.lower()}/"
-    
-    logger.info(f"Deleting S3 audit trails: s3://{audit_bucket}/{audit_prefix}")
-    
-    try:
-        audit_result = await delete_objects_by_prefix(audit_bucket, audit_prefix)
-        results["audit_trails"] = audit_result
-        results["total_deleted"] += audit_result.get("deleted_count", 0)
-        results["total_failed"] += audit_result.get("failed_count", 0)
-        results["errors"].extend(audit_result.get("errors", []))
-    except Exception as e:
-        error_msg = f"Audit trails deletion failed: {str(e)}"
-        results["errors"].append(error_msg)
-        logger.error(error_msg)
-    
-    # 2. Delete artifacts: s3://{s3_bucket}/artifacts/{project_id}/
-    s3_bucket = os.environ.get('S3_BUCKET_NAME')
-    if s3_bucket:
-        artifacts_prefix = f"artifacts/{project_id}/"
-        
-        logger.info(f"Deleting S3 artifacts: s3://{s3_bucket}/{artifacts_prefix}")
-        
-        try:
-            artifacts_result = await delete_objects_by_prefix(s3_bucket, artifacts_prefix)
-            results["artifacts"] = artifacts_result
-            results["total_deleted"] += artifacts_result.get("deleted_count", 0)
-            results["total_failed"] += artifacts_result.get("failed_count", 0)
-            results["errors"].extend(artifacts_result.get("errors", []))
-        except Exception as e:
-            error_msg = f"Artifacts deletion failed: {str(e)}"
-            results["errors"].append(error_msg)
-            logger.error(error_msg)
-    else:
-        logger.warning("S3_BUCKET_NAME not set, skipping artifacts deletion")
-    
     return results
 
 
-async def _delete_project_db_resources(project_id: str) -> Dict[str, Any]:
+async def resume_project_deletions() -> int:
     """
-    Delete all database resources associated with a project.
-    
-    Deletion order (leaf to parent to avoid orphans):
-    1. Tool Invocations (via MCP Tools)
-    2. MCP Tools (via Gateways)
-    3. MCP Gateways
-    4. Playground Invocations
-    5. Playgrounds
-    6. Workzone Invocations
-    7. Tasks
-    8. Tools (via Agents)
-    9. Evaluation Runs
-    10. Evaluations
-    11. Training Jobs
-    12. Data Sources
-    13. Agents
-    
-    Args:
-        project_id: The project ID
-        
+    Run the project deletions left unfinished by earlier attempts.
+
     Returns:
-        Dict with deletion counts per resource type and any errors
+        Number of deletions resumed
     """
-    deletions = {}
-    errors = []
-    
-    # Initialize ID lists to avoid NameError if early queries fail
-    gateway_ids = []
-    playground_ids = []
-    agent_ids = []
-    
-    # 1. Delete Tool Invocations via MCP Tools via Gateways
-    try:
-        gateways = await MCPGateway.find({"project_id": project_id}).to_list()
-        gateway_ids = [g.id for g in gateways]
-        
-        if gateway_ids:
-            mcp_tools = await MCPTool.find({"gateway_id": {"$in": gateway_ids}}).to_list()
-            tool_ids = [t.id for t in mcp_tools]
-            
-            if tool_ids:
-                invocation_result = await ToolInvocation.find({"tool_id": {"$in": tool_ids}}).delete()
-                deletions["tool_invocations"] = invocation_result.deleted_count if invocation_result else 0
-                logger.info(f"Deleted {deletions['tool_invocations']} tool invocations")
-            else:
-                deletions["tool_invocations"] = 0
-        else:
-            deletions["tool_invocations"] = 0
-    except Exception as e:
-        deletions["tool_invocations"] = 0
-        errors.append(f"Tool invocations deletion failed: {str(e)}")
-        logger.error(f"Project {project_id}: {errors[-1]}")
-    
-    # 2. Delete MCP Tools via Gateways
-    try:
-        if gateway_ids:
-            mcp_tools_result = await MCPTool.find({"gateway_id": {"$in": gateway_ids}}).delete()
-            deletions["mcp_tools"] = mcp_tools_result.deleted_count if mcp_tools_result else 0
-            logger.info(f"Deleted {deletions['mcp_tools']} MCP tools")
-        else:
-            deletions["mcp_tools"] = 0
-    except Exception as e:
-        deletions["mcp_tools"] = 0
-        errors.append(f"MCP tools deletion failed: {str(e)}")
-        logger.error(f"Project {project_id}: {errors[-1]}")
-    
-    # 3. Delete MCP Gateways
-    try:
-        gateways_result = await MCPGateway.find({"project_id": project_id}).delete()
-        deletions["mcp_gateways"] = gateways_result.deleted_count if gateways_result else 0
-        logger.info(f"Deleted {deletions['mcp_gateways']} MCP gateways")
-    except Exception as e:
-        deletions["mcp_gateways"] = 0
-        errors.append(f"MCP gateways deletion failed: {str(e)}")
-        logger.error(f"Project {project_id}: {errors[-1]}")
-    
-    # 4. Delete Playground Invocations via Playgrounds
-    try:
-        playgrounds = await Playground.find({"project_id": project_id}).to_list()
-        playground_ids = [p.id for p in playgrounds]
-        
-        if playground_ids:
-            pg_invocations_result = await PlaygroundInvocation.find({"playground_id": {"$in": playground_ids}}).delete()
-            deletions["playground_invocations"] = pg_invocations_result.deleted_count if pg_invocations_result else 0
-            logger.info(f"Deleted {deletions['playground_invocations']} playground invocations")
-        else:
-            deletions["playground_invocations"] = 0
-    except Exception as e:
-        deletions["playground_invocations"] = 0
-        errors.append(f"Playground invocations deletion failed: {str(e)}")
-        logger.error(f"Project {project_id}: {errors[-1]}")
-    
-    # 5. Delete Playgrounds
-    try:
-        playgrounds_result = await Playground.find({"project_id": project_id}).delete()
-        deletions["playgrounds"] = playgrounds_result.deleted_count if playgrounds_result else 0
-        logger.info(f"Deleted {deletions['playgrounds']} playgrounds")
-    except Exception as e:
-        deletions["playgrounds"] = 0
-        errors.append(f"Playgrounds deletion failed: {str(e)}")
-        logger.error(f"Project {project_id}: {errors[-1]}")
-    
-    # 6. Delete Workzone Invocations (Workzones are org-level, only delete invocations)
-    try:
-        wz_invocations_result = await WorkzoneInvocation.find({"project_id": project_id}).delete()
-        deletions["workzone_invocations"] = wz_invocations_result.deleted_count if wz_invocations_result else 0
-        logger.info(f"Deleted {deletions['workzone_invocations']} workzone invocations")
-    except Exception as e:
-        deletions["workzone_invocations"] = 0
-        errors.append(f"Workzone invocations deletion failed: {str(e)}")
-        logger.error(f"Project {project_id}: {errors[-1]}")
-    
-    # 7. Delete Tasks
-    try:
-        tasks_result = await Task.find({"project_id": project_id}).delete()
-        deletions["tasks"] = tasks_result.deleted_count if tasks_result else 0
-        logger.info(f"Deleted {deletions['tasks']} tasks")
-    except Exception as e:
-        deletions["tasks"] = 0
-        errors.append(f"Tasks deletion failed: {str(e)}")
-        logger.error(f"Project {project_id}: {errors[-1]}")
-    
-    # 8. Delete Tools via Agents
-    try:
-        agents = await Agent.find({"project_id": project_id}).to_list()
-        agent_ids = [a.id for a in agents]
-        
-        if agent_ids:
-            tools_result = await Tool.find({"agent_id": {"$in": agent_ids}}).delete()
-            deletions["tools"] = tools_result.deleted_count if tools_result else 0
-            logger.info(f"Deleted {deletions['tools']} tools")
-        else:
-            deletions["tools"] = 0
-    except Exception as e:
-        deletions["tools"] = 0
-        errors.append(f"Tools deletion failed: {str(e)}")
-        logger.error(f"Project {project_id}: {errors[-1]}")
-    
-    # 9. Delete Evaluation Runs
-    try:
-        eval_runs_result = await EvaluationRun.find({"project_id": project_id}).delete()
-        deletions["evaluation_runs"] = eval_runs_result.deleted_count if eval_runs_result else 0
-        logger.info(f"Deleted {deletions['evaluation_runs']} evaluation runs")
-    except Exception as e:
-        deletions["evaluation_runs"] = 0
-        errors.append(f"Evaluation runs deletion failed: {str(e)}")
-        logger.error(f"Project {project_id}: {errors[-1]}")
-    
-    # 10. Delete Evaluations
-    try:
-        evaluations_result = await Evaluation.find({"project_id": project_id}).delete()
-        deletions["evaluations"] = evaluations_result.deleted_count if evaluations_result else 0
-        logger.info(f"Deleted {deletions['evaluations']} evaluations")
-    except Exception as e:
-        deletions["evaluations"] = 0
-        errors.append(f"Evaluations deletion failed: {str(e)}")
-        logger.error(f"Project {project_id}: {errors[-1]}")
-    
-    # 11. Delete Training Jobs
-    try:
-        training_result = await Training.find({"project_id": project_id}).delete()
-        deletions["training_jobs"] = training_result.deleted_count if training_result else 0
-        logger.info(f"Deleted {deletions['training_jobs']} training jobs")
-    except Exception as e:
-        deletions["training_jobs"] = 0
-        errors.append(f"Training jobs deletion failed: {str(e)}")
-        logger.error(f"Project {project_id}: {errors[-1]}")
-    
-    # 12. Delete Data Sources
-    try:
-        data_sources_result = await DataSource.find({"project_id": project_id}).delete()
-        deletions["data_sources"] = data_sources_result.deleted_count if data_sources_result else 0
-        logger.info(f"Deleted {deletions['data_sources']} data sources")
-    except Exception as e:
-        deletions["data_sources"] = 0
-        errors.append(f"Data sources deletion failed: {str(e)}")
-        logger.error(f"Project {project_id}: {errors[-1]}")
-    
-    # 13. Delete Agents
-    try:
-        agents_result = await Agent.find({"project_id": project_id}).delete()
-        deletions["agents"] = agents_result.deleted_count if agents_result else 0
-        logger.info(f"Deleted {deletions['agents']} agents")
-    except Exception as e:
-        deletions["agents"] = 0
-        errors.append(f"Agents deletion failed: {str(e)}")
-        logger.error(f"Project {project_id}: {errors[-1]}")
-    
-    return {"deletions": deletions, "errors": errors}
+    project_ids = await ProjectDeletion.get_motor_collection().distinct("_id", {
+        "status": {"$ne": ProjectDeletionStatus.COMPLETED.value},
+        "attempts": {"$lt": PROJECT_DELETION_MAX_ATTEMPTS},
+        "$or": [{"lease_expires_at": None}, {"lease_expires_at": {"$lt": datetime.utcnow()}}],
+    })
+
+    resumed = 0
+    for project_id in project_ids:
+        results = await cascade_delete_project_resources(project_id)
+        if results["status"] != "skipped":
+            resumed += 1
+    return resumed
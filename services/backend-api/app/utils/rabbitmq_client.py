@@ -1,238 +1,280 @@
+"""
+RabbitMQ publishing for backend-api.
+
+Messages are published with aio-pika over one robust connection, which
+reconnects by itself after a broker restart, and a small pool of channels with
+publisher confirms, so concurrent requests publish in parallel without blocking
+the event loop. A message counts as queued once the broker has confirmed it.
+
+While the broker is unreachable, messages wait in a bounded in-process outbox
+that is drained in the background once the connection is back. Only when the
+outbox is full (or the broker rejects a message) does publishing fail and the
+task or training job get marked as failed.
+"""
 import os
+import ssl
 import json
 import logging
-import pika
-import time
 import asyncio
-from typing import Dict, Any, Optional
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
-from pika.exceptions import AMQPConnectionError, StreamLostError
+
+import aio_pika
+from aio_pika.abc import AbstractRobustChannel, AbstractRobustConnection
+from aio_pika.exceptions import ChannelNotFoundEntity, DeliveryError
+from aio_pika.pool import Pool
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Global connection variable for reuse
-_connection = None
-_channel = None
+# Channels opened on the shared connection
+RABBITMQ_CHANNEL_POOL_SIZE = int(os.getenv("RABBITMQ_CHANNEL_POOL_SIZE", "10"))
+RABBITMQ_CONNECT_TIMEOUT = float(os.getenv("RABBITMQ_CONNECT_TIMEOUT", "5"))
+# Time to wait for the broker to confirm a message
+RABBITMQ_PUBLISH_TIMEOUT = float(os.getenv("RABBITMQ_PUBLISH_TIMEOUT", "10"))
+# Messages held while the broker is unreachable
+RABBITMQ_OUTBOX_SIZE = int(os.getenv("RABBITMQ_OUTBOX_SIZE", "1000"))
+RABBITMQ_OUTBOX_RETRY_SECONDS = float(os.getenv("RABBITMQ_OUTBOX_RETRY_SECONDS", "2"))
+
+# Called with the error message when an outbox message can no longer be delivered
+FailureCallback = Callable[[str], Awaitable[None]]
+
+_connection: Optional[AbstractRobustConnection] = None
+_connection_lock: Optional[asyncio.Lock] = None
+_channel_pool: Optional[Pool] = None
+# Messages waiting for the broker: (exchange, routing_key, body, description, on_failure)
+_outbox: Deque[Tuple[str, str, bytes, str, Optional[FailureCallback]]] = deque()
+_outbox_task: Optional[asyncio.Task] = None
 
 
-def get_rabbitmq_connection(retry_count=3, retry_delay=1.0):
+def _queue_config(queue_type: str) -> Dict[str, str]:
+    """Exchange, queue and routing key names for a queue type ('training' or 'agent')"""
+    if queue_type == 'agent':
+        # Agent message queue configuration
+        return {
+            "exchange": os.getenv("AGENT_EXCHANGE_NAME", "task_exchange"),
+            "queue": os.getenv("AGENT_QUEUE_NAME", "agent_tasks_queue"),
+            "routing_key": os.getenv("AGENT_ROUTING_KEY", "agent.task"),
+        }
+    # Default to training queue configuration
+    return {
+        "exchange": os.getenv("TRAINING_EXCHANGE_NAME", "training_exchange"),
+        "queue": os.getenv("TRAINING_QUEUE_NAME", "training_queue"),
+        "routing_key": os.getenv("TRAINING_ROUTING_KEY", "training.job"),
+    }
+
+
+async def get_rabbitmq_connection() -> AbstractRobustConnection:
     """
-    Get a reusable RabbitMQ connection with retry logic
-    
-    Args:
-        retry_count: Number of connection attempts before giving up
-        retry_delay: Delay in seconds between retry attempts
-        
-    Returns:
-        A RabbitMQ connection that can be reused across calls
-        
+    Get the shared robust RabbitMQ connection, connecting on first use
+
+    Once established, the connection and its channels are restored
+    automatically after network failures or broker restarts.
+
     Raises:
-        AMQPConnectionError: If all connection attempts fail
+        Exception: If the initial connection attempt fails
     """
-    global _connection
-    
-    # If we have an existing connection and it's open, return it
-    if _connection is not None and _connection.is_open:
-        try:
-            # Verify the connection is actually usable
-            _connection.process_data_events()
-            return _connection
-        except (AMQPConnectionError, StreamLostError):
-            # Connection is broken, set to None and try to reconnect
-            _connection = None
-            logger.warning("Detected broken RabbitMQ connection, reconnecting...")
-    
-    # Get RabbitMQ connection details from environment variables with defaults
-    rabbitmq_host = os.getenv("RABBITMQ_HOST", "localhost")
-    rabbitmq_port = int(os.getenv("RABBITMQ_PORT", "5672"))
-    rabbitmq_vhost = os.getenv("RABBITMQ_VHOST", "/")
-    rabbitmq_username = os.getenv("RABBITMQ_USERNAME", "guest")
-    rabbitmq_password = os.getenv("RABBITMQ_PASSWORD", "guest")
-    
-    # Check if we need SSL (port 5671 is the standard SSL port for RabbitMQ)
-    use_ssl = rabbitmq_port == 5671
-    
-    # Set up SSL context if needed
-    ssl_options = None
-    if use_ssl:
-        import ssl
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-        ssl_options = pika.SSLOptions(ssl_context)
-        logger.info("Using SSL for RabbitMQ connection")
-    
-    # Connect to RabbitMQ with appropriate SSL settings and enable heartbeats
-    connection_params = pika.ConnectionParameters(
-        host=rabbitmq_host,
-        port=rabbitmq_port,
-        virtual_host=rabbitmq_vhost,
-        credentials=pika.PlainCredentials(
-            rabbitmq_username, 
-            rabbitmq_password
-        ),
-        ssl_options=ssl_options,
-        heartbeat=30,  # Send heartbeat every 30 seconds to detect broken connections
-        blocked_connection_timeout=10,  # Timeout for blocked connections
-        connection_attempts=2,  # Try to connect twice initially
-        retry_delay=0.5  # Half second delay between initial connection attempts
-    )
-    
-    # Try to connect with retry logic
-    last_exception = None
-    for attempt in range(retry_count):
-        try:
-            logger.info(f"Connecting to RabbitMQ at {rabbitmq_host}:{rabbitmq_port} (attempt {attempt+1}/{retry_count})")
-            _connection = pika.BlockingConnection(connection_params)
-            logger.info("Successfully connected to RabbitMQ")
+    global _connection, _connection_lock
+
+    if _connection is not None and not _connection.is_closed:
+        return _connection
+
+    if _connection_lock is None:
+        _connection_lock = asyncio.Lock()
+
+    async with _connection_lock:
+        if _connection is not None and not _connection.is_closed:
             return _connection
-        except Exception as e:
-            last_exception = e
-            logger.warning(f"RabbitMQ connection attempt {attempt+1} failed: {str(e)}")
-            if attempt < retry_count - 1:
-                logger.info(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-                # Increase delay for subsequent retries (backoff)
-                retry_delay = min(retry_delay * 1.5, 5.0)
-    
-    # If we get here, all retries failed
-    logger.error(f"Failed to connect to RabbitMQ after {retry_count} attempts")
-    raise last_exception or AMQPConnectionError("Failed to connect to RabbitMQ")
-
-
-def get_rabbitmq_channel(retry_count=3):
+
+        # Get RabbitMQ connection details from environment variables with defaults
+        rabbitmq_host = os.getenv("RABBITMQ_HOST", "localhost")
+        rabbitmq_port = int(os.getenv("RABBITMQ_PORT", "5672"))
+
+        # Port 5671 is the standard SSL port for RabbitMQ
+        ssl_context = None
+        if rabbitmq_port == 5671:
+            ssl_context = ssl.create_default_context()
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+            logger.info("Using SSL for RabbitMQ connection")
+
+        logger.info(f"Connecting to RabbitMQ at {rabbitmq_host}:{rabbitmq_port}")
+        _connection = await aio_pika.connect_robust(
+            host=rabbitmq_host,
+            port=rabbitmq_port,
+            virtualhost=os.getenv("RABBITMQ_VHOST", "/"),
+            login=os.getenv("RABBITMQ_USERNAME", "guest"),
+            password=os.getenv("RABBITMQ_PASSWORD", "guest"),
+            ssl=ssl_context is not None,
+            ssl_context=ssl_context,
+            timeout=RABBITMQ_CONNECT_TIMEOUT,
+            heartbeat=30,  # Detect broken connections
+        )
+        logger.info("Successfully connected to RabbitMQ")
+        return _connection
+
+
+async def _open_channel() -> AbstractRobustChannel:
+    connection = await get_rabbitmq_connection()
+    return await connection.channel(publisher_confirms=True)
+
+
+def _get_channel_pool() -> Pool:
+    global _channel_pool
+    if _channel_pool is None or _channel_pool.is_closed:
+        _channel_pool = Pool(_open_channel, max_size=RABBITMQ_CHANNEL_POOL_SIZE)
+    return _channel_pool
+
+
+async def _publish(exchange_name: str, routing_key: str, body: bytes):
+    """Publish one message on a pooled channel and wait for the broker's confirm"""
+    async with _get_channel_pool().acquire() as channel:
+        if channel.is_closed:
+            # The broker closes a channel on errors such as a missing exchange
+            await channel.reopen()
+        exchange = await channel.get_exchange(exchange_name, ensure=False)
+        await exchange.publish(
+            aio_pika.Message(
+                body,
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                content_type='application/json'
+            ),
+            routing_key=routing_key,
+            mandatory=False,
+            timeout=RABBITMQ_PUBLISH_TIMEOUT
+        )
+
+
+async def setup_rabbitmq_resources(queue_type='training') -> Dict[str, str]:
     """
-    Get a reusable RabbitMQ channel with retry logic
-    
+    Set up RabbitMQ resources (exchange, queue, binding) if they don't exist
+
     Args:
-        retry_count: Number of channel creation attempts before giving up
-        
+        queue_type: Type of queue to set up ('training' or 'agent')
+
     Returns:
-        A RabbitMQ channel that can be reused across calls
-        
-    Raises:
-        Exception: If all channel creation attempts fail
+        Dict containing exchange, queue, and routing key names
     """
-    global _channel, _connection
-    
-    # Check if we have a valid channel
-    if _channel is not None and _channel.is_open:
-        try:
-            # Verify channel is actually usable
-            _channel.basic_qos(prefetch_count=1)
-            return _channel
-        except Exception as e:
-            logger.warning(f"Existing RabbitMQ channel is broken: {str(e)}")
-            _channel = None
-    
-    # Try to create a new channel with retry logic
-    last_exception = None
-    for attempt in range(retry_count):
-        try:
-            # Always get a fresh connection if we need a new channel
-            connection = get_rabbitmq_connection()
-            _channel = connection.channel()
-            logger.info("Successfully created RabbitMQ channel")
-            return _channel
-        except Exception as e:
-            last_exception = e
-            logger.warning(f"RabbitMQ channel creation attempt {attempt+1} failed: {str(e)}")
-            # Clear the broken connection and try again
-            close_rabbitmq_connection()
-            if attempt < retry_count - 1:
-                time.sleep(0.5)
-    
-    # If we get here, all retries failed
-    logger.error(f"Failed to create RabbitMQ channel after {retry_count} attempts")
-    raise last_exception or Exception("Failed to create RabbitMQ channel")
-
-
-def setup_rabbitmq_resources(queue_type='training', retry_count=3):
+    config = _queue_config(queue_type)
+
+    async with _get_channel_pool().acquire() as channel:
+        if channel.is_closed:
+            await channel.reopen()
+
+        # Ensure the exchange and queue exist and survive broker restarts
+        exchange = await channel.declare_exchange(
+            config["exchange"],
+            aio_pika.ExchangeType.DIRECT,
+            durable=True
+        )
+        queue = await channel.declare_queue(config["queue"], durable=True)
+
+        # Bind the queue to the exchange
+        await queue.bind(exchange, routing_key=config["routing_key"])
+
+    logger.info(f"Successfully set up RabbitMQ resources for {queue_type} (exchange: {config['exchange']}, queue: {config['queue']})")
+    return config
+
+
+async def publish_message(
+    queue_type: str,
+    body: bytes,
+    description: str,
+    on_failure: Optional[FailureCallback] = None
+) -> bool:
     """
-    Set up RabbitMQ resources (exchange, queue, binding) if they don't exist
-    
+    Publish a message, or hold it in the outbox while the broker is unreachable
+
     Args:
-        queue_type: Type of queue to set up ('training' or 'task')
-        retry_count: Number of setup attempts before giving up
-        
+        queue_type: Type of queue to publish to ('training' or 'agent')
+        body: Message body
+        description: What the message is, for logging
+        on_failure: Called if a message held in the outbox is finally rejected
+
     Returns:
-        Dict containing exchange, queue, and routing key names
+        True if the broker confirmed the message, False if it waits in the outbox
+
+    Raises:
+        DeliveryError: If the broker rejected the message
+        Exception: If the broker is unreachable and the outbox is full
     """
-    # Try to set up resources with retry logic
-    last_exception = None
-    for attempt in range(retry_count):
+    config = _queue_config(queue_type)
+
+    # Keep order with messages already waiting for the broker
+    if _outbox:
+        _add_to_outbox(config, body, description, on_failure)
+        return False
+
+    try:
         try:
-            channel = get_rabbitmq_channel()
-            
-            # Define exchange, queue and routing key names based on queue type
-            if queue_type == 'agent':
-                # Agent message queue configuration
-                exchange_name = os.getenv("AGENT_EXCHANGE_NAME", "task_exchange")
-                queue_name = os.getenv("AGENT_QUEUE_NAME", "agent_tasks_queue")
-                routing_key = os.getenv("AGENT_ROUTING_KEY", "agent.task")
-            else:
-                # Default to training queue configuration
-                exchange_name = os.getenv("TRAINING_EXCHANGE_NAME", "training_exchange")
-                queue_name = os.getenv("TRAINING_QUEUE_NAME", "training_queue")
-                routing_key = os.getenv("TRAINING_ROUTING_KEY", "training.job")
-            
-            # Ensure the exchange exists
-            channel.exchange_declare(
-                exchange=exchange_name,
-                exchange_type='direct',
-                durable=True  # Survive broker restarts
-            )
-            
-            # Ensure the queue exists
-            channel.queue_declare(
-                queue=queue_name, 
-                durable=True  # Survive broker restarts
-            )
-            
-            # Bind the queue to the exchange
-            channel.queue_bind(
-                queue=queue_name,
-                exchange=exchange_name,
-                routing_key=routing_key
-            )
-            
-            logger.info(f"Successfully set up RabbitMQ resources for {queue_type} (exchange: {exchange_name}, queue: {queue_name})")
-            
-            return {
-                "exchange": exchange_name,
-                "queue": queue_name,
-                "routing_key": routing_key
-            }
+            await _publish(config["exchange"], config["routing_key"], body)
+        except ChannelNotFoundEntity:
+            logger.info("Queue might not exist, attempting to create it as fallback...")
+            await setup_rabbitmq_resources(queue_type=queue_type)
+            await _publish(config["exchange"], config["routing_key"], body)
+        return True
+    except DeliveryError:
+        raise
+    except Exception as e:
+        if len(_outbox) >= RABBITMQ_OUTBOX_SIZE:
+            raise
+        logger.warning(f"RabbitMQ unavailable, holding {description} in the outbox: {str(e)}")
+        _add_to_outbox(config, body, description, on_failure)
+        return False
+
+
+def _add_to_outbox(config: Dict[str, str], body: bytes, description: str, on_failure: Optional[FailureCallback]):
+    global _outbox_task
+    if len(_outbox) >= RABBITMQ_OUTBOX_SIZE:
+        raise RuntimeError(f"RabbitMQ outbox is full ({RABBITMQ_OUTBOX_SIZE} messages waiting)")
+    _outbox.append((config["exchange"], config["routing_key"], body, description, on_failure))
+    if _outbox_task is None or _outbox_task.done():
+        _outbox_task = asyncio.create_task(_drain_outbox())
+
+
+async def _report_undelivered(description: str, on_failure: Optional[FailureCallback], error_msg: str):
+    logger.error(error_msg)
+    if on_failure is not None:
+        try:
+            await on_failure(error_msg)
+        except Exception as e:
+            logger.error(f"Failed to record undelivered {description}: {e}")
+
+
+async def _drain_outbox():
+    """Publish outbox messages in order, waiting for the broker to come back as needed"""
+    while _outbox:
+        # Messages leave the outbox only once confirmed or rejected
+        exchange_name, routing_key, body, description, on_failure = _outbox[0]
+        try:
+            await _publish(exchange_name, routing_key, body)
+            logger.info(f"Published {description} from the outbox")
+        except DeliveryError as e:
+            await _report_undelivered(description, on_failure, f"RabbitMQ rejected {description}: {str(e)}")
         except Exception as e:
-            last_exception = e
-            logger.warning(f"Failed to set up RabbitMQ resources (attempt {attempt+1}): {str(e)}")
-            # Clear connections and try again
-            close_rabbitmq_connection()
-            if attempt < retry_count - 1:
-                time.sleep(0.5)
-    
-    # If we get here, all retries failed
-    logger.error(f"Failed to set up RabbitMQ resources after {retry_count} attempts")
-    raise last_exception or Exception("Failed to set up RabbitMQ resources")
-
-
-async def queue_training_job(training_id: str, project_id: str, project_name: str, data_source_ids: list, max_retries=3):
+            logger.warning(f"Outbox publish failed, retrying in {RABBITMQ_OUTBOX_RETRY_SECONDS}s "
+                           f"({len(_outbox)} messages waiting): {str(e)}")
+            await asyncio.sleep(RABBITMQ_OUTBOX_RETRY_SECONDS)
+            continue
+        _outbox.popleft()
+
+
+async def queue_training_job(training_id: str, project_id: str, project_name: str, data_source_ids: list):
     """
-    Queue a training job for processing using RabbitMQ with retry logic
-    
+    Queue a training job for processing using RabbitMQ
+
     Args:
         training_id: ID of the training job
         project_id: ID of the project
         project_name: Name of the project
         data_source_ids: List of data source IDs to include in training
-        max_retries: Maximum number of publish attempts before giving up
     """
     # The training service expects the PROJECT environment variable
     # and converts project names to lowercase for consistent directory naming
     project_name_lower = project_name.lower()
     os.environ["PROJECT"] = project_name_lower
-    
+
     # Prepare message payload
     message = {
         "training_id": training_id,
@@ -242,101 +284,37 @@ async def queue_training_job(training_id: str, project_id: str, project_name: st
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "action": "start_training"
     }
-    
-    # Convert message to JSON string
-    message_body = json.dumps(message)
-    
-    # Get queue configuration without setting up resources (they should already exist)
-    # Define exchange, queue and routing key names for training
-    exchange_name = os.getenv("TRAINING_EXCHANGE_NAME", "training_exchange")
-    queue_name = os.getenv("TRAINING_QUEUE_NAME", "training_queue")
-    routing_key = os.getenv("TRAINING_ROUTING_KEY", "training.job")
-    
-    rabbitmq_config = {
-        "exchange": exchange_name,
-        "queue": queue_name,
-        "routing_key": routing_key
-    }
-    
-    # Try to publish with retry logic
-    last_exception = None
-    for attempt in range(max_retries):
-        try:
-            channel = get_rabbitmq_channel()
-            
-            # Publish message
-            channel.basic_publish(
-                exchange=rabbitmq_config["exchange"],
-                routing_key=rabbitmq_config["routing_key"],
-                body=message_body,
-                properties=pika.BasicProperties(
-                    delivery_mode=2,  # Make message persistent
-                    content_type='application/json'
-                )
-            )
-            
+
+    async def mark_failed(error_msg: str):
+        # Import here to avoid circular imports
+        from app.models.training import Training
+
+        # Update training job status to failed
+        training = await Training.get(training_id)
+        if training:
+            await training.update({
+                "$set": {
+                    "status": "failed",
+                    "error": error_msg,
+                    "updated_at": datetime.now(timezone.utc)
+                }
+            })
+
+    description = f"training job {training_id}"
+    try:
+        if await publish_message('training', json.dumps(message).encode(), description, on_failure=mark_failed):
             logger.info(f"Published training job {training_id} for project {project_id} to RabbitMQ")
-            return  # Success, exit the function
-            
-        except Exception as e:
-            last_exception = e
-            logger.warning(f"Attempt {attempt+1} to queue training job failed: {str(e)}")
-            
-            # If this is the first attempt and the error might be due to missing queues,
-            # try to set them up as a fallback
-            if attempt == 0 and ("NOT_FOUND" in str(e) or "404" in str(e)):
-                try:
-                    logger.info("Queue might not exist, attempting to create it as fallback...")
-                    setup_rabbitmq_resources(queue_type='training')
-                    continue  # Retry immediately after creating the queue
-                except Exception as setup_error:
-                    logger.warning(f"Failed to create queue as fallback: {str(setup_error)}")
-            
-            # Reset connection on failure
-            close_rabbitmq_connection()
-            
-            # If we have more retries, wait before trying again
-            if attempt < max_retries - 1:
-                wait_time = 0.5 * (attempt + 1)  # Progressive backoff
-                logger.info(f"Retrying in {wait_time} seconds...")
-                await asyncio.sleep(wait_time)
-    
-    # If we get here, all retries failed
-    error_msg = f"Failed to queue training job after {max_retries} attempts: {str(last_exception)}"
-    logger.error(error_msg)
-    
-    # Import here to avoid circular imports
-    from app.models.training import Training
-    
-    # Update training job status to failed
-    training = await Training.get(training_id)
-    if training:
-        await training.update({
-            "$set": {
-                "status": "failed",
-                "error": error_msg,
-                "updated_at": datetime.now(timezone.utc)
-            }
-        })
-    
-    # Re-raise the exception for the caller to handle
-    raise last_exception or Exception("Failed to queue training job")
-
-
-async def queue_agent_task(task_id: str, assistant_task_id: str, agent_id: str, project_id: str, content: str, metadata: Dict[str, Any], max_retries=3):
-    """
-    Queue a task message for processing using RabbitMQ with retry logic
-    
-    Args:
-        task_id: ID of the user task
-        assistant_task_id: ID of the assistant task to be filled
-        agent_id: ID of the task
-        project_id: ID of the project
-        content: Content of the task
-        metadata: Additional metadata for the task. If it contains 'override_project_id', it will be propagated in the message
-        max_retries: Maximum number of publish attempts before giving up
-    """
-    # Prepare message payload
+    except Exception as e:
+        error_msg = f"Failed to queue training job: {str(e)}"
+        logger.error(error_msg)
+        await mark_failed(error_msg)
+
+        # Re-raise the exception for the caller to handle
+        raise
+
+
+def _agent_task_message(task_id: str, assistant_task_id: str, agent_id: str, project_id: str, content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the payload of an agent task message"""
     message = {
         "task_id": task_id,
         "assistant_task_id": assistant_task_id,
@@ -347,7 +325,7 @@ async def queue_agent_task(task_id: str, assistant_task_id: str, agent_id: str,
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "action": "process_task_message"
     }
-    
+
     # If a project override is provided in metadata, include it in the message
     try:
         override_project_id = metadata.get("override_project_id") if isinstance(metadata, dict) else None
@@ -356,125 +334,169 @@ async def queue_agent_task(task_id: str, assistant_task_id: str, agent_id: str,
             logger.debug(f"Including override_project_id in message: {override_project_id}")
     except Exception as e:
         logger.warning(f"Unable to read override_project_id from metadata: {e}")
-    
-    # Convert message to JSON string
-    message_body = json.dumps(message)
-    
-    # Get queue configuration without setting up resources (they should already exist)
-    # Define exchange, queue and routing key names for agent tasks
-    exchange_name = os.getenv("AGENT_EXCHANGE_NAME", "task_exchange")
-    queue_name = os.getenv("AGENT_QUEUE_NAME", "agent_tasks_queue")
-    routing_key = os.getenv("AGENT_ROUTING_KEY", "agent.task")
-    
-    rabbitmq_config = {
-        "exchange": exchange_name,
-        "queue": queue_name,
-        "routing_key": routing_key
+
+    return message
+
+
+async def _publish_agent_task(task: Dict[str, Any]) -> bool:
+    """Publish one agent task message; tasks rejected later from the outbox are marked failed"""
+    async def mark_failed(error_msg: str):
+        await _mark_unqueued_tasks_failed([task], error_msg)
+
+    body = json.dumps(_agent_task_message(**task)).encode()
+    return await publish_message('agent', body, f"task message {task['task_id']}", on_failure=mark_failed)
+
+
+async def queue_agent_task(task_id: str, assistant_task_id: str, agent_id: str, project_id: str, content: str, metadata: Dict[str, Any]):
+    """
+    Queue a task message for processing using RabbitMQ
+
+    Args:
+        task_id: ID of the user task
+        assistant_task_id: ID of the assistant task to be filled
+        agent_id: ID of the task
+        project_id: ID of the project
+        content: Content of the task
+        metadata: Additional metadata for the task. If it contains 'override_project_id', it will be propagated in the message
+    """
+    task = {
+        "task_id": task_id,
+        "assistant_task_id": assistant_task_id,
+        "agent_id": agent_id,
+        "project_id": project_id,
+        "content": content,
+        "metadata": metadata,
     }
-    
-    # Try to publish with retry logic
-    last_exception = None
-    for attempt in range(max_retries):
-        try:
-            channel = get_rabbitmq_channel()
-            
-            # Use the queue name from the config
-            queue_name = rabbitmq_config["queue"]
-            
-            # Publish message
-            channel.basic_publish(
-                exchange=rabbitmq_config["exchange"],
-                routing_key=rabbitmq_config["routing_key"],
-                body=message_body,
-                properties=pika.BasicProperties(
-                    delivery_mode=2,  # Make message persistent
-                    content_type='application/json'
-                )
-            )
-            
+    try:
+        if await _publish_agent_task(task):
             logger.info(f"Published task message {task_id} for task {agent_id} to RabbitMQ")
-            return  # Success, exit the function
-            
-        except Exception as e:
-            last_exception = e
-            logger.warning(f"Attempt {attempt+1} to queue task message failed: {str(e)}")
-            
-            # If this is the first attempt and the error might be due to missing queues,
-            # try to set them up as a fallback
-            if attempt == 0 and ("NOT_FOUND" in str(e) or "404" in str(e)):
-                try:
-                    logger.info("Queue might not exist, attempting to create it as fallback...")
-                    setup_rabbitmq_resources(queue_type='agent')
-                    continue  # Retry immediately after creating the queue
-                except Exception as setup_error:
-                    logger.warning(f"Failed to create queue as fallback: {str(setup_error)}")
-            
-            # Reset connection on failure
-            close_rabbitmq_connection()
-            
-            # If we have more retries, wait before trying again
-            if attempt < max_retries - 1:
-                wait_time = 0.5 * (attempt + 1)  # Progressive backoff
-                logger.info(f"Retrying in {wait_time} seconds...")
-                await asyncio.sleep(wait_time)
-    
-    # If we get here, all retries failed
-    error_msg = f"Failed to queue task message after {max_retries} attempts: {str(last_exception)}"
-    logger.error(error_msg)
-    
+    except Exception as e:
+        error_msg = f"Failed to queue task message: {str(e)}"
+        logger.error(error_msg)
+        await _mark_unqueued_tasks_failed([task], error_msg)
+
+        # Re-raise the exception for the caller to handle
+        raise
+
+
+async def queue_agent_tasks(tasks: List[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Queue several task messages concurrently on the channel pool
+
+    Tasks whose message could not be queued are marked as failed.
+
+    Args:
+        tasks: One dict per message with the task_id, assistant_task_id, agent_id,
+            project_id, content and metadata arguments of queue_agent_task
+
+    Returns:
+        Error message by assistant task ID for the messages that were not queued
+    """
+    if not tasks:
+        return {}
+
+    results = await asyncio.gather(*(_publish_agent_task(task) for task in tasks), return_exceptions=True)
+
+    failed: Dict[str, str] = {}
+    for task, result in zip(tasks, results):
+        if isinstance(result, BaseException):
+            error_msg = f"Failed to queue task message: {str(result)}"
+            failed[task["assistant_task_id"]] = error_msg
+            await _mark_unqueued_tasks_failed([task], error_msg)
+
+    logger.info(f"Published {len(tasks) - len(failed)} task messages to RabbitMQ")
+    return failed
+
+
+async def _mark_unqueued_tasks_failed(tasks: List[Dict[str, Any]], error_msg: str):
+    """Mark user and assistant tasks whose message was not queued as failed"""
     # Import here to avoid circular imports
+    from pymongo import UpdateOne
     from app.models.tasks import Task, TaskStatus
-    
-    # Update message status to failed
-    user_message = await Task.get(task_id)
-    if user_message:
-        user_message.metadata["error"] = error_msg
-        user_message.status = TaskStatus.FAILED
-        await user_message.save()
-    
-    assistant_message = await Task.get(assistant_task_id)
-    if assistant_message:
-        assistant_message.status = TaskStatus.FAILED
-        await assistant_message.save()
-    
-    # Re-raise the exception for the caller to handle
-    raise last_exception or Exception("Failed to queue task message")
-
-
-def initialize_rabbitmq_queues():
+    from app.api.routes.tasks import get_redis_client
+    from app.utils.task_stream import publish_task_update
+
+    now = datetime.utcnow()
+    operations = []
+    for task in tasks:
+        operations.append(UpdateOne(
+            {"_id": task["task_id"]},
+            {"$set": {"status": TaskStatus.FAILED.value, "metadata.error": error_msg, "updated_at": now}}
+        ))
+        operations.append(UpdateOne(
+            {"_id": task["assistant_task_id"]},
+            {"$set": {"status": TaskStatus.FAILED.value, "updated_at": now}}
+        ))
+    await Task.get_motor_collection().bulk_write(operations, ordered=False)
+
+    redis_client = await get_redis_client()
+    for task in tasks:
+        await publish_task_update(redis_client, task["assistant_task_id"], status=TaskStatus.FAILED.value)
+
+
+async def initialize_rabbitmq_queues():
     """
     Initialize all RabbitMQ queues on service startup
     This should be called during application startup to ensure all queues exist
     """
     try:
         logger.info("Initializing RabbitMQ queues on startup...")
-        
+
         # Initialize training queue
-        setup_rabbitmq_resources(queue_type='training')
+        await setup_rabbitmq_resources(queue_type='training')
         logger.info("Training queue initialized successfully")
-        
+
         # Initialize agent task queue
-        setup_rabbitmq_resources(queue_type='agent')
+        await setup_rabbitmq_resources(queue_type='agent')
         logger.info("Agent task queue initialized successfully")
-        
+
         logger.info("All RabbitMQ queues initialized successfully")
-        
+
     except Exception as e:
         logger.error(f"Failed to initialize RabbitMQ queues on startup: {str(e)}")
         # Don't raise the exception - let the service start even if RabbitMQ is temporarily unavailable
         # The queues will be created when first message is sent if they don't exist
 
 
-def close_rabbitmq_connection():
+def get_rabbitmq_stats() -> Dict[str, Any]:
+    """Connection state and outbox usage of the publisher"""
+    return {
+        "connected": _connection is not None and not _connection.is_closed,
+        "channel_pool_size": RABBITMQ_CHANNEL_POOL_SIZE,
+        "outbox": len(_outbox),
+        "outbox_size": RABBITMQ_OUTBOX_SIZE,
+    }
+
+
+async def close_rabbitmq_connection():
     """
-    Close the RabbitMQ connection if it exists and is open
+    Stop the outbox and close the channel pool and connection
     """
-    global _connection, _channel
-    
-    if _channel is not None and _channel.is_open:
-        _channel.close()
-        _channel = None
-        
-    if _connection is not None and _connection.is_open:
-        _connection.close()
+    global _connection, _channel_pool, _outbox_task
+
+    if _outbox_task is not None:
+        # Give a reachable broker a moment to take the remaining messages
+        try:
+            await asyncio.wait_for(asyncio.shield(_outbox_task), timeout=RABBITMQ_PUBLISH_TIMEOUT)
+        except Exception:
+            _outbox_task.cancel()
+        _outbox_task = None
+
+    # The outbox lives in memory only, so whatever is left would be lost silently
+    while _outbox:
+        _, _, _, description, on_failure = _outbox.popleft()
+        await _report_undelivered(description, on_failure, f"Service stopped before {description} was queued")
+
+    if _channel_pool is not None:
+        try:
+            await _channel_pool.close()
+        except Exception as e:
+            logger.warning(f"Error closing RabbitMQ channels: {e}")
+        _channel_pool = None
+
+    if _connection is not None:
+        try:
+            await _connection.close()
+        except Exception as e:
+            logger.warning(f"Error closing RabbitMQ connection: {e}")
         _connection = None
@@ -1,17 +1,28 @@
 """
 S3 utilities for AWS S3 operations
+
+S3 clients are created once per configuration and shared, so requests reuse
+the botocore connection pool. boto3 is blocking; the helpers below run their
+S3 calls on a thread pool sized to match that connection pool.
 """
 import os
 import re
 import json
+import math
+import base64
 import boto3
+import asyncio
 import hashlib
 import logging
+import functools
+import threading
 import urllib.parse
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import HTTPException, status
-from typing import Tuple, Dict, Any, List, Optional
+from typing import Tuple, Dict, Any, List, Optional, Callable
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
@@ -19,6 +30,81 @@ logger = logging.getLogger(__name__)
 # Default presigned URL expiration (1 hour)
 PRESIGNED_URL_EXPIRATION = 3600
 
+# HTTP connections per shared S3 client, also the number of threads running S3 calls
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "32"))
+
+# S3 parts must be at least 5 MiB, except the last one
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+# Files up to this size are sent with one PutObject, larger files as multipart uploads
+S3_MULTIPART_THRESHOLD = max(int(os.getenv("S3_MULTIPART_THRESHOLD", str(8 * 1024 * 1024))), S3_MIN_PART_SIZE)
+# Part size of multipart uploads, which is also how much of a file is held in memory
+S3_MULTIPART_CHUNK_SIZE = max(int(os.getenv("S3_MULTIPART_CHUNK_SIZE", str(8 * 1024 * 1024))), S3_MIN_PART_SIZE)
+
+# DeleteObjects requests (of up to 1000 keys each) in flight per prefix being deleted
+S3_DELETE_CONCURRENCY = int(os.getenv("S3_DELETE_CONCURRENCY", "8"))
+
+_s3_clients: Dict[Tuple[Optional[str], ...], Any] = {}
+_s3_clients_lock = threading.Lock()
+_s3_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_shared_s3_client(
+    s3_region: str,
+    s3_endpoint: Optional[str],
+    aws_access_key: Optional[str],
+    aws_secret_key: Optional[str]
+) -> Any:
+    """Get the shared S3 client for a configuration, creating it on first use.
+
+    boto3 clients are thread-safe, so one client (and its connection pool) serves
+    every request and thread.
+    """
+    key = (s3_region, s3_endpoint, aws_access_key, aws_secret_key)
+    with _s3_clients_lock:
+        s3_client = _s3_clients.get(key)
+        if s3_client is not None:
+            return s3_client
+
+        client_kwargs = {
+            'region_name': s3_region,
+            'config': BotoConfig(max_pool_connections=S3_MAX_POOL_CONNECTIONS),
+        }
+
+        # Add endpoint URL if specified (for MinIO or other S3-compatible storage)
+        if s3_endpoint:
+            client_kwargs['endpoint_url'] = s3_endpoint
+            logger.info(f"Using custom S3 endpoint: {s3_endpoint}")
+
+        if aws_access_key and aws_secret_key:
+            # Use explicit credentials if provided
+            logger.info("Using explicit AWS credentials from environment variables")
+            client_kwargs['aws_access_key_id'] = aws_access_key
+            client_kwargs['aws_secret_access_key'] = aws_secret_key
+        else:
+            # Use EC2 instance IAM role credentials (default behavior)
+            logger.info("Using EC2 instance IAM role credentials for S3 access")
+
+        s3_client = boto3.client('s3', **client_kwargs)
+        _s3_clients[key] = s3_client
+        return s3_client
+
+
+def _get_s3_executor() -> ThreadPoolExecutor:
+    global _s3_executor
+    with _s3_clients_lock:
+        if _s3_executor is None:
+            _s3_executor = ThreadPoolExecutor(
+                max_workers=S3_MAX_POOL_CONNECTIONS,
+                thread_name_prefix="s3-client"
+            )
+        return _s3_executor
+
+
+async def run_s3(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking boto3 call on the shared S3 thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_s3_executor(), functools.partial(func, *args, **kwargs))
+
 
 def _get_s3_client_for_bucket(bucket_name: str) -> Tuple[object, str]:
     """Get an S3 client for a specific bucket.
@@ -30,22 +116,12 @@ def _get_s3_client_for_bucket(bucket_name: str) -> Tuple[object, str]:
         tuple: (s3_client, s3_region)
     """
     s3_region = os.getenv("AWS_REGION", "us-east-1")
-    s3_endpoint = os.getenv("S3_ENDPOINT_URL")
-    aws_access_key = os.getenv("AWS_ACCESS_KEY_ID")
-    aws_secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
-
-    client_kwargs = {'region_name': s3_region}
-
-    # Add endpoint URL if specified (for MinIO or other S3-compatible storage)
-    if s3_endpoint:
-        client_kwargs['endpoint_url'] = s3_endpoint
-
-    # Add explicit credentials if provided
-    if aws_access_key and aws_secret_key:
-        client_kwargs['aws_access_key_id'] = aws_access_key
-        client_kwargs['aws_secret_access_key'] = aws_secret_key
-
-    s3_client = boto3.client('s3', **client_kwargs)
+    s3_client = _get_shared_s3_client(
+        s3_region,
+        os.getenv("S3_ENDPOINT_URL"),
+        os.getenv("AWS_ACCESS_KEY_ID"),
+        os.getenv("AWS_SECRET_ACCESS_KEY")
+    )
 
     return s3_client, s3_region
 
@@ -77,23 +153,7 @@ async def get_s3_client() -> Tuple[object, str, str]:
     aws_secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
 
     try:
-        client_kwargs = {'region_name': s3_region}
-
-        # Add endpoint URL if specified (for MinIO or other S3-compatible storage)
-        if s3_endpoint:
-            client_kwargs['endpoint_url'] = s3_endpoint
-            logger.info(f"Using custom S3 endpoint: {s3_endpoint}")
-
-        if aws_access_key and aws_secret_key:
-            # Use explicit credentials if provided
-            logger.info("Using explicit AWS credentials from environment variables")
-            client_kwargs['aws_access_key_id'] = aws_access_key
-            client_kwargs['aws_secret_access_key'] = aws_secret_key
-        else:
-            # Use EC2 instance IAM role credentials (default behavior)
-            logger.info("Using EC2 instance IAM role credentials for S3 access")
-
-        s3_client = boto3.client('s3', **client_kwargs)
+        s3_client = _get_shared_s3_client(s3_region, s3_endpoint, aws_access_key, aws_secret_key)
 
         return s3_client, s3_bucket, s3_region
     except Exception as e:
@@ -128,23 +188,7 @@ def get_s3_client_sync() -> Tuple[object, str, str]:
     aws_secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
 
     try:
-        client_kwargs = {'region_name': s3_region}
-
-        # Add endpoint URL if specified (for MinIO or other S3-compatible storage)
-        if s3_endpoint:
-            client_kwargs['endpoint_url'] = s3_endpoint
-            logger.info(f"Using custom S3 endpoint: {s3_endpoint}")
-
-        if aws_access_key and aws_secret_key:
-            # Use explicit credentials if provided
-            logger.info("Using explicit AWS credentials from environment variables")
-            client_kwargs['aws_access_key_id'] = aws_access_key
-            client_kwargs['aws_secret_access_key'] = aws_secret_key
-        else:
-            # Use EC2 instance IAM role credentials (default behavior)
-            logger.info("Using EC2 instance IAM role credentials for S3 access")
-
-        s3_client = boto3.client('s3', **client_kwargs)
+        s3_client = _get_shared_s3_client(s3_region, s3_endpoint, aws_access_key, aws_secret_key)
 
         return s3_client, s3_bucket, s3_region
     except Exception as e:
@@ -157,7 +201,9 @@ async def delete_objects_by_prefix(bucket_name: str, prefix: str) -> Dict[str, A
     Delete all S3 objects under a given prefix.
     
     Uses S3's delete_objects API which can delete up to 1000 objects per request.
-    Handles pagination for prefixes with more than 1000 objects.
+    Each listing page is handed to delete_objects as soon as it arrives, with up
+    to S3_DELETE_CONCURRENCY batches in flight, so deletion overlaps with listing
+    the rest of the prefix.
     
     Args:
         bucket_name: The S3 bucket name
@@ -177,45 +223,48 @@ async def delete_objects_by_prefix(bucket_name: str, prefix: str) -> Dict[str, A
     
     try:
         s3_client, _ = _get_s3_client_for_bucket(bucket_name)
-        
-        # Use paginator to handle large number of objects
-        paginator = s3_client.get_paginator('list_objects_v2')
-        pages = paginator.paginate(Bucket=bucket_name, Prefix=prefix)
-        
-        for page in pages:
-            if 'Contents' not in page:
-                continue
-                
-            # Prepare objects for deletion (max 1000 per request)
-            objects_to_delete = [{'Key': obj['Key']} for obj in page['Contents']]
-            
-            if not objects_to_delete:
-                continue
-            
-            # Delete objects in batch
+        semaphore = asyncio.Semaphore(S3_DELETE_CONCURRENCY)
+        batches = []
+
+        async def delete_batch(objects_to_delete: List[Dict[str, str]]):
             try:
-                response = s3_client.delete_objects(
+                # Quiet mode only reports the objects that failed
+                response = await run_s3(
+                    s3_client.delete_objects,
                     Bucket=bucket_name,
                     Delete={
                         'Objects': objects_to_delete,
-                        'Quiet': False  # Get detailed response
+                        'Quiet': True
                     }
                 )
-                
-                # Count successful deletions
-                if 'Deleted' in response:
-                    result["deleted_count"] += len(response['Deleted'])
-                
-                # Track failures
-                if 'Errors' in response:
-                    for error in response['Errors']:
-                        result["failed_count"] += 1
-                        result["errors"].append(f"{error['Key']}: {error['Message']}")
-                        
+                errors = response.get('Errors', [])
+                result["deleted_count"] += len(objects_to_delete) - len(errors)
+                for error in errors:
+                    result["failed_count"] += 1
+                    result["errors"].append(f"{error['Key']}: {error['Message']}")
+
             except Exception as batch_error:
                 result["failed_count"] += len(objects_to_delete)
                 result["errors"].append(f"Batch delete failed: {str(batch_error)}")
                 logger.error(f"Batch delete failed for prefix {prefix}: {str(batch_error)}")
+            finally:
+                semaphore.release()
+
+        try:
+            list_kwargs = {'Bucket': bucket_name, 'Prefix': prefix}
+            while True:
+                page = await run_s3(s3_client.list_objects_v2, **list_kwargs)
+
+                objects_to_delete = [{'Key': obj['Key']} for obj in page.get('Contents', [])]
+                if objects_to_delete:
+                    await semaphore.acquire()
+                    batches.append(asyncio.create_task(delete_batch(objects_to_delete)))
+
+                if not page.get('IsTruncated'):
+                    break
+                list_kwargs['ContinuationToken'] = page['NextContinuationToken']
+        finally:
+            await asyncio.gather(*batches)
         
         logger.info(f"S3 cleanup for {bucket_name}/{prefix}: deleted={result['deleted_count']}, failed={result['failed_count']}")
 
@@ -269,65 +318,292 @@ def get_folder_file_s3_key(
 
 
 async def upload_folder_file(
-    file_data: bytes,
+    file: Any,
     project_id: str,
     upload_id: str,
     relative_path: str,
-    content_type: str = 'application/octet-stream'
+    content_type: str = 'application/octet-stream',
+    max_size: Optional[int] = None
 ) -> Dict[str, Any]:
     """
-    Upload a single file to S3 as part of a folder upload.
+    Stream a single file to S3 as part of a folder upload.
+
+    The file is read in chunks while its SHA-256 checksum is computed, so at
+    most one part is held in memory. Files up to S3_MULTIPART_THRESHOLD are sent
+    with one PutObject, larger files as a multipart upload. Multipart objects
+    carry no checksum metadata, since it is only known after the last part.
 
     Args:
-        file_data: The file contents as bytes
+        file: The file to upload, any object with an async read(size) such as UploadFile
         project_id: The project ID
         upload_id: The folder upload ID
         relative_path: The file's relative path within the folder
         content_type: MIME type of the file
+        max_size: Optional size limit in bytes; larger files are rejected with ValueError
 
     Returns:
-        Dict with s3_bucket, s3_key, s3_url, and checksum (SHA-256)
+        Dict with s3_bucket, s3_key, s3_url, file_size and checksum (SHA-256)
     """
     s3_client, s3_bucket, s3_region = await get_s3_client()
 
     s3_key = get_folder_file_s3_key(project_id, upload_id, relative_path)
+    metadata = {
+        'relative-path': relative_path,
+        'upload-id': upload_id,
+    }
 
-    # Calculate SHA-256 checksum (stronger than MD5)
-    checksum = hashlib.sha256(file_data).hexdigest()
+    # Calculate SHA-256 checksum (stronger than MD5) while reading
+    hasher = hashlib.sha256()
+    file_size = 0
 
+    def add_chunk(chunk: bytes):
+        nonlocal file_size
+        file_size += len(chunk)
+        if max_size is not None and file_size > max_size:
+            raise ValueError(f"File exceeds maximum size of {max_size} bytes")
+        hasher.update(chunk)
+
+    upload = None
     try:
-        s3_client.put_object(
-            Bucket=s3_bucket,
-            Key=s3_key,
-            Body=file_data,
-            ContentType=content_type,
-            Metadata={
-                'relative-path': relative_path,
-                'upload-id': upload_id,
-                'checksum-sha256': checksum
-            }
-        )
+        chunk = await file.read(S3_MULTIPART_THRESHOLD)
+        add_chunk(chunk)
+        next_chunk = await file.read(S3_MULTIPART_CHUNK_SIZE) if len(chunk) == S3_MULTIPART_THRESHOLD else b""
+
+        if not next_chunk:
+            checksum = hasher.hexdigest()
+            await run_s3(
+                s3_client.put_object,
+                Bucket=s3_bucket,
+                Key=s3_key,
+                Body=chunk,
+                ContentType=content_type,
+                Metadata={**metadata, 'checksum-sha256': checksum}
+            )
+        else:
+            upload = await run_s3(
+                s3_client.create_multipart_upload,
+                Bucket=s3_bucket,
+                Key=s3_key,
+                ContentType=content_type,
+                Metadata=metadata
+            )
+            parts = []
+            while chunk:
+                response = await run_s3(
+                    s3_client.upload_part,
+                    Bucket=s3_bucket,
+                    Key=s3_key,
+                    UploadId=upload['UploadId'],
+                    PartNumber=len(parts) + 1,
+                    Body=chunk
+                )
+                parts.append({'PartNumber': len(parts) + 1, 'ETag': response['ETag']})
+
+                chunk = next_chunk
+                if chunk:
+                    add_chunk(chunk)
+                    next_chunk = await file.read(S3_MULTIPART_CHUNK_SIZE)
+
+            await run_s3(
+                s3_client.complete_multipart_upload,
+                Bucket=s3_bucket,
+                Key=s3_key,
+                UploadId=upload['UploadId'],
+                MultipartUpload={'Parts': parts}
+            )
+            checksum = hasher.hexdigest()
 
         # Generate URL
         s3_url = f"https://{s3_bucket}.s3.{s3_region}.amazonaws.com/{s3_key}"
 
-        logger.debug(f"Uploaded file to S3: {s3_key}")
+        logger.debug(f"Uploaded file to S3: {s3_key} ({file_size} bytes)")
 
         return {
             "s3_bucket": s3_bucket,
             "s3_key": s3_key,
             "s3_url": s3_url,
+            "file_size": file_size,
             "checksum": checksum  # SHA-256 hash
         }
 
+    except BaseException as e:
+        if upload is not None:
+            try:
+                await run_s3(
+                    s3_client.abort_multipart_upload,
+                    Bucket=s3_bucket,
+                    Key=s3_key,
+                    UploadId=upload['UploadId']
+                )
+            except Exception as abort_error:
+                logger.warning(f"Failed to abort multipart upload for {s3_key}: {str(abort_error)}")
+
+        if isinstance(e, ClientError):
+            logger.error(f"Failed to upload file to S3: {s3_key}, error: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to upload file to storage"
+            )
+        raise
+
+
+async def create_presigned_folder_file_upload(
+    project_id: str,
+    upload_id: str,
+    relative_path: str,
+    file_size: int,
+    content_type: str = 'application/octet-stream',
+    checksum: Optional[str] = None,
+    expiration: int = PRESIGNED_URL_EXPIRATION
+) -> Dict[str, Any]:
+    """
+    Prepare a direct client-to-S3 upload of a single folder file.
+
+    Files up to S3_MULTIPART_THRESHOLD get one presigned PutObject URL. A given
+    SHA-256 checksum is signed into that URL, so S3 rejects a body that does not
+    match it. Larger files get a multipart upload with one presigned UploadPart
+    URL per S3_MULTIPART_CHUNK_SIZE part; the parts are collected with
+    complete_presigned_multipart_upload once the client is done. S3 has no
+    whole-object SHA-256 for multipart uploads, so their checksum is not checked.
+
+    Args:
+        project_id: The project ID
+        upload_id: The folder upload ID
+        relative_path: The file's relative path within the folder
+        file_size: Declared size of the file in bytes
+        content_type: MIME type of the file, which the client must send as Content-Type
+        checksum: Optional hex SHA-256 of the file (single PUT only)
+        expiration: URL expiration time in seconds (default 1 hour)
+
+    Returns:
+        Dict with s3_key, s3_url and method; "put" uploads carry url and headers,
+        "multipart" uploads carry s3_upload_id, part_size and parts (part_number, url)
+    """
+    s3_client, s3_bucket, s3_region = await get_s3_client()
+    s3_key = get_folder_file_s3_key(project_id, upload_id, relative_path)
+    s3_url = f"https://{s3_bucket}.s3.{s3_region}.amazonaws.com/{s3_key}"
+
+    try:
+        if file_size <= S3_MULTIPART_THRESHOLD:
+            params = {'Bucket': s3_bucket, 'Key': s3_key, 'ContentType': content_type}
+            headers = {'Content-Type': content_type}
+            if checksum:
+                try:
+                    digest = bytes.fromhex(checksum)
+                except ValueError:
+                    digest = b''
+                if len(digest) != hashlib.sha256().digest_size:
+                    raise ValueError("checksum must be a hex SHA-256 digest")
+                params['ChecksumSHA256'] = headers['x-amz-checksum-sha256'] = base64.b64encode(digest).decode()
+
+            url = s3_client.generate_presigned_url('put_object', Params=params, ExpiresIn=expiration)
+            return {"s3_key": s3_key, "s3_url": s3_url, "method": "put", "url": url, "headers": headers}
+
+        upload = await run_s3(
+            s3_client.create_multipart_upload,
+            Bucket=s3_bucket,
+            Key=s3_key,
+            ContentType=content_type,
+            Metadata={'relative-path': relative_path, 'upload-id': upload_id}
+        )
+        parts = [
+            {
+                "part_number": part_number,
+                "url": s3_client.generate_presigned_url(
+                    'upload_part',
+                    Params={
+                        'Bucket': s3_bucket,
+                        'Key': s3_key,
+                        'UploadId': upload['UploadId'],
+                        'PartNumber': part_number,
+                    },
+                    ExpiresIn=expiration
+                ),
+            }
+            for part_number in range(1, math.ceil(file_size / S3_MULTIPART_CHUNK_SIZE) + 1)
+        ]
+        return {
+            "s3_key": s3_key,
+            "s3_url": s3_url,
+            "method": "multipart",
+            "s3_upload_id": upload['UploadId'],
+            "part_size": S3_MULTIPART_CHUNK_SIZE,
+            "parts": parts,
+        }
+
+    except ClientError as e:
+        logger.error(f"Failed to prepare direct upload for {s3_key}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to prepare upload URLs"
+        )
+
+
+async def complete_presigned_multipart_upload(s3_key: str, s3_upload_id: str, file_size: int) -> bool:
+    """
+    Complete a multipart upload whose parts the client sent to presigned URLs.
+
+    The upload is only completed once every part presigned for file_size is
+    there and the parts add up to file_size; until then it stays open, so the
+    client can still send the missing parts.
+
+    Args:
+        s3_key: The S3 key of the file
+        s3_upload_id: The multipart upload ID from create_presigned_folder_file_upload
+        file_size: Declared size of the file in bytes
+
+    Returns:
+        False if parts are missing or S3 no longer knows the upload
+        (it was completed or aborted before)
+    """
+    s3_client, s3_bucket, _ = await get_s3_client()
+
+    def list_parts() -> List[Dict[str, Any]]:
+        parts = []
+        paginator = s3_client.get_paginator('list_parts')
+        for page in paginator.paginate(Bucket=s3_bucket, Key=s3_key, UploadId=s3_upload_id):
+            parts.extend(page.get('Parts', []))
+        return parts
+
+    try:
+        parts = sorted(await run_s3(list_parts), key=lambda part: part['PartNumber'])
+        part_count = math.ceil(file_size / S3_MULTIPART_CHUNK_SIZE)
+        uploaded_size = sum(part['Size'] for part in parts)
+        if [part['PartNumber'] for part in parts] != list(range(1, part_count + 1)) or uploaded_size != file_size:
+            logger.info(
+                f"Multipart upload for {s3_key} is incomplete: {len(parts)} of {part_count} parts, "
+                f"{uploaded_size} of {file_size} bytes"
+            )
+            return False
+
+        await run_s3(
+            s3_client.complete_multipart_upload,
+            Bucket=s3_bucket,
+            Key=s3_key,
+            UploadId=s3_upload_id,
+            MultipartUpload={'Parts': [{'PartNumber': part['PartNumber'], 'ETag': part['ETag']} for part in parts]}
+        )
+        return True
+
     except ClientError as e:
-        logger.error(f"Failed to upload file to S3: {s3_key}, error: {str(e)}")
+        if e.response['Error']['Code'] == 'NoSuchUpload':
+            return False
+        logger.error(f"Failed to complete multipart upload for {s3_key}: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to upload file to storage"
+            detail="Failed to complete file upload"
         )
 
 
+async def abort_presigned_multipart_upload(s3_key: str, s3_upload_id: str) -> None:
+    """Abort a multipart upload from create_presigned_folder_file_upload, discarding any uploaded parts."""
+    s3_client, s3_bucket, _ = await get_s3_client()
+    try:
+        await run_s3(s3_client.abort_multipart_upload, Bucket=s3_bucket, Key=s3_key, UploadId=s3_upload_id)
+    except ClientError as e:
+        logger.warning(f"Failed to abort multipart upload for {s3_key}: {str(e)}")
+
+
 async def upload_folder_manifest(
     project_id: str,
     upload_id: str,
@@ -352,7 +628,8 @@ async def upload_folder_manifest(
     manifest_json = json.dumps(manifest_data, indent=2, default=str)
 
     try:
-        s3_client.put_object(
+        await run_s3(
+            s3_client.put_object,
             Bucket=s3_bucket,
             Key=s3_key,
             Body=manifest_json.encode('utf-8'),
@@ -445,7 +722,8 @@ async def delete_folder_file(
     s3_key = get_folder_file_s3_key(project_id, upload_id, relative_path)
 
     try:
-        s3_client.delete_object(
+        await run_s3(
+            s3_client.delete_object,
             Bucket=s3_bucket,
             Key=s3_key
         )
@@ -491,7 +769,8 @@ async def get_file_metadata(s3_key: str) -> Optional[Dict[str, Any]]:
     s3_client, s3_bucket, _ = await get_s3_client()
 
     try:
-        response = s3_client.head_object(
+        response = await run_s3(
+            s3_client.head_object,
             Bucket=s3_bucket,
             Key=s3_key
         )
@@ -536,9 +815,10 @@ async def list_folder_files(
     if path_filter:
         prefix += path_filter.lstrip('/')
 
-    files = []
+    files_prefix = get_folder_upload_prefix(project_id, upload_id) + "files/"
 
-    try:
+    def list_files() -> List[Dict[str, Any]]:
+        files = []
         paginator = s3_client.get_paginator('list_objects_v2')
         pages = paginator.paginate(Bucket=s3_bucket, Prefix=prefix)
 
@@ -549,7 +829,6 @@ async def list_folder_files(
             for obj in page['Contents']:
                 # Extract relative path from S3 key
                 s3_key = obj['Key']
-                files_prefix = get_folder_upload_prefix(project_id, upload_id) + "files/"
                 relative_path = s3_key[len(files_prefix):] if s3_key.startswith(files_prefix) else s3_key
 
                 files.append({
@@ -562,6 +841,9 @@ async def list_folder_files(
 
         return files
 
+    try:
+        return await run_s3(list_files)
+
     except ClientError as e:
         logger.error(f"Failed to list folder files for {project_id}/{upload_id}: {str(e)}")
         raise HTTPException(
@@ -0,0 +1,302 @@
+"""
+Redis-backed streaming of assistant task updates.
+
+Task content and status changes are appended to the task's Redis stream
+(`task_stream:{task_id}`, the same stream the worker publishes agent messages
+to) as content deltas, and a small status key records when a task finishes.
+SSE handlers subscribe through a shared hub that blocks on the streams, so an
+idle stream costs no Mongo reads and long answers are sent once rather than
+re-sent in full on every change.
+"""
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from redis.asyncio.cluster import RedisCluster
+
+logger = logging.getLogger(__name__)
+
+# How long task streams and status keys live after their last update
+TASK_STREAM_TTL_SECONDS = int(os.getenv("TASK_STREAM_TTL_SECONDS", "3600"))
+# XREAD block time; must stay below the Redis client's socket timeout
+TASK_STREAM_BLOCK_MS = int(os.getenv("TASK_STREAM_BLOCK_MS", "1000"))
+# Interval for SSE keep-alive pings and idle status checks
+TASK_STREAM_HEARTBEAT_SECONDS = int(os.getenv("TASK_STREAM_HEARTBEAT_SECONDS", "15"))
+# How often an idle stream re-reads the task from Mongo as a safety net
+TASK_STREAM_RECONCILE_SECONDS = int(os.getenv("TASK_STREAM_RECONCILE_SECONDS", "60"))
+# Mongo polling interval used only when Redis is unavailable
+TASK_STREAM_FALLBACK_POLL_SECONDS = float(os.getenv("TASK_STREAM_FALLBACK_POLL_SECONDS", "1"))
+
+# Entries read per XREAD call
+TASK_STREAM_BATCH_SIZE = 100
+
+# message_type of stream entries written by the backend (agent messages use the SDK type names)
+TASK_UPDATE_MESSAGE_TYPE = "task_update"
+
+TERMINAL_TASK_STATUSES = ("completed", "failed", "cancelled")
+
+# Shared stream announcing every task that reaches a terminal status
+TASK_COMPLETIONS_STREAM = "task_completions"
+TASK_COMPLETIONS_MAXLEN = int(os.getenv("TASK_COMPLETIONS_MAXLEN", "100000"))
+
+
+def task_stream_key(task_id: str) -> str:
+    return f"task_stream:{task_id}"
+
+
+def task_status_key(task_id: str) -> str:
+    return f"task_status:{task_id}"
+
+
+def utf16_len(text: str) -> int:
+    """Length of text in UTF-16 code units, the unit JavaScript strings are indexed in."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def content_delta(old_content: Optional[str], new_content: Optional[str]) -> Tuple[int, str]:
+    """
+    Describe new_content relative to old_content as (offset, text).
+
+    Applying the delta keeps the first `offset` UTF-16 code units of the old
+    content and appends `text`; for the usual append-only updates `offset` is
+    simply the old length. Offsets count UTF-16 code units rather than code
+    points so that clients can apply them with String.slice.
+    """
+    old_content = old_content or ""
+    new_content = new_content or ""
+    prefix = len(os.path.commonprefix([old_content, new_content]))
+    return utf16_len(old_content[:prefix]), new_content[prefix:]
+
+
+def apply_content_delta(content: str, offset: int, delta: str) -> str:
+    # Offsets produced by content_delta always fall on a code point boundary
+    return content.encode("utf-16-le")[:offset * 2].decode("utf-16-le") + delta
+
+
+def _entry_id(entry_id: str) -> Tuple[int, int]:
+    milliseconds, _, sequence = entry_id.partition("-")
+    return int(milliseconds), int(sequence or 0)
+
+
+async def publish_task_update(
+    redis_client: Any,
+    task_id: str,
+    old_content: Optional[str] = None,
+    new_content: Optional[str] = None,
+    status: Optional[str] = None,
+    completed_at: Optional[datetime] = None
+) -> None:
+    """
+    Publish a content and/or status change of a task to its Redis stream.
+
+    Failures are logged and swallowed: streams fall back to reading the task
+    from Mongo, so a missed publish only delays the update.
+
+    Args:
+        redis_client: Client from get_redis_client(); None disables publishing
+        task_id: ID of the task that changed
+        old_content: Content before the change
+        new_content: Content after the change (None if unchanged)
+        status: New status value (None if unchanged)
+        completed_at: Completion time for terminal statuses
+    """
+    if redis_client is None:
+        return
+
+    fields = {
+        "task_id": task_id,
+        "message_type": TASK_UPDATE_MESSAGE_TYPE,
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+    if new_content is not None and new_content != (old_content or ""):
+        offset, delta = content_delta(old_content, new_content)
+        fields["content_offset"] = str(offset)
+        fields["content_delta"] = delta
+
+    if status is not None:
+        fields["status"] = status
+        if completed_at:
+            fields["completed_at"] = completed_at.isoformat()
+
+    if "content_offset" not in fields and "status" not in fields:
+        return
+
+    stream_key = task_stream_key(task_id)
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.xadd(stream_key, fields)
+            pipe.expire(stream_key, TASK_STREAM_TTL_SECONDS)
+            if status is not None:
+                pipe.set(
+                    task_status_key(task_id),
+                    json.dumps({"status": status, "completed_at": fields.get("completed_at")}),
+                    ex=TASK_STREAM_TTL_SECONDS
+                )
+            if status in TERMINAL_TASK_STATUSES:
+                pipe.xadd(
+                    TASK_COMPLETIONS_STREAM,
+                    {"task_id": task_id, "status": status},
+                    maxlen=TASK_COMPLETIONS_MAXLEN,
+                    approximate=True
+                )
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to publish update for task {task_id}: {e}")
+
+
+async def get_task_stream_status(redis_client: Any, task_id: str) -> Optional[Dict[str, Any]]:
+    """Read the status key of a task, or None if it is missing or Redis fails."""
+    try:
+        payload = await redis_client.get(task_status_key(task_id))
+    except Exception as e:
+        logger.warning(f"Failed to read stream status for task {task_id}: {e}")
+        return None
+    return json.loads(payload) if payload else None
+
+
+async def latest_task_completion_id(redis_client: Any) -> str:
+    """ID of the newest entry of the completions stream; read from it to get later completions."""
+    entries = await redis_client.xrevrange(TASK_COMPLETIONS_STREAM, count=1)
+    return entries[0][0] if entries else "0-0"
+
+
+async def read_task_completions(redis_client: Any, last_id: str, block_ms: int = TASK_STREAM_BLOCK_MS) -> Tuple[str, Dict[str, str]]:
+    """
+    Wait up to block_ms for tasks finishing after last_id.
+
+    Returns:
+        The new last_id and a mapping of finished task IDs to their status
+    """
+    response = await redis_client.xread(
+        {TASK_COMPLETIONS_STREAM: last_id},
+        count=TASK_STREAM_BATCH_SIZE,
+        block=block_ms
+    )
+    completions: Dict[str, str] = {}
+    for _, entries in response or []:
+        for entry_id, fields in entries:
+            last_id = entry_id
+            completions[fields["task_id"]] = fields.get("status")
+    return last_id, completions
+
+
+class TaskStreamSubscription:
+    """Entries of one task stream delivered to one SSE client."""
+
+    def __init__(self, task_id: str):
+        self.task_id = task_id
+        self.stream_key = task_stream_key(task_id)
+        self.last_id = "0"
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    def deliver(self, entries: List[Tuple[str, Dict[str, str]]]) -> None:
+        """Queue entries newer than the last one delivered."""
+        last = _entry_id(self.last_id)
+        fresh = [(entry_id, fields) for entry_id, fields in entries if _entry_id(entry_id) > last]
+        if fresh:
+            self.last_id = fresh[-1][0]
+            self._queue.put_nowait(fresh)
+
+    async def next_entries(self, timeout: float) -> List[Tuple[str, Dict[str, str]]]:
+        """Wait up to `timeout` seconds for new entries; returns [] on timeout."""
+        try:
+            entries = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return []
+        while not self._queue.empty():
+            entries.extend(self._queue.get_nowait())
+        return entries
+
+
+class TaskStreamHub:
+    """
+    Shares blocking XREADs between all task stream subscribers of the process.
+
+    Streams are read together with one XREAD per reader, so hundreds of open
+    SSE connections use a handful of Redis connections. In cluster mode keys
+    in different hash slots cannot share an XREAD, so there is one reader per
+    slot in use.
+    """
+
+    def __init__(self):
+        self._subscriptions: Dict[str, Set[TaskStreamSubscription]] = {}
+        self._readers: Dict[Any, asyncio.Task] = {}
+
+    async def subscribe(self, redis_client: Any, task_id: str) -> TaskStreamSubscription:
+        """
+        Subscribe to a task stream, replaying the entries already in it.
+
+        The caller must call unsubscribe() when done.
+        """
+        subscription = TaskStreamSubscription(task_id)
+
+        # Catch up on history before joining the shared reader
+        while True:
+            response = await redis_client.xread(
+                {subscription.stream_key: subscription.last_id},
+                count=TASK_STREAM_BATCH_SIZE
+            )
+            entries = response[0][1] if response else []
+            if not entries:
+                break
+            subscription.deliver(entries)
+
+        self._subscriptions.setdefault(subscription.stream_key, set()).add(subscription)
+
+        group = self._group(redis_client, subscription.stream_key)
+        reader = self._readers.get(group)
+        if reader is None or reader.done():
+            self._readers[group] = asyncio.create_task(self._read(redis_client, group))
+
+        return subscription
+
+    def unsubscribe(self, subscription: TaskStreamSubscription) -> None:
+        subscribers = self._subscriptions.get(subscription.stream_key)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscriptions[subscription.stream_key]
+
+    @staticmethod
+    def _group(redis_client: Any, stream_key: str) -> Optional[int]:
+        if isinstance(redis_client, RedisCluster):
+            return redis_client.keyslot(stream_key)
+        return None
+
+    async def _read(self, redis_client: Any, group: Optional[int]) -> None:
+        while True:
+            streams = {}
+            for stream_key, subscribers in self._subscriptions.items():
+                if self._group(redis_client, stream_key) != group:
+                    continue
+                streams[stream_key] = min((s.last_id for s in subscribers), key=_entry_id)
+
+            if not streams:
+                self._readers.pop(group, None)
+                return
+
+            try:
+                response = await redis_client.xread(
+                    streams,
+                    count=TASK_STREAM_BATCH_SIZE,
+                    block=TASK_STREAM_BLOCK_MS
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Task stream read failed, retrying: {e}")
+                await asyncio.sleep(1)
+                continue
+
+            for stream_key, entries in response or []:
+                for subscription in list(self._subscriptions.get(stream_key, ())):
+                    subscription.deliver(entries)
+
+
+# Shared by all SSE handlers in the process
+task_stream_hub = TaskStreamHub()
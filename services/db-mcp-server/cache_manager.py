@@ -68,17 +68,17 @@ class ConnectionCacheManager:
             # Count total connections across all projects
             total_connections = sum(len(project_cache) for project_cache in self.cache.values())
             
-            # Enforce max size by removing oldest entries
+            # Enforce max size by evicting the least recently used entry
             if total_connections >= self.max_size:
-                # Find the oldest connection across all projects
+                # Find the least recently used connection across all projects
                 oldest_project = None
                 oldest_key = None
                 oldest_time = datetime.now()
                 
                 for proj_id, proj_cache in self.cache.items():
                     for conn_key, entry in proj_cache.items():
-                        if entry['created_at'] < oldest_time:
-                            oldest_time = entry['created_at']
+                        if entry['last_used'] < oldest_time:
+                            oldest_time = entry['last_used']
                             oldest_project = proj_id
                             oldest_key = conn_key
                 
@@ -158,6 +158,14 @@ class ConnectionCacheManager:
         with self.lock:
             return self._remove_connection(project_id, connection_key)
     
+    def remove_project(self, project_id: str) -> int:
+        """Remove all cached connections for a project and return how many were removed."""
+        with self.lock:
+            connection_keys = list(self.cache.get(project_id, {}).keys())
+            for connection_key in connection_keys:
+                self._remove_connection(project_id, connection_key)
+            return len(connection_keys)
+    
     def _remove_connection(self, project_id: str, connection_key: str) -> bool:
         """Internal method to remove connection (assumes lock is held)."""
         if project_id in self.cache and connection_key in self.cache[project_id]:
@@ -257,6 +265,18 @@ class ConnectionCacheManager:
             
             return stats
     
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool statistics of cached clients that pool connections, by project."""
+        with self.lock:
+            result = {}
+            for project_id, project_cache in self.cache.items():
+                for connection_key, entry in project_cache.items():
+                    client = entry.get('client')
+                    pool_stats = client.get_pool_stats() if hasattr(client, 'get_pool_stats') else None
+                    if pool_stats:
+                        result.setdefault(project_id, {})[connection_key] = pool_stats
+            return result
+    
     def list_connections(self, project_id: Optional[str] = None) -> Dict[str, Any]:
         """List all connections, optionally filtered by project."""
         with self.lock:
@@ -3,7 +3,7 @@ Configuration management for DB MCP Server.
 """
 
 import os
-from typing import Optional
+from typing import Dict, Optional
 
 
 class Config:
@@ -21,6 +21,36 @@ class Config:
         # Cache Configuration
         self.CONNECTION_CACHE_TTL = int(os.getenv("CONNECTION_CACHE_TTL", "3600"))  # 1 hour default
         self.CONNECTION_CACHE_MAX_SIZE = int(os.getenv("CONNECTION_CACHE_MAX_SIZE", "100"))
+        self.DATA_SOURCE_CACHE_TTL = int(os.getenv("DATA_SOURCE_CACHE_TTL", "60"))  # seconds
+        
+        # Metadata cache Configuration (list/describe/sample tool results)
+        self.METADATA_CACHE_MAX_ENTRIES = int(os.getenv("METADATA_CACHE_MAX_ENTRIES", "1000"))
+        self.METADATA_CACHE_TTL_LIST = int(os.getenv("METADATA_CACHE_TTL_LIST", "300"))  # seconds
+        self.METADATA_CACHE_TTL_DESCRIBE = int(os.getenv("METADATA_CACHE_TTL_DESCRIBE", "900"))  # seconds
+        self.METADATA_CACHE_TTL_SAMPLE = int(os.getenv("METADATA_CACHE_TTL_SAMPLE", "120"))  # seconds
+        self.METADATA_CACHE_TOOL_TTLS = self._parse_tool_ttls(os.getenv("METADATA_CACHE_TOOL_TTLS", ""))
+        self.METADATA_CACHE_REDIS_URL = os.getenv("METADATA_CACHE_REDIS_URL", "")
+        
+        # Backend API HTTP pool Configuration
+        self.BACKEND_HTTP_POOL_LIMIT = int(os.getenv("BACKEND_HTTP_POOL_LIMIT", "100"))
+        self.BACKEND_HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("BACKEND_HTTP_POOL_LIMIT_PER_HOST", "20"))
+        self.BACKEND_HTTP_KEEPALIVE_TIMEOUT = float(os.getenv("BACKEND_HTTP_KEEPALIVE_TIMEOUT", "30"))  # seconds
+        self.BACKEND_HTTP_CONNECT_TIMEOUT = float(os.getenv("BACKEND_HTTP_CONNECT_TIMEOUT", "5"))  # seconds
+        self.BACKEND_HTTP_TOTAL_TIMEOUT = float(os.getenv("BACKEND_HTTP_TOTAL_TIMEOUT", "30"))  # seconds
+        
+        # Driver executor Configuration (blocking database drivers run on bounded thread pools)
+        self.DRIVER_MAX_WORKERS_PER_PROVIDER = int(os.getenv("DRIVER_MAX_WORKERS_PER_PROVIDER", "16"))
+        self.DRIVER_MAX_CONCURRENCY_PER_PROJECT = int(os.getenv("DRIVER_MAX_CONCURRENCY_PER_PROJECT", "4"))
+        
+        # Per-project connection pool Configuration (Snowflake, Redshift)
+        self.CONNECTION_POOL_SIZE = int(os.getenv("CONNECTION_POOL_SIZE", "5"))
+        self.CONNECTION_POOL_MAX_LIFETIME = int(os.getenv("CONNECTION_POOL_MAX_LIFETIME", "1800"))  # seconds
+        self.CONNECTION_POOL_HEALTH_CHECK_INTERVAL = int(os.getenv("CONNECTION_POOL_HEALTH_CHECK_INTERVAL", "60"))  # seconds
+        
+        # Databricks statement execution Configuration
+        self.DATABRICKS_STATEMENT_TIMEOUT = int(os.getenv("DATABRICKS_STATEMENT_TIMEOUT", "600"))  # seconds
+        self.DATABRICKS_CHUNK_FETCH_CONCURRENCY = int(os.getenv("DATABRICKS_CHUNK_FETCH_CONCURRENCY", "4"))
+        self.DATABRICKS_USE_ARROW = os.getenv("DATABRICKS_USE_ARROW", "true").lower() == "true"
         
         # Query Limits
         self.DEFAULT_QUERY_LIMIT = int(os.getenv("DEFAULT_QUERY_LIMIT", "100"))
@@ -33,6 +63,16 @@ class Config:
         # Cleanup interval (in seconds)
         self.CACHE_CLEANUP_INTERVAL = int(os.getenv("CACHE_CLEANUP_INTERVAL", "300"))  # 5 minutes
     
+    @staticmethod
+    def _parse_tool_ttls(value: str) -> Dict[str, int]:
+        """Parse per-tool TTL overrides in the form "tool_name=seconds,tool_name=seconds"."""
+        ttls = {}
+        for item in value.split(","):
+            if "=" in item:
+                tool_name, seconds = item.split("=", 1)
+                ttls[tool_name.strip()] = int(seconds)
+        return ttls
+    
     def validate(self) -> bool:
         """Validate configuration settings."""
         if not self.API_BASE_URL:
@@ -44,6 +84,31 @@ class Config:
         if self.CONNECTION_CACHE_MAX_SIZE <= 0:
             raise ValueError("CONNECTION_CACHE_MAX_SIZE must be positive")
         
+        if self.DATA_SOURCE_CACHE_TTL < 0:
+            raise ValueError("DATA_SOURCE_CACHE_TTL must be non-negative")
+        
+        if self.METADATA_CACHE_MAX_ENTRIES <= 0:
+            raise ValueError("METADATA_CACHE_MAX_ENTRIES must be positive")
+        
+        if min([self.METADATA_CACHE_TTL_LIST, self.METADATA_CACHE_TTL_DESCRIBE, self.METADATA_CACHE_TTL_SAMPLE,
+                *self.METADATA_CACHE_TOOL_TTLS.values()]) < 0:
+            raise ValueError("Metadata cache TTLs must be non-negative")
+        
+        if self.BACKEND_HTTP_POOL_LIMIT <= 0 or self.BACKEND_HTTP_POOL_LIMIT_PER_HOST <= 0:
+            raise ValueError("BACKEND_HTTP_POOL_LIMIT and BACKEND_HTTP_POOL_LIMIT_PER_HOST must be positive")
+        
+        if self.DRIVER_MAX_WORKERS_PER_PROVIDER <= 0 or self.DRIVER_MAX_CONCURRENCY_PER_PROJECT <= 0:
+            raise ValueError("DRIVER_MAX_WORKERS_PER_PROVIDER and DRIVER_MAX_CONCURRENCY_PER_PROJECT must be positive")
+        
+        if self.CONNECTION_POOL_SIZE <= 0 or self.CONNECTION_POOL_MAX_LIFETIME <= 0:
+            raise ValueError("CONNECTION_POOL_SIZE and CONNECTION_POOL_MAX_LIFETIME must be positive")
+        
+        if self.CONNECTION_POOL_HEALTH_CHECK_INTERVAL < 0:
+            raise ValueError("CONNECTION_POOL_HEALTH_CHECK_INTERVAL must be non-negative")
+        
+        if self.DATABRICKS_STATEMENT_TIMEOUT <= 0 or self.DATABRICKS_CHUNK_FETCH_CONCURRENCY <= 0:
+            raise ValueError("DATABRICKS_STATEMENT_TIMEOUT and DATABRICKS_CHUNK_FETCH_CONCURRENCY must be positive")
+        
         if self.DEFAULT_QUERY_LIMIT <= 0 or self.DEFAULT_QUERY_LIMIT > self.MAX_QUERY_LIMIT:
             raise ValueError("DEFAULT_QUERY_LIMIT must be positive and <= MAX_QUERY_LIMIT")
         
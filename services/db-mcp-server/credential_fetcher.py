@@ -4,6 +4,7 @@ Fetches credentials from the backend API based on project ID.
 """
 
 import aiohttp
+import asyncio
 import logging
 from typing import Dict, List, Optional, Any
 
@@ -13,8 +14,65 @@ logger = logging.getLogger(__name__)
 class CredentialFetcher:
     """Fetches database credentials from the backend API."""
     
-    def __init__(self, api_base_url: str):
+    def __init__(self, api_base_url: str, pool_limit: int = 100, pool_limit_per_host: int = 20,
+                 keepalive_timeout: float = 30.0, connect_timeout: float = 5.0,
+                 total_timeout: float = 30.0):
         self.api_base_url = api_base_url.rstrip('/')
+        self.pool_limit = pool_limit
+        self.pool_limit_per_host = pool_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(total=total_timeout, connect=connect_timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        self._requests = 0
+        self._request_errors = 0
+    
+    async def start(self) -> None:
+        """Create the shared HTTP session if it does not exist yet."""
+        await self._get_session()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the long-lived pooled session, creating it on first use."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+    
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.pool_limit,
+                    limit_per_host=self.pool_limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=300
+                )
+                self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+                logger.info(f"Created pooled HTTP session for {self.api_base_url} "
+                            f"(limit={self.pool_limit}, limit_per_host={self.pool_limit_per_host})")
+            return self._session
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session and release pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("Closed pooled HTTP session")
+        self._session = None
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool statistics for the shared HTTP session."""
+        stats = {
+            "session_open": self._session is not None and not self._session.closed,
+            "limit": self.pool_limit,
+            "limit_per_host": self.pool_limit_per_host,
+            "requests": self._requests,
+            "request_errors": self._request_errors,
+            "acquired_connections": 0,
+            "idle_connections": 0
+        }
+        if stats["session_open"]:
+            connector = self._session.connector
+            # aiohttp does not expose pool occupancy publicly; read it defensively
+            stats["acquired_connections"] = len(getattr(connector, "_acquired", ()))
+            stats["idle_connections"] = sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+        return stats
     
     async def get_credentials(self, project_id: str, provider_type: str) -> Optional[Dict[str, Any]]:
         """
@@ -28,74 +86,82 @@ class CredentialFetcher:
             Dictionary containing database credentials or None if not found
         """
         try:
-            url = f"{self.api_base_url}/projects/{project_id}/data-sources"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Failed to get data sources for project {project_id}. "
-                                   f"Status: {response.status}, Error: {error_text}")
-                        return None
-                    
-                    data = await response.json()
-                    data_sources = data.get("data_sources", [])
-                    
-                    # Find data source matching the specified provider type
-                    for ds in data_sources:
-                        ds_type = ds.get("type")
-                        
-                        # Only look for the specified provider type
-                        if ds_type != provider_type:
-                            continue
-                        
-                        if ds_type == "databricks":
-                            credentials = self._extract_databricks_credentials(ds)
-                            if credentials:
-                                logger.info(f"Retrieved Databricks credentials for project: {project_id}")
-                                return {
-                                    "type": "databricks",
-                                    "configuration": credentials
-                                }
-                        elif ds_type == "snowflake":
-                            credentials = self._extract_snowflake_credentials(ds)
-                            if credentials:
-                                logger.info(f"Retrieved Snowflake credentials for project: {project_id}")
-                                return {
-                                    "type": "snowflake", 
-                                    "configuration": credentials
-                                }
-                        elif ds_type == "bigquery":
-                            credentials = self._extract_bigquery_credentials(ds)
-                            if credentials:
-                                logger.info(f"Retrieved BigQuery credentials for project: {project_id}")
-                                return {
-                                    "type": "bigquery",
-                                    "configuration": credentials
-                                }
-                        elif ds_type == "redshift":
-                            credentials = self._extract_redshift_credentials(ds)
-                            if credentials:
-                                logger.info(f"Retrieved Redshift credentials for project: {project_id}")
-                                return {
-                                    "type": "redshift",
-                                    "configuration": credentials
-                                }
-                        elif ds_type == "glue":
-                            credentials = self._extract_glue_credentials(ds)
-                            if credentials:
-                                logger.info(f"Retrieved Glue credentials for project: {project_id}")
-                                return {
-                                    "type": "glue",
-                                    "configuration": credentials
-                                }
-
-                    logger.warning(f"No {provider_type} data source found for project: {project_id}")
-                    return None
-                    
+            data_sources = await self.fetch_data_sources(project_id)
         except Exception as e:
             logger.error(f"Error fetching credentials for project {project_id}: {str(e)}")
             return None
+        
+        return self.extract_credentials(project_id, data_sources, provider_type)
+    
+    def extract_credentials(self, project_id: str, data_sources: List[Dict[str, Any]],
+                            provider_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract credentials for a provider type from an already fetched data source list.
+        
+        Args:
+            project_id: Project identifier (used for logging)
+            data_sources: Data source configurations as returned by the backend API
+            provider_type: Provider type (databricks, snowflake)
+            
+        Returns:
+            Dictionary containing database credentials or None if not found
+        """
+        try:
+            # Find data source matching the specified provider type
+            for ds in data_sources:
+                ds_type = ds.get("type")
+                
+                # Only look for the specified provider type
+                if ds_type != provider_type:
+                    continue
+                
+                if ds_type == "databricks":
+                    credentials = self._extract_databricks_credentials(ds)
+                    if credentials:
+                        logger.info(f"Retrieved Databricks credentials for project: {project_id}")
+                        return {
+                            "type": "databricks",
+                            "configuration": credentials
+                        }
+                elif ds_type == "snowflake":
+                    credentials = self._extract_snowflake_credentials(ds)
+                    if credentials:
+                        logger.info(f"Retrieved Snowflake credentials for project: {project_id}")
+                        return {
+                            "type": "snowflake", 
+                            "configuration": credentials
+                        }
+                elif ds_type == "bigquery":
+                    credentials = self._extract_bigquery_credentials(ds)
+                    if credentials:
+                        logger.info(f"Retrieved BigQuery credentials for project: {project_id}")
+                        return {
+                            "type": "bigquery",
+                            "configuration": credentials
+                        }
+                elif ds_type == "redshift":
+                    credentials = self._extract_redshift_credentials(ds)
+                    if credentials:
+                        logger.info(f"Retrieved Redshift credentials for project: {project_id}")
+                        return {
+                            "type": "redshift",
+                            "configuration": credentials
+                        }
+                elif ds_type == "glue":
+                    credentials = self._extract_glue_credentials(ds)
+                    if credentials:
+                        logger.info(f"Retrieved Glue credentials for project: {project_id}")
+                        return {
+                            "type": "glue",
+                            "configuration": credentials
+                        }
+
+            logger.warning(f"No {provider_type} data source found for project: {project_id}")
+            return None
+            
+        except Exception as e:
+            logger.error(f"Error extracting credentials for project {project_id}: {str(e)}")
+            return None
     
     def _extract_databricks_credentials(self, data_source: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -419,6 +485,39 @@ class CredentialFetcher:
             logger.error(f"Error extracting Glue credentials: {str(e)}")
             return None
 
+    async def fetch_data_sources(self, project_id: str) -> List[Dict[str, Any]]:
+        """
+        Fetch all data sources for a project, raising on failure.
+        
+        Unlike get_all_data_sources, errors are propagated so callers that cache
+        the result can tell an empty project apart from a failed request.
+        
+        Args:
+            project_id: Project identifier
+            
+        Returns:
+            List of data source configurations
+            
+        Raises:
+            RuntimeError: If the backend API returns a non-200 response
+        """
+        url = f"{self.api_base_url}/projects/{project_id}/data-sources"
+        
+        session = await self._get_session()
+        self._requests += 1
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise RuntimeError(f"Failed to get data sources for project {project_id}. "
+                                       f"Status: {response.status}, Error: {error_text}")
+                
+                data = await response.json()
+                return data.get("data_sources", [])
+        except Exception:
+            self._request_errors += 1
+            raise
+    
     async def get_all_data_sources(self, project_id: str) -> List[Dict[str, Any]]:
         """
         Get all data sources for a project.
@@ -430,19 +529,7 @@ class CredentialFetcher:
             List of data source configurations
         """
         try:
-            url = f"{self.api_base_url}/projects/{project_id}/data-sources"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Failed to get data sources for project {project_id}. "
-                                   f"Status: {response.status}, Error: {error_text}")
-                        return []
-                    
-                    data = await response.json()
-                    return data.get("data_sources", [])
-                    
+            return await self.fetch_data_sources(project_id)
         except Exception as e:
             logger.error(f"Error fetching data sources for project {project_id}: {str(e)}")
             return []
@@ -0,0 +1,189 @@
+"""
+Metadata result cache for list/describe/sample tools.
+
+Warehouse metadata changes rarely compared to how often agents ask for it, so
+provider results are cached per project and tool arguments. Entries live in an
+in-process LRU, optionally backed by Redis so that results are shared across
+server replicas and survive restarts.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+try:
+    import redis.asyncio as redis
+except ImportError:
+    # Redis tier is optional; the in-process LRU works without it
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+
+class MetadataCache:
+    """Per-project LRU cache of metadata tool results with an optional Redis tier."""
+
+    def __init__(self, max_entries: int = 1000, tool_ttls: Optional[Dict[str, int]] = None,
+                 default_ttl: int = 300, redis_url: Optional[str] = None,
+                 key_prefix: str = "db-mcp:metadata"):
+        """
+        Args:
+            max_entries: Maximum entries kept in process
+            tool_ttls: TTL in seconds per tool name; 0 disables caching for that tool
+            default_ttl: TTL for tools not listed in tool_ttls
+            redis_url: Redis URL for the shared tier (None keeps the cache in process)
+            key_prefix: Prefix for Redis keys
+        """
+        self.max_entries = max_entries
+        self.tool_ttls = tool_ttls or {}
+        self.default_ttl = default_ttl
+        self.key_prefix = key_prefix
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._redis = None
+        self._stats = {
+            'hits': 0,
+            'redis_hits': 0,
+            'misses': 0,
+            'bypassed': 0,
+            'refreshed': 0,
+            'redis_errors': 0
+        }
+
+        if redis_url:
+            if redis is None:
+                logger.warning("METADATA_CACHE_REDIS_URL is set but the redis package is not installed; using in-process cache only")
+            else:
+                self._redis = redis.from_url(redis_url, decode_responses=True)
+
+    def _key(self, project_id: str, tool_name: str, arguments: Dict[str, Any]) -> str:
+        """Build a cache key from the project, tool and normalized arguments."""
+        args = json.dumps(arguments, sort_keys=True, default=str)
+        digest = hashlib.sha1(args.encode()).hexdigest()
+        return f"{self.key_prefix}:{project_id}:{tool_name}:{digest}"
+
+    async def get_or_load(self, project_id: str, tool_name: str, arguments: Dict[str, Any],
+                          load: Callable[[], Awaitable[Dict[str, Any]]],
+                          refresh: bool = False, bypass: bool = False) -> Dict[str, Any]:
+        """
+        Return a cached provider result, loading and storing it on a miss.
+
+        Results containing an "error" key are returned but never cached.
+
+        Args:
+            project_id: Project identifier
+            tool_name: Tool the result belongs to (selects the TTL)
+            arguments: Tool arguments that determine the result
+            load: Coroutine function fetching the result from the warehouse
+            refresh: Skip the cached value and overwrite it with a fresh result
+            bypass: Fetch from the warehouse without reading or writing the cache
+        """
+        ttl = self.tool_ttls.get(tool_name, self.default_ttl)
+        if bypass or ttl <= 0:
+            self._stats['bypassed'] += 1
+            return await load()
+
+        key = self._key(project_id, tool_name, arguments)
+
+        if refresh:
+            self._stats['refreshed'] += 1
+        else:
+            cached = await self._get(key)
+            if cached is not None:
+                return cached
+            self._stats['misses'] += 1
+
+        result = await load()
+        if "error" not in result:
+            await self._set(key, result, ttl)
+        return result
+
+    async def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return value
+            del self._entries[key]
+
+        if self._redis is None:
+            return None
+
+        try:
+            payload = await self._redis.get(key)
+            if payload is None:
+                return None
+            ttl = await self._redis.ttl(key)
+        except Exception as e:
+            self._stats['redis_errors'] += 1
+            logger.warning(f"Metadata cache Redis read failed: {e}")
+            return None
+
+        value = json.loads(payload)
+        if ttl and ttl > 0:
+            self._store_local(key, value, ttl)
+        self._stats['redis_hits'] += 1
+        return value
+
+    async def _set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        self._store_local(key, value, ttl)
+
+        if self._redis is None:
+            return
+
+        try:
+            await self._redis.set(key, json.dumps(value, default=str), ex=ttl)
+        except Exception as e:
+            self._stats['redis_errors'] += 1
+            logger.warning(f"Metadata cache Redis write failed: {e}")
+
+    def _store_local(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, project_id: Optional[str] = None) -> int:
+        """
+        Drop cached metadata for one project, or for all projects.
+
+        Returns:
+            Number of in-process entries removed
+        """
+        prefix = f"{self.key_prefix}:{project_id}:" if project_id else f"{self.key_prefix}:"
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+
+        if self._redis is not None:
+            try:
+                redis_keys = [key async for key in self._redis.scan_iter(match=f"{prefix}*", count=500)]
+                if redis_keys:
+                    await self._redis.delete(*redis_keys)
+            except Exception as e:
+                self._stats['redis_errors'] += 1
+                logger.warning(f"Metadata cache Redis invalidation failed: {e}")
+
+        logger.info(f"Invalidated {len(keys)} metadata cache entries for {project_id or 'all projects'}")
+        return len(keys)
+
+    async def close(self) -> None:
+        """Close the Redis connection, if any."""
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self._stats['hits'] + self._stats['redis_hits'] + self._stats['misses']
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'redis_enabled': self._redis is not None,
+            'hit_rate': round((self._stats['hits'] + self._stats['redis_hits']) / lookups, 4) if lookups else 0.0,
+            **self._stats
+        }
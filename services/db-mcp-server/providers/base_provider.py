@@ -4,7 +4,9 @@ Minimal base database provider interface - infrastructure only.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
+
+from .driver_executor import driver_executor
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,21 @@ class DatabaseProvider(ABC):
         self.credentials: Optional[Dict[str, Any]] = None
         self._initialized = False
         self.provider_type: str = self.__class__.__name__.lower().replace('provider', '')
+        # Set by the server so driver calls count against the right project's cap
+        self.project_id: Optional[str] = None
+    
+    async def run_sync(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking driver call on this provider's bounded thread pool.
+        
+        Args:
+            func: Blocking callable
+            *args, **kwargs: Arguments for func
+            
+        Returns:
+            Result of func
+        """
+        return await driver_executor.run(self.provider_type, self.project_id, func, *args, **kwargs)
     
     @abstractmethod
     async def initialize(self, credentials: Dict[str, Any]) -> None:
@@ -57,6 +74,14 @@ class DatabaseProvider(ABC):
         except Exception as e:
             logger.error(f"Error during {self.provider_type} provider cleanup: {e}")
     
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool statistics.
+        Default implementation for providers without a pool.
+        """
+        pool = getattr(self, 'pool', None)
+        return pool.get_stats() if pool else {}
+    
     @property
     def is_initialized(self) -> bool:
         """Check if the provider is initialized."""
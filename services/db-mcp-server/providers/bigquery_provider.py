@@ -9,6 +9,7 @@ from google.cloud import bigquery
 from google.oauth2 import service_account
 
 from .base_provider import DatabaseProvider
+from .query_limits import FETCH_BATCH_SIZE, limit_query
 
 logger = logging.getLogger(__name__)
 
@@ -63,7 +64,7 @@ class BigQueryProvider(DatabaseProvider):
                 return False
             
             # Try to list datasets to test connection
-            datasets = list(self.client.list_datasets(max_results=1))
+            datasets = await self.run_sync(lambda: list(self.client.list_datasets(max_results=1)))
             logger.info("BigQuery connection test successful")
             return True
             
@@ -95,6 +96,10 @@ class BigQueryProvider(DatabaseProvider):
         Returns:
             List of table information dictionaries
         """
+        return await self.run_sync(self._list_tables_sync, dataset, limit)
+    
+    def _list_tables_sync(self, dataset: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """List tables with the blocking BigQuery client (runs on the driver thread pool)."""
         try:
             if not self.client:
                 raise RuntimeError("BigQuery client not initialized")
@@ -168,6 +173,10 @@ class BigQueryProvider(DatabaseProvider):
         Returns:
             Dictionary with table metadata and schema information
         """
+        return await self.run_sync(self._describe_table_sync, table_id, dataset)
+    
+    def _describe_table_sync(self, table_id: str, dataset: str) -> Dict[str, Any]:
+        """Describe a table with the blocking BigQuery client (runs on the driver thread pool)."""
         try:
             if not self.client:
                 raise RuntimeError("BigQuery client not initialized")
@@ -248,6 +257,10 @@ class BigQueryProvider(DatabaseProvider):
         Returns:
             Dictionary with sample data and metadata
         """
+        return await self.run_sync(self._sample_table_sync, table_id, dataset, limit)
+    
+    def _sample_table_sync(self, table_id: str, dataset: str, limit: int = 100) -> Dict[str, Any]:
+        """Sample a table with the blocking BigQuery client (runs on the driver thread pool)."""
         try:
             if not self.client:
                 raise RuntimeError("BigQuery client not initialized")
@@ -318,19 +331,16 @@ class BigQueryProvider(DatabaseProvider):
         Returns:
             Dictionary with query results and metadata
         """
+        return await self.run_sync(self._query_sync, sql, limit, dataset)
+    
+    def _query_sync(self, sql: str, limit: int = 100, dataset: Optional[str] = None) -> Dict[str, Any]:
+        """Execute a query with the blocking BigQuery client (runs on the driver thread pool)."""
         try:
             if not self.client:
                 raise RuntimeError("BigQuery client not initialized")
 
-            # Add limit to query if not already present
-            sql_lower = sql.lower().strip()
-            if not sql_lower.endswith(';'):
-                sql = sql.strip()
-            if 'limit' not in sql_lower:
-                if sql.endswith(';'):
-                    sql = sql[:-1] + f" LIMIT {limit};"
-                else:
-                    sql = sql + f" LIMIT {limit}"
+            # Enforce the limit in the statement; one extra row tells us whether results were truncated
+            sql = limit_query(sql, limit + 1)
 
             # Configure query with default dataset if provided
             job_config = None
@@ -341,11 +351,16 @@ class BigQueryProvider(DatabaseProvider):
 
             # Execute query
             query_job = self.client.query(sql, job_config=job_config)
-            results = query_job.result()
+            # Page through at most limit + 1 rows instead of downloading the whole result
+            results = query_job.result(max_results=limit + 1, page_size=min(FETCH_BATCH_SIZE, limit + 1))
             
             # Convert results to list of dictionaries
             rows = []
+            truncated = False
             for row in results:
+                if len(rows) >= limit:
+                    truncated = True
+                    break
                 row_dict = {}
                 for key, value in row.items():
                     if hasattr(value, 'isoformat'):  # datetime objects
@@ -369,6 +384,7 @@ class BigQueryProvider(DatabaseProvider):
             query_info = {
                 "sql": sql,
                 "row_count": len(rows),
+                "truncated": truncated,
                 "columns": columns,
                 "rows": rows,
                 "total_bytes_processed": query_job.total_bytes_processed,
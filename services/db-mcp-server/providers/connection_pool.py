@@ -0,0 +1,203 @@
+"""
+Connection pool for blocking DB-API drivers.
+
+Each provider instance (one per project and provider type) owns a pool so that
+concurrent tool calls get their own connection instead of sharing one, which
+would otherwise race on session state such as Snowflake's USE DATABASE.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Sizing applied to every provider pool; set by the server at startup
+POOL_DEFAULTS: Dict[str, float] = {
+    'max_size': 5,
+    'max_lifetime': 1800,
+    'health_check_interval': 60
+}
+
+
+def configure_pool_defaults(max_size: int, max_lifetime: float, health_check_interval: float) -> None:
+    """Set the sizing used for provider connection pools created from now on."""
+    POOL_DEFAULTS.update(
+        max_size=max_size,
+        max_lifetime=max_lifetime,
+        health_check_interval=health_check_interval
+    )
+
+
+class PooledConnection:
+    """A driver connection plus the bookkeeping the pool needs."""
+
+    def __init__(self, connection: Any):
+        self.connection = connection
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.last_checked = self.created_at
+
+
+class ConnectionPool:
+    """Bounded async pool around blocking driver connections."""
+
+    def __init__(self, name: str,
+                 create: Callable[[], Any],
+                 run_sync: Callable[..., Awaitable[Any]],
+                 validate: Optional[Callable[[Any], None]] = None,
+                 max_size: int = 5,
+                 max_lifetime: float = 1800,
+                 health_check_interval: float = 60):
+        """
+        Args:
+            name: Pool name used in logs and stats
+            create: Blocking callable returning a new driver connection
+            run_sync: Coroutine function used to run blocking calls off the event loop
+            validate: Blocking callable that raises if a connection is unusable
+            max_size: Maximum number of connections (checked out + idle)
+            max_lifetime: Seconds after which a connection is recycled
+            health_check_interval: Idle seconds after which a connection is validated on checkout
+        """
+        self.name = name
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+        self._create = create
+        self._validate = validate
+        self._run_sync = run_sync
+        self._idle: Deque[PooledConnection] = deque()
+        self._slots = asyncio.Semaphore(max_size)
+        self._in_use = 0
+        self._closed = False
+        self._stats = {
+            'created': 0,
+            'recycled': 0,
+            'failed_health_checks': 0,
+            'checkouts': 0,
+            'waits': 0
+        }
+
+    async def acquire(self, accept: Optional[Callable[[Any], bool]] = None) -> PooledConnection:
+        """
+        Check out a healthy connection, creating one if none is idle.
+
+        Args:
+            accept: Optional check an idle connection must pass to be handed out,
+                    e.g. that it carries no session state; when no idle connection
+                    passes, one is closed to make room and a new one opened
+        """
+        if self._closed:
+            raise RuntimeError(f"Connection pool {self.name} is closed")
+
+        if self._slots.locked():
+            self._stats['waits'] += 1
+        await self._slots.acquire()
+
+        rejected = []
+        try:
+            while self._idle:
+                pooled = self._idle.pop()
+                now = time.monotonic()
+
+                if now - pooled.created_at > self.max_lifetime:
+                    self._stats['recycled'] += 1
+                    await self._close(pooled)
+                    continue
+
+                if accept and not accept(pooled.connection):
+                    rejected.append(pooled)
+                    continue
+
+                if self._validate and now - pooled.last_checked > self.health_check_interval:
+                    try:
+                        await self._run_sync(self._validate, pooled.connection)
+                        pooled.last_checked = now
+                    except Exception as e:
+                        logger.warning(f"Discarding unhealthy connection from pool {self.name}: {e}")
+                        self._stats['failed_health_checks'] += 1
+                        await self._close(pooled)
+                        continue
+
+                break
+            else:
+                if rejected:
+                    # Make room for the new connection
+                    self._stats['recycled'] += 1
+                    await self._close(rejected.pop())
+                pooled = PooledConnection(await self._run_sync(self._create))
+                self._stats['created'] += 1
+                logger.info(f"Opened new connection for pool {self.name}")
+        except BaseException:
+            self._slots.release()
+            raise
+        finally:
+            # Connections passed over stay idle for other borrowers, in their order
+            self._idle.extend(reversed(rejected))
+
+        self._in_use += 1
+        self._stats['checkouts'] += 1
+        return pooled
+
+    async def release(self, pooled: PooledConnection, failed: bool = False) -> None:
+        """
+        Return a connection to the pool.
+
+        Args:
+            pooled: Connection obtained from acquire()
+            failed: Whether the borrower hit an error; the connection is then
+                    validated on its next checkout instead of trusted
+        """
+        self._in_use -= 1
+        try:
+            if self._closed or time.monotonic() - pooled.created_at > self.max_lifetime:
+                await self._close(pooled)
+                return
+
+            pooled.last_used = time.monotonic()
+            if failed:
+                pooled.last_checked = 0
+            self._idle.append(pooled)
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def connection(self, accept: Optional[Callable[[Any], bool]] = None) -> AsyncIterator[Any]:
+        """Context manager yielding a raw driver connection for exclusive use (see acquire)."""
+        pooled = await self.acquire(accept)
+        failed = False
+        try:
+            yield pooled.connection
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            await self.release(pooled, failed=failed)
+
+    async def _close(self, pooled: PooledConnection) -> None:
+        try:
+            await self._run_sync(pooled.connection.close)
+        except Exception as e:
+            logger.warning(f"Error closing connection in pool {self.name}: {e}")
+
+    async def close(self) -> None:
+        """Close idle connections now; checked-out ones are closed on release."""
+        self._closed = True
+        while self._idle:
+            await self._close(self._idle.pop())
+        logger.info(f"Closed connection pool {self.name}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            'name': self.name,
+            'max_size': self.max_size,
+            'in_use': self._in_use,
+            'idle': len(self._idle),
+            'closed': self._closed,
+            **self._stats
+        }
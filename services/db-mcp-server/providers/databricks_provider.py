@@ -2,23 +2,52 @@
 Databricks database provider implementation using the official Databricks Python SDK.
 """
 
+import asyncio
 import logging
+import time
 from typing import Dict, List, Any, Optional
+
+import aiohttp
 from databricks.sdk import WorkspaceClient
-from databricks.sdk.service.sql import StatementExecutionAPI
+from databricks.sdk.service.sql import (
+    Disposition,
+    ExecuteStatementRequestOnWaitTimeout,
+    Format,
+    StatementExecutionAPI,
+    StatementState
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401
+except ImportError:
+    # Without pyarrow, results are fetched INLINE as JSON arrays
+    pa = None
 
 from .base_provider import DatabaseProvider
+from .query_limits import limit_query
 
 logger = logging.getLogger(__name__)
 
+# How long execute_statement blocks before returning a statement ID to poll (API allows 5s-50s)
+STATEMENT_SUBMIT_WAIT = "10s"
+POLL_INITIAL_DELAY = 0.5
+POLL_MAX_DELAY = 5.0
+
 
 class DatabricksProvider(DatabaseProvider):
     """Databricks database provider using the official Databricks Python SDK."""
     
+    # Statement execution settings, set by the server via configure()
+    statement_timeout: float = 600
+    chunk_fetch_concurrency: int = 4
+    use_arrow: bool = True
+    
     def __init__(self):
         super().__init__()
         self.workspace_client: Optional[WorkspaceClient] = None
         self.warehouse_id: Optional[str] = None
+        self._http_session: Optional[aiohttp.ClientSession] = None
     
     async def initialize(self, credentials: Dict[str, Any]) -> None:
         """Initialize Databricks connection using the Python SDK."""
@@ -41,8 +70,8 @@ class DatabricksProvider(DatabaseProvider):
             else:
                 raise ValueError(f"Invalid http_path format: {http_path}. Expected format: /sql/1.0/warehouses/{{warehouse_id}}")
             
-            # Create Databricks workspace client directly (no threading needed)
-            self.workspace_client = self._create_workspace_client(host, access_token)
+            # Client construction resolves auth config over the network, so keep it off the loop
+            self.workspace_client = await self.run_sync(self._create_workspace_client, host, access_token)
             
             self._initialized = True
             
@@ -63,23 +92,85 @@ class DatabricksProvider(DatabaseProvider):
             token=access_token
         )
     
+    @classmethod
+    def configure(cls, statement_timeout: float, chunk_fetch_concurrency: int, use_arrow: bool) -> None:
+        """
+        Set statement execution settings for all Databricks providers.
+        
+        Args:
+            statement_timeout: Seconds to wait for a statement before cancelling it
+            chunk_fetch_concurrency: Result chunks downloaded in parallel per statement
+            use_arrow: Fetch results as Arrow via EXTERNAL_LINKS when pyarrow is installed
+        """
+        cls.statement_timeout = statement_timeout
+        cls.chunk_fetch_concurrency = chunk_fetch_concurrency
+        cls.use_arrow = use_arrow
+    
     async def execute_query(self, query: str, limit: Optional[int] = None, catalog: str = None, schema: str = None) -> Dict[str, Any]:
-        """Execute a SQL query against Databricks using the Python SDK."""
+        """
+        Execute a SQL query against Databricks using the Statement Execution API.
+        
+        The statement is submitted asynchronously and polled with backoff until it
+        finishes or statement_timeout expires. If the caller is cancelled (e.g. the
+        client disconnected) or the timeout hits, the statement is cancelled on the
+        warehouse as well.
+        """
         if not self._initialized or not self.workspace_client:
             raise RuntimeError("Provider not initialized")
         
+        statement_id = None
         try:
-            # Apply limit only for SELECT statements and if not already present
-            query_upper = query.strip().upper()
-            if limit and query_upper.startswith('SELECT') and not any(keyword in query_upper for keyword in ['LIMIT', 'TOP']):
-                query = f"{query.rstrip(';')} LIMIT {limit}"
+            # Enforce the limit in the statement; one extra row tells us whether results were truncated
+            if limit:
+                query = limit_query(query, limit + 1)
+            
+            use_arrow = self.use_arrow and pa is not None
+            response = await self.run_sync(self._submit_statement, query, catalog, schema, limit, use_arrow)
+            statement_id = response.statement_id
+            
+            response = await self._wait_for_statement(response)
+            statement_id = None
             
-            # Execute query directly (no threading needed)
-            result = self._execute_query_sync(query, catalog, schema)
+            state = response.status.state if response.status else None
+            if state != StatementState.SUCCEEDED:
+                error = response.status.error if response.status else None
+                if error and error.message:
+                    raise RuntimeError(error.message)
+                raise RuntimeError(f"Statement finished in state {state.value if state else 'UNKNOWN'}")
+            
+            columns = []
+            if response.manifest and response.manifest.schema and response.manifest.schema.columns:
+                columns = [col.name for col in response.manifest.schema.columns]
             
-            return result
+            data_array = await self._fetch_result_rows(response, limit)
+            truncated = bool(limit) and len(data_array) > limit
+            if truncated:
+                data_array = data_array[:limit]
             
+            # Convert data array to list of dictionaries
+            result_rows = []
+            for row_data in data_array:
+                row_dict = {}
+                for i, value in enumerate(row_data):
+                    column_name = columns[i] if i < len(columns) else f"col_{i}"
+                    row_dict[column_name] = self._convert_value(value)
+                result_rows.append(row_dict)
+            
+            return {
+                "query": query,
+                "columns": columns,
+                "rows": result_rows,
+                "row_count": len(result_rows),
+                "truncated": truncated
+            }
+            
+        except asyncio.CancelledError:
+            if statement_id:
+                await asyncio.shield(self._cancel_statement(statement_id))
+            raise
         except Exception as e:
+            if statement_id:
+                await self._cancel_statement(statement_id)
             logger.error(f"Error executing query: {str(e)}")
             return {
                 "error": str(e),
@@ -88,58 +179,109 @@ class DatabricksProvider(DatabaseProvider):
                 "columns": []
             }
     
-    def _execute_query_sync(self, query: str, catalog: str, schema: str) -> Dict[str, Any]:
-        """Execute query synchronously using Databricks SDK (runs in thread pool)."""
+    def _submit_statement(self, query: str, catalog: str, schema: str, limit: Optional[int], use_arrow: bool):
+        """Submit a statement, waiting briefly so short queries return inline (runs in thread pool)."""
+        return self.workspace_client.statement_execution.execute_statement(
+            statement=query,
+            warehouse_id=self.warehouse_id,
+            catalog=catalog,
+            schema=schema,
+            wait_timeout=STATEMENT_SUBMIT_WAIT,
+            on_wait_timeout=ExecuteStatementRequestOnWaitTimeout.CONTINUE,
+            disposition=Disposition.EXTERNAL_LINKS if use_arrow else Disposition.INLINE,
+            format=Format.ARROW_STREAM if use_arrow else Format.JSON_ARRAY,
+            # Caps the result set server-side even for statements limit_query leaves unchanged
+            row_limit=limit + 1 if limit else None
+        )
+    
+    async def _wait_for_statement(self, response):
+        """Poll a submitted statement with exponential backoff until it leaves PENDING/RUNNING."""
+        deadline = time.monotonic() + self.statement_timeout
+        delay = POLL_INITIAL_DELAY
+        
+        while response.status and response.status.state in (StatementState.PENDING, StatementState.RUNNING):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Statement {response.statement_id} did not finish within {self.statement_timeout}s")
+            
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, POLL_MAX_DELAY)
+            response = await self.run_sync(self.workspace_client.statement_execution.get_statement, response.statement_id)
+        
+        return response
+    
+    async def _cancel_statement(self, statement_id: str) -> None:
+        """Ask the warehouse to stop a statement we no longer wait for."""
         try:
-            # Execute SQL statement using the Databricks SDK
-            response = self.workspace_client.statement_execution.execute_statement(
-                statement=query,
-                warehouse_id=self.warehouse_id,
-                catalog=catalog,
-                schema=schema,
-                wait_timeout="30s"
-            )
-            
-            # Extract results from the response
-            if response.result and response.result.data_array:
-                # Get column names from manifest
-                columns = []
-                if response.manifest and response.manifest.schema and response.manifest.schema.columns:
-                    columns = [col.name for col in response.manifest.schema.columns]
-                
-                # Convert data array to list of dictionaries
-                result_rows = []
-                for row_data in response.result.data_array:
-                    row_dict = {}
-                    for i, value in enumerate(row_data):
-                        column_name = columns[i] if i < len(columns) else f"col_{i}"
-                        # Handle None values and convert complex types to string for JSON serialization
-                        if value is None:
-                            row_dict[column_name] = None
-                        elif isinstance(value, (bytes, bytearray)):
-                            row_dict[column_name] = str(value)
-                        else:
-                            row_dict[column_name] = value
-                    result_rows.append(row_dict)
-                
-                return {
-                    "query": query,
-                    "columns": columns,
-                    "rows": result_rows,
-                    "row_count": len(result_rows)
-                }
-            else:
-                # No data returned (e.g., DDL statements)
-                return {
-                    "query": query,
-                    "columns": [],
-                    "rows": [],
-                    "row_count": 0
-                }
-                
+            await self.run_sync(self.workspace_client.statement_execution.cancel_execution, statement_id)
+            logger.info(f"Cancelled Databricks statement {statement_id}")
         except Exception as e:
-            logger.error(f"Error in _execute_query_sync: {str(e)}")
-            raise
+            logger.warning(f"Failed to cancel Databricks statement {statement_id}: {e}")
+    
+    async def _fetch_result_rows(self, response, limit: Optional[int]) -> List[List[Any]]:
+        """Collect all result chunks of a finished statement, fetching chunks in parallel."""
+        if not response.result:
+            return []
+        
+        chunk_count = response.manifest.total_chunk_count if response.manifest and response.manifest.total_chunk_count else 1
+        first_index = response.result.chunk_index or 0
+        semaphore = asyncio.Semaphore(self.chunk_fetch_concurrency)
+        
+        async def fetch_chunk(chunk_index: int) -> List[List[Any]]:
+            async with semaphore:
+                if chunk_index == first_index:
+                    chunk = response.result
+                else:
+                    chunk = await self.run_sync(
+                        self.workspace_client.statement_execution.get_statement_result_chunk_n,
+                        response.statement_id, chunk_index
+                    )
+                
+                if chunk.external_links:
+                    rows = []
+                    for link in chunk.external_links:
+                        rows.extend(await self._download_arrow(link))
+                    return rows
+                return chunk.data_array or []
+        
+        chunks = await asyncio.gather(*[fetch_chunk(index) for index in range(first_index, chunk_count)])
+        
+        rows = []
+        for chunk_rows in chunks:
+            rows.extend(chunk_rows)
+            if limit and len(rows) > limit:
+                break
+        return rows
+    
+    async def _download_arrow(self, link) -> List[List[Any]]:
+        """Download one EXTERNAL_LINKS chunk and decode its Arrow stream into rows."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.statement_timeout))
+        
+        # Presigned cloud storage URL: send only the headers Databricks asks for, never the workspace token
+        async with self._http_session.get(link.external_link, headers=link.http_headers or {}) as resp:
+            resp.raise_for_status()
+            payload = await resp.read()
+        
+        return await self.run_sync(self._decode_arrow, payload)
+    
+    @staticmethod
+    def _decode_arrow(payload: bytes) -> List[List[Any]]:
+        """Decode an Arrow IPC stream into row lists (runs in thread pool)."""
+        table = pa.ipc.open_stream(payload).read_all()
+        return [list(row) for row in zip(*(column.to_pylist() for column in table.columns))]
+    
+    @staticmethod
+    def _convert_value(value: Any) -> Any:
+        """Make a result value JSON serializable."""
+        # Handle None values and convert complex types to string for JSON serialization
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, (bytes, bytearray)):
+            return str(value)
+        if hasattr(value, 'isoformat'):  # datetime objects from Arrow results
+            return value.isoformat()
+        return str(value)
     
     async def list_tables(self, catalog: str, schema_name: str) -> Dict[str, Any]:
         """List tables using SHOW TABLES command."""
@@ -272,6 +414,10 @@ class DatabricksProvider(DatabaseProvider):
             if self.workspace_client:
                 self.workspace_client = None
             
+            if self._http_session and not self._http_session.closed:
+                await self._http_session.close()
+            self._http_session = None
+            
         except Exception as e:
             logger.error(f"Error during cleanup: {str(e)}")
         finally:
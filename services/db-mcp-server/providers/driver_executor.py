@@ -0,0 +1,168 @@
+"""
+Bounded executor layer for synchronous database drivers.
+
+Snowflake, Redshift (psycopg2), Databricks and BigQuery drivers are blocking.
+Calls are run on a dedicated thread pool per provider type so they never stall
+the event loop, and a per-project semaphore keeps one project from occupying
+every worker.
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DriverExecutor:
+    """Runs blocking driver calls off the event loop with per-project caps."""
+
+    def __init__(self, max_workers_per_provider: int = 16, max_concurrency_per_project: int = 4):
+        self.max_workers_per_provider = max_workers_per_provider
+        self.max_concurrency_per_project = max_concurrency_per_project
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._project_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._project_inflight: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def configure(self, max_workers_per_provider: int, max_concurrency_per_project: int) -> None:
+        """
+        Update pool sizes. Must be called before the first driver call.
+
+        Args:
+            max_workers_per_provider: Thread pool size for each provider type
+            max_concurrency_per_project: Concurrent driver calls allowed per project
+        """
+        if self._executors:
+            logger.warning("DriverExecutor already has running pools; new sizes apply to new pools only")
+        self.max_workers_per_provider = max_workers_per_provider
+        self.max_concurrency_per_project = max_concurrency_per_project
+
+    def _get_executor(self, provider_type: str) -> ThreadPoolExecutor:
+        with self._lock:
+            executor = self._executors.get(provider_type)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers_per_provider,
+                    thread_name_prefix=f"{provider_type}-driver"
+                )
+                self._executors[provider_type] = executor
+                self._stats[provider_type] = {
+                    'waiting': 0,
+                    'queued': 0,
+                    'active': 0,
+                    'completed': 0,
+                    'failed': 0,
+                    'total_wait_seconds': 0.0,
+                    'total_run_seconds': 0.0
+                }
+            return executor
+
+    def _get_project_semaphore(self, project_id: str) -> asyncio.Semaphore:
+        semaphore = self._project_semaphores.get(project_id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency_per_project)
+            self._project_semaphores[project_id] = semaphore
+        return semaphore
+
+    async def run(self, provider_type: str, project_id: Optional[str],
+                  func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking callable on the provider's thread pool.
+
+        Args:
+            provider_type: Provider name used to select the thread pool
+            project_id: Project the call belongs to (None skips the per-project cap)
+            func: Blocking callable
+            *args, **kwargs: Arguments for func
+
+        Returns:
+            Whatever func returns; exceptions raised by func propagate
+        """
+        executor = self._get_executor(provider_type)
+        stats = self._stats[provider_type]
+        semaphore = self._get_project_semaphore(project_id) if project_id else None
+
+        stats['waiting'] += 1
+        enqueued_at = time.monotonic()
+        try:
+            if semaphore is not None:
+                await semaphore.acquire()
+        finally:
+            stats['waiting'] -= 1
+
+        if project_id:
+            self._project_inflight[project_id] = self._project_inflight.get(project_id, 0) + 1
+        try:
+            with self._lock:
+                stats['queued'] += 1
+            call = functools.partial(self._run_tracked, stats, enqueued_at, func, *args, **kwargs)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, call)
+        finally:
+            if project_id:
+                self._project_inflight[project_id] -= 1
+                if not self._project_inflight[project_id]:
+                    del self._project_inflight[project_id]
+            if semaphore is not None:
+                semaphore.release()
+
+    def _run_tracked(self, stats: Dict[str, float], enqueued_at: float,
+                     func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Worker-thread wrapper that records queue and run timings."""
+        started_at = time.monotonic()
+        with self._lock:
+            stats['queued'] -= 1
+            stats['active'] += 1
+            stats['total_wait_seconds'] += started_at - enqueued_at
+        # BaseExceptions (SystemExit, KeyboardInterrupt) also count as failed
+        outcome = 'failed'
+        try:
+            result = func(*args, **kwargs)
+            outcome = 'completed'
+            return result
+        finally:
+            with self._lock:
+                stats['active'] -= 1
+                stats[outcome] += 1
+                stats['total_run_seconds'] += time.monotonic() - started_at
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth and throughput statistics per provider."""
+        with self._lock:
+            providers = {}
+            for provider_type, stats in self._stats.items():
+                finished = stats['completed'] + stats['failed']
+                providers[provider_type] = {
+                    'waiting_for_project_slot': int(stats['waiting']),
+                    'queued': int(stats['queued']),
+                    'active': int(stats['active']),
+                    'completed': int(stats['completed']),
+                    'failed': int(stats['failed']),
+                    'avg_queue_seconds': round(stats['total_wait_seconds'] / finished, 4) if finished else 0.0,
+                    'avg_run_seconds': round(stats['total_run_seconds'] / finished, 4) if finished else 0.0
+                }
+
+        return {
+            'max_workers_per_provider': self.max_workers_per_provider,
+            'max_concurrency_per_project': self.max_concurrency_per_project,
+            'providers': providers,
+            'busy_projects': dict(self._project_inflight)
+        }
+
+    def shutdown(self) -> None:
+        """Shut down all thread pools without waiting for running calls."""
+        with self._lock:
+            for executor in self._executors.values():
+                executor.shutdown(wait=False, cancel_futures=True)
+            self._executors.clear()
+        logger.info("Driver executor shut down")
+
+
+# Shared instance used by all providers; sized by the server at startup
+driver_executor = DriverExecutor()
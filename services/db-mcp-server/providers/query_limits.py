@@ -0,0 +1,162 @@
+"""
+Row limiting helpers for user-supplied SQL.
+
+The limit is enforced in two places: the statement is rewritten so the warehouse
+only produces `limit` rows, and results are fetched in bounded batches so a
+statement that could not be rewritten still cannot pull an unbounded result
+into server memory.
+"""
+
+import re
+from typing import Any, List, Optional, Tuple
+
+# Rows requested from the driver per fetchmany() call
+FETCH_BATCH_SIZE = 500
+
+# Statements that return rows and can be wrapped in a subquery
+_ROW_QUERY_KEYWORDS = ('SELECT', 'WITH', 'VALUES')
+
+# Clauses that already restrict or skip rows at the top level
+_ROW_LIMIT_KEYWORDS = ('LIMIT', 'TOP', 'FETCH', 'OFFSET')
+
+_WORD = re.compile(r'[A-Za-z_][A-Za-z0-9_$]*|\d+')
+
+
+def _scan(query: str) -> Tuple[List[Tuple[str, int]], int, bool]:
+    """
+    Tokenize the top level of a statement, skipping strings, quoted identifiers and comments.
+
+    Returns:
+        (top-level words with their start offsets, offset just past the last
+        code character, whether the statement contains more than one statement)
+    """
+    words: List[Tuple[str, int]] = []
+    depth = 0
+    code_end = 0
+    multiple = False
+    # Whether a top-level semicolon has ended a statement
+    ended = False
+    i = 0
+    n = len(query)
+
+    while i < n:
+        ch = query[i]
+
+        if ch == '-' and query.startswith('--', i):
+            newline = query.find('\n', i)
+            i = n if newline == -1 else newline + 1
+            continue
+        if ch == '/' and query.startswith('/*', i):
+            close = query.find('*/', i + 2)
+            i = n if close == -1 else close + 2
+            continue
+        if ch.isspace():
+            i += 1
+            continue
+
+        if ch == ';':
+            if depth == 0:
+                ended = True
+            i += 1
+            continue
+        if ended:
+            # Code after a top-level semicolon, not just comments or more semicolons
+            multiple = True
+
+        if ch in ("'", '"', '`'):
+            j = i + 1
+            while j < n:
+                if query[j] == '\\' and ch == "'":
+                    j += 2
+                    continue
+                if query[j] == ch:
+                    if j + 1 < n and query[j + 1] == ch:
+                        j += 2
+                        continue
+                    break
+                j += 1
+            i = j + 1
+            code_end = min(i, n)
+            continue
+
+        if ch == '(':
+            if depth == 0:
+                words.append(('(', i))
+            depth += 1
+        elif ch == ')':
+            depth = max(depth - 1, 0)
+        else:
+            match = _WORD.match(query, i)
+            if match:
+                if depth == 0:
+                    words.append((match.group().upper(), i))
+                i = match.end()
+                code_end = i
+                continue
+
+        i += 1
+        code_end = i
+
+    return words, code_end, multiple
+
+
+def limit_query(query: str, limit: int) -> str:
+    """
+    Rewrite a statement so the warehouse returns at most `limit` rows.
+
+    A query with no top-level row restriction gets `LIMIT n` appended. One that
+    already has a literal top-level LIMIT within the cap is left alone, and any
+    other row-returning query is wrapped in `SELECT * FROM (...) LIMIT n`.
+    Statements that do not return rows (DDL, DML, SHOW, ...) and multi-statement
+    scripts are returned unchanged and rely on the bounded fetch instead.
+
+    Args:
+        query: SQL statement
+        limit: Maximum number of rows
+
+    Returns:
+        The statement to execute, without a trailing semicolon
+    """
+    words, code_end, multiple = _scan(query)
+    statement = query[:code_end].rstrip().rstrip(';').rstrip()
+
+    if multiple or not words or words[0][0] not in _ROW_QUERY_KEYWORDS + ('(',):
+        return statement
+
+    keywords = [word for word, _ in words]
+    restrictions = [word for word in keywords if word in _ROW_LIMIT_KEYWORDS]
+
+    if not restrictions:
+        return f"{statement}\nLIMIT {limit}"
+
+    if restrictions == ['LIMIT']:
+        position = keywords.index('LIMIT')
+        following = keywords[position + 1:]
+        if len(following) == 1 and following[0].isdigit() and int(following[0]) <= limit:
+            return statement
+
+    return f"SELECT * FROM (\n{statement}\n) AS limited_query\nLIMIT {limit}"
+
+
+def clamp_limit(limit: Optional[int], default: int, maximum: int) -> int:
+    """Resolve a requested row limit against the configured default and maximum."""
+    if not limit or limit <= 0:
+        return min(default, maximum)
+    return min(limit, maximum)
+
+
+def fetch_limited(cursor: Any, limit: int, batch_size: int = FETCH_BATCH_SIZE) -> Tuple[List[Any], bool]:
+    """
+    Fetch at most `limit` rows from a DB-API cursor in bounded batches.
+
+    Returns:
+        (rows, truncated) where truncated is True if the cursor had more rows
+    """
+    rows: List[Any] = []
+    while len(rows) < limit:
+        batch = cursor.fetchmany(min(batch_size, limit - len(rows)))
+        if not batch:
+            return rows, False
+        rows.extend(batch)
+
+    return rows, bool(cursor.fetchmany(1))
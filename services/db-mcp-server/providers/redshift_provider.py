@@ -5,9 +5,11 @@ Redshift database provider implementation using the psycopg2 PostgreSQL adapter.
 import logging
 import psycopg2
 import psycopg2.extras
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from .base_provider import DatabaseProvider
+from .connection_pool import ConnectionPool, POOL_DEFAULTS
+from .query_limits import fetch_limited, limit_query
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +19,7 @@ class RedshiftProvider(DatabaseProvider):
     
     def __init__(self):
         super().__init__()
-        self.connection = None
+        self.pool: Optional[ConnectionPool] = None
         self.host: Optional[str] = None
         self.port: Optional[int] = None
         self.database: Optional[str] = None
@@ -40,18 +42,15 @@ class RedshiftProvider(DatabaseProvider):
             if not all([self.host, self.database, self.user, self.password]):
                 raise ValueError("Missing required Redshift credentials: host, database, user, or password")
             
-            # Create connection
-            self.connection = psycopg2.connect(
-                host=self.host,
-                port=self.port,
-                database=self.database,
-                user=self.user,
-                password=self.password,
-                connect_timeout=30
+            # Create the connection pool and open one connection up front to validate credentials
+            self.pool = ConnectionPool(
+                f"redshift:{self.project_id}",
+                create=self._connect,
+                run_sync=self.run_sync,
+                validate=lambda connection: self._run_sync_query(connection, "SELECT 1"),
+                **POOL_DEFAULTS
             )
-            
-            # Set autocommit for read operations
-            self.connection.autocommit = True
+            await self.pool.release(await self.pool.acquire())
             
             self._initialized = True
             logger.info(f"Redshift provider initialized successfully for {self.host}:{self.port}/{self.database}")
@@ -64,12 +63,10 @@ class RedshiftProvider(DatabaseProvider):
     async def test_connection(self) -> bool:
         """Test the Redshift connection by executing a simple query."""
         try:
-            if not self.connection:
+            if not self.pool:
                 return False
             
-            with self.connection.cursor() as cursor:
-                cursor.execute("SELECT 1")
-                cursor.fetchone()
+            await self._run_pooled(self._run_sync_query, "SELECT 1")
             
             logger.info("Redshift connection test successful")
             return True
@@ -81,9 +78,9 @@ class RedshiftProvider(DatabaseProvider):
     async def cleanup(self) -> None:
         """Clean up Redshift resources."""
         try:
-            if self.connection:
-                self.connection.close()
-                self.connection = None
+            if self.pool:
+                await self.pool.close()
+                self.pool = None
             
             await super().cleanup()
             logger.info("Redshift provider cleanup completed")
@@ -103,56 +100,88 @@ class RedshiftProvider(DatabaseProvider):
             Dictionary with query results and metadata
         """
         try:
-            if not self.connection:
+            if not self.pool:
                 raise RuntimeError("Redshift connection not initialized")
             
-            # Add limit to query if not already present
-            query_lower = query.lower().strip()
-            if not query_lower.endswith(';'):
-                query = query.strip()
-            if 'limit' not in query_lower and not query_lower.startswith(('insert', 'update', 'delete', 'create', 'drop', 'alter')):
-                if query.endswith(';'):
-                    query = query[:-1] + f" LIMIT {limit};"
-                else:
-                    query = query + f" LIMIT {limit}"
-            
-            with self.connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                cursor.execute(query)
-                
-                # For SELECT queries, fetch results
-                if cursor.description:
-                    rows = cursor.fetchall()
-                    columns = [desc.name for desc in cursor.description]
-                    
-                    # Convert rows to list of dictionaries
-                    result_rows = []
-                    for row in rows:
-                        row_dict = {}
-                        for key, value in row.items():
-                            if hasattr(value, 'isoformat'):  # datetime objects
-                                row_dict[key] = value.isoformat()
-                            else:
-                                row_dict[key] = value
-                        result_rows.append(row_dict)
-                    
-                    return {
-                        "rows": result_rows,
-                        "columns": columns,
-                        "row_count": len(result_rows)
-                    }
-                else:
-                    # For non-SELECT queries (INSERT, UPDATE, DELETE, etc.)
-                    return {
-                        "rows": [],
-                        "columns": [],
-                        "row_count": cursor.rowcount if cursor.rowcount > 0 else 0,
-                        "affected_rows": cursor.rowcount if cursor.rowcount > 0 else 0
-                    }
+            # Enforce the limit in the statement; one extra row tells us whether results were truncated
+            query = limit_query(query, limit + 1)
+            
+            return await self._run_pooled(self._execute_query_sync, query, limit)
             
         except Exception as e:
             logger.error(f"Error executing Redshift query: {e}")
             return {"error": str(e)}
     
+    def _connect(self):
+        """Open a new psycopg2 connection (runs on the driver thread pool)."""
+        connection = psycopg2.connect(
+            host=self.host,
+            port=self.port,
+            database=self.database,
+            user=self.user,
+            password=self.password,
+            connect_timeout=30
+        )
+        
+        # Set autocommit for read operations
+        connection.autocommit = True
+        return connection
+    
+    async def _run_pooled(self, func, *args) -> Any:
+        """Check out a pooled connection and run a blocking helper with it."""
+        async with self.pool.connection() as connection:
+            return await self.run_sync(func, connection, *args)
+    
+    def _execute_query_sync(self, connection, query: str, limit: int) -> Dict[str, Any]:
+        """Execute a query with psycopg2 (runs on the driver thread pool)."""
+        with connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            cursor.execute(query)
+            
+            # For SELECT queries, fetch results
+            if cursor.description:
+                rows, truncated = fetch_limited(cursor, limit)
+                columns = [desc.name for desc in cursor.description]
+                
+                # Convert rows to list of dictionaries
+                result_rows = []
+                for row in rows:
+                    row_dict = {}
+                    for key, value in row.items():
+                        if hasattr(value, 'isoformat'):  # datetime objects
+                            row_dict[key] = value.isoformat()
+                        else:
+                            row_dict[key] = value
+                    result_rows.append(row_dict)
+                
+                return {
+                    "rows": result_rows,
+                    "columns": columns,
+                    "row_count": len(result_rows),
+                    "truncated": truncated
+                }
+            else:
+                # For non-SELECT queries (INSERT, UPDATE, DELETE, etc.)
+                return {
+                    "rows": [],
+                    "columns": [],
+                    "row_count": cursor.rowcount if cursor.rowcount > 0 else 0,
+                    "affected_rows": cursor.rowcount if cursor.rowcount > 0 else 0
+                }
+    
+    def _run_sync_query(self, connection, query: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
+        """Run a parameterized query and fetch all rows (runs on the driver thread pool)."""
+        with connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall() if cursor.description else []
+    
+    def _fetch_with_columns_sync(self, connection, query: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Run a query and return its rows and column names (runs on the driver thread pool)."""
+        with connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+            cursor.execute(query)
+            results = cursor.fetchall()
+            columns = [desc.name for desc in cursor.description] if cursor.description else []
+            return results, columns
+    
     async def list_tables(self, schema_name: Optional[str] = None) -> Dict[str, Any]:
         """
         List tables in Redshift schemas.
@@ -164,7 +193,7 @@ class RedshiftProvider(DatabaseProvider):
             Dictionary with list of tables and metadata
         """
         try:
-            if not self.connection:
+            if not self.pool:
                 raise RuntimeError("Redshift connection not initialized")
             
             schema = schema_name or "public"
@@ -177,28 +206,26 @@ class RedshiftProvider(DatabaseProvider):
                 ORDER BY tablename
             """
             
-            with self.connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                cursor.execute(query, (schema,))
-                results = cursor.fetchall()
-                
-                tables = []
-                for row in results:
-                    tables.append({
-                        "schema": row["schemaname"],
-                        "name": row["tablename"],
-                        "owner": row["tableowner"],
-                        "tablespace": row["tablespace"],
-                        "has_indexes": row["hasindexes"],
-                        "has_rules": row["hasrules"],
-                        "has_triggers": row["hastriggers"],
-                        "type": "TABLE"
-                    })
-                
-                return {
-                    "tables": tables,
-                    "schema": schema,
-                    "count": len(tables)
-                }
+            results = await self._run_pooled(self._run_sync_query, query, (schema,))
+            
+            tables = []
+            for row in results:
+                tables.append({
+                    "schema": row["schemaname"],
+                    "name": row["tablename"],
+                    "owner": row["tableowner"],
+                    "tablespace": row["tablespace"],
+                    "has_indexes": row["hasindexes"],
+                    "has_rules": row["hasrules"],
+                    "has_triggers": row["hastriggers"],
+                    "type": "TABLE"
+                })
+            
+            return {
+                "tables": tables,
+                "schema": schema,
+                "count": len(tables)
+            }
             
         except Exception as e:
             logger.error(f"Error listing Redshift tables: {e}")
@@ -216,7 +243,7 @@ class RedshiftProvider(DatabaseProvider):
             Dictionary with table metadata and schema information
         """
         try:
-            if not self.connection:
+            if not self.pool:
                 raise RuntimeError("Redshift connection not initialized")
             
             schema = schema_name or "public"
@@ -237,40 +264,38 @@ class RedshiftProvider(DatabaseProvider):
                 ORDER BY ordinal_position
             """
             
-            with self.connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                cursor.execute(query, (schema, table_name))
-                columns = cursor.fetchall()
-                
-                if not columns:
-                    return {"error": f"Table {schema}.{table_name} not found"}
+            columns = await self._run_pooled(self._run_sync_query, query, (schema, table_name))
+            
+            if not columns:
+                return {"error": f"Table {schema}.{table_name} not found"}
+            
+            # Format column information
+            column_info = []
+            for col in columns:
+                col_dict = {
+                    "name": col["column_name"],
+                    "type": col["data_type"],
+                    "nullable": col["is_nullable"] == "YES",
+                    "default": col["column_default"],
+                    "position": col["ordinal_position"]
+                }
                 
-                # Format column information
-                column_info = []
-                for col in columns:
-                    col_dict = {
-                        "name": col["column_name"],
-                        "type": col["data_type"],
-                        "nullable": col["is_nullable"] == "YES",
-                        "default": col["column_default"],
-                        "position": col["ordinal_position"]
-                    }
-                    
-                    # Add type-specific information
-                    if col["character_maximum_length"]:
-                        col_dict["max_length"] = col["character_maximum_length"]
-                    if col["numeric_precision"]:
-                        col_dict["precision"] = col["numeric_precision"]
-                    if col["numeric_scale"]:
-                        col_dict["scale"] = col["numeric_scale"]
-                    
-                    column_info.append(col_dict)
+                # Add type-specific information
+                if col["character_maximum_length"]:
+                    col_dict["max_length"] = col["character_maximum_length"]
+                if col["numeric_precision"]:
+                    col_dict["precision"] = col["numeric_precision"]
+                if col["numeric_scale"]:
+                    col_dict["scale"] = col["numeric_scale"]
                 
-                return {
-                    "table_name": f"{schema}.{table_name}",
-                    "schema": schema,
-                    "columns": column_info,
-                    "column_count": len(column_info)
-                }
+                column_info.append(col_dict)
+            
+            return {
+                "table_name": f"{schema}.{table_name}",
+                "schema": schema,
+                "columns": column_info,
+                "column_count": len(column_info)
+            }
             
         except Exception as e:
             logger.error(f"Error describing Redshift table {table_name}: {e}")
@@ -289,7 +314,7 @@ class RedshiftProvider(DatabaseProvider):
             Dictionary with sample data and metadata
         """
         try:
-            if not self.connection:
+            if not self.pool:
                 raise RuntimeError("Redshift connection not initialized")
             
             schema = schema_name or "public"
@@ -298,31 +323,28 @@ class RedshiftProvider(DatabaseProvider):
             # Execute sample query
             query = f"SELECT * FROM {qualified_table} LIMIT {limit}"
             
-            with self.connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
-                cursor.execute(query)
-                results = cursor.fetchall()
-                columns = [desc.name for desc in cursor.description] if cursor.description else []
-                
-                # Convert results to list of dictionaries
-                rows = []
-                for row in results:
-                    row_dict = {}
-                    for key, value in row.items():
-                        if hasattr(value, 'isoformat'):  # datetime objects
-                            row_dict[key] = value.isoformat()
-                        else:
-                            row_dict[key] = value
-                    rows.append(row_dict)
-                
-                return {
-                    "table_name": f"{schema}.{table_name}",
-                    "schema": schema,
-                    "sample_size": len(rows),
-                    "actual_rows": len(rows),
-                    "limit": limit,
-                    "columns": columns,
-                    "rows": rows
-                }
+            results, columns = await self._run_pooled(self._fetch_with_columns_sync, query)
+            
+            # Convert results to list of dictionaries
+            rows = []
+            for row in results:
+                row_dict = {}
+                for key, value in row.items():
+                    if hasattr(value, 'isoformat'):  # datetime objects
+                        row_dict[key] = value.isoformat()
+                    else:
+                        row_dict[key] = value
+                rows.append(row_dict)
+            
+            return {
+                "table_name": f"{schema}.{table_name}",
+                "schema": schema,
+                "sample_size": len(rows),
+                "actual_rows": len(rows),
+                "limit": limit,
+                "columns": columns,
+                "rows": rows
+            }
             
         except Exception as e:
             logger.error(f"Error sampling Redshift table {table_name}: {e}")
@@ -10,6 +10,8 @@ from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 
 from .base_provider import DatabaseProvider
+from .connection_pool import ConnectionPool, POOL_DEFAULTS
+from .query_limits import fetch_limited, limit_query
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +21,7 @@ class SnowflakeProvider(DatabaseProvider):
     
     def __init__(self):
         super().__init__()
-        self.connection = None
+        self.pool: Optional[ConnectionPool] = None
         self.warehouse: Optional[str] = None
     
     async def initialize(self, credentials: Dict[str, Any]) -> None:
@@ -167,8 +169,15 @@ class SnowflakeProvider(DatabaseProvider):
                 logger.info("Using password authentication")
                 conn_params["password"] = password
 
-            # Create Snowflake connection
-            self.connection = snowflake.connector.connect(**conn_params)
+            # Create the connection pool and open one connection up front to validate credentials
+            self.pool = ConnectionPool(
+                f"snowflake:{self.project_id}",
+                create=lambda: snowflake.connector.connect(**conn_params),
+                run_sync=self.run_sync,
+                validate=self._validate_connection,
+                **POOL_DEFAULTS
+            )
+            await self.pool.release(await self.pool.acquire())
 
             self._initialized = True
 
@@ -181,46 +190,78 @@ class SnowflakeProvider(DatabaseProvider):
     
     async def execute_query(self, query: str, limit: Optional[int] = None, database: Optional[str] = None, schema: Optional[str] = None) -> Dict[str, Any]:
         """Execute a SQL query against Snowflake."""
-        if not self._initialized or not self.connection:
+        if not self._initialized or not self.pool:
             raise RuntimeError("Provider not initialized")
         
+        # Enforce the limit in the statement; one extra row tells us whether results were truncated
+        if limit:
+            query = limit_query(query, limit + 1)
+        
         try:
-            # Set database and schema context if provided
-            cursor = self.connection.cursor(DictCursor)
+            # Each query gets its own connection, so USE DATABASE/SCHEMA cannot race.
+            # Without a database to switch to, a connection left in another
+            # borrower's database/schema can't be reset, so only take a clean one.
+            accept = None if database else self._has_no_context
+            async with self.pool.connection(accept) as connection:
+                return await self.run_sync(self._execute_query_sync, connection, query, database, schema, limit)
             
+        except Exception as e:
+            logger.error(f"Error executing query: {str(e)}")
+            return {
+                "error": str(e),
+                "query": query,
+                "rows": [],
+                "columns": []
+            }
+    
+    @staticmethod
+    def _validate_connection(connection) -> None:
+        """Raise if a pooled connection is no longer usable."""
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        finally:
+            cursor.close()
+    
+    @staticmethod
+    def _has_no_context(connection) -> bool:
+        """Whether a pooled connection is still outside any database and schema, as opened."""
+        return not connection.database and not connection.schema
+
+    def _execute_query_sync(self, connection, query: str, database: Optional[str], schema: Optional[str],
+                            limit: Optional[int] = None) -> Dict[str, Any]:
+        """Execute a query with the blocking connector (runs on the driver thread pool)."""
+        # Set the session context explicitly; pooled connections keep what the
+        # previous borrower set. USE DATABASE also resets the schema to PUBLIC.
+        cursor = connection.cursor(DictCursor)
+        try:
+            if self.warehouse and (connection.warehouse or "").upper() != self.warehouse.upper():
+                cursor.execute(f"USE WAREHOUSE {self.warehouse}")
             if database:
                 cursor.execute(f"USE DATABASE {database}")
             if schema:
                 cursor.execute(f"USE SCHEMA {schema}")
             
-            # Apply limit if specified and not already in query
-            if limit and not any(keyword in query.upper() for keyword in ['LIMIT', 'TOP']):
-                query = f"{query.rstrip(';')} LIMIT {limit}"
-            
             # Execute query
             cursor.execute(query)
             
-            # Fetch results
-            rows = cursor.fetchall()
+            # Fetch results in bounded batches when a limit applies
+            truncated = False
+            if limit:
+                rows, truncated = fetch_limited(cursor, limit)
+            else:
+                rows = cursor.fetchall()
             columns = [desc[0] for desc in cursor.description] if cursor.description else []
-            
+        finally:
             cursor.close()
-            
-            return {
-                "query": query,
-                "columns": columns,
-                "rows": rows,
-                "row_count": len(rows)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error executing query: {str(e)}")
-            return {
-                "error": str(e),
-                "query": query,
-                "rows": [],
-                "columns": []
-            }
+        
+        return {
+            "query": query,
+            "columns": columns,
+            "rows": rows,
+            "row_count": len(rows),
+            "truncated": truncated
+        }
     
     async def list_tables(self, database: str, schema: str) -> Dict[str, Any]:
         """
@@ -385,7 +426,7 @@ class SnowflakeProvider(DatabaseProvider):
     async def test_connection(self) -> bool:
         """Test the Snowflake connection."""
         try:
-            if not self._initialized or not self.connection:
+            if not self._initialized or not self.pool:
                 return False
             
             # Simple test query
@@ -399,10 +440,10 @@ class SnowflakeProvider(DatabaseProvider):
     async def cleanup(self) -> None:
         """Clean up Snowflake connection and resources."""
         try:
-            # Close Snowflake connection
-            if self.connection:
-                self.connection.close()
-                self.connection = None
+            # Close pooled Snowflake connections
+            if self.pool:
+                await self.pool.close()
+                self.pool = None
             
         except Exception as e:
             logger.error(f"Error during cleanup: {str(e)}")
@@ -8,9 +8,10 @@ for additional database providers.
 """
 
 import asyncio
+import functools
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 from mcp.server.fastmcp import FastMCP
@@ -23,9 +24,14 @@ from providers.bigquery_provider import BigQueryProvider
 from providers.redshift_provider import RedshiftProvider
 from providers.glue_provider import GlueProvider
 from providers.base_provider import DatabaseProvider
+from providers.driver_executor import driver_executor
+from providers.connection_pool import configure_pool_defaults
+from providers.query_limits import clamp_limit
 from config import Config
 from cache_manager import ConnectionCacheManager
 from credential_fetcher import CredentialFetcher
+from data_source_registry import DataSourceRegistry
+from metadata_cache import MetadataCache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -40,7 +46,67 @@ cache_manager = ConnectionCacheManager(
     ttl_seconds=config.CONNECTION_CACHE_TTL,
     max_size=config.CONNECTION_CACHE_MAX_SIZE
 )
-credential_fetcher = CredentialFetcher(config.API_BASE_URL)
+credential_fetcher = CredentialFetcher(
+    config.API_BASE_URL,
+    pool_limit=config.BACKEND_HTTP_POOL_LIMIT,
+    pool_limit_per_host=config.BACKEND_HTTP_POOL_LIMIT_PER_HOST,
+    keepalive_timeout=config.BACKEND_HTTP_KEEPALIVE_TIMEOUT,
+    connect_timeout=config.BACKEND_HTTP_CONNECT_TIMEOUT,
+    total_timeout=config.BACKEND_HTTP_TOTAL_TIMEOUT
+)
+data_source_registry = DataSourceRegistry(
+    credential_fetcher,
+    ttl_seconds=config.DATA_SOURCE_CACHE_TTL
+)
+
+def _metadata_tool_ttls() -> Dict[str, int]:
+    """Metadata cache TTL per tool: one per tool kind, then per-tool overrides."""
+    kind_ttls = {
+        "list": config.METADATA_CACHE_TTL_LIST,
+        "describe": config.METADATA_CACHE_TTL_DESCRIBE,
+        "sample": config.METADATA_CACHE_TTL_SAMPLE
+    }
+    tool_kinds = {
+        "databricks_list_tables_tool": "list",
+        "databricks_describe_table_tool": "describe",
+        "databricks_sample_table_tool": "sample",
+        "snowflake_list_tables_tool": "list",
+        "snowflake_describe_table_tool": "describe",
+        "snowflake_sample_table_tool": "sample",
+        "bigquery_list_tables_tool": "list",
+        "bigquery_describe_table_tool": "describe",
+        "bigquery_sample_table_tool": "sample",
+        "redshift_list_tables_tool": "list",
+        "redshift_describe_table_tool": "describe",
+        "redshift_sample_table_tool": "sample",
+        "glue_list_databases_tool": "list",
+        "glue_list_tables_tool": "list",
+        "glue_describe_table_tool": "describe"
+    }
+    ttls = {tool_name: kind_ttls[kind] for tool_name, kind in tool_kinds.items()}
+    ttls.update(config.METADATA_CACHE_TOOL_TTLS)
+    return ttls
+
+
+metadata_cache = MetadataCache(
+    max_entries=config.METADATA_CACHE_MAX_ENTRIES,
+    tool_ttls=_metadata_tool_ttls(),
+    redis_url=config.METADATA_CACHE_REDIS_URL or None
+)
+driver_executor.configure(
+    max_workers_per_provider=config.DRIVER_MAX_WORKERS_PER_PROVIDER,
+    max_concurrency_per_project=config.DRIVER_MAX_CONCURRENCY_PER_PROJECT
+)
+configure_pool_defaults(
+    max_size=config.CONNECTION_POOL_SIZE,
+    max_lifetime=config.CONNECTION_POOL_MAX_LIFETIME,
+    health_check_interval=config.CONNECTION_POOL_HEALTH_CHECK_INTERVAL
+)
+DatabricksProvider.configure(
+    statement_timeout=config.DATABRICKS_STATEMENT_TIMEOUT,
+    chunk_fetch_concurrency=config.DATABRICKS_CHUNK_FETCH_CONCURRENCY,
+    use_arrow=config.DATABRICKS_USE_ARROW
+)
 
 # Provider registry - store classes, not instances
 providers: Dict[str, type] = {
@@ -76,7 +142,7 @@ async def get_database_client(project_id: str, provider_name: Optional[str] = No
     if provider_name is None:
         logger.info(f"Auto-detecting provider type for project: {project_id}")
         # Get all data sources to find the first available provider
-        all_data_sources = await credential_fetcher.get_all_data_sources(project_id)
+        all_data_sources = await data_source_registry.get_data_sources(project_id)
         for ds in all_data_sources:
             ds_type = ds.get("type")
             if ds_type in providers:
@@ -89,7 +155,7 @@ async def get_database_client(project_id: str, provider_name: Optional[str] = No
     
     # Fetch credentials for the specified provider type
     logger.info(f"Fetching credentials for project: {project_id}, provider: {provider_name}")
-    credentials = await credential_fetcher.get_credentials(project_id, provider_name)
+    credentials = await data_source_registry.get_credentials(project_id, provider_name)
     if not credentials:
         raise ValueError(f"No {provider_name} credentials found for project: {project_id}")
     
@@ -110,6 +176,7 @@ async def get_database_client(project_id: str, provider_name: Optional[str] = No
     # Create a new instance of the provider for this project
     provider_class = providers[provider_name]
     provider = provider_class()
+    provider.project_id = project_id
     
     logger.info(f"Created {provider_name} provider instance, initializing with credentials")
     
@@ -137,7 +204,7 @@ async def get_supported_providers(project_id: str) -> List[str]:
     """
     try:
         # Get all data sources for the project
-        all_data_sources = await credential_fetcher.get_all_data_sources(project_id)
+        all_data_sources = await data_source_registry.get_data_sources(project_id)
         supported_providers = []
         
         for ds in all_data_sources:
@@ -212,6 +279,7 @@ async def databricks_query_tool(chicory_project_id: str, catalog: str, schema: s
         if not provider:
             return "Error: Could not get Databricks provider for project"
         
+        limit = clamp_limit(limit, config.DEFAULT_QUERY_LIMIT, config.MAX_QUERY_LIMIT)
         result = await provider.execute_query(query, limit=limit, catalog=catalog, schema=schema)
         
         if "error" in result:
@@ -236,6 +304,9 @@ async def databricks_query_tool(chicory_project_id: str, catalog: str, schema: s
         else:
             output += "No data returned.\n"
         
+        if result.get("truncated"):
+            output += f"Results truncated to {limit} rows; add filters or aggregation to narrow the query\n"
+        
         return output
         
     except Exception as e:
@@ -243,7 +314,7 @@ async def databricks_query_tool(chicory_project_id: str, catalog: str, schema: s
         return f"Error: {str(e)}"
 
 
-async def databricks_list_tables_tool(chicory_project_id: str, catalog: str, schema_name: str) -> str:
+async def databricks_list_tables_tool(chicory_project_id: str, catalog: str, schema_name: str, refresh: bool = False, bypass_cache: bool = False) -> str:
     """
     List tables in a Databricks schema using SHOW TABLES.
     
@@ -251,6 +322,8 @@ async def databricks_list_tables_tool(chicory_project_id: str, catalog: str, sch
         chicory_project_id: Project ID for credential lookup
         catalog: Databricks catalog name
         schema_name: Schema name to list tables from (required)
+        refresh: Fetch fresh metadata and update the cache (default: False)
+        bypass_cache: Fetch from the warehouse without using the cache (default: False)
     
     Returns:
         List of tables formatted as a string
@@ -266,7 +339,11 @@ async def databricks_list_tables_tool(chicory_project_id: str, catalog: str, sch
         if not provider:
             return "Error: Could not get Databricks provider for project"
         
-        result = await provider.list_tables(catalog, schema_name)
+        result = await metadata_cache.get_or_load(
+            chicory_project_id, "databricks_list_tables_tool", {"catalog": catalog, "schema_name": schema_name},
+            lambda: provider.list_tables(catalog, schema_name),
+            refresh=refresh, bypass=bypass_cache
+        )
         
         if "error" in result:
             return f"Error listing tables: {result['error']}"
@@ -291,7 +368,7 @@ async def databricks_list_tables_tool(chicory_project_id: str, catalog: str, sch
         return f"Error: {str(e)}"
 
 
-async def databricks_describe_table_tool(chicory_project_id: str, catalog: str, schema_name: str, table_name: str) -> str:
+async def databricks_describe_table_tool(chicory_project_id: str, catalog: str, schema_name: str, table_name: str, refresh: bool = False, bypass_cache: bool = False) -> str:
     """
     Get schema information for a specific table using DESCRIBE.
     
@@ -300,6 +377,8 @@ async def databricks_describe_table_tool(chicory_project_id: str, catalog: str,
         catalog: Databricks catalog name
         schema_name: Schema name
         table_name: Table name to describe
+        refresh: Fetch fresh metadata and update the cache (default: False)
+        bypass_cache: Fetch from the warehouse without using the cache (default: False)
     
     Returns:
         Table schema information formatted as a string
@@ -315,7 +394,11 @@ async def databricks_describe_table_tool(chicory_project_id: str, catalog: str,
         if not provider:
             return "Error: Could not get Databricks provider for project"
         
-        result = await provider.describe_table(table_name, catalog, schema_name)
+        result = await metadata_cache.get_or_load(
+            chicory_project_id, "databricks_describe_table_tool", {"table_name": table_name, "catalog": catalog, "schema_name": schema_name},
+            lambda: provider.describe_table(table_name, catalog, schema_name),
+            refresh=refresh, bypass=bypass_cache
+        )
         
         if "error" in result:
             return f"Error describing table: {result['error']}"
@@ -347,7 +430,7 @@ async def databricks_describe_table_tool(chicory_project_id: str, catalog: str,
         return f"Error: {str(e)}"
 
 
-async def databricks_sample_table_tool(chicory_project_id: str, catalog: str, schema_name: str, table_name: str, limit: int = 10) -> str:
+async def databricks_sample_table_tool(chicory_project_id: str, catalog: str, schema_name: str, table_name: str, limit: int = 10, refresh: bool = False, bypass_cache: bool = False) -> str:
     """
     Sample data from a specific table.
     
@@ -357,6 +440,8 @@ async def databricks_sample_table_tool(chicory_project_id: str, catalog: str, sc
         schema_name: Schema name
         table_name: Table name to sample
         limit: Number of sample rows to return (default: 10)
+        refresh: Fetch fresh metadata and update the cache (default: False)
+        bypass_cache: Fetch from the warehouse without using the cache (default: False)
     
     Returns:
         Sample data formatted as a string
@@ -372,7 +457,11 @@ async def databricks_sample_table_tool(chicory_project_id: str, catalog: str, sc
         if not provider:
             return "Error: Could not get Databricks provider for project"
         
-        result = await provider.sample_table(table_name, catalog, schema_name, limit)
+        result = await metadata_cache.get_or_load(
+            chicory_project_id, "databricks_sample_table_tool", {"table_name": table_name, "catalog": catalog, "schema_name": schema_name, "limit": limit},
+            lambda: provider.sample_table(table_name, catalog, schema_name, limit),
+            refresh=refresh, bypass=bypass_cache
+        )
         
         if "error" in result:
             return f"Error sampling table: {result['error']}"
@@ -426,6 +515,7 @@ async def snowflake_query_tool(chicory_project_id: str, database: str, schema: s
         if not provider:
             return "Error: Could not get Snowflake provider for project"
         
+        limit = clamp_limit(limit, config.DEFAULT_QUERY_LIMIT, config.MAX_QUERY_LIMIT)
         result = await provider.execute_query(query, limit, database=database, schema=schema)
         
         if "error" in result:
@@ -455,6 +545,9 @@ async def snowflake_query_tool(chicory_project_id: str, database: str, schema: s
         if len(rows) > 10:
             output += f"... and {len(rows) - 10} more rows\n"
         
+        if result.get("truncated"):
+            output += f"Results truncated to {limit} rows; add filters or aggregation to narrow the query\n"
+        
         return output
         
     except Exception as e:
@@ -462,7 +555,7 @@ async def snowflake_query_tool(chicory_project_id: str, database: str, schema: s
         return f"Error: {str(e)}"
 
 
-async def snowflake_list_tables_tool(chicory_project_id: str, database: str, schema: str) -> str:
+async def snowflake_list_tables_tool(chicory_project_id: str, database: str, schema: str, refresh: bool = False, bypass_cache: bool = False) -> str:
     """
     List tables in a Snowflake database and schema.
     
@@ -470,6 +563,8 @@ async def snowflake_list_tables_tool(chicory_project_id: str, database: str, sch
         chicory_project_id: Project identifier for credential lookup
         database: Database name
         schema: Schema name
+        refresh: Fetch fresh metadata and update the cache (default: False)
+        bypass_cache: Fetch from the warehouse without using the cache (default: False)
         
     Returns:
         List of tables as formatted string
@@ -483,7 +578,11 @@ async def snowflake_list_tables_tool(chicory_project_id: str, database: str, sch
         if not provider:
             return "Error: Could not get Snowflake provider for project"
         
-        result = await provider.list_tables(database, schema)
+        result = await metadata_cache.get_or_load(
+            chicory_project_id, "snowflake_list_tables_tool", {"database": database, "schema": schema},
+            lambda: provider.list_tables(database, schema),
+            refresh=refresh, bypass=bypass_cache
+        )
         
         if "error" in result:
             return f"Failed to list tables: {result['error']}"
@@ -508,7 +607,7 @@ async def snowflake_list_tables_tool(chicory_project_id: str, database: str, sch
         return f"Error: {str(e)}"
 
 
-async def snowflake_describe_table_tool(chicory_project_id: str, table_name: str, database: Optional[str] = None, schema: Optional[str] = None) -> str:
+async def snowflake_describe_table_tool(chicory_project_id: str, table_name: str, database: Optional[str] = None, schema: Optional[str] = None, refresh: bool = False, bypass_cache: bool = False) -> str:
     """
     Get schema information for a Snowflake table.
     
@@ -517,6 +616,8 @@ async def snowflake_describe_table_tool(chicory_project_id: str, table_name: str
         table_name: Name of the table to describe
         database: Database name (optional, uses default if not provided)
         schema: Schema name (optional, uses default if not provided)
+        refresh: Fetch fresh metadata and update the cache (default: False)
+        bypass_cache: Fetch from the warehouse without using the cache (default: False)
         
     Returns:
         Table schema information as formatted string
@@ -530,7 +631,11 @@ async def snowflake_describe_table_tool(chicory_project_id: str, table_name: str
         if not provider:
             return "Error: Could not get Snowflake provider for project"
         
-        result = await provider.describe_table(table_name, database, schema)
+        result = await metadata_cache.get_or_load(
+            chicory_project_id, "snowflake_describe_table_tool", {"table_name": table_name, "database": database, "schema": schema},
+            lambda: provider.describe_table(table_name, database, schema),
+            refresh=refresh, bypass=bypass_cache
+        )
         
         if "error" in result:
             return f"Failed to describe table: {result['error']}"
@@ -568,7 +673,7 @@ async def snowflake_describe_table_tool(chicory_project_id: str, table_name: str
         return f"Error: {str(e)}"
 
 
-async def snowflake_sample_table_tool(chicory_project_id: str, table_name: str, database: Optional[str] = None, schema: Optional[str] = None, limit: Optional[int] = None) -> str:
+async def snowflake_sample_table_tool(chicory_project_id: str, table_name: str, database: Optional[str] = None, schema: Optional[str] = None, limit: Optional[int] = None, refresh: bool = False, bypass_cache: bool = False) -> str:
     """
     Sample data from a Snowflake table.
     
@@ -578,6 +683,8 @@ async def snowflake_sample_table_tool(chicory_project_id: str, table_name: str,
         database: Database name (optional, uses default if not provided)
         schema: Schema name (optional, uses default if not provided)
         limit: Number of rows to sample (default: 10)
+        refresh: Fetch fresh metadata and update the cache (default: False)
+        bypass_cache: Fetch from the warehouse without using the cache (default: False)
         
     Returns:
         Sample data as formatted string
@@ -591,7 +698,11 @@ async def snowflake_sample_table_tool(chicory_project_id: str, table_name: str,
         if not provider:
             return "Error: Could not get Snowflake provider for project"
         
-        result = await provider.sample_table(table_name, database, schema, limit)
+        result = await metadata_cache.get_or_load(
+            chicory_project_id, "snowflake_sample_table_tool", {"table_name": table_name, "database": database, "schema": schema, "limit": limit},
+            lambda: provider.sample_table(table_name, database, schema, limit),
+            refresh=refresh, bypass=bypass_cache
+        )
         
         if "error" in result:
             return f"Failed to sample table: {result['error']}"
@@ -652,6 +763,7 @@ async def bigquery_query_tool(chicory_project_id: str, dataset: str, query: str,
         if not provider:
             return "Error: Could not get BigQuery provider for project"
         
+        limit = clamp_limit(limit, config.DEFAULT_QUERY_LIMIT, config.MAX_QUERY_LIMIT)
         result = await provider.query(query, limit, dataset=dataset)
         
         if "error" in result:
@@ -684,6 +796,9 @@ async def bigquery_query_tool(chicory_project_id: str, dataset: str, query: str,
         if len(rows) > 10:
             output += f"... and {len(rows) - 10} more rows\n"
         
+        if result.get("truncated"):
+            output += f"Results truncated to {limit} rows; add filters or aggregation to narrow the query\n"
+        
         return output
         
     except Exception as e:
@@ -691,13 +806,15 @@ async def bigquery_query_tool(chicory_project_id: str, dataset: str, query: str,
         return f"Error: {str(e)}"
 
 
-async def bigquery_list_tables_tool(chicory_project_id: str, dataset: Optional[str] = None) -> str:
+async def bigquery_list_tables_tool(chicory_project_id: str, dataset: Optional[str] = None, refresh: bool = False, bypass_cache: bool = False) -> str:
     """
     List tables in BigQuery datasets.
     
     Args:
         chicory_project_id: Project identifier for credential lookup
         dataset: Dataset name (optional, lists from all datasets if not provided)
+        refresh: Fetch fresh metadata and update the cache (default: False)
+        bypass_cache: Fetch from the warehouse without using the cache (default: False)
         
     Returns:
         List of tables as formatted string
@@ -711,7 +828,11 @@ async def bigquery_list_tables_tool(chicory_project_id: str, dataset: Optional[s
         if not provider:
             return "Error: Could not get BigQuery provider for project"
         
-        result = await provider.list_tables(dataset)
+        result = await metadata_cache.get_or_load(
+            chicory_project_id, "bigquery_list_tables_tool", {"dataset": dataset},
+            lambda: provider.list_tables(dataset),
+            refresh=refresh, bypass=bypass_cache
+        )
         
         if not result:
             return f"No tables found in dataset {dataset}" if dataset else "No tables found"
@@ -740,7 +861,7 @@ async def bigquery_list_tables_tool(chicory_project_id: str, dataset: Optional[s
         return f"Error: {str(e)}"
 
 
-async def bigquery_describe_table_tool(chicory_project_id: str, table_id: str, dataset: Optional[str] = None) -> str:
+async def bigquery_describe_table_tool(chicory_project_id: str, table_id: str, dataset: Optional[str] = None, refresh: bool = False, bypass_cache: bool = False) -> str:
     """
     Get schema information for a BigQuery table.
     
@@ -748,6 +869,8 @@ async def bigquery_describe_table_tool(chicory_project_id: str, table_id: str, d
         chicory_project_id: Project identifier for credential lookup
         table_id: Table identifier (can be full path project.dataset.table or just table name)
         dataset: Dataset name (optional if table_id is fully qualified)
+        refresh: Fetch fresh metadata and update the cache (default: False)
+        bypass_cache: Fetch from the warehouse without using the cache (default: False)
         
     Returns:
         Table schema information as formatted string
@@ -761,7 +884,11 @@ async def bigquery_describe_table_tool(chicory_project_id: str, table_id: str, d
         if not provider:
             return "Error: Could not get BigQuery provider for project"
         
-        result = await provider.describe_table(table_id, dataset)
+        result = await metadata_cache.get_or_load(
+            chicory_project_id, "bigquery_describe_table_tool", {"table_id": table_id, "dataset": dataset},
+            lambda: provider.describe_table(table_id, dataset),
+            refresh=refresh, bypass=bypass_cache
+        )
         
         full_table_id = result.get("full_table_id", table_id)
         schema = result.get("schema", [])
@@ -802,7 +929,7 @@ async def bigquery_describe_table_tool(chicory_project_id: str, table_id: str, d
         return f"Error: {str(e)}"
 
 
-async def bigquery_sample_table_tool(chicory_project_id: str, table_id: str, dataset: Optional[str] = None, limit: int = 10) -> str:
+async def bigquery_sample_table_tool(chicory_project_id: str, table_id: str, dataset: Optional[str] = None, limit: int = 10, refresh: bool = False, bypass_cache: bool = False) -> str:
     """
     Sample data from a BigQuery table.
     
@@ -811,6 +938,8 @@ async def bigquery_sample_table_tool(chicory_project_id: str, table_id: str, dat
         table_id: Table identifier (can be full path project.dataset.table or just table name)
         dataset: Dataset name (optional if table_id is fully qualified)
         limit: Number of rows to sample (default: 10)
+        refresh: Fetch fresh metadata and update the cache (default: False)
+        bypass_cache: Fetch from the warehouse without using the cache (default: False)
         
     Returns:
         Sample data as formatted string
@@ -824,7 +953,11 @@ async def bigquery_sample_table_tool(chicory_project_id: str, table_id: str, dat
         if not provider:
             return "Error: Could not get BigQuery provider for project"
         
-        result = await provider.sample_table(table_id, dataset, limit)
+        result = await metadata_cache.get_or_load(
+            chicory_project_id, "bigquery_sample_table_tool", {"table_id": table_id, "dataset": dataset, "limit": limit},
+            lambda: provider.sample_table(table_id, dataset, limit),
+            refresh=refresh, bypass=bypass_cache
+        )
         
         full_table_id = result.get("table_id", table_id)
         columns = result.get("columns", [])
@@ -881,6 +1014,7 @@ async def redshift_query_tool(chicory_project_id: str, query: str, limit: int =
         if not provider:
             return "Error: Could not get Redshift provider for project"
         
+        limit = clamp_limit(limit, config.DEFAULT_QUERY_LIMIT, config.MAX_QUERY_LIMIT)
         result = await provider.execute_query(query, limit)
         
         if "error" in result:
@@ -911,6 +1045,9 @@ async def redshift_query_tool(chicory_project_id: str, query: str, limit: int =
         if len(rows) > 10:
             output += f"... and {len(rows) - 10} more rows\n"
         
+        if result.get("truncated"):
+            output += f"Results truncated to {limit} rows; add filters or aggregation to narrow the query\n"
+        
         return output
         
     except Exception as e:
@@ -918,13 +1055,15 @@ async def redshift_query_tool(chicory_project_id: str, query: str, limit: int =
         return f"Error: {str(e)}"
 
 
-async def redshift_list_tables_tool(chicory_project_id: str, schema: Optional[str] = None) -> str:
+async def redshift_list_tables_tool(chicory_project_id: str, schema: Optional[str] = None, refresh: bool = False, bypass_cache: bool = False) -> str:
     """
     List tables in Redshift schemas.
     
     Args:
         chicory_project_id: Project identifier for credential lookup
         schema: Schema name (optional, lists from public schema if not provided)
+        refresh: Fetch fresh metadata and update the cache (default: False)
+        bypass_cache: Fetch from the warehouse without using the cache (default: False)
         
     Returns:
         List of tables as formatted string
@@ -938,7 +1077,11 @@ async def redshift_list_tables_tool(chicory_project_id: str, schema: Optional[st
         if not provider:
             return "Error: Could not get Redshift provider for project"
         
-        result = await provider.list_tables(schema)
+        result = await metadata_cache.get_or_load(
+            chicory_project_id, "redshift_list_tables_tool", {"schema": schema},
+            lambda: provider.list_tables(schema),
+            refresh=refresh, bypass=bypass_cache
+        )
         
         if "error" in result:
             return f"Failed to list tables: {result['error']}"
@@ -965,7 +1108,7 @@ async def redshift_list_tables_tool(chicory_project_id: str, schema: Optional[st
         return f"Error: {str(e)}"
 
 
-async def redshift_describe_table_tool(chicory_project_id: str, table_name: str, schema: Optional[str] = None) -> str:
+async def redshift_describe_table_tool(chicory_project_id: str, table_name: str, schema: Optional[str] = None, refresh: bool = False, bypass_cache: bool = False) -> str:
     """
     Get schema information for a Redshift table.
     
@@ -973,6 +1116,8 @@ async def redshift_describe_table_tool(chicory_project_id: str, table_name: str,
         chicory_project_id: Project identifier for credential lookup
         table_name: Name of the table to describe
         schema: Schema name (optional, uses public if not provided)
+        refresh: Fetch fresh metadata and update the cache (default: False)
+        bypass_cache: Fetch from the warehouse without using the cache (default: False)
         
     Returns:
         Table schema information as formatted string
@@ -986,7 +1131,11 @@ async def redshift_describe_table_tool(chicory_project_id: str, table_name: str,
         if not provider:
             return "Error: Could not get Redshift provider for project"
         
-        result = await provider.describe_table(table_name, schema)
+        result = await metadata_cache.get_or_load(
+            chicory_project_id, "redshift_describe_table_tool", {"table_name": table_name, "schema": schema},
+            lambda: provider.describe_table(table_name, schema),
+            refresh=refresh, bypass=bypass_cache
+        )
         
         if "error" in result:
             return f"Failed to describe table: {result['error']}"
@@ -1024,7 +1173,7 @@ async def redshift_describe_table_tool(chicory_project_id: str, table_name: str,
         return f"Error: {str(e)}"
 
 
-async def redshift_sample_table_tool(chicory_project_id: str, table_name: str, schema: Optional[str] = None, limit: int = 10) -> str:
+async def redshift_sample_table_tool(chicory_project_id: str, table_name: str, schema: Optional[str] = None, limit: int = 10, refresh: bool = False, bypass_cache: bool = False) -> str:
     """
     Sample data from a Redshift table.
     
@@ -1033,6 +1182,8 @@ async def redshift_sample_table_tool(chicory_project_id: str, table_name: str, s
         table_name: Name of the table to sample
         schema: Schema name (optional, uses public if not provided)
         limit: Number of rows to sample (default: 10)
+        refresh: Fetch fresh metadata and update the cache (default: False)
+        bypass_cache: Fetch from the warehouse without using the cache (default: False)
         
     Returns:
         Sample data as formatted string
@@ -1046,7 +1197,11 @@ async def redshift_sample_table_tool(chicory_project_id: str, table_name: str, s
         if not provider:
             return "Error: Could not get Redshift provider for project"
         
-        result = await provider.sample_table(table_name, schema, limit)
+        result = await metadata_cache.get_or_load(
+            chicory_project_id, "redshift_sample_table_tool", {"table_name": table_name, "schema": schema, "limit": limit},
+            lambda: provider.sample_table(table_name, schema, limit),
+            refresh=refresh, bypass=bypass_cache
+        )
         
         if "error" in result:
             return f"Failed to sample table: {result['error']}"
@@ -1085,12 +1240,14 @@ async def redshift_sample_table_tool(chicory_project_id: str, table_name: str, s
 
 
 # Glue Tools
-async def glue_list_databases_tool(chicory_project_id: str) -> str:
+async def glue_list_databases_tool(chicory_project_id: str, refresh: bool = False, bypass_cache: bool = False) -> str:
     """
     List all databases in AWS Glue Data Catalog.
 
     Args:
         chicory_project_id: Project identifier for credential lookup
+        refresh: Fetch fresh metadata and update the cache (default: False)
+        bypass_cache: Fetch from the warehouse without using the cache (default: False)
 
     Returns:
         List of databases as formatted string
@@ -1104,7 +1261,11 @@ async def glue_list_databases_tool(chicory_project_id: str) -> str:
         if not provider:
             return "Error: Could not get Glue provider for project"
 
-        result = await provider.list_databases()
+        result = await metadata_cache.get_or_load(
+            chicory_project_id, "glue_list_databases_tool", {},
+            lambda: provider.list_databases(),
+            refresh=refresh, bypass=bypass_cache
+        )
 
         if "error" in result:
             return f"Failed to list databases: {result['error']}"
@@ -1136,13 +1297,15 @@ async def glue_list_databases_tool(chicory_project_id: str) -> str:
         return f"Error: {str(e)}"
 
 
-async def glue_list_tables_tool(chicory_project_id: str, database_name: str) -> str:
+async def glue_list_tables_tool(chicory_project_id: str, database_name: str, refresh: bool = False, bypass_cache: bool = False) -> str:
     """
     List tables in an AWS Glue database.
 
     Args:
         chicory_project_id: Project identifier for credential lookup
         database_name: Database name in Glue Data Catalog
+        refresh: Fetch fresh metadata and update the cache (default: False)
+        bypass_cache: Fetch from the warehouse without using the cache (default: False)
 
     Returns:
         List of tables as formatted string
@@ -1156,7 +1319,11 @@ async def glue_list_tables_tool(chicory_project_id: str, database_name: str) ->
         if not provider:
             return "Error: Could not get Glue provider for project"
 
-        result = await provider.list_tables(database_name)
+        result = await metadata_cache.get_or_load(
+            chicory_project_id, "glue_list_tables_tool", {"database_name": database_name},
+            lambda: provider.list_tables(database_name),
+            refresh=refresh, bypass=bypass_cache
+        )
 
         if "error" in result:
             return f"Failed to list tables: {result['error']}"
@@ -1191,7 +1358,7 @@ async def glue_list_tables_tool(chicory_project_id: str, database_name: str) ->
         return f"Error: {str(e)}"
 
 
-async def glue_describe_table_tool(chicory_project_id: str, database_name: str, table_name: str) -> str:
+async def glue_describe_table_tool(chicory_project_id: str, database_name: str, table_name: str, refresh: bool = False, bypass_cache: bool = False) -> str:
     """
     Get schema information for an AWS Glue table.
 
@@ -1199,6 +1366,8 @@ async def glue_describe_table_tool(chicory_project_id: str, database_name: str,
         chicory_project_id: Project identifier for credential lookup
         database_name: Database name in Glue Data Catalog
         table_name: Table name to describe
+        refresh: Fetch fresh metadata and update the cache (default: False)
+        bypass_cache: Fetch from the warehouse without using the cache (default: False)
 
     Returns:
         Table schema information as formatted string
@@ -1212,7 +1381,11 @@ async def glue_describe_table_tool(chicory_project_id: str, database_name: str,
         if not provider:
             return "Error: Could not get Glue provider for project"
 
-        result = await provider.describe_table(database_name, table_name)
+        result = await metadata_cache.get_or_load(
+            chicory_project_id, "glue_describe_table_tool", {"database_name": database_name, "table_name": table_name},
+            lambda: provider.describe_table(database_name, table_name),
+            refresh=refresh, bypass=bypass_cache
+        )
 
         if "error" in result:
             return f"Failed to describe table: {result['error']}"
@@ -2216,6 +2389,773 @@ async def glue_athena_batch_get_query_execution_tool(
         return f"Error: {str(e)}"
 
 
+# Tool registry - built once at import time so MCP requests do no per-call schema construction
+
+# Tools exposed for each provider type
+PROVIDER_TOOLS: Dict[str, List[str]] = {
+    "databricks": [
+        "databricks_query_tool",
+        "databricks_list_tables_tool",
+        "databricks_describe_table_tool",
+        "databricks_sample_table_tool"
+    ],
+    "snowflake": [
+        "snowflake_query_tool",
+        "snowflake_list_tables_tool",
+        "snowflake_describe_table_tool",
+        "snowflake_sample_table_tool"
+    ],
+    "bigquery": [
+        "bigquery_query_tool",
+        "bigquery_list_tables_tool",
+        "bigquery_describe_table_tool",
+        "bigquery_sample_table_tool"
+    ],
+    "redshift": [
+        "redshift_query_tool",
+        "redshift_list_tables_tool",
+        "redshift_describe_table_tool",
+        "redshift_sample_table_tool"
+    ],
+    "glue": [
+        "glue_list_databases_tool",
+        "glue_list_tables_tool",
+        "glue_describe_table_tool",
+        "glue_get_partitions_tool",
+        "glue_create_data_quality_ruleset_tool",
+        "glue_get_data_quality_ruleset_tool",
+        "glue_update_data_quality_ruleset_tool",
+        "glue_delete_data_quality_ruleset_tool",
+        "glue_list_data_quality_rulesets_tool",
+        "glue_start_data_quality_rule_recommendation_run_tool",
+        "glue_get_data_quality_rule_recommendation_run_tool",
+        "glue_start_data_quality_ruleset_evaluation_run_tool",
+        "glue_get_data_quality_ruleset_evaluation_run_tool",
+        "glue_list_data_quality_results_tool",
+        "glue_get_column_statistics_for_table_tool",
+        "glue_get_column_statistics_for_partition_tool",
+        "glue_delete_column_statistics_for_table_tool",
+        "glue_delete_column_statistics_for_partition_tool",
+        "glue_athena_create_work_group_tool",
+        "glue_athena_list_work_groups_tool",
+        "glue_athena_get_work_group_tool",
+        "glue_athena_update_work_group_tool",
+        "glue_athena_delete_work_group_tool",
+        "glue_athena_get_data_catalog_tool",
+        "glue_athena_list_data_catalogs_tool",
+        "glue_athena_update_data_catalog_tool",
+        "glue_athena_start_query_execution_tool",
+        "glue_athena_get_query_execution_tool",
+        "glue_athena_stop_query_execution_tool",
+        "glue_athena_get_query_results_tool",
+        "glue_athena_list_query_executions_tool",
+        "glue_athena_batch_get_query_execution_tool"
+    ]
+}
+
+# Full MCP schema of every tool
+TOOL_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "databricks_query_tool": {
+        "name": "databricks_query_tool",
+        "description": "Execute any SQL query against a Databricks database",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "catalog": {"type": "string", "description": "Databricks catalog name"},
+                "schema": {"type": "string", "description": "Databricks schema name"},
+                "query": {"type": "string", "description": "SQL query to execute"},
+                "limit": {"type": "integer", "description": "Maximum number of rows to return", "default": 100}
+            },
+            "required": ["catalog", "schema", "query"]
+        }
+    },
+    "databricks_list_tables_tool": {
+        "name": "databricks_list_tables_tool", 
+        "description": "List tables in a Databricks schema using SHOW TABLES",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "catalog": {"type": "string", "description": "Databricks catalog name"},
+                "schema_name": {"type": "string", "description": "Schema name to list tables from"},
+                "refresh": {"type": "boolean", "description": "Fetch fresh metadata and update the cache", "default": False},
+                "bypass_cache": {"type": "boolean", "description": "Fetch from the warehouse without using the cache", "default": False}
+            },
+            "required": ["catalog", "schema_name"]
+        }
+    },
+    "databricks_describe_table_tool": {
+        "name": "databricks_describe_table_tool",
+        "description": "Get schema information for a specific table using DESCRIBE",
+        "inputSchema": {
+            "type": "object", 
+            "properties": {
+                "catalog": {"type": "string", "description": "Databricks catalog name"},
+                "schema_name": {"type": "string", "description": "Schema name"},
+                "table_name": {"type": "string", "description": "Table name to describe"},
+                "refresh": {"type": "boolean", "description": "Fetch fresh metadata and update the cache", "default": False},
+                "bypass_cache": {"type": "boolean", "description": "Fetch from the warehouse without using the cache", "default": False}
+            },
+            "required": ["catalog", "schema_name", "table_name"]
+        }
+    },
+    "databricks_sample_table_tool": {
+        "name": "databricks_sample_table_tool",
+        "description": "Sample data from a specific table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "catalog": {"type": "string", "description": "Databricks catalog name"},
+                "schema_name": {"type": "string", "description": "Schema name"},
+                "table_name": {"type": "string", "description": "Table name to sample"},
+                "limit": {"type": "integer", "description": "Number of sample rows to return", "default": 10},
+                "refresh": {"type": "boolean", "description": "Fetch fresh metadata and update the cache", "default": False},
+                "bypass_cache": {"type": "boolean", "description": "Fetch from the warehouse without using the cache", "default": False}
+            },
+            "required": ["catalog", "schema_name", "table_name"]
+        }
+    },
+    # Snowflake tools
+    "snowflake_query_tool": {
+        "name": "snowflake_query_tool",
+        "description": "Execute a SQL query against a Snowflake database",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "database": {"type": "string", "description": "Snowflake database name"},
+                "schema": {"type": "string", "description": "Snowflake schema name"},
+                "query": {"type": "string", "description": "SQL query to execute"},
+                "limit": {"type": "integer", "description": "Maximum number of rows to return", "default": 100}
+            },
+            "required": ["database", "schema", "query"]
+        }
+    },
+    "snowflake_list_tables_tool": {
+        "name": "snowflake_list_tables_tool",
+        "description": "List tables in a Snowflake database and schema",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "database": {"type": "string", "description": "Database name"},
+                "schema": {"type": "string", "description": "Schema name"},
+                "refresh": {"type": "boolean", "description": "Fetch fresh metadata and update the cache", "default": False},
+                "bypass_cache": {"type": "boolean", "description": "Fetch from the warehouse without using the cache", "default": False}
+            },
+            "required": ["database", "schema"]
+        }
+    },
+    "snowflake_describe_table_tool": {
+        "name": "snowflake_describe_table_tool",
+        "description": "Get schema information for a Snowflake table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "database": {"type": "string", "description": "Database name"},
+                "schema": {"type": "string", "description": "Schema name"},
+                "table_name": {"type": "string", "description": "Name of the table to describe"},
+                "refresh": {"type": "boolean", "description": "Fetch fresh metadata and update the cache", "default": False},
+                "bypass_cache": {"type": "boolean", "description": "Fetch from the warehouse without using the cache", "default": False}
+            },
+            "required": ["database", "schema", "table_name"]
+        }
+    },
+    "snowflake_sample_table_tool": {
+        "name": "snowflake_sample_table_tool",
+        "description": "Sample data from a Snowflake table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "database": {"type": "string", "description": "Database name"},
+                "schema": {"type": "string", "description": "Schema name"},
+                "table_name": {"type": "string", "description": "Name of the table to sample"},
+                "limit": {"type": "integer", "description": "Number of rows to sample", "default": 10},
+                "refresh": {"type": "boolean", "description": "Fetch fresh metadata and update the cache", "default": False},
+                "bypass_cache": {"type": "boolean", "description": "Fetch from the warehouse without using the cache", "default": False}
+            },
+            "required": ["database", "schema", "table_name"]
+        }
+    },
+    # BigQuery tools
+    "bigquery_query_tool": {
+        "name": "bigquery_query_tool",
+        "description": "Execute a SQL query against a BigQuery database",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "dataset": {"type": "string", "description": "BigQuery dataset name"},
+                "query": {"type": "string", "description": "SQL query to execute"},
+                "limit": {"type": "integer", "description": "Maximum number of rows to return", "default": 100}
+            },
+            "required": ["dataset", "query"]
+        }
+    },
+    "bigquery_list_tables_tool": {
+        "name": "bigquery_list_tables_tool",
+        "description": "List tables in BigQuery datasets",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "dataset": {"type": "string", "description": "Dataset name"},
+                "refresh": {"type": "boolean", "description": "Fetch fresh metadata and update the cache", "default": False},
+                "bypass_cache": {"type": "boolean", "description": "Fetch from the warehouse without using the cache", "default": False}
+            },
+            "required": ["dataset"]
+        }
+    },
+    "bigquery_describe_table_tool": {
+        "name": "bigquery_describe_table_tool",
+        "description": "Get schema information for a BigQuery table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "dataset": {"type": "string", "description": "Dataset name"},
+                "table_id": {"type": "string", "description": "Table name"},
+                "refresh": {"type": "boolean", "description": "Fetch fresh metadata and update the cache", "default": False},
+                "bypass_cache": {"type": "boolean", "description": "Fetch from the warehouse without using the cache", "default": False}
+            },
+            "required": ["dataset", "table_id"]
+        }
+    },
+    "bigquery_sample_table_tool": {
+        "name": "bigquery_sample_table_tool",
+        "description": "Sample data from a BigQuery table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "dataset": {"type": "string", "description": "Dataset name"},
+                "table_id": {"type": "string", "description": "Table name"},
+                "limit": {"type": "integer", "description": "Number of rows to sample", "default": 10},
+                "refresh": {"type": "boolean", "description": "Fetch fresh metadata and update the cache", "default": False},
+                "bypass_cache": {"type": "boolean", "description": "Fetch from the warehouse without using the cache", "default": False}
+            },
+            "required": ["dataset", "table_id"]
+        }
+    },
+    # Redshift tools
+    "redshift_query_tool": {
+        "name": "redshift_query_tool",
+        "description": "Execute a SQL query against a Redshift database",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "SQL query to execute"},
+                "limit": {"type": "integer", "description": "Maximum number of rows to return", "default": 100}
+            },
+            "required": ["query"]
+        }
+    },
+    "redshift_list_tables_tool": {
+        "name": "redshift_list_tables_tool",
+        "description": "List tables in Redshift schemas",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "schema": {"type": "string", "description": "Schema name (optional, lists from public schema if not provided)"},
+                "refresh": {"type": "boolean", "description": "Fetch fresh metadata and update the cache", "default": False},
+                "bypass_cache": {"type": "boolean", "description": "Fetch from the warehouse without using the cache", "default": False}
+            },
+            "required": []
+        }
+    },
+    "redshift_describe_table_tool": {
+        "name": "redshift_describe_table_tool",
+        "description": "Get schema information for a Redshift table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "table_name": {"type": "string", "description": "Name of the table to describe"},
+                "schema": {"type": "string", "description": "Schema name (optional, uses public if not provided)"},
+                "refresh": {"type": "boolean", "description": "Fetch fresh metadata and update the cache", "default": False},
+                "bypass_cache": {"type": "boolean", "description": "Fetch from the warehouse without using the cache", "default": False}
+            },
+            "required": ["table_name"]
+        }
+    },
+    "redshift_sample_table_tool": {
+        "name": "redshift_sample_table_tool",
+        "description": "Sample data from a Redshift table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "table_name": {"type": "string", "description": "Name of the table to sample"},
+                "schema": {"type": "string", "description": "Schema name (optional, uses public if not provided)"},
+                "limit": {"type": "integer", "description": "Number of rows to sample", "default": 10},
+                "refresh": {"type": "boolean", "description": "Fetch fresh metadata and update the cache", "default": False},
+                "bypass_cache": {"type": "boolean", "description": "Fetch from the warehouse without using the cache", "default": False}
+            },
+            "required": ["table_name"]
+        }
+    },
+    # Glue tools
+    "glue_list_databases_tool": {
+        "name": "glue_list_databases_tool",
+        "description": "List all databases in AWS Glue Data Catalog",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "refresh": {"type": "boolean", "description": "Fetch fresh metadata and update the cache", "default": False},
+                "bypass_cache": {"type": "boolean", "description": "Fetch from the warehouse without using the cache", "default": False}
+            },
+            "required": []
+        }
+    },
+    "glue_list_tables_tool": {
+        "name": "glue_list_tables_tool",
+        "description": "List tables in an AWS Glue database",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "database_name": {"type": "string", "description": "Database name in Glue Data Catalog"},
+                "refresh": {"type": "boolean", "description": "Fetch fresh metadata and update the cache", "default": False},
+                "bypass_cache": {"type": "boolean", "description": "Fetch from the warehouse without using the cache", "default": False}
+            },
+            "required": ["database_name"]
+        }
+    },
+    "glue_describe_table_tool": {
+        "name": "glue_describe_table_tool",
+        "description": "Get schema information for an AWS Glue table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "database_name": {"type": "string", "description": "Database name in Glue Data Catalog"},
+                "table_name": {"type": "string", "description": "Table name to describe"},
+                "refresh": {"type": "boolean", "description": "Fetch fresh metadata and update the cache", "default": False},
+                "bypass_cache": {"type": "boolean", "description": "Fetch from the warehouse without using the cache", "default": False}
+            },
+            "required": ["database_name", "table_name"]
+        }
+    },
+    "glue_get_partitions_tool": {
+        "name": "glue_get_partitions_tool",
+        "description": "Get partitions for an AWS Glue table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "database_name": {"type": "string", "description": "Database name in Glue Data Catalog"},
+                "table_name": {"type": "string", "description": "Table name"},
+                "max_results": {"type": "integer", "description": "Maximum number of partitions to return", "default": 100}
+            },
+            "required": ["database_name", "table_name"]
+        }
+    },
+    # Glue Data Quality tools
+    "glue_create_data_quality_ruleset_tool": {
+        "name": "glue_create_data_quality_ruleset_tool",
+        "description": "Create a data quality ruleset for an AWS Glue table using DQDL (Data Quality Definition Language)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Name of the data quality ruleset"},
+                "ruleset": {"type": "string", "description": "Data quality rules in DQDL format"},
+                "database_name": {"type": "string", "description": "Target database name"},
+                "table_name": {"type": "string", "description": "Target table name"},
+                "description": {"type": "string", "description": "Optional description of the ruleset"}
+            },
+            "required": ["name", "ruleset", "database_name", "table_name"]
+        }
+    },
+    "glue_get_data_quality_ruleset_tool": {
+        "name": "glue_get_data_quality_ruleset_tool",
+        "description": "Get details of a data quality ruleset by name",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Name of the data quality ruleset"}
+            },
+            "required": ["name"]
+        }
+    },
+    "glue_update_data_quality_ruleset_tool": {
+        "name": "glue_update_data_quality_ruleset_tool",
+        "description": "Update an existing data quality ruleset",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Name of the data quality ruleset"},
+                "ruleset": {"type": "string", "description": "Updated data quality rules in DQDL format"},
+                "description": {"type": "string", "description": "Updated description"}
+            },
+            "required": ["name"]
+        }
+    },
+    "glue_delete_data_quality_ruleset_tool": {
+        "name": "glue_delete_data_quality_ruleset_tool",
+        "description": "Delete a data quality ruleset",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Name of the data quality ruleset to delete"}
+            },
+            "required": ["name"]
+        }
+    },
+    "glue_list_data_quality_rulesets_tool": {
+        "name": "glue_list_data_quality_rulesets_tool",
+        "description": "List data quality rulesets, optionally filtered by target table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "database_name": {"type": "string", "description": "Filter by database name"},
+                "table_name": {"type": "string", "description": "Filter by table name"},
+                "max_results": {"type": "integer", "description": "Maximum number of rulesets to return", "default": 100}
+            },
+            "required": []
+        }
+    },
+    "glue_start_data_quality_rule_recommendation_run_tool": {
+        "name": "glue_start_data_quality_rule_recommendation_run_tool",
+        "description": "Start an AI-powered data quality rule recommendation run for a Glue table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "database_name": {"type": "string", "description": "Database name"},
+                "table_name": {"type": "string", "description": "Table name"},
+                "role": {"type": "string", "description": "IAM role ARN for the recommendation run"},
+                "number_of_workers": {"type": "integer", "description": "Number of workers for the job", "default": 5}
+            },
+            "required": ["database_name", "table_name", "role"]
+        }
+    },
+    "glue_get_data_quality_rule_recommendation_run_tool": {
+        "name": "glue_get_data_quality_rule_recommendation_run_tool",
+        "description": "Get the status and results of a data quality rule recommendation run",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "run_id": {"type": "string", "description": "Run ID from start_data_quality_rule_recommendation_run"}
+            },
+            "required": ["run_id"]
+        }
+    },
+    "glue_start_data_quality_ruleset_evaluation_run_tool": {
+        "name": "glue_start_data_quality_ruleset_evaluation_run_tool",
+        "description": "Start a data quality ruleset evaluation run against a Glue table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "database_name": {"type": "string", "description": "Database name"},
+                "table_name": {"type": "string", "description": "Table name"},
+                "ruleset_names": {"type": "string", "description": "Comma-separated list of ruleset names to evaluate"},
+                "role": {"type": "string", "description": "IAM role ARN for the evaluation run"},
+                "number_of_workers": {"type": "integer", "description": "Number of workers for the job", "default": 5}
+            },
+            "required": ["database_name", "table_name", "ruleset_names", "role"]
+        }
+    },
+    "glue_get_data_quality_ruleset_evaluation_run_tool": {
+        "name": "glue_get_data_quality_ruleset_evaluation_run_tool",
+        "description": "Get the status and results of a data quality ruleset evaluation run",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "run_id": {"type": "string", "description": "Run ID from start_data_quality_ruleset_evaluation_run"}
+            },
+            "required": ["run_id"]
+        }
+    },
+    "glue_list_data_quality_results_tool": {
+        "name": "glue_list_data_quality_results_tool",
+        "description": "List data quality evaluation results, optionally filtered by table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "database_name": {"type": "string", "description": "Filter by database name"},
+                "table_name": {"type": "string", "description": "Filter by table name"},
+                "max_results": {"type": "integer", "description": "Maximum number of results to return", "default": 100}
+            },
+            "required": []
+        }
+    },
+    # Glue Column Statistics tools
+    "glue_get_column_statistics_for_table_tool": {
+        "name": "glue_get_column_statistics_for_table_tool",
+        "description": "Get column statistics for specified columns in a Glue table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "database_name": {"type": "string", "description": "Database name"},
+                "table_name": {"type": "string", "description": "Table name"},
+                "column_names": {"type": "string", "description": "Comma-separated list of column names"}
+            },
+            "required": ["database_name", "table_name", "column_names"]
+        }
+    },
+    "glue_get_column_statistics_for_partition_tool": {
+        "name": "glue_get_column_statistics_for_partition_tool",
+        "description": "Get column statistics for specified columns in a Glue table partition",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "database_name": {"type": "string", "description": "Database name"},
+                "table_name": {"type": "string", "description": "Table name"},
+                "partition_values": {"type": "string", "description": "Comma-separated partition values"},
+                "column_names": {"type": "string", "description": "Comma-separated list of column names"}
+            },
+            "required": ["database_name", "table_name", "partition_values", "column_names"]
+        }
+    },
+    "glue_delete_column_statistics_for_table_tool": {
+        "name": "glue_delete_column_statistics_for_table_tool",
+        "description": "Delete column statistics for a specific column in a Glue table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "database_name": {"type": "string", "description": "Database name"},
+                "table_name": {"type": "string", "description": "Table name"},
+                "column_name": {"type": "string", "description": "Column name"}
+            },
+            "required": ["database_name", "table_name", "column_name"]
+        }
+    },
+    "glue_delete_column_statistics_for_partition_tool": {
+        "name": "glue_delete_column_statistics_for_partition_tool",
+        "description": "Delete column statistics for a specific column in a Glue table partition",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "database_name": {"type": "string", "description": "Database name"},
+                "table_name": {"type": "string", "description": "Table name"},
+                "partition_values": {"type": "string", "description": "Comma-separated partition values"},
+                "column_name": {"type": "string", "description": "Column name"}
+            },
+            "required": ["database_name", "table_name", "partition_values", "column_name"]
+        }
+    },
+    # Athena tools
+    "glue_athena_create_work_group_tool": {
+        "name": "glue_athena_create_work_group_tool",
+        "description": "Create an Athena workgroup",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Name of the workgroup"},
+                "description": {"type": "string", "description": "Optional description of the workgroup"}
+            },
+            "required": ["name"]
+        }
+    },
+    "glue_athena_list_work_groups_tool": {
+        "name": "glue_athena_list_work_groups_tool",
+        "description": "List all Athena workgroups",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "max_results": {"type": "integer", "description": "Maximum number of workgroups to return", "default": 50}
+            },
+            "required": []
+        }
+    },
+    "glue_athena_get_work_group_tool": {
+        "name": "glue_athena_get_work_group_tool",
+        "description": "Get details of an Athena workgroup",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Name of the workgroup"}
+            },
+            "required": ["name"]
+        }
+    },
+    "glue_athena_update_work_group_tool": {
+        "name": "glue_athena_update_work_group_tool",
+        "description": "Update an Athena workgroup",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Name of the workgroup"},
+                "description": {"type": "string", "description": "Updated description"},
+                "state": {"type": "string", "description": "Updated state (ENABLED or DISABLED)"}
+            },
+            "required": ["name"]
+        }
+    },
+    "glue_athena_delete_work_group_tool": {
+        "name": "glue_athena_delete_work_group_tool",
+        "description": "Delete an Athena workgroup",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Name of the workgroup"},
+                "recursive_delete": {"type": "boolean", "description": "If true, deletes the workgroup and its contents", "default": False}
+            },
+            "required": ["name"]
+        }
+    },
+    "glue_athena_get_data_catalog_tool": {
+        "name": "glue_athena_get_data_catalog_tool",
+        "description": "Get details of an Athena data catalog",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Name of the data catalog"}
+            },
+            "required": ["name"]
+        }
+    },
+    "glue_athena_list_data_catalogs_tool": {
+        "name": "glue_athena_list_data_catalogs_tool",
+        "description": "List all Athena data catalogs",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "max_results": {"type": "integer", "description": "Maximum number of catalogs to return", "default": 50}
+            },
+            "required": []
+        }
+    },
+    "glue_athena_update_data_catalog_tool": {
+        "name": "glue_athena_update_data_catalog_tool",
+        "description": "Update an Athena data catalog",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Name of the data catalog"},
+                "type": {"type": "string", "description": "Type of the data catalog (GLUE, LAMBDA, HIVE)"},
+                "description": {"type": "string", "description": "Optional description"}
+            },
+            "required": ["name", "type"]
+        }
+    },
+    "glue_athena_start_query_execution_tool": {
+        "name": "glue_athena_start_query_execution_tool",
+        "description": "Start an Athena query execution",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query_string": {"type": "string", "description": "SQL query string to execute"},
+                "database": {"type": "string", "description": "Optional database name"},
+                "output_location": {"type": "string", "description": "Optional S3 output location"},
+                "work_group": {"type": "string", "description": "Optional workgroup name"}
+            },
+            "required": ["query_string"]
+        }
+    },
+    "glue_athena_get_query_execution_tool": {
+        "name": "glue_athena_get_query_execution_tool",
+        "description": "Get details of an Athena query execution",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query_execution_id": {"type": "string", "description": "Query execution ID"}
+            },
+            "required": ["query_execution_id"]
+        }
+    },
+    "glue_athena_stop_query_execution_tool": {
+        "name": "glue_athena_stop_query_execution_tool",
+        "description": "Stop an Athena query execution",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query_execution_id": {"type": "string", "description": "Query execution ID"}
+            },
+            "required": ["query_execution_id"]
+        }
+    },
+    "glue_athena_get_query_results_tool": {
+        "name": "glue_athena_get_query_results_tool",
+        "description": "Get results of an Athena query execution",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query_execution_id": {"type": "string", "description": "Query execution ID"},
+                "max_results": {"type": "integer", "description": "Maximum number of results to return", "default": 1000}
+            },
+            "required": ["query_execution_id"]
+        }
+    },
+    "glue_athena_list_query_executions_tool": {
+        "name": "glue_athena_list_query_executions_tool",
+        "description": "List Athena query executions",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "work_group": {"type": "string", "description": "Optional workgroup name to filter by"},
+                "max_results": {"type": "integer", "description": "Maximum number of query executions to return", "default": 50}
+            },
+            "required": []
+        }
+    },
+    "glue_athena_batch_get_query_execution_tool": {
+        "name": "glue_athena_batch_get_query_execution_tool",
+        "description": "Batch get details of multiple Athena query executions",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query_execution_ids": {"type": "string", "description": "Comma-separated list of query execution IDs"}
+            },
+            "required": ["query_execution_ids"]
+        }
+    }
+}
+
+# Dispatch table from tool name to implementation
+TOOL_FUNCTIONS: Dict[str, Callable[..., Awaitable[str]]] = {
+    "databricks_query_tool": databricks_query_tool,
+    "databricks_list_tables_tool": databricks_list_tables_tool,
+    "databricks_describe_table_tool": databricks_describe_table_tool,
+    "databricks_sample_table_tool": databricks_sample_table_tool,
+    "snowflake_query_tool": snowflake_query_tool,
+    "snowflake_list_tables_tool": snowflake_list_tables_tool,
+    "snowflake_describe_table_tool": snowflake_describe_table_tool,
+    "snowflake_sample_table_tool": snowflake_sample_table_tool,
+    "bigquery_query_tool": bigquery_query_tool,
+    "bigquery_list_tables_tool": bigquery_list_tables_tool,
+    "bigquery_describe_table_tool": bigquery_describe_table_tool,
+    "bigquery_sample_table_tool": bigquery_sample_table_tool,
+    "redshift_query_tool": redshift_query_tool,
+    "redshift_list_tables_tool": redshift_list_tables_tool,
+    "redshift_describe_table_tool": redshift_describe_table_tool,
+    "redshift_sample_table_tool": redshift_sample_table_tool,
+    "glue_list_databases_tool": glue_list_databases_tool,
+    "glue_list_tables_tool": glue_list_tables_tool,
+    "glue_describe_table_tool": glue_describe_table_tool,
+    "glue_get_partitions_tool": glue_get_partitions_tool,
+    "glue_create_data_quality_ruleset_tool": glue_create_data_quality_ruleset_tool,
+    "glue_get_data_quality_ruleset_tool": glue_get_data_quality_ruleset_tool,
+    "glue_update_data_quality_ruleset_tool": glue_update_data_quality_ruleset_tool,
+    "glue_delete_data_quality_ruleset_tool": glue_delete_data_quality_ruleset_tool,
+    "glue_list_data_quality_rulesets_tool": glue_list_data_quality_rulesets_tool,
+    "glue_start_data_quality_rule_recommendation_run_tool": glue_start_data_quality_rule_recommendation_run_tool,
+    "glue_get_data_quality_rule_recommendation_run_tool": glue_get_data_quality_rule_recommendation_run_tool,
+    "glue_start_data_quality_ruleset_evaluation_run_tool": glue_start_data_quality_ruleset_evaluation_run_tool,
+    "glue_get_data_quality_ruleset_evaluation_run_tool": glue_get_data_quality_ruleset_evaluation_run_tool,
+    "glue_list_data_quality_results_tool": glue_list_data_quality_results_tool,
+    "glue_get_column_statistics_for_table_tool": glue_get_column_statistics_for_table_tool,
+    "glue_get_column_statistics_for_partition_tool": glue_get_column_statistics_for_partition_tool,
+    "glue_delete_column_statistics_for_table_tool": glue_delete_column_statistics_for_table_tool,
+    "glue_delete_column_statistics_for_partition_tool": glue_delete_column_statistics_for_partition_tool,
+    "glue_athena_create_work_group_tool": glue_athena_create_work_group_tool,
+    "glue_athena_list_work_groups_tool": glue_athena_list_work_groups_tool,
+    "glue_athena_get_work_group_tool": glue_athena_get_work_group_tool,
+    "glue_athena_update_work_group_tool": glue_athena_update_work_group_tool,
+    "glue_athena_delete_work_group_tool": glue_athena_delete_work_group_tool,
+    "glue_athena_get_data_catalog_tool": glue_athena_get_data_catalog_tool,
+    "glue_athena_list_data_catalogs_tool": glue_athena_list_data_catalogs_tool,
+    "glue_athena_update_data_catalog_tool": glue_athena_update_data_catalog_tool,
+    "glue_athena_start_query_execution_tool": glue_athena_start_query_execution_tool,
+    "glue_athena_get_query_execution_tool": glue_athena_get_query_execution_tool,
+    "glue_athena_stop_query_execution_tool": glue_athena_stop_query_execution_tool,
+    "glue_athena_get_query_results_tool": glue_athena_get_query_results_tool,
+    "glue_athena_list_query_executions_tool": glue_athena_list_query_executions_tool,
+    "glue_athena_batch_get_query_execution_tool": glue_athena_batch_get_query_execution_tool,
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _tools_for_providers(providers: Tuple[str, ...]) -> Tuple[Tuple[str, ...], FrozenSet[str], Tuple[Dict[str, Any], ...]]:
+    """
+    Resolve the tools available for a set of supported providers.
+    
+    Memoized per provider tuple, so tools/list and tools/call only do lookups.
+    
+    Returns:
+        Tuple of (tool names in display order, tool name set, tool schemas)
+    """
+    tool_names = tuple(name for provider in providers for name in PROVIDER_TOOLS.get(provider, []))
+    return tool_names, frozenset(tool_names), tuple(TOOL_SCHEMAS[name] for name in tool_names if name in TOOL_SCHEMAS)
+
+
 @mcp.custom_route("/mcp/{project_id}", methods=["GET", "POST"])
 async def project_mcp_endpoint(request: Request) -> JSONResponse:
     """
@@ -2235,7 +3175,7 @@ async def project_mcp_endpoint(request: Request) -> JSONResponse:
         
         # Get supported providers for the project
         supported_providers = await get_supported_providers(project_id)
-        available_tool_names = await get_available_tools_for_project(project_id)
+        available_tool_names, available_tool_set, available_tool_schemas = _tools_for_providers(tuple(supported_providers))
         
         # Handle MCP protocol requests
         if request.method == "POST":
@@ -2267,624 +3207,12 @@ async def project_mcp_endpoint(request: Request) -> JSONResponse:
                     return JSONResponse(content={}, status_code=200)
                 
                 elif method == "tools/list":
-                    # Return only tools available for this project
-                    tools = []
-                    
-                    # Define full tool schemas for supported tools
-                    all_tool_schemas = {
-                        "databricks_query_tool": {
-                            "name": "databricks_query_tool",
-                            "description": "Execute any SQL query against a Databricks database",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "catalog": {"type": "string", "description": "Databricks catalog name"},
-                                    "schema": {"type": "string", "description": "Databricks schema name"},
-                                    "query": {"type": "string", "description": "SQL query to execute"},
-                                    "limit": {"type": "integer", "description": "Maximum number of rows to return", "default": 100}
-                                },
-                                "required": ["catalog", "schema", "query"]
-                            }
-                        },
-                        "databricks_list_tables_tool": {
-                            "name": "databricks_list_tables_tool", 
-                            "description": "List tables in a Databricks schema using SHOW TABLES",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "catalog": {"type": "string", "description": "Databricks catalog name"},
-                                    "schema_name": {"type": "string", "description": "Schema name to list tables from"}
-                                },
-                                "required": ["catalog", "schema_name"]
-                            }
-                        },
-                        "databricks_describe_table_tool": {
-                            "name": "databricks_describe_table_tool",
-                            "description": "Get schema information for a specific table using DESCRIBE",
-                            "inputSchema": {
-                                "type": "object", 
-                                "properties": {
-                                    "catalog": {"type": "string", "description": "Databricks catalog name"},
-                                    "schema_name": {"type": "string", "description": "Schema name"},
-                                    "table_name": {"type": "string", "description": "Table name to describe"}
-                                },
-                                "required": ["catalog", "schema_name", "table_name"]
-                            }
-                        },
-                        "databricks_sample_table_tool": {
-                            "name": "databricks_sample_table_tool",
-                            "description": "Sample data from a specific table",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "catalog": {"type": "string", "description": "Databricks catalog name"},
-                                    "schema_name": {"type": "string", "description": "Schema name"},
-                                    "table_name": {"type": "string", "description": "Table name to sample"},
-                                    "limit": {"type": "integer", "description": "Number of sample rows to return", "default": 10}
-                                },
-                                "required": ["catalog", "schema_name", "table_name"]
-                            }
-                        },
-                        # Snowflake tools
-                        "snowflake_query_tool": {
-                            "name": "snowflake_query_tool",
-                            "description": "Execute a SQL query against a Snowflake database",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "database": {"type": "string", "description": "Snowflake database name"},
-                                    "schema": {"type": "string", "description": "Snowflake schema name"},
-                                    "query": {"type": "string", "description": "SQL query to execute"},
-                                    "limit": {"type": "integer", "description": "Maximum number of rows to return", "default": 100}
-                                },
-                                "required": ["database", "schema", "query"]
-                            }
-                        },
-                        "snowflake_list_tables_tool": {
-                            "name": "snowflake_list_tables_tool",
-                            "description": "List tables in a Snowflake database and schema",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "database": {"type": "string", "description": "Database name"},
-                                    "schema": {"type": "string", "description": "Schema name"}
-                                },
-                                "required": ["database", "schema"]
-                            }
-                        },
-                        "snowflake_describe_table_tool": {
-                            "name": "snowflake_describe_table_tool",
-                            "description": "Get schema information for a Snowflake table",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "database": {"type": "string", "description": "Database name"},
-                                    "schema": {"type": "string", "description": "Schema name"},
-                                    "table_name": {"type": "string", "description": "Name of the table to describe"}
-                                },
-                                "required": ["database", "schema", "table_name"]
-                            }
-                        },
-                        "snowflake_sample_table_tool": {
-                            "name": "snowflake_sample_table_tool",
-                            "description": "Sample data from a Snowflake table",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "database": {"type": "string", "description": "Database name"},
-                                    "schema": {"type": "string", "description": "Schema name"},
-                                    "table_name": {"type": "string", "description": "Name of the table to sample"},
-                                    "limit": {"type": "integer", "description": "Number of rows to sample", "default": 10}
-                                },
-                                "required": ["database", "schema", "table_name"]
-                            }
-                        },
-                        # BigQuery tools
-                        "bigquery_query_tool": {
-                            "name": "bigquery_query_tool",
-                            "description": "Execute a SQL query against a BigQuery database",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "dataset": {"type": "string", "description": "BigQuery dataset name"},
-                                    "query": {"type": "string", "description": "SQL query to execute"},
-                                    "limit": {"type": "integer", "description": "Maximum number of rows to return", "default": 100}
-                                },
-                                "required": ["dataset", "query"]
-                            }
-                        },
-                        "bigquery_list_tables_tool": {
-                            "name": "bigquery_list_tables_tool",
-                            "description": "List tables in BigQuery datasets",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "dataset": {"type": "string", "description": "Dataset name"}
-                                },
-                                "required": ["dataset"]
-                            }
-                        },
-                        "bigquery_describe_table_tool": {
-                            "name": "bigquery_describe_table_tool",
-                            "description": "Get schema information for a BigQuery table",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "dataset": {"type": "string", "description": "Dataset name"},
-                                    "table_id": {"type": "string", "description": "Table name"}
-                                },
-                                "required": ["dataset", "table_id"]
-                            }
-                        },
-                        "bigquery_sample_table_tool": {
-                            "name": "bigquery_sample_table_tool",
-                            "description": "Sample data from a BigQuery table",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "dataset": {"type": "string", "description": "Dataset name"},
-                                    "table_id": {"type": "string", "description": "Table name"},
-                                    "limit": {"type": "integer", "description": "Number of rows to sample", "default": 10}
-                                },
-                                "required": ["dataset", "table_id"]
-                            }
-                        },
-                        # Redshift tools
-                        "redshift_query_tool": {
-                            "name": "redshift_query_tool",
-                            "description": "Execute a SQL query against a Redshift database",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query": {"type": "string", "description": "SQL query to execute"},
-                                    "limit": {"type": "integer", "description": "Maximum number of rows to return", "default": 100}
-                                },
-                                "required": ["query"]
-                            }
-                        },
-                        "redshift_list_tables_tool": {
-                            "name": "redshift_list_tables_tool",
-                            "description": "List tables in Redshift schemas",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "schema": {"type": "string", "description": "Schema name (optional, lists from public schema if not provided)"}
-                                },
-                                "required": []
-                            }
-                        },
-                        "redshift_describe_table_tool": {
-                            "name": "redshift_describe_table_tool",
-                            "description": "Get schema information for a Redshift table",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "table_name": {"type": "string", "description": "Name of the table to describe"},
-                                    "schema": {"type": "string", "description": "Schema name (optional, uses public if not provided)"}
-                                },
-                                "required": ["table_name"]
-                            }
-                        },
-                        "redshift_sample_table_tool": {
-                            "name": "redshift_sample_table_tool",
-                            "description": "Sample data from a Redshift table",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "table_name": {"type": "string", "description": "Name of the table to sample"},
-                                    "schema": {"type": "string", "description": "Schema name (optional, uses public if not provided)"},
-                                    "limit": {"type": "integer", "description": "Number of rows to sample", "default": 10}
-                                },
-                                "required": ["table_name"]
-                            }
-                        },
-                        # Glue tools
-                        "glue_list_databases_tool": {
-                            "name": "glue_list_databases_tool",
-                            "description": "List all databases in AWS Glue Data Catalog",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        "glue_list_tables_tool": {
-                            "name": "glue_list_tables_tool",
-                            "description": "List tables in an AWS Glue database",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "database_name": {"type": "string", "description": "Database name in Glue Data Catalog"}
-                                },
-                                "required": ["database_name"]
-                            }
-                        },
-                        "glue_describe_table_tool": {
-                            "name": "glue_describe_table_tool",
-                            "description": "Get schema information for an AWS Glue table",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "database_name": {"type": "string", "description": "Database name in Glue Data Catalog"},
-                                    "table_name": {"type": "string", "description": "Table name to describe"}
-                                },
-                                "required": ["database_name", "table_name"]
-                            }
-                        },
-                        "glue_get_partitions_tool": {
-                            "name": "glue_get_partitions_tool",
-                            "description": "Get partitions for an AWS Glue table",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "database_name": {"type": "string", "description": "Database name in Glue Data Catalog"},
-                                    "table_name": {"type": "string", "description": "Table name"},
-                                    "max_results": {"type": "integer", "description": "Maximum number of partitions to return", "default": 100}
-                                },
-                                "required": ["database_name", "table_name"]
-                            }
-                        },
-                        # Glue Data Quality tools
-                        "glue_create_data_quality_ruleset_tool": {
-                            "name": "glue_create_data_quality_ruleset_tool",
-                            "description": "Create a data quality ruleset for an AWS Glue table using DQDL (Data Quality Definition Language)",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Name of the data quality ruleset"},
-                                    "ruleset": {"type": "string", "description": "Data quality rules in DQDL format"},
-                                    "database_name": {"type": "string", "description": "Target database name"},
-                                    "table_name": {"type": "string", "description": "Target table name"},
-                                    "description": {"type": "string", "description": "Optional description of the ruleset"}
-                                },
-                                "required": ["name", "ruleset", "database_name", "table_name"]
-                            }
-                        },
-                        "glue_get_data_quality_ruleset_tool": {
-                            "name": "glue_get_data_quality_ruleset_tool",
-                            "description": "Get details of a data quality ruleset by name",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Name of the data quality ruleset"}
-                                },
-                                "required": ["name"]
-                            }
-                        },
-                        "glue_update_data_quality_ruleset_tool": {
-                            "name": "glue_update_data_quality_ruleset_tool",
-                            "description": "Update an existing data quality ruleset",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Name of the data quality ruleset"},
-                                    "ruleset": {"type": "string", "description": "Updated data quality rules in DQDL format"},
-                                    "description": {"type": "string", "description": "Updated description"}
-                                },
-                                "required": ["name"]
-                            }
-                        },
-                        "glue_delete_data_quality_ruleset_tool": {
-                            "name": "glue_delete_data_quality_ruleset_tool",
-                            "description": "Delete a data quality ruleset",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Name of the data quality ruleset to delete"}
-                                },
-                                "required": ["name"]
-                            }
-                        },
-                        "glue_list_data_quality_rulesets_tool": {
-                            "name": "glue_list_data_quality_rulesets_tool",
-                            "description": "List data quality rulesets, optionally filtered by target table",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "database_name": {"type": "string", "description": "Filter by database name"},
-                                    "table_name": {"type": "string", "description": "Filter by table name"},
-                                    "max_results": {"type": "integer", "description": "Maximum number of rulesets to return", "default": 100}
-                                },
-                                "required": []
-                            }
-                        },
-                        "glue_start_data_quality_rule_recommendation_run_tool": {
-                            "name": "glue_start_data_quality_rule_recommendation_run_tool",
-                            "description": "Start an AI-powered data quality rule recommendation run for a Glue table",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "database_name": {"type": "string", "description": "Database name"},
-                                    "table_name": {"type": "string", "description": "Table name"},
-                                    "role": {"type": "string", "description": "IAM role ARN for the recommendation run"},
-                                    "number_of_workers": {"type": "integer", "description": "Number of workers for the job", "default": 5}
-                                },
-                                "required": ["database_name", "table_name", "role"]
-                            }
-                        },
-                        "glue_get_data_quality_rule_recommendation_run_tool": {
-                            "name": "glue_get_data_quality_rule_recommendation_run_tool",
-                            "description": "Get the status and results of a data quality rule recommendation run",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "run_id": {"type": "string", "description": "Run ID from start_data_quality_rule_recommendation_run"}
-                                },
-                                "required": ["run_id"]
-                            }
-                        },
-                        "glue_start_data_quality_ruleset_evaluation_run_tool": {
-                            "name": "glue_start_data_quality_ruleset_evaluation_run_tool",
-                            "description": "Start a data quality ruleset evaluation run against a Glue table",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "database_name": {"type": "string", "description": "Database name"},
-                                    "table_name": {"type": "string", "description": "Table name"},
-                                    "ruleset_names": {"type": "string", "description": "Comma-separated list of ruleset names to evaluate"},
-                                    "role": {"type": "string", "description": "IAM role ARN for the evaluation run"},
-                                    "number_of_workers": {"type": "integer", "description": "Number of workers for the job", "default": 5}
-                                },
-                                "required": ["database_name", "table_name", "ruleset_names", "role"]
-                            }
-                        },
-                        "glue_get_data_quality_ruleset_evaluation_run_tool": {
-                            "name": "glue_get_data_quality_ruleset_evaluation_run_tool",
-                            "description": "Get the status and results of a data quality ruleset evaluation run",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "run_id": {"type": "string", "description": "Run ID from start_data_quality_ruleset_evaluation_run"}
-                                },
-                                "required": ["run_id"]
-                            }
-                        },
-                        "glue_list_data_quality_results_tool": {
-                            "name": "glue_list_data_quality_results_tool",
-                            "description": "List data quality evaluation results, optionally filtered by table",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "database_name": {"type": "string", "description": "Filter by database name"},
-                                    "table_name": {"type": "string", "description": "Filter by table name"},
-                                    "max_results": {"type": "integer", "description": "Maximum number of results to return", "default": 100}
-                                },
-                                "required": []
-                            }
-                        },
-                        # Glue Column Statistics tools
-                        "glue_get_column_statistics_for_table_tool": {
-                            "name": "glue_get_column_statistics_for_table_tool",
-                            "description": "Get column statistics for specified columns in a Glue table",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "database_name": {"type": "string", "description": "Database name"},
-                                    "table_name": {"type": "string", "description": "Table name"},
-                                    "column_names": {"type": "string", "description": "Comma-separated list of column names"}
-                                },
-                                "required": ["database_name", "table_name", "column_names"]
-                            }
-                        },
-                        "glue_get_column_statistics_for_partition_tool": {
-                            "name": "glue_get_column_statistics_for_partition_tool",
-                            "description": "Get column statistics for specified columns in a Glue table partition",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "database_name": {"type": "string", "description": "Database name"},
-                                    "table_name": {"type": "string", "description": "Table name"},
-                                    "partition_values": {"type": "string", "description": "Comma-separated partition values"},
-                                    "column_names": {"type": "string", "description": "Comma-separated list of column names"}
-                                },
-                                "required": ["database_name", "table_name", "partition_values", "column_names"]
-                            }
-                        },
-                        "glue_delete_column_statistics_for_table_tool": {
-                            "name": "glue_delete_column_statistics_for_table_tool",
-                            "description": "Delete column statistics for a specific column in a Glue table",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "database_name": {"type": "string", "description": "Database name"},
-                                    "table_name": {"type": "string", "description": "Table name"},
-                                    "column_name": {"type": "string", "description": "Column name"}
-                                },
-                                "required": ["database_name", "table_name", "column_name"]
-                            }
-                        },
-                        "glue_delete_column_statistics_for_partition_tool": {
-                            "name": "glue_delete_column_statistics_for_partition_tool",
-                            "description": "Delete column statistics for a specific column in a Glue table partition",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "database_name": {"type": "string", "description": "Database name"},
-                                    "table_name": {"type": "string", "description": "Table name"},
-                                    "partition_values": {"type": "string", "description": "Comma-separated partition values"},
-                                    "column_name": {"type": "string", "description": "Column name"}
-                                },
-                                "required": ["database_name", "table_name", "partition_values", "column_name"]
-                            }
-                        },
-                        # Athena tools
-                        "glue_athena_create_work_group_tool": {
-                            "name": "glue_athena_create_work_group_tool",
-                            "description": "Create an Athena workgroup",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Name of the workgroup"},
-                                    "description": {"type": "string", "description": "Optional description of the workgroup"}
-                                },
-                                "required": ["name"]
-                            }
-                        },
-                        "glue_athena_list_work_groups_tool": {
-                            "name": "glue_athena_list_work_groups_tool",
-                            "description": "List all Athena workgroups",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "max_results": {"type": "integer", "description": "Maximum number of workgroups to return", "default": 50}
-                                },
-                                "required": []
-                            }
-                        },
-                        "glue_athena_get_work_group_tool": {
-                            "name": "glue_athena_get_work_group_tool",
-                            "description": "Get details of an Athena workgroup",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Name of the workgroup"}
-                                },
-                                "required": ["name"]
-                            }
-                        },
-                        "glue_athena_update_work_group_tool": {
-                            "name": "glue_athena_update_work_group_tool",
-                            "description": "Update an Athena workgroup",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Name of the workgroup"},
-                                    "description": {"type": "string", "description": "Updated description"},
-                                    "state": {"type": "string", "description": "Updated state (ENABLED or DISABLED)"}
-                                },
-                                "required": ["name"]
-                            }
-                        },
-                        "glue_athena_delete_work_group_tool": {
-                            "name": "glue_athena_delete_work_group_tool",
-                            "description": "Delete an Athena workgroup",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Name of the workgroup"},
-                                    "recursive_delete": {"type": "boolean", "description": "If true, deletes the workgroup and its contents", "default": False}
-                                },
-                                "required": ["name"]
-                            }
-                        },
-                        "glue_athena_get_data_catalog_tool": {
-                            "name": "glue_athena_get_data_catalog_tool",
-                            "description": "Get details of an Athena data catalog",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Name of the data catalog"}
-                                },
-                                "required": ["name"]
-                            }
-                        },
-                        "glue_athena_list_data_catalogs_tool": {
-                            "name": "glue_athena_list_data_catalogs_tool",
-                            "description": "List all Athena data catalogs",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "max_results": {"type": "integer", "description": "Maximum number of catalogs to return", "default": 50}
-                                },
-                                "required": []
-                            }
-                        },
-                        "glue_athena_update_data_catalog_tool": {
-                            "name": "glue_athena_update_data_catalog_tool",
-                            "description": "Update an Athena data catalog",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Name of the data catalog"},
-                                    "type": {"type": "string", "description": "Type of the data catalog (GLUE, LAMBDA, HIVE)"},
-                                    "description": {"type": "string", "description": "Optional description"}
-                                },
-                                "required": ["name", "type"]
-                            }
-                        },
-                        "glue_athena_start_query_execution_tool": {
-                            "name": "glue_athena_start_query_execution_tool",
-                            "description": "Start an Athena query execution",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query_string": {"type": "string", "description": "SQL query string to execute"},
-                                    "database": {"type": "string", "description": "Optional database name"},
-                                    "output_location": {"type": "string", "description": "Optional S3 output location"},
-                                    "work_group": {"type": "string", "description": "Optional workgroup name"}
-                                },
-                                "required": ["query_string"]
-                            }
-                        },
-                        "glue_athena_get_query_execution_tool": {
-                            "name": "glue_athena_get_query_execution_tool",
-                            "description": "Get details of an Athena query execution",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query_execution_id": {"type": "string", "description": "Query execution ID"}
-                                },
-                                "required": ["query_execution_id"]
-                            }
-                        },
-                        "glue_athena_stop_query_execution_tool": {
-                            "name": "glue_athena_stop_query_execution_tool",
-                            "description": "Stop an Athena query execution",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query_execution_id": {"type": "string", "description": "Query execution ID"}
-                                },
-                                "required": ["query_execution_id"]
-                            }
-                        },
-                        "glue_athena_get_query_results_tool": {
-                            "name": "glue_athena_get_query_results_tool",
-                            "description": "Get results of an Athena query execution",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query_execution_id": {"type": "string", "description": "Query execution ID"},
-                                    "max_results": {"type": "integer", "description": "Maximum number of results to return", "default": 1000}
-                                },
-                                "required": ["query_execution_id"]
-                            }
-                        },
-                        "glue_athena_list_query_executions_tool": {
-                            "name": "glue_athena_list_query_executions_tool",
-                            "description": "List Athena query executions",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "work_group": {"type": "string", "description": "Optional workgroup name to filter by"},
-                                    "max_results": {"type": "integer", "description": "Maximum number of query executions to return", "default": 50}
-                                },
-                                "required": []
-                            }
-                        },
-                        "glue_athena_batch_get_query_execution_tool": {
-                            "name": "glue_athena_batch_get_query_execution_tool",
-                            "description": "Batch get details of multiple Athena query executions",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query_execution_ids": {"type": "string", "description": "Comma-separated list of query execution IDs"}
-                                },
-                                "required": ["query_execution_ids"]
-                            }
-                        }
-                    }
-                    
-                    # Only include tools that are available for this project
-                    for tool_name in available_tool_names:
-                        if tool_name in all_tool_schemas:
-                            tools.append(all_tool_schemas[tool_name])
-                    
+                    # Return only tools available for this project (precomputed per provider set)
                     return JSONResponse(content={
                         "jsonrpc": "2.0",
                         "id": body.get("id"),
                         "result": {
-                            "tools": tools
+                            "tools": available_tool_schemas
                         }
                     })
                 
@@ -2894,74 +3222,22 @@ async def project_mcp_endpoint(request: Request) -> JSONResponse:
                     tool_name = params.get("name")
                     tool_arguments = params.get("arguments", {})
                     
-                    if tool_name not in available_tool_names:
+                    if tool_name not in available_tool_set:
                         return JSONResponse(content={
                             "jsonrpc": "2.0",
                             "id": body.get("id"),
                             "error": {
                                 "code": -32601,
-                                "message": f"Tool '{tool_name}' is not available for project '{project_id}'. Available tools: {available_tool_names}"
+                                "message": f"Tool '{tool_name}' is not available for project '{project_id}'. Available tools: {list(available_tool_names)}"
                             }
                         })
                     
                     # Inject chicory_project_id into tool arguments
                     tool_arguments["chicory_project_id"] = project_id
                     
-                    # Map tool names to their actual functions
-                    tool_functions = {
-                        "databricks_query_tool": databricks_query_tool,
-                        "databricks_list_tables_tool": databricks_list_tables_tool,
-                        "databricks_describe_table_tool": databricks_describe_table_tool,
-                        "databricks_sample_table_tool": databricks_sample_table_tool,
-                        "snowflake_query_tool": snowflake_query_tool,
-                        "snowflake_list_tables_tool": snowflake_list_tables_tool,
-                        "snowflake_describe_table_tool": snowflake_describe_table_tool,
-                        "snowflake_sample_table_tool": snowflake_sample_table_tool,
-                        "bigquery_query_tool": bigquery_query_tool,
-                        "bigquery_list_tables_tool": bigquery_list_tables_tool,
-                        "bigquery_describe_table_tool": bigquery_describe_table_tool,
-                        "bigquery_sample_table_tool": bigquery_sample_table_tool,
-                        "redshift_query_tool": redshift_query_tool,
-                        "redshift_list_tables_tool": redshift_list_tables_tool,
-                        "redshift_describe_table_tool": redshift_describe_table_tool,
-                        "redshift_sample_table_tool": redshift_sample_table_tool,
-                        "glue_list_databases_tool": glue_list_databases_tool,
-                        "glue_list_tables_tool": glue_list_tables_tool,
-                        "glue_describe_table_tool": glue_describe_table_tool,
-                        "glue_get_partitions_tool": glue_get_partitions_tool,
-                        "glue_create_data_quality_ruleset_tool": glue_create_data_quality_ruleset_tool,
-                        "glue_get_data_quality_ruleset_tool": glue_get_data_quality_ruleset_tool,
-                        "glue_update_data_quality_ruleset_tool": glue_update_data_quality_ruleset_tool,
-                        "glue_delete_data_quality_ruleset_tool": glue_delete_data_quality_ruleset_tool,
-                        "glue_list_data_quality_rulesets_tool": glue_list_data_quality_rulesets_tool,
-                        "glue_start_data_quality_rule_recommendation_run_tool": glue_start_data_quality_rule_recommendation_run_tool,
-                        "glue_get_data_quality_rule_recommendation_run_tool": glue_get_data_quality_rule_recommendation_run_tool,
-                        "glue_start_data_quality_ruleset_evaluation_run_tool": glue_start_data_quality_ruleset_evaluation_run_tool,
-                        "glue_get_data_quality_ruleset_evaluation_run_tool": glue_get_data_quality_ruleset_evaluation_run_tool,
-                        "glue_list_data_quality_results_tool": glue_list_data_quality_results_tool,
-                        "glue_get_column_statistics_for_table_tool": glue_get_column_statistics_for_table_tool,
-                        "glue_get_column_statistics_for_partition_tool": glue_get_column_statistics_for_partition_tool,
-                        "glue_delete_column_statistics_for_table_tool": glue_delete_column_statistics_for_table_tool,
-                        "glue_delete_column_statistics_for_partition_tool": glue_delete_column_statistics_for_partition_tool,
-                        "glue_athena_create_work_group_tool": glue_athena_create_work_group_tool,
-                        "glue_athena_list_work_groups_tool": glue_athena_list_work_groups_tool,
-                        "glue_athena_get_work_group_tool": glue_athena_get_work_group_tool,
-                        "glue_athena_update_work_group_tool": glue_athena_update_work_group_tool,
-                        "glue_athena_delete_work_group_tool": glue_athena_delete_work_group_tool,
-                        "glue_athena_get_data_catalog_tool": glue_athena_get_data_catalog_tool,
-                        "glue_athena_list_data_catalogs_tool": glue_athena_list_data_catalogs_tool,
-                        "glue_athena_update_data_catalog_tool": glue_athena_update_data_catalog_tool,
-                        "glue_athena_start_query_execution_tool": glue_athena_start_query_execution_tool,
-                        "glue_athena_get_query_execution_tool": glue_athena_get_query_execution_tool,
-                        "glue_athena_stop_query_execution_tool": glue_athena_stop_query_execution_tool,
-                        "glue_athena_get_query_results_tool": glue_athena_get_query_results_tool,
-                        "glue_athena_list_query_executions_tool": glue_athena_list_query_executions_tool,
-                        "glue_athena_batch_get_query_execution_tool": glue_athena_batch_get_query_execution_tool,
-                    }
-                    
                     # Execute the tool
                     try:
-                        tool_func = tool_functions.get(tool_name)
+                        tool_func = TOOL_FUNCTIONS.get(tool_name)
                         if not tool_func:
                             return JSONResponse(content={
                                 "jsonrpc": "2.0",
@@ -3025,7 +3301,7 @@ async def project_mcp_endpoint(request: Request) -> JSONResponse:
             return JSONResponse(content={
                 "project_id": project_id,
                 "supported_providers": supported_providers,
-                "available_tools": available_tool_names,
+                "available_tools": list(available_tool_names),
                 "total_tools": len(available_tool_names),
                 "mcp_endpoint": f"/mcp/{project_id}"
             })
@@ -3056,7 +3332,12 @@ async def health_endpoint(request: Request) -> JSONResponse:
             "components": {
                 "cache_manager": "active" if cache_manager else "inactive",
                 "credential_fetcher": "active" if credential_fetcher else "inactive"
-            }
+            },
+            "data_source_registry": data_source_registry.get_stats(),
+            "backend_http_pool": credential_fetcher.get_pool_stats(),
+            "driver_executor": driver_executor.get_stats(),
+            "connection_pools": cache_manager.get_pool_stats(),
+            "metadata_cache": metadata_cache.get_stats()
         }
         
         return JSONResponse(content=status, status_code=200)
@@ -3071,6 +3352,34 @@ async def health_endpoint(request: Request) -> JSONResponse:
         return JSONResponse(content=error_status, status_code=503)
 
 
+@mcp.custom_route("/cache/invalidate/{project_id}", methods=["POST"])
+async def invalidate_project_cache_endpoint(request: Request) -> JSONResponse:
+    """
+    Invalidate cached data sources, provider connections and metadata for a project.
+    
+    Called by backend-api whenever a project's data sources are created,
+    updated or deleted so that new credentials take effect immediately.
+    """
+    project_id = request.path_params.get("project_id")
+    if not project_id:
+        return JSONResponse(
+            content={"error": "project_id path parameter is required"},
+            status_code=400
+        )
+    
+    data_source_registry.invalidate(project_id)
+    removed_connections = cache_manager.remove_project(project_id)
+    removed_metadata = await metadata_cache.invalidate(project_id)
+    
+    logger.info(f"Invalidated caches for project {project_id} ({removed_connections} connections removed)")
+    return JSONResponse(content={
+        "project_id": project_id,
+        "invalidated": True,
+        "removed_connections": removed_connections,
+        "removed_metadata_entries": removed_metadata
+    })
+
+
 async def get_available_tools_for_project(project_id: str) -> List[str]:
     """
     Get list of available tool names for a specific project based on supported integrations.
@@ -3082,98 +3391,33 @@ async def get_available_tools_for_project(project_id: str) -> List[str]:
         List of tool names available for the project
     """
     supported_providers = await get_supported_providers(project_id)
+    available_tools, _, _ = _tools_for_providers(tuple(supported_providers))
     
-    # Define tool name mappings
-    tool_name_mappings = {
-        "databricks": [
-            "databricks_query_tool",
-            "databricks_list_tables_tool",
-            "databricks_describe_table_tool",
-            "databricks_sample_table_tool"
-        ],
-        "snowflake": [
-            "snowflake_query_tool",
-            "snowflake_list_tables_tool",
-            "snowflake_describe_table_tool",
-            "snowflake_sample_table_tool"
-        ],
-        "bigquery": [
-            "bigquery_query_tool",
-            "bigquery_list_tables_tool",
-            "bigquery_describe_table_tool",
-            "bigquery_sample_table_tool"
-        ],
-        "redshift": [
-            "redshift_query_tool",
-            "redshift_list_tables_tool",
-            "redshift_describe_table_tool",
-            "redshift_sample_table_tool"
-        ],
-        "glue": [
-            "glue_list_databases_tool",
-            "glue_list_tables_tool",
-            "glue_describe_table_tool",
-            "glue_get_partitions_tool",
-            "glue_create_data_quality_ruleset_tool",
-            "glue_get_data_quality_ruleset_tool",
-            "glue_update_data_quality_ruleset_tool",
-            "glue_delete_data_quality_ruleset_tool",
-            "glue_list_data_quality_rulesets_tool",
-            "glue_start_data_quality_rule_recommendation_run_tool",
-            "glue_get_data_quality_rule_recommendation_run_tool",
-            "glue_start_data_quality_ruleset_evaluation_run_tool",
-            "glue_get_data_quality_ruleset_evaluation_run_tool",
-            "glue_list_data_quality_results_tool",
-            "glue_get_column_statistics_for_table_tool",
-            "glue_get_column_statistics_for_partition_tool",
-            "glue_delete_column_statistics_for_table_tool",
-            "glue_delete_column_statistics_for_partition_tool",
-            "glue_athena_create_work_group_tool",
-            "glue_athena_list_work_groups_tool",
-            "glue_athena_get_work_group_tool",
-            "glue_athena_update_work_group_tool",
-            "glue_athena_delete_work_group_tool",
-            "glue_athena_get_data_catalog_tool",
-            "glue_athena_list_data_catalogs_tool",
-            "glue_athena_update_data_catalog_tool",
-            "glue_athena_start_query_execution_tool",
-            "glue_athena_get_query_execution_tool",
-            "glue_athena_stop_query_execution_tool",
-            "glue_athena_get_query_results_tool",
-            "glue_athena_list_query_executions_tool",
-            "glue_athena_batch_get_query_execution_tool"
-        ]
-    }
-
-    # Build available tools list
-    available_tools = []
-    for provider in supported_providers:
-        if provider in tool_name_mappings:
-            available_tools.extend(tool_name_mappings[provider])
-    
-    logger.info(f"Available tools for project {project_id}: {available_tools}")
-    return available_tools
+    logger.info(f"Available tools for project {project_id}: {list(available_tools)}")
+    return list(available_tools)
 
 
 async def cleanup():
     """Cleanup resources on server shutdown."""
     logger.info("Cleaning up database connections...")
     cache_manager.cleanup()
+    await credential_fetcher.close()
+    await metadata_cache.close()
+    driver_executor.shutdown()
     logger.info("Cleanup completed")
 
 
+async def main():
+    """Run the server, with the shared backend HTTP session open for its whole life."""
+    await credential_fetcher.start()
+    try:
+        # Run the FastMCP server with HTTP transport (streamable); uvicorn handles SIGINT/SIGTERM
+        await mcp.run_streamable_http_async()
+    finally:
+        logger.info("Shutting down")
+        await cleanup()
+
+
 if __name__ == "__main__":
-    # Setup cleanup on shutdown
-    import signal
-    
-    def signal_handler(signum, frame):
-        logger.info("Received shutdown signal")
-        asyncio.create_task(cleanup())
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
     logger.info("Starting DB MCP Server on 0.0.0.0:8080")
-    
-    # Run the FastMCP server with HTTP transport (streamable)
-    mcp.run(transport="streamable-http")
+    asyncio.run(main())
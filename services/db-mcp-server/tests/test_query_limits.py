@@ -0,0 +1,153 @@
+"""Tests for the row limiting helpers in providers.query_limits."""
+
+import pytest
+
+from providers.query_limits import clamp_limit, fetch_limited, limit_query
+
+CAP = 100
+
+
+def wrapped(statement: str) -> str:
+    return f"SELECT * FROM (\n{statement}\n) AS limited_query\nLIMIT {CAP}"
+
+
+class TestLimitQuery:
+    def test_appends_limit(self):
+        assert limit_query("SELECT * FROM t", CAP) == f"SELECT * FROM t\nLIMIT {CAP}"
+
+    def test_strips_trailing_semicolons(self):
+        assert limit_query("SELECT * FROM t;;\n", CAP) == f"SELECT * FROM t\nLIMIT {CAP}"
+
+    def test_comment_mentioning_limit_is_ignored(self):
+        query = "SELECT * /* limit 5 */ FROM t -- limit 10\nWHERE a = 1"
+        assert limit_query(query, CAP) == f"{query}\nLIMIT {CAP}"
+
+    def test_trailing_comment_is_dropped_before_limit(self):
+        # LIMIT appended after a -- comment would be commented out
+        assert limit_query("SELECT * FROM t -- limit 5", CAP) == f"SELECT * FROM t\nLIMIT {CAP}"
+
+    def test_unterminated_block_comment(self):
+        assert limit_query("SELECT * FROM t /* limit 5", CAP) == f"SELECT * FROM t\nLIMIT {CAP}"
+
+    @pytest.mark.parametrize("query", [
+        "SELECT 'it''s LIMIT 5' FROM t",
+        "SELECT 'it\\'s LIMIT 5' FROM t",
+        'SELECT "limit" FROM t',
+        'SELECT "a""limit" FROM t',
+        "SELECT `limit` FROM t",
+    ])
+    def test_quoted_limit_is_ignored(self, query):
+        assert limit_query(query, CAP) == f"{query}\nLIMIT {CAP}"
+
+    def test_semicolon_inside_string_is_one_statement(self):
+        query = "SELECT ';' AS a, 'x; DROP TABLE t' AS b FROM t"
+        assert limit_query(query, CAP) == f"{query}\nLIMIT {CAP}"
+
+    def test_identifier_containing_keyword(self):
+        query = "SELECT offset_value, limit_count FROM t"
+        assert limit_query(query, CAP) == f"{query}\nLIMIT {CAP}"
+
+    def test_cte_with_inner_limit(self):
+        query = "WITH c AS (SELECT * FROM t LIMIT 5) SELECT * FROM c"
+        assert limit_query(query, CAP) == f"{query}\nLIMIT {CAP}"
+
+    def test_subquery_with_inner_limit(self):
+        query = "SELECT * FROM (SELECT * FROM t LIMIT 5000) s"
+        assert limit_query(query, CAP) == f"{query}\nLIMIT {CAP}"
+
+    def test_parenthesized_query(self):
+        query = "(SELECT * FROM t)"
+        assert limit_query(query, CAP) == f"{query}\nLIMIT {CAP}"
+
+    def test_values(self):
+        assert limit_query("VALUES (1), (2)", CAP) == f"VALUES (1), (2)\nLIMIT {CAP}"
+
+    @pytest.mark.parametrize("existing", [1, 50, CAP])
+    def test_existing_limit_within_cap_is_kept(self, existing):
+        query = f"SELECT * FROM t ORDER BY a LIMIT {existing}"
+        assert limit_query(query, CAP) == query
+
+    def test_existing_limit_above_cap_is_wrapped(self):
+        query = f"SELECT * FROM t LIMIT {CAP + 1}"
+        assert limit_query(query, CAP) == wrapped(query)
+
+    def test_existing_limit_with_semicolon(self):
+        assert limit_query("SELECT * FROM t LIMIT 5;", CAP) == "SELECT * FROM t LIMIT 5"
+
+    @pytest.mark.parametrize("query", [
+        "SELECT * FROM t LIMIT 5 OFFSET 10",
+        "SELECT * FROM t OFFSET 10",
+        "SELECT * FROM t LIMIT 10, 5",
+        "SELECT * FROM t LIMIT ALL",
+        "SELECT * FROM t LIMIT :n",
+        "SELECT TOP 5 * FROM t",
+        "SELECT * FROM t FETCH FIRST 5 ROWS ONLY",
+    ])
+    def test_other_row_restrictions_are_wrapped(self, query):
+        assert limit_query(query, CAP) == wrapped(query)
+
+    @pytest.mark.parametrize("query", [
+        "SELECT 1; SELECT 2",
+        "SELECT 1;\nDROP TABLE t",
+        "USE DATABASE d; SELECT * FROM t",
+    ])
+    def test_multiple_statements_are_unchanged(self, query):
+        assert limit_query(query, CAP) == query
+
+    def test_comment_after_final_semicolon_is_one_statement(self):
+        assert limit_query("SELECT * FROM t; -- done", CAP) == f"SELECT * FROM t\nLIMIT {CAP}"
+
+    @pytest.mark.parametrize("query", [
+        "INSERT INTO t SELECT * FROM s",
+        "UPDATE t SET a = 1",
+        "DELETE FROM t",
+        "CREATE TABLE t AS SELECT * FROM s",
+        "SHOW TABLES",
+        "DESCRIBE TABLE t",
+        "EXPLAIN SELECT * FROM t",
+    ])
+    def test_non_row_statements_are_unchanged(self, query):
+        assert limit_query(query, CAP) == query
+
+    def test_empty_query(self):
+        assert limit_query("  -- nothing\n", CAP) == ""
+
+    def test_lowercase_keywords(self):
+        query = "with c as (select 1) select * from c limit 5"
+        assert limit_query(query, CAP) == query
+
+
+class TestClampLimit:
+    @pytest.mark.parametrize("requested, expected", [
+        (None, 50), (0, 50), (-1, 50), (10, 10), (500, 200),
+    ])
+    def test_clamp(self, requested, expected):
+        assert clamp_limit(requested, default=50, maximum=200) == expected
+
+    def test_default_above_maximum(self):
+        assert clamp_limit(None, default=500, maximum=200) == 200
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.requested = []
+
+    def fetchmany(self, size):
+        self.requested.append(size)
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+
+class TestFetchLimited:
+    def test_fewer_rows_than_limit(self):
+        assert fetch_limited(FakeCursor(range(3)), 10, batch_size=2) == ([0, 1, 2], False)
+
+    def test_exactly_limit_rows(self):
+        assert fetch_limited(FakeCursor(range(4)), 4, batch_size=2) == ([0, 1, 2, 3], False)
+
+    def test_truncated(self):
+        cursor = FakeCursor(range(10))
+        assert fetch_limited(cursor, 5, batch_size=2) == ([0, 1, 2, 3, 4], True)
+        # Never asks for more than the remaining limit, then probes one row
+        assert cursor.requested == [2, 2, 1, 1]
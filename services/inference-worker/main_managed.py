@@ -2,17 +2,23 @@ import os
 import sys
 import logging
 import time
-import pika
 import json
 import asyncio
+import hashlib
 import aiohttp
 import signal
 import boto3
+import aio_pika
+from collections import OrderedDict, deque
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Set, Tuple
 from datetime import datetime, timezone
+from aio_pika.abc import AbstractIncomingMessage, AbstractQueue, AbstractRobustConnection
+from aio_pika.exceptions import ChannelNotFoundEntity
 from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
+import redis.asyncio as redis
+from redis.asyncio.cluster import RedisCluster
 
 # Define TaskStatus enum locally to match the API definition
 class TaskStatus(str, Enum):
@@ -32,15 +38,15 @@ load_default_envs()
 # Import from BrewSearch services
 from services.workflows.data_understanding.hybrid_rag.adaptive_rag import initialize_agent
 from services.integration.phoenix import initialize_phoenix
+from services.integration.metrics import initialize_metrics
 
 # Configure logging
 logging_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 logging.basicConfig(level=logging.INFO, format=logging_format)
 
 # Set higher log level for noisy libraries
-logging.getLogger('pika').setLevel(logging.WARNING)
-logging.getLogger('pika.adapters').setLevel(logging.WARNING)
-logging.getLogger('pika.adapters.select_connection').setLevel(logging.WARNING)
+logging.getLogger('aio_pika').setLevel(logging.WARNING)
+logging.getLogger('aiormq').setLevel(logging.WARNING)
 
 # Get our application logger
 logger = logging.getLogger(__name__)
@@ -53,13 +59,34 @@ DB_MCP_SERVER_URL = os.getenv("DB_MCP_SERVER_URL", "http://localhost:8080/mcp")
 TOOLS_MCP_SERVER_URL = os.getenv("TOOLS_MCP_SERVER_URL", "http://localhost:8081/mcp")
 GITHUB_MCP_SERVER_URL = os.getenv("GITHUB_MCP_SERVER_URL", "https://api.githubcopilot.com/mcp/")
 
-# Global flag for graceful shutdown
-shutdown_flag = False
-_connection = None
-_channel = None
+# Agent tasks one worker runs at the same time; most of a task's time is spent waiting on LLM and MCP I/O
+INFERENCE_CONCURRENCY = max(1, int(os.getenv("INFERENCE_CONCURRENCY", "4")))
+# Tasks of one agent that run at the same time; each works in a directory of its own
+INFERENCE_AGENT_CONCURRENCY = max(1, int(os.getenv("INFERENCE_AGENT_CONCURRENCY", str(INFERENCE_CONCURRENCY))))
+# Messages the broker hands to a worker ahead of a free task slot (RabbitMQ prefetch)
+INFERENCE_PREFETCH = max(1, int(os.getenv("INFERENCE_PREFETCH", str(INFERENCE_CONCURRENCY))))
+# Seconds running tasks get to finish after SIGTERM before they are cancelled
+INFERENCE_DRAIN_TIMEOUT = float(os.getenv("INFERENCE_DRAIN_TIMEOUT", "300"))
+# Seconds an initialized workflow client is reused before it is rebuilt
+WORKFLOW_CLIENT_TTL = float(os.getenv("WORKFLOW_CLIENT_TTL", "900"))
+# Seconds an agent's MCP configuration and data sources are reused before they are fetched again
+WORKFLOW_CONFIG_TTL = float(os.getenv("WORKFLOW_CONFIG_TTL", "60"))
+# Initialized workflow clients kept by a worker, least recently used evicted first
+WORKFLOW_CLIENT_POOL_SIZE = max(1, int(os.getenv("WORKFLOW_CLIENT_POOL_SIZE", "32")))
+
+# Redis stream on which backend-api announces tasks reaching a terminal status, cancellations included
+TASK_COMPLETIONS_STREAM = "task_completions"
+# XREAD block time of the cancellation watcher; must stay below the Redis socket timeout
+CANCELLATION_BLOCK_MS = int(os.getenv("CANCELLATION_BLOCK_MS", "1000"))
+# Seconds between task status checks while the completions stream can't be read
+CANCELLATION_POLL_SECONDS = float(os.getenv("CANCELLATION_POLL_SECONDS", "5"))
+# Seconds between task status checks while it can, as a safety net for missed entries
+CANCELLATION_RECONCILE_SECONDS = float(os.getenv("CANCELLATION_RECONCILE_SECONDS", "60"))
 
 # Initialize Phoenix tracing
 initialize_phoenix()
+# Initialize OpenTelemetry metrics
+initialize_metrics()
 
 # Task status enum - match values with backend API
 class TaskStatus(str, Enum):
@@ -76,11 +103,29 @@ class InferenceJobManager:
         self.api_base_url = API_BASE_URL
         # Base directory for projects
         self.base_dir = os.getenv("BASE_DIR", "/data")
-        # Temporary directory for project data
-        self.temp_base_dir = os.getenv("TEMP_BASE_DIR", "/tmp/data")
-        # Signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # Received messages waiting for a task slot, per project in arrival order,
+        # with the (config project, agent) they run as
+        self._pending: Dict[str, Deque[Tuple[Tuple[str, str], AbstractIncomingMessage]]] = {}
+        # Running tasks, in total, per project and per (config project, agent)
+        self._running: Set[asyncio.Task] = set()
+        self._running_per_project: Dict[str, int] = {}
+        self._running_per_agent: Dict[Tuple[str, str], int] = {}
+        # Set by SIGTERM/SIGINT; stops intake and drains running tasks
+        self._shutdown = asyncio.Event()
+        self._draining = False
+        # Concurrent tasks of one project share a single S3 sync
+        self._sync_locks: Dict[str, asyncio.Lock] = {}
+        # Initialized workflow clients by (project, agent, config project), with the
+        # fingerprint of the configuration they were built from and when they were built
+        self._workflow_clients: "OrderedDict[Tuple[str, str, str], Tuple[str, float, Any]]" = OrderedDict()
+        self._workflow_client_locks: Dict[Tuple[str, str, str], asyncio.Lock] = {}
+        # MCP configuration and client fingerprint by (config project, agent), with when they were fetched
+        self._workflow_configs: Dict[Tuple[str, str], Tuple[float, dict, str]] = {}
+        # Cancellation flags of running assistant tasks, set from the completions stream
+        self._cancel_events: Dict[str, asyncio.Event] = {}
+        # Whether the completions stream is being followed; status polling takes over otherwise
+        self._cancellation_push = False
+        self._redis: Optional[redis.Redis | RedisCluster] = None
 
     def _get_s3_client(self):
         """Create S3 client with optional custom endpoint (MinIO, LocalStack, etc.)"""
@@ -186,7 +231,8 @@ class InferenceJobManager:
             logger.error(f"Error syncing project data from S3: {e}")
             return False
 
-    async def _build_mcp_configuration(self, project_id: str, agent_id: str = None) -> dict:
+    async def _build_mcp_configuration(self, project_id: str, agent_id: str = None,
+                                       data_sources: Optional[list] = None) -> dict:
         """Build MCP server configuration using project-specific MCP endpoints."""
         mcp_servers = {}
         
@@ -214,7 +260,8 @@ class InferenceJobManager:
         if GITHUB_MCP_SERVER_URL:
             try:
                 # Get data sources for the project
-                data_sources = await self.get_data_sources(project_id)
+                if data_sources is None:
+                    data_sources = await self.get_data_sources(project_id)
                 
                 # Find GitHub data source
                 github_datasource = None
@@ -289,57 +336,17 @@ class InferenceJobManager:
         logger.info(f"Built MCP configuration with {len(mcp_servers)} servers for project {project_id}")
         return mcp_config
 
-    def _signal_handler(self, sig, frame):
+    def _request_shutdown(self, sig: signal.Signals):
         """Handle termination signals for graceful shutdown"""
-        global shutdown_flag
-        logger.info(f"Received signal {sig}, initiating graceful shutdown...")
-        shutdown_flag = True
-        # If we have an active connection, close it
-        if _connection and _connection.is_open:
-            _connection.close()
-
-    def copy_project_to_temp(self, project_id):
-        """
-        Copy project data to a temporary directory for isolated processing.
-        
-        Args:
-            project_id: The project ID to copy data for (lowercase)
-            
-        Returns:
-            Path to the temporary project directory
-        """
-        from pathlib import Path
-        from services.utils.dir import copy_folder_content
-        
-        # Source project directory
-        source_dir = Path(self.base_dir) / project_id
-        
-        if not source_dir.exists():
-            logger.warning(f"Source project directory not found: {source_dir}")
-            return None
-            
-        # Create temporary directory path
-        temp_dir = Path(self.temp_base_dir) / project_id
-        
-        # Use os.path to check if directory exists (more reliable than Path.exists in some environments)
-        temp_dir_str = str(temp_dir)  # Convert Path to string for os.path functions
-        
-        # Create a fresh temporary directory
-        os.makedirs(temp_dir_str, exist_ok=True)
-        
-        try:
-            # Log operation
-            logger.info(f"Copying project data: {source_dir} -> {temp_dir}")
-            # Copy project data to temporary location
-            copy_folder_content(str(source_dir), str(temp_dir))
-            
-            # Log success
-            logger.info(f"Successfully copied project data to {temp_dir}")
-            return str(temp_dir)
-        except Exception as e:
-            logger.error(f"Failed to copy project data: {str(e)}")
-            return None
-    
+        logger.info(f"Received signal {sig.name}, initiating graceful shutdown...")
+        self._shutdown.set()
+
+    async def sync_project_data(self, project_id: str) -> bool:
+        """Sync project data from S3 off the event loop, once at a time per project."""
+        lock = self._sync_locks.setdefault(project_id, asyncio.Lock())
+        async with lock:
+            return await asyncio.to_thread(self.sync_project_data_from_s3, project_id)
+
     async def get_data_sources(self, project_id: str) -> list:
         """
         Get data sources for a project using the API
@@ -497,8 +504,16 @@ class InferenceJobManager:
 
     async def get_workflow_client(self, project_id, agent_id=None, override_project_id: Optional[str] = None):
         """
-        Always create and return a new workflow client for the specified agent within a project.
-        Caching is intentionally bypassed so each invocation builds a fresh client.
+        Return a workflow client for the specified agent within a project.
+
+        Initialized clients are pooled by (project, agent, config project). Each
+        pooled client records a fingerprint of the MCP configuration and data
+        sources it was built from; it is reused while the fingerprint matches and
+        it is younger than WORKFLOW_CLIENT_TTL, and rebuilt otherwise. The
+        configuration is fetched at most every WORKFLOW_CONFIG_TTL, so changes to
+        agent tools or data sources take effect within that time. Agent
+        environment variables are injected per task and never baked into a client.
+        Every call returns a fork of the pooled client, with its own runtime state.
 
         Tool configuration can be sourced from a different override project by passing
         override_project_id. The client itself is initialized for the provided project_id,
@@ -510,7 +525,7 @@ class InferenceJobManager:
             override_project_id: Optional override project to use when configuring tools
 
         Returns:
-            A newly created workflow client for the agent
+            A workflow client for the agent, for use by a single task
         """
         # Always ensure project_id is lowercase for consistency
         project_id = project_id.lower()
@@ -523,21 +538,72 @@ class InferenceJobManager:
         
         # Use override_project_id for configuration if provided, otherwise fall back to project_id
         config_project_id = (override_project_id or project_id).lower()
-        
-        logger.info(f"Initializing new workflow client for agent: {agent_id}, project: {project_id}, config_project: {config_project_id}")
+
+        mcp_config, fingerprint = await self._get_workflow_config(config_project_id, agent_id)
+
+        key = (project_id, agent_id, config_project_id)
+        lock = self._workflow_client_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                pooled = self._workflow_clients.get(key)
+                if pooled and pooled[0] == fingerprint and time.monotonic() - pooled[1] < WORKFLOW_CLIENT_TTL:
+                    self._workflow_clients.move_to_end(key)
+                    logger.info(f"Reusing warm workflow client for agent: {agent_id}, project: {project_id}, config_project: {config_project_id}")
+                    task_client = pooled[2].fork()
+                else:
+                    if pooled:
+                        logger.info(f"Workflow client for agent {agent_id} is expired or its configuration changed, rebuilding")
+                    logger.info(f"Initializing new workflow client for agent: {agent_id}, project: {project_id}, config_project: {config_project_id}")
+
+                    # Initialize agent with MCP configuration
+                    logger.info(f"Initializing agent with MCP configuration for project: {config_project_id}")
+                    client = await initialize_agent('agent', config_project_id, mcp_config=mcp_config, 
+                                                   agent_id=agent_id, recursion_limit=150)
+
+                    self._workflow_clients[key] = (fingerprint, time.monotonic(), client)
+                    self._workflow_clients.move_to_end(key)
+                    while len(self._workflow_clients) > WORKFLOW_CLIENT_POOL_SIZE:
+                        evicted, _ = self._workflow_clients.popitem(last=False)
+                        evicted_lock = self._workflow_client_locks.get(evicted)
+                        if evicted_lock is not None and not evicted_lock.locked():
+                            del self._workflow_client_locks[evicted]
+                        logger.info(f"Evicted workflow client for agent {evicted[1]}, project {evicted[0]}")
+                    task_client = client.fork()
+        finally:
+            # Locks are kept only for clients in the pool
+            if key not in self._workflow_clients and not lock.locked():
+                self._workflow_client_locks.pop(key, None)
+
+        # Outside the lock, so other tasks of the agent don't wait on this one's directory
+        await task_client.prepare_task_directory()
+        return task_client
+
+    async def _get_workflow_config(self, config_project_id: str, agent_id: str) -> Tuple[dict, str]:
+        """
+        Return an agent's MCP configuration and the fingerprint pooled clients are matched on.
+
+        The fingerprint covers the MCP configuration and the project's data sources.
+        Both are cached for WORKFLOW_CONFIG_TTL, so tasks that reuse a pooled client
+        don't each fetch data sources and agent tools from the API.
+        """
+        key = (config_project_id, agent_id)
+        now = time.monotonic()
+        cached = self._workflow_configs.get(key)
+        if cached and now - cached[0] < WORKFLOW_CONFIG_TTL:
+            return cached[1], cached[2]
 
         # Build MCP configuration with data source filtering
-        mcp_config = await self._build_mcp_configuration(config_project_id, agent_id)
-        
-        # Initialize the data understanding workflow
-        logger.info(f"Using Data Understanding workflow for project: {config_project_id}")
-        
-        # Initialize agent with MCP configuration
-        logger.info(f"Initializing agent with MCP configuration for project: {config_project_id}")
-        client = await initialize_agent('agent', config_project_id, mcp_config=mcp_config, 
-                                       agent_id=agent_id, recursion_limit=150)
-        
-        return client
+        data_sources = await self.get_data_sources(config_project_id)
+        mcp_config = await self._build_mcp_configuration(config_project_id, agent_id, data_sources=data_sources)
+        fingerprint = hashlib.sha256(
+            json.dumps({"mcp_config": mcp_config, "data_sources": data_sources}, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+        # Expired entries are dropped, so only recently used agents stay cached
+        for stale_key in [k for k, (fetched_at, _, _) in self._workflow_configs.items() if now - fetched_at >= WORKFLOW_CONFIG_TTL]:
+            del self._workflow_configs[stale_key]
+        self._workflow_configs[key] = (now, mcp_config, fingerprint)
+        return mcp_config, fingerprint
 
     def _build_complete_response(self, history, current_state):
         """
@@ -562,111 +628,190 @@ class InferenceJobManager:
             title = json.dumps({"status": "Generating Response"})
         return title
             
-    def get_rabbitmq_connection(self, retry_count=3, retry_delay=1.0):
+    async def _connect_redis(self) -> redis.Redis | RedisCluster:
+        """Connect to Redis as a standalone server, or as a cluster if that fails."""
+        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
+        connection_params = {
+            "socket_connect_timeout": 3,
+            "socket_timeout": CANCELLATION_BLOCK_MS / 1000 + 5,
+            "decode_responses": True,
+        }
+        if redis_url.startswith("rediss://"):
+            connection_params.update({
+                "ssl_cert_reqs": "required",
+                "ssl_ca_certs": os.getenv("REDIS_SSL_CA_CERTS", "/etc/ssl/certs/ca-certificates.crt"),
+            })
+            if os.getenv("REDIS_SSL_CERT_FILE"):
+                connection_params["ssl_certfile"] = os.getenv("REDIS_SSL_CERT_FILE")
+            if os.getenv("REDIS_SSL_KEY_FILE"):
+                connection_params["ssl_keyfile"] = os.getenv("REDIS_SSL_KEY_FILE")
+
+        try:
+            client = redis.from_url(redis_url, **connection_params)
+            await client.ping()
+            return client
+        except Exception as standalone_error:
+            logger.info(f"Standalone Redis connection failed ({standalone_error}), trying cluster mode")
+            client = RedisCluster.from_url(redis_url, **connection_params)
+            await client.ping()
+            return client
+
+    async def _watch_cancellations(self) -> None:
+        """
+        Follow backend-api's task completions stream and flag cancelled running tasks.
+
+        backend-api appends every task reaching a terminal status to the stream,
+        including tasks cancelled through the cancel route. A cancellation sets the
+        task's event, which the agent loop checks without a round-trip. While the
+        stream can't be read, tasks fall back to polling their status.
+        """
+        last_id = None
+        while True:
+            try:
+                if self._redis is None:
+                    self._redis = await self._connect_redis()
+                if last_id is None:
+                    # Only completions from now on; earlier ones are seen by the status check at task start
+                    entries = await self._redis.xrevrange(TASK_COMPLETIONS_STREAM, count=1)
+                    last_id = entries[0][0] if entries else "0-0"
+                if not self._cancellation_push:
+                    logger.info(f"Following task cancellations on Redis stream {TASK_COMPLETIONS_STREAM}")
+                    self._cancellation_push = True
+
+                response = await self._redis.xread(
+                    {TASK_COMPLETIONS_STREAM: last_id},
+                    count=100,
+                    block=CANCELLATION_BLOCK_MS
+                )
+                for _, entries in response or []:
+                    for entry_id, fields in entries:
+                        last_id = entry_id
+                        if fields.get("status") != TaskStatus.CANCELLED.value:
+                            continue
+                        event = self._cancel_events.get(fields.get("task_id"))
+                        if event and not event.is_set():
+                            logger.info(f"Task {fields.get('task_id')} was cancelled")
+                            event.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self._cancellation_push:
+                    logger.warning(f"Lost the task completions stream, polling task status instead: {str(e)}")
+                else:
+                    logger.debug(f"Task completions stream unavailable: {str(e)}")
+                self._cancellation_push = False
+                if self._redis is not None:
+                    try:
+                        await self._redis.close()
+                    except Exception:
+                        pass
+                    self._redis = None
+                await asyncio.sleep(CANCELLATION_POLL_SECONDS)
+
+    def _cancellation_check(self, project_id: str, agent_id: str, task_id: str) -> Callable[[], Awaitable[bool]]:
+        """
+        Build the cancellation check of a running task.
+
+        The check reads the task's event, set by _watch_cancellations, and asks
+        backend-api only every CANCELLATION_POLL_SECONDS while the completions
+        stream is unavailable (every CANCELLATION_RECONCILE_SECONDS otherwise).
+        """
+        event = self._cancel_events[task_id]
+        last_checked = time.monotonic()
+
+        async def is_cancelled() -> bool:
+            nonlocal last_checked
+            if event.is_set():
+                return True
+            interval = CANCELLATION_RECONCILE_SECONDS if self._cancellation_push else CANCELLATION_POLL_SECONDS
+            if time.monotonic() - last_checked < interval:
+                return False
+            last_checked = time.monotonic()
+            try:
+                if await self.get_task_status(project_id, agent_id, task_id) == TaskStatus.CANCELLED.value:
+                    event.set()
+            except Exception as e:
+                logger.warning(f"Error checking task cancellation status: {e}")
+            return event.is_set()
+
+        return is_cancelled
+
+    async def get_rabbitmq_connection(self, retry_count=3, retry_delay=1.0) -> AbstractRobustConnection:
         """
         Get a RabbitMQ connection with retry logic
 
+        The connection is robust: once established, it restores its channels
+        and consumers by itself after network failures or broker restarts.
+
         Args:
             retry_count: Number of connection attempts before giving up
             retry_delay: Delay in seconds between retry attempts
 
         Returns:
-            A RabbitMQ connection
+            A robust RabbitMQ connection
 
         Raises:
-            AMQPConnectionError: If all connection attempts fail
+            Exception: If all connection attempts fail
         """
-        global _connection
-
-        # If we have an existing connection and it's open, return it
-        if _connection is not None and _connection.is_open:
-            try:
-                # Verify the connection is actually usable
-                _connection.process_data_events()
-                return _connection
-            except (AMQPConnectionError, StreamLostError):
-                # Connection is broken, set to None and try to reconnect
-                _connection = None
-                logger.warning("Detected broken RabbitMQ connection, reconnecting...")
-
         # Get RabbitMQ connection details from environment variables with defaults
         rabbitmq_host = os.getenv("RABBITMQ_HOST", "localhost")
         rabbitmq_port = int(os.getenv("RABBITMQ_PORT", "5672"))
-        rabbitmq_vhost = os.getenv("RABBITMQ_VHOST", "/")
-        rabbitmq_username = os.getenv("RABBITMQ_USERNAME", "guest")
-        rabbitmq_password = os.getenv("RABBITMQ_PASSWORD", "guest")
 
         # Check if we need SSL (port 5671 is the standard SSL port for RabbitMQ)
-        use_ssl = rabbitmq_port == 5671
-
-        # Set up SSL context if needed
-        ssl_options = None
-        if use_ssl:
+        ssl_context = None
+        if rabbitmq_port == 5671:
             import ssl
             ssl_context = ssl.create_default_context()
             ssl_context.check_hostname = False
             ssl_context.verify_mode = ssl.CERT_NONE
-            ssl_options = pika.SSLOptions(ssl_context)
             logger.info("Using SSL for RabbitMQ connection")
 
-        # Connect to RabbitMQ with appropriate SSL settings and enable heartbeats
-        connection_params = pika.ConnectionParameters(
-            host=rabbitmq_host,
-            port=rabbitmq_port,
-            virtual_host=rabbitmq_vhost,
-            credentials=pika.PlainCredentials(
-                rabbitmq_username,
-                rabbitmq_password
-            ),
-            ssl_options=ssl_options,
-            heartbeat=30,  # Send heartbeat every 30 seconds to detect broken connections
-            blocked_connection_timeout=10,  # Timeout for blocked connections
-            connection_attempts=2,  # Try to connect twice initially
-            retry_delay=0.5  # Half second delay between initial connection attempts
-        )
-
         # Try to connect with retry logic
         last_exception = None
         for attempt in range(retry_count):
             try:
                 logger.info(
                     f"Connecting to RabbitMQ at {rabbitmq_host}:{rabbitmq_port} (attempt {attempt + 1}/{retry_count})")
-                _connection = pika.BlockingConnection(connection_params)
+                connection = await aio_pika.connect_robust(
+                    host=rabbitmq_host,
+                    port=rabbitmq_port,
+                    virtualhost=os.getenv("RABBITMQ_VHOST", "/"),
+                    login=os.getenv("RABBITMQ_USERNAME", "guest"),
+                    password=os.getenv("RABBITMQ_PASSWORD", "guest"),
+                    ssl=ssl_context is not None,
+                    ssl_context=ssl_context,
+                    heartbeat=30,  # Send heartbeat every 30 seconds to detect broken connections
+                )
                 logger.info("Successfully connected to RabbitMQ")
-                return _connection
+                return connection
             except Exception as e:
                 last_exception = e
                 logger.warning(f"RabbitMQ connection attempt {attempt + 1} failed: {str(e)}")
                 if attempt < retry_count - 1:
                     logger.info(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
+                    await asyncio.sleep(retry_delay)
                     # Increase delay for subsequent retries (backoff)
                     retry_delay = min(retry_delay * 1.5, 5.0)
 
         # If we get here, all retries failed
         logger.error(f"Failed to connect to RabbitMQ after {retry_count} attempts")
-        raise last_exception or AMQPConnectionError("Failed to connect to RabbitMQ")
+        raise last_exception or ConnectionError("Failed to connect to RabbitMQ")
 
-    def setup_rabbitmq_consumer(self):
+    async def setup_rabbitmq_consumer(self, connection: AbstractRobustConnection) -> AbstractQueue:
         """
-        Set up RabbitMQ resources for consuming training job messages
+        Set up RabbitMQ resources for consuming agent task messages
+
+        Args:
+            connection: The RabbitMQ connection
 
         Returns:
-            Tuple of (connection, channel)
+            The agent task queue
         """
-        global _connection, _channel
-
-        # Get a connection
-        connection = self.get_rabbitmq_connection()
-        _connection = connection
-
-        # Create a channel
-        channel = connection.channel()
-        _channel = channel
+        channel = await connection.channel()
 
-        # Set prefetch count - only process one message at a time
-        # This ensures we don't take on too many training jobs simultaneously
-        channel.basic_qos(prefetch_count=1)
+        # Prefetch bounds the messages waiting in this worker for a task slot;
+        # a message is acknowledged when its task starts
+        await channel.set_qos(prefetch_count=INFERENCE_PREFETCH)
 
         # Define exchange and queue names
         exchange_name = os.getenv("AGENT_EXCHANGE_NAME", "agent_exchange")
@@ -674,40 +819,35 @@ class InferenceJobManager:
         routing_key = os.getenv("AGENT_ROUTING_KEY", "agent.message")
 
         # Ensure the exchange exists
-        channel.exchange_declare(
-            exchange=exchange_name,
-            exchange_type='direct',
+        exchange = await channel.declare_exchange(
+            exchange_name,
+            aio_pika.ExchangeType.DIRECT,
             durable=True  # Survive broker restarts
         )
 
         # Check if queue exists - do not create if it doesn't exist
         try:
             # Check if queue exists using passive declaration
-            channel.queue_declare(queue=queue_name, passive=True)
+            queue = await channel.declare_queue(queue_name, passive=True)
             logger.info(f"Queue {queue_name} already exists, using existing configuration")
-        except pika.exceptions.ChannelClosedByBroker:
+        except ChannelNotFoundEntity:
             # Queue doesn't exist, exit with error
             logger.error(f"Queue {queue_name} does not exist in RabbitMQ. Please create the queue before starting the service.")
             # Close the connection before exiting
-            if connection and connection.is_open:
-                try:
-                    connection.close()
-                    logger.info("RabbitMQ connection closed")
-                except Exception as e:
-                    logger.error(f"Error closing connection: {str(e)}")
+            try:
+                await connection.close()
+                logger.info("RabbitMQ connection closed")
+            except Exception as e:
+                logger.error(f"Error closing connection: {str(e)}")
             # Exit with error code
             sys.exit(1)
 
         # Bind the queue to the exchange
-        channel.queue_bind(
-            queue=queue_name,
-            exchange=exchange_name,
-            routing_key=routing_key
-        )
+        await queue.bind(exchange, routing_key=routing_key)
 
-        logger.info(f"RabbitMQ consumer set up for queue: {queue_name}")
+        logger.info(f"RabbitMQ consumer set up for queue: {queue_name} (prefetch {INFERENCE_PREFETCH})")
 
-        return connection, channel
+        return queue
 
     async def get_agent_info(self, agent_id: str, project_id: str) -> dict[str, Any]:
         """
@@ -898,19 +1038,18 @@ class InferenceJobManager:
             logger.error(f"Error calling task get API for {task_id}: {str(e)}", exc_info=True)
             return None
 
-    async def process_inference_message(self, ch, method, properties, body) -> None:
+    async def process_inference_message(self, message: AbstractIncomingMessage) -> None:
         """
         Process an inference message from RabbitMQ
 
         Args:
-            ch: The channel object
-            method: The method
-            properties: The properties
-            body: The message body
+            message: The delivered message
         """
+        message_data = {}
+        task_id = 'unknown'
         try:
             # Decode and process message
-            message_data = json.loads(body.decode('utf-8'))
+            message_data = json.loads(message.body.decode('utf-8'))
             task_id = message_data.get('task_id', 'unknown')
             assistant_task_id = message_data.get('assistant_task_id')
 
@@ -929,19 +1068,19 @@ class InferenceJobManager:
             logger.info(f"Received message: {task_id} with assistant message ID: {assistant_task_id}")
             
             # Get delivery timestamp to calculate message age
-            delivery_time = properties.timestamp or time.time()
+            delivery_time = message.timestamp.timestamp() if message.timestamp else time.time()
             message_age = time.time() - delivery_time
             
             # Check if the message is too old before processing
             if message_age >= 3600:  # 1 hour cutoff
                 logger.warning(f"Task {task_id} is too old ({message_age:.1f} seconds), rejecting")
                 # Reject the message and don't requeue it
-                ch.basic_reject(delivery_tag=method.delivery_tag, requeue=False)
+                await message.reject(requeue=False)
                 return
                 
             # Acknowledge the message immediately to remove it from the queue
             # This prevents duplicate processing if the service crashes during processing
-            ch.basic_ack(delivery_tag=method.delivery_tag)
+            await message.ack()
             logger.info(f"Acknowledged message {task_id} before processing (early ack strategy)")
             
             # Immediately update message statuses through the API
@@ -1001,14 +1140,15 @@ class InferenceJobManager:
                     recoverable = True
                     break
 
-            if recoverable:
+            if recoverable and not message.processed:
                 # Negative acknowledgment and requeue the message for retry
                 logger.warning(f"Recoverable error for task {task_id}, requeueing for retry")
-                ch.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
+                await message.nack(requeue=True)
             else:
                 # Non-recoverable error, acknowledge to remove from queue
                 logger.warning(f"Non-recoverable error for task {task_id}, acknowledging to prevent redelivery")
-                ch.basic_ack(delivery_tag=method.delivery_tag)
+                if not message.processed:
+                    await message.ack()
 
                 # Attempt to update the task to failed state via API
                 try:
@@ -1052,7 +1192,7 @@ class InferenceJobManager:
             # Sync project data from S3/MinIO to local filesystem
             # This ensures the agent has access to uploaded files (CSV, Excel, etc.)
             logger.info(f"Syncing project data from S3 for project: {project_id}")
-            sync_result = self.sync_project_data_from_s3(project_id)
+            sync_result = await self.sync_project_data(project_id)
             if sync_result:
                 logger.info(f"Successfully synced project data from S3")
             else:
@@ -1093,7 +1233,7 @@ class InferenceJobManager:
             override_project_id_value = metadata.get('override_project_id')
             project_for_config = (override_project_id_value or project_id or "").lower()
 
-            # Initialize a fresh workflow client. Tools are configured using override_project_id if provided.
+            # Get a workflow client for this task. Tools are configured using override_project_id if provided.
             agent_backend_app = await self.get_workflow_client(task_project, agent_id, override_project_id=project_for_config)
             logger.info(f"Using workflow client for agent: {agent_id}, project: {task_project}")
 
@@ -1248,6 +1388,12 @@ class InferenceJobManager:
         # Invoke the workflow
         logger.info(f"Running workflow with question: {question}")
 
+        # Register for cancellations first, so none falls between the check below and the stream
+        is_cancelled = None
+        if assistant_task_id is not None:
+            self._cancel_events[assistant_task_id] = asyncio.Event()
+            is_cancelled = self._cancellation_check(project_id, agent_id, assistant_task_id)
+
         try:
             # Check if task has been cancelled before starting the workflow
             if assistant_task_id is not None:
@@ -1349,26 +1495,13 @@ class InferenceJobManager:
                 # Stream the response and update the assistant task in real-time
                 logger.info("Using streaming mode for detailed analysis")
                 try:
-                    # Create cancellation check callback for Claude Code
-                    async def check_cancellation() -> bool:
-                        """Check if the task has been cancelled."""
-                        if assistant_task_id is None:
-                            return False
-                        try:
-                            task_status = await self.get_task_status(project_id, agent_id, assistant_task_id)
-                            return task_status == TaskStatus.CANCELLED.value
-                        except Exception as e:
-                            logger.warning(f"Error checking task cancellation status: {e}")
-                            return False
-                    
                     # Create the async generator for streaming with cancellation callback
-                    stream_generator = agent_backend_app.astream(inputs, config=config, cancellation_check=check_cancellation)
+                    stream_generator = agent_backend_app.astream(inputs, config=config, cancellation_check=is_cancelled)
                     
                     async for event in stream_generator:
                         # Check if task has been cancelled before processing each event
-                        if assistant_task_id is not None:
-                            task_status = await self.get_task_status(project_id, agent_id, assistant_task_id)
-                            if task_status == TaskStatus.CANCELLED.value:
+                        if is_cancelled is not None:
+                            if await is_cancelled():
                                 logger.info(f"Task {assistant_task_id} has been cancelled. Stopping workflow execution.")
                                 
                                 # Close the async generator to stop LangGraph execution
@@ -1510,107 +1643,163 @@ class InferenceJobManager:
         except Exception as e:
             logger.exception(f"Error running workflow: {str(e)}")
             raise
+        finally:
+            if assistant_task_id is not None:
+                self._cancel_events.pop(assistant_task_id, None)
 
-    def start_consumer(self):
+    async def _on_message(self, message: AbstractIncomingMessage) -> None:
+        """Queue a delivered message for a task slot."""
+        try:
+            message_data = json.loads(message.body.decode('utf-8'))
+            project_id = message_data.get('project_id') or ''
+            metadata = message_data.get('metadata')
+            override_project_id = metadata.get('override_project_id') if isinstance(metadata, dict) else None
+            # The agent's working directory belongs to the project its client is configured for
+            agent_key = ((override_project_id or project_id).lower(), (message_data.get('agent_id') or project_id).lower())
+        except Exception:
+            # Malformed messages are rejected by process_inference_message
+            project_id = ''
+            agent_key = ('', '')
+
+        self._pending.setdefault(project_id, deque()).append((agent_key, message))
+        self._dispatch()
+
+    def _dispatch(self) -> None:
         """
-        Start consuming messages from the RabbitMQ queue
+        Start tasks for waiting messages while slots are free.
+
+        For fairness across projects, the waiting project with the fewest running
+        tasks goes next, ties going to the project that has waited longest, so
+        one busy project cannot take every slot of the worker. A message waits
+        while INFERENCE_AGENT_CONCURRENCY tasks of its agent are running; the
+        project's next message for another agent may go ahead of it.
         """
-        # Set up initial variables
-        connection = None
-        channel = None
-        reconnect_delay = 5  # Start with 5 seconds delay
-        max_reconnect_delay = 60  # Maximum delay of 60 seconds
-        queue_name = os.getenv("AGENT_QUEUE_NAME", "agent_tasks_queue")
+        while self._pending and len(self._running) < INFERENCE_CONCURRENCY and not self._draining:
+            for project_id in sorted(self._pending, key=lambda p: self._running_per_project.get(p, 0)):
+                messages = self._pending[project_id]
+                index = next((
+                    i for i, (agent_key, _) in enumerate(messages)
+                    if self._running_per_agent.get(agent_key, 0) < INFERENCE_AGENT_CONCURRENCY
+                ), None)
+                if index is not None:
+                    break
+            else:
+                # Every waiting message's agent is at its limit
+                return
 
-        # Set up message consumption
-        # Set visibility timeout via consumer configuration
-        # Consumer will have sole access to the message during processing
-        visibility_timeout = int(os.getenv("RABBITMQ_VISIBILITY_TIMEOUT", "7200"))  # 2 hours default
+            agent_key, message = messages[index]
+            del messages[index]
+            del self._pending[project_id]
+            if messages:
+                # Back of the line for the next slot
+                self._pending[project_id] = messages
 
-        logger.info(f"Setting RabbitMQ message visibility timeout to {visibility_timeout} seconds")
+            self._running_per_project[project_id] = self._running_per_project.get(project_id, 0) + 1
+            self._running_per_agent[agent_key] = self._running_per_agent.get(agent_key, 0) + 1
+            task = asyncio.create_task(self._run_message(project_id, agent_key, message))
+            self._running.add(task)
 
-        # Initial connection setup
+    async def _run_message(self, project_id: str, agent_key: Tuple[str, str], message: AbstractIncomingMessage) -> None:
+        """Process one message in its task slot, then hand the slot on."""
         try:
-            connection, channel = self.setup_rabbitmq_consumer()
-        except Exception as e:
-            logger.error(f"Failed to establish initial RabbitMQ connection: {str(e)}")
-            # Let the exception propagate to trigger container restart
+            await self.process_inference_message(message)
+        except asyncio.CancelledError:
+            # Drain timeout on shutdown: don't leave the task processing forever
+            try:
+                message_data = json.loads(message.body.decode('utf-8'))
+                if message_data.get('assistant_task_id'):
+                    await self.update_task_status(
+                        message_data['assistant_task_id'],
+                        TaskStatus.FAILED,
+                        json.dumps({"response": "The worker shut down before the task finished", "error": True}),
+                        project_id=message_data.get('project_id'),
+                        agent_id=message_data.get('agent_id')
+                    )
+            except Exception as e:
+                logger.error(f"Failed to mark interrupted task as failed: {str(e)}")
             raise
+        except Exception as e:
+            logger.error(f"Error processing message: {str(e)}")
+            # Acknowledge the message even if processing fails, to avoid infinite retry loops
+            # This is a safety measure since we should already be acknowledging in process_inference_message
+            try:
+                if not message.processed:
+                    await message.ack()
+            except Exception as ack_error:
+                logger.error(f"Failed to acknowledge message after error: {str(ack_error)}")
+        finally:
+            self._running_per_project[project_id] -= 1
+            if not self._running_per_project[project_id]:
+                del self._running_per_project[project_id]
+            self._running_per_agent[agent_key] -= 1
+            if not self._running_per_agent[agent_key]:
+                del self._running_per_agent[agent_key]
+            self._running.discard(asyncio.current_task())
+            self._dispatch()
+
+    async def _drain(self, queue: AbstractQueue, consumer_tag: str) -> None:
+        """Stop intake, return waiting messages to the queue and let running tasks finish."""
+        self._draining = True
+        try:
+            await queue.cancel(consumer_tag)
+        except Exception as e:
+            logger.warning(f"Error cancelling consumer: {str(e)}")
 
-        def callback(ch, method, properties, body):
-            # Run the coroutine in the event loop
+        # Messages that have not started go back to the queue for other workers
+        waiting = [message for messages in self._pending.values() for _, message in messages]
+        self._pending.clear()
+        for message in waiting:
             try:
-                asyncio.run(self.process_inference_message(ch, method, properties, body))
+                await message.nack(requeue=True)
             except Exception as e:
-                logger.error(f"Error processing message: {str(e)}")
-                # Acknowledge the message even if processing fails, to avoid infinite retry loops
-                # This is a safety measure since we should already be acknowledging in process_inference_message
-                try:
-                    ch.basic_ack(delivery_tag=method.delivery_tag)
-                except Exception as ack_error:
-                    logger.error(f"Failed to acknowledge message after error: {str(ack_error)}")
-
-        # Start consuming messages with extended visibility timeout
-        channel.basic_consume(queue=queue_name, on_message_callback=callback, auto_ack=False)
+                logger.warning(f"Error requeueing message: {str(e)}")
+        if waiting:
+            logger.info(f"Returned {len(waiting)} waiting messages to the queue")
+
+        if self._running:
+            logger.info(f"Waiting up to {INFERENCE_DRAIN_TIMEOUT:.0f}s for {len(self._running)} running tasks to finish")
+            _, unfinished = await asyncio.wait(set(self._running), timeout=INFERENCE_DRAIN_TIMEOUT)
+            if unfinished:
+                logger.warning(f"Cancelling {len(unfinished)} tasks still running after the drain timeout")
+                for task in unfinished:
+                    task.cancel()
+                await asyncio.gather(*unfinished, return_exceptions=True)
+
+    async def start_consumer(self):
+        """
+        Start consuming messages from the RabbitMQ queue
 
-        logger.info(f"Started consuming messages from queue: {queue_name}")
-        logger.info("Waiting for training job messages. Press CTRL+C to exit.")
+        Runs on one event loop for the life of the process. Up to
+        INFERENCE_CONCURRENCY agent tasks run at the same time; SIGTERM stops
+        intake and lets running tasks finish before the process exits.
+        """
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._request_shutdown, sig)
 
+        # Initial connection setup; failures propagate to trigger a container restart
+        connection = await self.get_rabbitmq_connection()
+        watcher = asyncio.create_task(self._watch_cancellations())
         try:
-            # Start consuming in a loop that checks for shutdown flag
-            while not shutdown_flag:
-                if not connection or not connection.is_open:
-                    # If connection is not available, try to reconnect
-                    try:
-                        logger.info("Attempting to reconnect to RabbitMQ...")
-                        # Close the old connection if it's still around
-                        if connection and connection.is_open:
-                            try:
-                                connection.close()
-                            except Exception as close_error:
-                                logger.warning(f"Error closing old connection: {str(close_error)}")
-
-                        # Set up a fresh connection
-                        connection, channel = self.setup_rabbitmq_consumer()
-                        channel.basic_consume(queue=queue_name, on_message_callback=callback, auto_ack=False)
-                        logger.info("Successfully reconnected to RabbitMQ")
-                        reconnect_delay = 5  # Reset delay after successful reconnection
-                    except Exception as reconnect_error:
-                        logger.error(f"Failed to reconnect: {str(reconnect_error)}")
-                        # Implement exponential backoff for reconnect attempts
-                        logger.info(f"Waiting {reconnect_delay} seconds before trying again")
-                        time.sleep(reconnect_delay)
-                        # Increase delay for next attempt, up to max_reconnect_delay
-                        reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
-                        continue  # Skip to next iteration after reconnect attempt
+            queue = await self.setup_rabbitmq_consumer(connection)
+            consumer_tag = await queue.consume(self._on_message)
 
-                try:
-                    # Process messages but don't block indefinitely
-                    connection.process_data_events(time_limit=1.0)
-                    time.sleep(0.1)
-                except (pika.exceptions.AMQPError, KeyboardInterrupt, ConnectionError, OSError) as e:
-                    logger.warning(f"Connection issue: {str(e)}")
-                    if not shutdown_flag:
-                        # Mark the connection as closed to trigger reconnect on next iteration
-                        if connection and connection.is_open:
-                            try:
-                                connection.close()
-                            except Exception as close_error:
-                                logger.warning(f"Error closing problematic connection: {str(close_error)}")
-                        connection = None
-                        channel = None
-                        # Wait before trying again, but don't increase delay yet
-                        time.sleep(reconnect_delay)
-        except KeyboardInterrupt:
-            logger.info("Interrupted by user, shutting down...")
+            logger.info(f"Started consuming messages from queue: {queue.name}")
+            logger.info(f"Running up to {INFERENCE_CONCURRENCY} agent tasks at a time. Press CTRL+C to exit.")
+
+            await self._shutdown.wait()
+            await self._drain(queue, consumer_tag)
         finally:
+            watcher.cancel()
+            await asyncio.gather(watcher, return_exceptions=True)
+            if self._redis is not None:
+                await self._redis.close()
             # Clean up
-            if connection and connection.is_open:
-                try:
-                    connection.close()
-                    logger.info("RabbitMQ connection closed")
-                except Exception as e:
-                    logger.error(f"Error closing connection: {str(e)}")
+            try:
+                await connection.close()
+                logger.info("RabbitMQ connection closed")
+            except Exception as e:
+                logger.error(f"Error closing connection: {str(e)}")
 
 
 def main():
@@ -1620,7 +1809,7 @@ def main():
         manager = InferenceJobManager()
         
         # Start consuming messages
-        manager.start_consumer()
+        asyncio.run(manager.start_consumer())
     except Exception as e:
         logger.error(f"Main process error: {str(e)}", exc_info=True)
         # Exit with error code
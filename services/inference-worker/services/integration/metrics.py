@@ -0,0 +1,54 @@
+import os
+
+from services.utils.logger import logger
+
+# Try to import OpenTelemetry metrics - these are optional dependencies
+try:
+    from opentelemetry import metrics
+    from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+    OTEL_METRICS_AVAILABLE = True
+except ImportError:
+    OTEL_METRICS_AVAILABLE = False
+    metrics = None
+    OTLPMetricExporter = None
+    MeterProvider = None
+    PeriodicExportingMetricReader = None
+
+# Instruments, created once metrics are enabled; recording is a no-op until then
+_workspace_materialization_seconds = None
+
+
+def initialize_metrics():
+    """Initialize OpenTelemetry metrics export if enabled.
+
+    Metrics are exported over OTLP/HTTP; the endpoint is taken from the standard
+    OTEL_EXPORTER_OTLP_METRICS_ENDPOINT or OTEL_EXPORTER_OTLP_ENDPOINT variables.
+    """
+    global _workspace_materialization_seconds
+    enable_metrics = os.getenv("ENABLE_OTEL_METRICS", "False").lower() == "true"
+
+    if enable_metrics:
+        if not OTEL_METRICS_AVAILABLE:
+            logger.warning("Metrics requested but opentelemetry-sdk/exporter packages not installed. Skipping.")
+            return
+
+        reader = PeriodicExportingMetricReader(OTLPMetricExporter())
+        metrics.set_meter_provider(MeterProvider(metric_readers=[reader]))
+        meter = metrics.get_meter("inference-worker")
+        _workspace_materialization_seconds = meter.create_histogram(
+            "inference.workspace.materialization",
+            unit="s",
+            description="Time taken to build a task's working directory, by workspace mode",
+        )
+
+        logger.info("OpenTelemetry metrics enabled")
+    else:
+        logger.info("OpenTelemetry metrics disabled")
+
+
+def record_workspace_materialization(seconds: float, mode: str):
+    """Record how long a task's working directory took to build and the mode it was built with."""
+    if _workspace_materialization_seconds is not None:
+        _workspace_materialization_seconds.record(seconds, {"mode": mode})
@@ -1,8 +1,25 @@
+import ctypes
+import errno
+import fcntl
 import shutil
 import os
+import time
 
 from services.utils.logger import logger
 
+# FICLONE ioctl (linux/fs.h): clone a file's extents, copy-on-write (btrfs, xfs, overlayfs on them)
+FICLONE = 0x40049409
+# umount2 flag (sys/mount.h): detach now, finish unmounting once the mount is no longer busy
+MNT_DETACH = 2
+
+# Errors meaning the filesystem or process can't share files this way, so it isn't tried again
+_LINK_UNSUPPORTED_ERRORS = {errno.EXDEV, errno.EPERM, errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL}
+
+# Suffix of the directory next to an overlay workspace holding its upper and work directories
+_OVERLAY_LAYER_SUFFIX = ".layer"
+
+_libc = ctypes.CDLL(None, use_errno=True)
+
 
 def copy_folder_content(source_folder, destination_folder):
     # Ensure source folder exists
@@ -29,6 +46,146 @@ def copy_folder_content(source_folder, destination_folder):
             logger.error(f"Failed to copy folder '{source_path}' to '{destination_path}'.")
 
 
+def _reflink(source_path, destination_path):
+    """Clone a file copy-on-write; raises OSError where the filesystem doesn't support it."""
+    with open(source_path, "rb") as source, open(destination_path, "wb") as destination:
+        try:
+            fcntl.ioctl(destination.fileno(), FICLONE, source.fileno())
+        except OSError:
+            destination.close()
+            os.remove(destination_path)
+            raise
+    shutil.copystat(source_path, destination_path)
+
+
+def _mount_overlay(source_folder, destination_folder):
+    """Mount source_folder read-only at destination_folder, with writes going to an upper directory of its own."""
+    layer = destination_folder + _OVERLAY_LAYER_SUFFIX
+    upper, work = os.path.join(layer, "upper"), os.path.join(layer, "work")
+    os.makedirs(upper)
+    os.makedirs(work)
+    os.makedirs(destination_folder, exist_ok=True)
+    options = f"lowerdir={source_folder},upperdir={upper},workdir={work}"
+    if _libc.mount(b"overlay", os.fsencode(destination_folder), b"overlay", 0, os.fsencode(options)) != 0:
+        error = ctypes.get_errno()
+        shutil.rmtree(layer, ignore_errors=True)
+        raise OSError(error, os.strerror(error), destination_folder)
+
+
+def release_workspace(destination_folder):
+    """Unmount and remove a workspace built by materialize_workspace; the source is left as it is."""
+    if os.path.ismount(destination_folder):
+        if _libc.umount2(os.fsencode(destination_folder), MNT_DETACH) != 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error), destination_folder)
+    # rmtree removes symlinks rather than following them
+    shutil.rmtree(destination_folder, ignore_errors=True)
+    shutil.rmtree(destination_folder + _OVERLAY_LAYER_SUFFIX, ignore_errors=True)
+
+
+def materialize_workspace(source_folder, destination_folder, mode="auto"):
+    """
+    Give a task its own writable view of a folder without copying it where possible.
+
+    The source folder is never modified:
+    - "overlay": an overlayfs mount of the source as a read-only lower layer, with
+      every write going to an upper directory of the task's own. Needs mount
+      privileges (CAP_SYS_ADMIN) and an upper directory on a filesystem overlayfs
+      accepts.
+    - "symlink": directories are recreated and each file is a symlink to the
+      source, so new files land in the task's own directories. Writes through a
+      link would reach the source, so the caller's sandbox must deny writes there.
+    - "reflink": directories are recreated and files cloned copy-on-write.
+    - "copy": full copies.
+    - "auto": overlay where it can be mounted, symlink otherwise.
+    Files that can't be linked or cloned are copied; a file that can't be copied
+    either raises, and the partial workspace is removed.
+
+    Args:
+        source_folder: The folder to materialize
+        destination_folder: Where to build the workspace; must not exist or be empty.
+            Remove it with release_workspace.
+        mode: One of "auto", "overlay", "symlink", "reflink" or "copy"
+
+    Returns:
+        Dict with the mode used, the file counts by how they were shared ("symlink",
+        "reflink" and "copy"), the number of bytes copied and the seconds taken
+    """
+    if mode not in ("auto", "overlay", "symlink", "reflink", "copy"):
+        raise ValueError(f"Unknown workspace mode: {mode}")
+    if not os.path.isdir(source_folder):
+        raise FileNotFoundError(f"Source folder '{source_folder}' does not exist.")
+
+    start_time = time.monotonic()
+    counts = {"symlink": 0, "reflink": 0, "copy": 0}
+    copied_bytes = 0
+
+    if mode in ("auto", "overlay"):
+        try:
+            _mount_overlay(source_folder, destination_folder)
+            return {
+                "mode": "overlay",
+                "modes": counts,
+                "copied_bytes": 0,
+                "seconds": time.monotonic() - start_time,
+            }
+        except OSError as e:
+            logger.info(f"Overlay workspace not available for '{destination_folder}' ({e}); linking files instead")
+            mode = "symlink"
+
+    # Strategy still worth trying; once the filesystem rejects it, files are copied
+    strategy = None if mode == "copy" else mode
+    try:
+        os.makedirs(destination_folder, exist_ok=True)
+        for root, dirs, files in os.walk(source_folder):
+            target_root = os.path.join(destination_folder, os.path.relpath(root, source_folder))
+            for name in dirs:
+                source_dir = os.path.join(root, name)
+                if os.path.islink(source_dir):
+                    # os.walk doesn't descend into symlinked directories; keep them as links
+                    os.symlink(os.readlink(source_dir), os.path.join(target_root, name))
+                else:
+                    os.makedirs(os.path.join(target_root, name), exist_ok=True)
+
+            for name in files:
+                source_path = os.path.join(root, name)
+                destination_path = os.path.join(target_root, name)
+                if os.path.islink(source_path):
+                    os.symlink(os.readlink(source_path), destination_path)
+                    continue
+
+                if strategy is not None:
+                    try:
+                        if strategy == "symlink":
+                            os.symlink(os.path.abspath(source_path), destination_path)
+                        else:
+                            _reflink(source_path, destination_path)
+                        counts[strategy] += 1
+                        continue
+                    except OSError as e:
+                        if e.errno in _LINK_UNSUPPORTED_ERRORS:
+                            logger.info(f"Workspace files can't be shared by {strategy} ({e}); copying them instead")
+                            strategy = None
+                        else:
+                            logger.warning(f"Failed to {strategy} '{source_path}', copying it instead: {e}")
+
+                shutil.copy2(source_path, destination_path)  # copy2 preserves metadata
+                counts["copy"] += 1
+                copied_bytes += os.path.getsize(destination_path)
+    except Exception:
+        release_workspace(destination_folder)
+        raise
+
+    if counts["copy"] and not counts["symlink"] + counts["reflink"]:
+        mode = "copy"
+    return {
+        "mode": mode,
+        "modes": counts,
+        "copied_bytes": copied_bytes,
+        "seconds": time.monotonic() - start_time,
+    }
+
+
 def copy_files_with_txt_extension(source_folder, dest_folder):
     if not os.path.exists(source_folder):
         return
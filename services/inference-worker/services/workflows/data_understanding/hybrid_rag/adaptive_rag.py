@@ -1,8 +1,11 @@
 import asyncio
+import copy
+import dataclasses
 import mimetypes
 import os
 import json
 import shutil
+import uuid
 from typing import Dict, Any, List, Union, Optional, Callable, Awaitable
 import time
 import boto3
@@ -17,7 +20,10 @@ from datetime import datetime
 
 from services.workflows.data_understanding.hybrid_rag.model.data import GraphStateHybrid
 from services.customer.personalization import get_project_config
+from services.workflows.data_understanding.hybrid_rag.stream_publisher import RedisStreamPublisher
+from services.utils.dir import materialize_workspace, release_workspace
 from services.utils.logger import logger
+from services.integration.metrics import record_workspace_materialization
 
 # Redis imports for streaming
 import redis.asyncio as redis
@@ -82,6 +88,9 @@ DEFAULT_ERROR_MESSAGE = (
 # Cancellation message constant
 TASK_CANCELLED_MESSAGE = "Task was cancelled by user."
 
+# How a task's working directory shares the packaged skills: auto (overlay, else symlink), overlay, symlink, reflink or copy
+WORKSPACE_MODE = os.getenv("INFERENCE_WORKSPACE_MODE", "auto")
+
 # Directories to exclude from artifact uploads
 ARTIFACT_SKIP_DIRS = {'.claude', 'node_modules', '.git', '__pycache__', '.next', '.cache', 'dist', '.remotion', '.venv', 'venv', 'build'}
 
@@ -106,6 +115,8 @@ class LLMAgentArchitecture:
 
         # Redis client for streaming (lazy initialization)
         self.redis_client: Optional[redis.Redis | RedisCluster] = None
+        # Publishes Claude messages to the task stream in the background (one per run)
+        self.stream_publisher: Optional[RedisStreamPublisher] = None
         
         # Runtime config (set during astream call)
         self.runtime_config: Optional[Dict[str, Any]] = None
@@ -114,6 +125,13 @@ class LLMAgentArchitecture:
         self.cancellation_check: Optional[Callable[[], Awaitable[bool]]] = None
         self._last_cancel_check: float = 0
         self._cancel_check_interval: float = 5.0  # Check cancellation every 5 seconds
+
+        # Claude Code stderr lines of the current run
+        self.stderr_messages: List[str] = []
+        # Timestamp written into the system prompt
+        self._prompt_timestamp: Optional[str] = None
+        # Working directory of a forked client's task, removed when its run ends
+        self._task_directory: Optional[str] = None
         
         self.config = {
             "project": project,
@@ -286,16 +304,7 @@ class LLMAgentArchitecture:
                 logger.info(f"Created empty skills directory: {target_skills_dir}")
             
             # Copy CLAUDE.md from context directory's raw/ subfolder to .claude folder
-            context_directory = self._get_context_directory()
-            # CLAUDE.md is stored in the raw/ subdirectory
-            source_claude_md = os.path.join(context_directory, "raw", "CLAUDE.md")
-            target_claude_md = os.path.join(target_claude_dir, "CLAUDE.md")
-
-            if os.path.exists(source_claude_md):
-                shutil.copy2(source_claude_md, target_claude_md)
-                logger.info(f"Copied CLAUDE.md from context to .claude directory")
-            else:
-                logger.debug(f"CLAUDE.md not found in context directory: {source_claude_md}")
+            self._copy_claude_md(target_claude_dir)
                 
         except Exception as e:
             logger.error(f"Failed to setup .claude directory: {e}", exc_info=True)
@@ -303,6 +312,119 @@ class LLMAgentArchitecture:
             if skills_copied > 0 or files_copied > 0:
                 logger.info(f"Partial setup: {skills_copied} skills, {files_copied} files copied before error")
 
+    def _copy_claude_md(self, target_claude_dir: str) -> None:
+        """Copy the project's CLAUDE.md from the context directory into a .claude directory."""
+        context_directory = self._get_context_directory()
+        # CLAUDE.md is stored in the raw/ subdirectory
+        source_claude_md = os.path.join(context_directory, "raw", "CLAUDE.md")
+        target_claude_md = os.path.join(target_claude_dir, "CLAUDE.md")
+
+        if os.path.exists(source_claude_md):
+            shutil.copy2(source_claude_md, target_claude_md)
+            logger.info(f"Copied CLAUDE.md from context to .claude directory")
+        else:
+            logger.debug(f"CLAUDE.md not found in context directory: {source_claude_md}")
+
+    def _create_task_directory(self) -> str:
+        """Create a working directory for one task, next to the agent's work_dir.
+
+        Tasks of one agent can run at the same time, so each works in a directory
+        of its own. Its skills are a read-only view of the packaged skills
+        directory (WORKSPACE_MODE, see materialize_workspace) rather than a copy;
+        the symlink fallback stays read-only because the sandbox denies writes
+        under /app. The time taken is recorded as a metric by mode.
+        """
+        template_directory = self.action_agent_options.cwd
+        task_directory = os.path.join(os.path.dirname(template_directory), "tasks", uuid.uuid4().hex)
+        source_skills_dir = os.path.join(os.path.dirname(__file__), "skills")
+        target_claude_dir = os.path.join(task_directory, ".claude")
+        target_skills_dir = os.path.join(target_claude_dir, "skills")
+        if not os.path.isdir(source_skills_dir):
+            logger.warning(f"Source skills directory not found: {source_skills_dir}")
+            os.makedirs(target_skills_dir)
+        else:
+            os.makedirs(target_claude_dir)
+            try:
+                stats = materialize_workspace(source_skills_dir, target_skills_dir, mode=WORKSPACE_MODE)
+            except Exception:
+                shutil.rmtree(task_directory, ignore_errors=True)
+                raise
+            record_workspace_materialization(stats["seconds"], stats["mode"])
+            logger.info(
+                f"Materialized task skills ({stats['mode']}) in {stats['seconds']:.3f}s "
+                f"(files symlinked: {stats['modes']['symlink']}, reflinked: {stats['modes']['reflink']}, "
+                f"copied: {stats['modes']['copy']}, bytes copied: {stats['copied_bytes']})"
+            )
+
+        # CLAUDE.md may have changed with the latest project sync
+        try:
+            self._copy_claude_md(target_claude_dir)
+        except Exception as e:
+            logger.error(f"Failed to copy CLAUDE.md: {e}", exc_info=True)
+        logger.info(f"Created task working directory: {task_directory}")
+        return task_directory
+
+    def _remove_task_directory(self) -> None:
+        """Remove a forked client's working directory once its run is over."""
+        if self._task_directory is None:
+            return
+        try:
+            # An overlay mount has to go before the directory it is mounted in
+            release_workspace(os.path.join(self._task_directory, ".claude", "skills"))
+        except OSError as e:
+            logger.warning(f"Failed to release task skills in {self._task_directory}: {e}")
+        shutil.rmtree(self._task_directory, ignore_errors=True)
+        logger.info(f"Removed task working directory: {self._task_directory}")
+        self._task_directory = None
+
+    def fork(self) -> "LLMAgentArchitecture":
+        """Create a client for one task from this initialized one.
+
+        The fork shares the prepared agent options, so MCP tool discovery and
+        skills setup are not repeated. Runtime state (config, cancellation
+        callback, Redis client, stderr capture) is its own. Forking does no I/O;
+        await prepare_task_directory() on the fork before running it, to give it
+        a working directory of its own, removed when the run ends.
+        """
+        if not self.workflow_app:
+            raise RuntimeError("Workflow not initialized. Call initialize() first.")
+
+        clone = copy.copy(self)
+        clone.config = dict(self.config)
+        clone.redis_client = None
+        clone.stream_publisher = None
+        clone.runtime_config = None
+        clone.cancellation_check = None
+        clone._last_cancel_check = 0
+        clone.stderr_messages = []
+        clone._task_directory = None
+        clone.action_agent_options = dataclasses.replace(self.action_agent_options, stderr=clone._on_stderr)
+        return clone
+
+    async def prepare_task_directory(self) -> None:
+        """Create a forked client's working directory off the event loop and point its options at it."""
+        if self._task_directory is not None:
+            return
+        task_directory = await asyncio.to_thread(self._create_task_directory)
+        self._task_directory = task_directory
+
+        # Keep the date in the system prompt current
+        current_timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+        previous_timestamp = self._prompt_timestamp
+        self._prompt_timestamp = current_timestamp
+        # The prompt and the file permissions name the working directory
+        template_directory = self.action_agent_options.cwd
+        self.action_agent_options = dataclasses.replace(
+            self.action_agent_options,
+            system_prompt=self.action_agent_options.system_prompt.replace(
+                f"Current Date/Time: {previous_timestamp}",
+                f"Current Date/Time: {current_timestamp}",
+                1
+            ).replace(template_directory, task_directory),
+            settings=self.action_agent_options.settings.replace(template_directory, task_directory),
+            cwd=task_directory,
+        )
+
     def _detect_security_violation(self, command: str) -> tuple[bool, str]:
         """Detect potential security violations in commands for MONITORING/LOGGING purposes.
         
@@ -431,6 +553,7 @@ class LLMAgentArchitecture:
 
         # Get current timestamp for the system prompt
         current_timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+        self._prompt_timestamp = current_timestamp
 
         # System message defining the architecture (unchanged from original)
         system_prompt = f"""
@@ -922,21 +1045,10 @@ For refused execution:
         }}
         """
         
-        # Create stderr callback to capture debug output
+        # Capture stderr debug output
         # Store as instance variable so it can be accessed in _invoke_claude_agent
         self.stderr_messages = []
         
-        def stderr_callback(message: str):
-            """Callback that receives each line of stderr output from Claude Code."""
-            self.stderr_messages.append(message)
-            # Log stderr messages with appropriate level
-            if "[ERROR]" in message or "error" in message.lower():
-                logger.error(f"[CLAUDE_CODE_STDERR] {message}")
-            elif "[WARN]" in message or "warning" in message.lower():
-                logger.warning(f"[CLAUDE_CODE_STDERR] {message}")
-            else:
-                logger.debug(f"[CLAUDE_CODE_STDERR] {message}")
-        
         # Buffer size configuration:
         # - Default: 20MB - sufficient for most document processing (PDFs, Excel files typically < 10MB)
         # - Configurable via MAX_BUFFER_SIZE_MB environment variable
@@ -962,7 +1074,7 @@ For refused execution:
             "max_turns": self.recursion_limit,
             "max_buffer_size": buffer_size_mb * 1024 * 1024,
             "agents": subagents,  # Add subagents for specialized tasks
-            "stderr": stderr_callback,  # Add stderr callback to capture debug output
+            "stderr": self._on_stderr,  # Add stderr callback to capture debug output
             "max_thinking_tokens": max_thinking_tokens if max_thinking_tokens > 0 else None  # Enable extended thinking
         }
 
@@ -976,6 +1088,17 @@ For refused execution:
         if max_thinking_tokens > 0:
             logger.info(f"Extended thinking enabled with {max_thinking_tokens} token budget")
 
+    def _on_stderr(self, message: str):
+        """Callback that receives each line of stderr output from Claude Code."""
+        self.stderr_messages.append(message)
+        # Log stderr messages with appropriate level
+        if "[ERROR]" in message or "error" in message.lower():
+            logger.error(f"[CLAUDE_CODE_STDERR] {message}")
+        elif "[WARN]" in message or "warning" in message.lower():
+            logger.warning(f"[CLAUDE_CODE_STDERR] {message}")
+        else:
+            logger.debug(f"[CLAUDE_CODE_STDERR] {message}")
+
     def _serialize_content_block(self, block) -> dict:
         """Serialize a single content block to a dictionary."""
         if isinstance(block, TextBlock):
@@ -1166,6 +1289,19 @@ For refused execution:
             await self.redis_client.close()
             self.redis_client = None
 
+    async def _close_stream_publisher(self) -> None:
+        """Publish the messages still queued and release the run's Redis client."""
+        if self.stream_publisher is not None:
+            try:
+                await self.stream_publisher.close()
+            except Exception as e:
+                logger.warning(f"Failed to flush Claude messages: {e}")
+            self.stream_publisher = None
+        try:
+            await self.close_redis_client()
+        except Exception as e:
+            logger.debug(f"Error closing Redis client: {e}")
+
     async def _publish_claude_message(self, message):
         """Publish raw Claude Code message to Redis."""
         try:
@@ -1178,9 +1314,8 @@ For refused execution:
         if not redis_enabled:
             return
             
-        redis_client = await self._get_redis_client()
-        if not redis_client:
-            return
+        if self.stream_publisher is None:
+            self.stream_publisher = RedisStreamPublisher(self._get_redis_client)
             
         try:
             # Use shared message formatter
@@ -1194,12 +1329,10 @@ For refused execution:
                 "structured_data": json.dumps(message_entry["structured_data"])
             }
             
-            # Publish to Redis stream using assistant_task_id as key
+            # Publish to Redis stream using assistant_task_id as key; written in
+            # batches by the publisher, which also sets the stream's expiration
             stream_key = f"task_stream:{assistant_task_id}"
-            await redis_client.xadd(stream_key, message_data)
-            
-            # Set expiration for the stream (1 hour)
-            await redis_client.expire(stream_key, 3600)
+            await self.stream_publisher.publish(stream_key, message_data)
             
         except Exception as e:
             logger.warning(f"Failed to publish Claude message: {e}")
@@ -1310,8 +1443,8 @@ Original request: {user_prompt}
             existing_env.update(env_variables)
             existing_settings["env"] = existing_env
             
-            # Update settings on the options object directly
-            options.settings = json.dumps(existing_settings)
+            # Copy so the client's own options never carry a task's env variables
+            options = dataclasses.replace(options, settings=json.dumps(existing_settings))
             
             logger.info(f"Injected {len(env_variables)} environment variables into Claude Code settings: {list(env_variables.keys())}")
             return options
@@ -1807,7 +1940,12 @@ CRITICAL IDENTITY RULES:
         # Use asyncio to run the async method
         import asyncio
         state = {"question": query, "context": "", "messages": [], "generation": "", "output_format": ""}
-        result = asyncio.get_event_loop().run_until_complete(self._execute_agent(state))
+        loop = asyncio.get_event_loop()
+        try:
+            result = loop.run_until_complete(self._execute_agent(state))
+        finally:
+            loop.run_until_complete(self._close_stream_publisher())
+            self._remove_task_directory()
         return result
 
     async def astream(self, input: dict = None, config: dict = None, cancellation_check: Optional[Callable[[], Awaitable[bool]]] = None):
@@ -1853,7 +1991,12 @@ CRITICAL IDENTITY RULES:
         }
 
         # Execute agent directly (replaces LangGraph workflow)
-        result = await self._execute_agent(state)
+        try:
+            result = await self._execute_agent(state)
+        finally:
+            # Flush streamed messages before the final result is reported
+            await self._close_stream_publisher()
+            await asyncio.to_thread(self._remove_task_directory)
 
         # Yield result in LangGraph-compatible format
         yield {"agent_node": result}
@@ -1891,7 +2034,12 @@ CRITICAL IDENTITY RULES:
 
         # Execute and yield result in LangGraph-compatible format
         import asyncio
-        result = asyncio.get_event_loop().run_until_complete(self._execute_agent(state))
+        loop = asyncio.get_event_loop()
+        try:
+            result = loop.run_until_complete(self._execute_agent(state))
+        finally:
+            loop.run_until_complete(self._close_stream_publisher())
+            self._remove_task_directory()
         yield {"agent_node": result}
 
     async def save_messages_to_s3(self, messages: List[Any]) -> bool:
@@ -1952,10 +2100,7 @@ CRITICAL IDENTITY RULES:
                 return False
             
             assistant_task_id = self.runtime_config["configurable"]["assistant_task_id"]
-            # Reconstruct working directory path without cleanup
-            project_id = self.project.lower()
-            agent_id = self.agent_id.lower()
-            working_directory = os.path.join("/tmp", "chicory", project_id, agent_id, "work_dir")
+            working_directory = self.action_agent_options.cwd
             
             # Check if working directory exists
             if not os.path.exists(working_directory):
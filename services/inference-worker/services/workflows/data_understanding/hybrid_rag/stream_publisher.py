@@ -0,0 +1,135 @@
+"""
+Batched publishing of agent messages to Redis streams.
+
+publish() only queues an entry; a background task drains the queue and
+writes everything waiting in one pipeline: an XADD per entry, trimmed with
+MAXLEN ~, and an EXPIRE per stream only when its TTL is due for a refresh.
+Entries published while a pipeline is in flight go out together in the next
+one, so a fast agent costs a round-trip per batch rather than two per
+message, without adding latency when messages are sparse.
+
+The queue is bounded: if Redis falls behind, publish() waits instead of
+buffering without limit. Should the background task die, publish() drops
+entries rather than wait on a queue nothing drains. close() flushes what is
+queued and sets the final TTL of every stream written.
+"""
+import asyncio
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from services.utils.logger import logger
+
+# How long task streams live after their last entry (matches backend-api's TASK_STREAM_TTL_SECONDS)
+TASK_STREAM_TTL_SECONDS = int(os.getenv("TASK_STREAM_TTL_SECONDS", "3600"))
+# Approximate number of entries a task stream is trimmed to
+TASK_STREAM_MAXLEN = int(os.getenv("TASK_STREAM_MAXLEN", "10000"))
+# Entries waiting to be published before publish() blocks
+STREAM_PUBLISH_QUEUE_SIZE = int(os.getenv("STREAM_PUBLISH_QUEUE_SIZE", "1000"))
+# Entries written per pipeline
+STREAM_PUBLISH_BATCH_SIZE = int(os.getenv("STREAM_PUBLISH_BATCH_SIZE", "200"))
+
+
+class RedisStreamPublisher:
+    """Publishes entries to Redis streams from a background task."""
+
+    def __init__(self, get_client: Callable[[], Awaitable[Optional[Any]]]):
+        """
+        Args:
+            get_client: Returns the Redis client to publish with, or None if Redis is unavailable
+        """
+        self._get_client = get_client
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_PUBLISH_QUEUE_SIZE)
+        self._task: Optional[asyncio.Task] = None
+        # When each stream's TTL was last set
+        self._expiry_set_at: Dict[str, float] = {}
+
+    async def publish(self, stream_key: str, fields: Dict[str, str]) -> None:
+        """Queue an entry for a stream; waits while the queue is full."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        if not await self._put((stream_key, fields)):
+            logger.debug(f"Stream publisher stopped, dropping entry for {stream_key}")
+
+    async def close(self) -> None:
+        """Publish everything queued, then set the final TTL of the streams written."""
+        if self._task is None:
+            return
+        await self._put(None)
+        try:
+            await self._task
+        except Exception as e:
+            logger.warning(f"Stream publisher failed: {e}")
+        self._task = None
+
+        if self._expiry_set_at:
+            try:
+                client = await self._get_client()
+                if client is None:
+                    return
+                async with client.pipeline(transaction=False) as pipe:
+                    for stream_key in self._expiry_set_at:
+                        pipe.expire(stream_key, TASK_STREAM_TTL_SECONDS)
+                    await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Failed to set stream expiry: {e}")
+            self._expiry_set_at.clear()
+
+    async def _put(self, entry: Optional[Tuple[str, Dict[str, str]]]) -> bool:
+        """Queue an entry for the background task; False if that task has stopped."""
+        if self._task.done():
+            return False
+        try:
+            self._queue.put_nowait(entry)
+            return True
+        except asyncio.QueueFull:
+            pass
+        # Wait for room, or for the task to die and leave the queue undrained
+        put = asyncio.ensure_future(self._queue.put(entry))
+        try:
+            await asyncio.wait((put, self._task), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not put.done():
+                put.cancel()
+        return not put.cancelled()
+
+    async def _run(self) -> None:
+        closing = False
+        while not closing:
+            batch: List[Tuple[str, Dict[str, str]]] = []
+            entry = await self._queue.get()
+            while True:
+                if entry is None:
+                    closing = True
+                    break
+                batch.append(entry)
+                if len(batch) >= STREAM_PUBLISH_BATCH_SIZE or self._queue.empty():
+                    break
+                entry = self._queue.get_nowait()
+
+            if batch:
+                await self._write(batch)
+
+    async def _write(self, batch: List[Tuple[str, Dict[str, str]]]) -> None:
+        now = time.monotonic()
+        for stream_key, _ in batch:
+            self._expiry_set_at.setdefault(stream_key, float("-inf"))
+        # Refresh a stream's TTL once half of it has passed; close() sets the final one
+        expiring = {
+            stream_key for stream_key, _ in batch
+            if now - self._expiry_set_at[stream_key] >= TASK_STREAM_TTL_SECONDS / 2
+        }
+        try:
+            client = await self._get_client()
+            if client is None:
+                return
+            async with client.pipeline(transaction=False) as pipe:
+                for stream_key, fields in batch:
+                    pipe.xadd(stream_key, fields, maxlen=TASK_STREAM_MAXLEN, approximate=True)
+                for stream_key in expiring:
+                    pipe.expire(stream_key, TASK_STREAM_TTL_SECONDS)
+                await pipe.execute()
+            for stream_key in expiring:
+                self._expiry_set_at[stream_key] = now
+        except Exception as e:
+            logger.warning(f"Failed to publish {len(batch)} stream entries: {e}")
@@ -158,6 +158,14 @@ class ConnectionCacheManager:
         with self.lock:
             return self._remove_connection(project_id, connection_key)
     
+    def remove_project(self, project_id: str) -> int:
+        """Remove all cached connections for a project and return how many were removed."""
+        with self.lock:
+            connection_keys = list(self.cache.get(project_id, {}).keys())
+            for connection_key in connection_keys:
+                self._remove_connection(project_id, connection_key)
+            return len(connection_keys)
+    
     def _remove_connection(self, project_id: str, connection_key: str) -> bool:
         """Internal method to remove connection (assumes lock is held)."""
         if project_id in self.cache and connection_key in self.cache[project_id]:
@@ -21,6 +21,18 @@ class Config:
         # Cache Configuration
         self.CONNECTION_CACHE_TTL = int(os.getenv("CONNECTION_CACHE_TTL", "3600"))  # 1 hour default
         self.CONNECTION_CACHE_MAX_SIZE = int(os.getenv("CONNECTION_CACHE_MAX_SIZE", "100"))
+        self.DATA_SOURCE_CACHE_TTL = int(os.getenv("DATA_SOURCE_CACHE_TTL", "60"))  # seconds
+
+        # Backend API HTTP pool Configuration
+        self.BACKEND_HTTP_POOL_LIMIT = int(os.getenv("BACKEND_HTTP_POOL_LIMIT", "100"))
+        self.BACKEND_HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("BACKEND_HTTP_POOL_LIMIT_PER_HOST", "20"))
+        self.BACKEND_HTTP_KEEPALIVE_TIMEOUT = float(os.getenv("BACKEND_HTTP_KEEPALIVE_TIMEOUT", "30"))  # seconds
+        self.BACKEND_HTTP_CONNECT_TIMEOUT = float(os.getenv("BACKEND_HTTP_CONNECT_TIMEOUT", "5"))  # seconds
+        self.BACKEND_HTTP_TOTAL_TIMEOUT = float(os.getenv("BACKEND_HTTP_TOTAL_TIMEOUT", "30"))  # seconds
+
+        # S3 client Configuration
+        self.S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "32"))
+        self.S3_GET_OBJECT_MAX_BYTES = int(os.getenv("S3_GET_OBJECT_MAX_BYTES", str(1024 * 1024)))  # 1 MiB
 
         # Query/Request Limits
         self.DEFAULT_QUERY_LIMIT = int(os.getenv("DEFAULT_QUERY_LIMIT", "100"))
@@ -49,6 +61,15 @@ class Config:
         if self.CONNECTION_CACHE_MAX_SIZE <= 0:
             raise ValueError("CONNECTION_CACHE_MAX_SIZE must be positive")
 
+        if self.DATA_SOURCE_CACHE_TTL < 0:
+            raise ValueError("DATA_SOURCE_CACHE_TTL must be non-negative")
+
+        if self.BACKEND_HTTP_POOL_LIMIT <= 0 or self.BACKEND_HTTP_POOL_LIMIT_PER_HOST <= 0:
+            raise ValueError("BACKEND_HTTP_POOL_LIMIT and BACKEND_HTTP_POOL_LIMIT_PER_HOST must be positive")
+
+        if self.S3_MAX_POOL_CONNECTIONS <= 0 or self.S3_GET_OBJECT_MAX_BYTES <= 0:
+            raise ValueError("S3_MAX_POOL_CONNECTIONS and S3_GET_OBJECT_MAX_BYTES must be positive")
+
         if self.DEFAULT_QUERY_LIMIT <= 0 or self.DEFAULT_QUERY_LIMIT > self.MAX_QUERY_LIMIT:
             raise ValueError("DEFAULT_QUERY_LIMIT must be positive and <= MAX_QUERY_LIMIT")
 
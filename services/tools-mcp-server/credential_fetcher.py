@@ -4,6 +4,7 @@ Fetches credentials from the backend API based on project ID.
 """
 
 import aiohttp
+import asyncio
 import logging
 from typing import Dict, List, Optional, Any
 
@@ -13,8 +14,65 @@ logger = logging.getLogger(__name__)
 class CredentialFetcher:
     """Fetches analytics service credentials from the backend API."""
 
-    def __init__(self, api_base_url: str):
+    def __init__(self, api_base_url: str, pool_limit: int = 100, pool_limit_per_host: int = 20,
+                 keepalive_timeout: float = 30.0, connect_timeout: float = 5.0,
+                 total_timeout: float = 30.0):
         self.api_base_url = api_base_url.rstrip('/')
+        self.pool_limit = pool_limit
+        self.pool_limit_per_host = pool_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(total=total_timeout, connect=connect_timeout)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        self._requests = 0
+        self._request_errors = 0
+
+    async def start(self) -> None:
+        """Create the shared HTTP session if it does not exist yet."""
+        await self._get_session()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the long-lived pooled session, creating it on first use."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.pool_limit,
+                    limit_per_host=self.pool_limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=300
+                )
+                self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+                logger.info(f"Created pooled HTTP session for {self.api_base_url} "
+                            f"(limit={self.pool_limit}, limit_per_host={self.pool_limit_per_host})")
+            return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session and release pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("Closed pooled HTTP session")
+        self._session = None
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool statistics for the shared HTTP session."""
+        stats = {
+            "session_open": self._session is not None and not self._session.closed,
+            "limit": self.pool_limit,
+            "limit_per_host": self.pool_limit_per_host,
+            "requests": self._requests,
+            "request_errors": self._request_errors,
+            "acquired_connections": 0,
+            "idle_connections": 0
+        }
+        if stats["session_open"]:
+            connector = self._session.connector
+            # aiohttp does not expose pool occupancy publicly; read it defensively
+            stats["acquired_connections"] = len(getattr(connector, "_acquired", ()))
+            stats["idle_connections"] = sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+        return stats
 
     async def get_credentials(self, project_id: str, provider_type: str) -> Optional[Dict[str, Any]]:
         """
@@ -28,131 +86,139 @@ class CredentialFetcher:
             Dictionary containing service credentials or None if not found
         """
         try:
-            url = f"{self.api_base_url}/projects/{project_id}/data-sources"
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Failed to get data sources for project {project_id}. "
-                                   f"Status: {response.status}, Error: {error_text}")
-                        return None
-
-                    data = await response.json()
-                    data_sources = data.get("data_sources", [])
-
-                    # Find analytics source matching the specified provider type
-                    for source in data_sources:
-                        source_type = source.get("type")
-
-                        # Only look for the specified provider type
-                        if source_type != provider_type:
-                            continue
-
-                        if source_type == "looker":
-                            credentials = self._extract_looker_credentials(source)
-                            if credentials:
-                                logger.info(f"Retrieved Looker credentials for project: {project_id}")
-                                return {
-                                    "type": "looker",
-                                    "configuration": credentials
-                                }
-                        elif source_type == "redash":
-                            credentials = self._extract_redash_credentials(source)
-                            if credentials:
-                                logger.info(f"Retrieved Redash credentials for project: {project_id}")
-                                return {
-                                    "type": "redash",
-                                    "configuration": credentials
-                                }
-                        elif source_type == "openapi":
-                            credentials = self._extract_openapi_credentials(source)
-                            if credentials:
-                                logger.info(f"Retrieved OpenAPI credentials for project: {project_id}")
-                                return {
-                                    "type": "openapi",
-                                    "configuration": credentials
-                                }
-                        elif source_type == "dbt":
-                            credentials = self._extract_dbt_credentials(source)
-                            if credentials:
-                                logger.info(f"Retrieved dbt Cloud credentials for project: {project_id}")
-                                return {
-                                    "type": "dbt",
-                                    "configuration": credentials
-                                }
-                        elif source_type == "datahub":
-                            credentials = self._extract_datahub_credentials(source)
-                            if credentials:
-                                logger.info(f"Retrieved DataHub credentials for project: {project_id}")
-                                return {
-                                    "type": "datahub",
-                                    "configuration": credentials
-                                }
-                        elif source_type == "airflow":
-                            credentials = self._extract_airflow_credentials(source)
-                            if credentials:
-                                logger.info(f"Retrieved Airflow credentials for project: {project_id}")
-                                return {
-                                    "type": "airflow",
-                                    "configuration": credentials
-                                }
-                        elif source_type == "datazone":
-                            credentials = self._extract_datazone_credentials(source)
-                            if credentials:
-                                logger.info(f"Retrieved DataZone credentials for project: {project_id}")
-                                return {
-                                    "type": "datazone",
-                                    "configuration": credentials
-                                }
-                        elif source_type == "s3":
-                            credentials = self._extract_s3_credentials(source)
-                            if credentials:
-                                logger.info(f"Retrieved S3 credentials for project: {project_id}")
-                                return {
-                                    "type": "s3",
-                                    "configuration": credentials
-                                }
-                        elif source_type == "jira":
-                            credentials = self._extract_jira_credentials(source)
-                            if credentials:
-                                logger.info(f"Retrieved Jira credentials for project: {project_id}")
-                                return {
-                                    "type": "jira",
-                                    "configuration": credentials
-                                }
-                        elif source_type == "azure_blob_storage":
-                            credentials = self._extract_azure_blob_storage_credentials(source)
-                            if credentials:
-                                logger.info(f"Retrieved Azure Blob Storage credentials for project: {project_id}")
-                                return {
-                                    "type": "azure_blob_storage",
-                                    "configuration": credentials
-                                }
-                        elif source_type == "azure_data_factory":
-                            credentials = self._extract_azure_data_factory_credentials(source)
-                            if credentials:
-                                logger.info(f"Retrieved Azure Data Factory credentials for project: {project_id}")
-                                return {
-                                    "type": "azure_data_factory",
-                                    "configuration": credentials
-                                }
-                        elif source_type == "atlan":
-                            credentials = self._extract_atlan_credentials(source)
-                            if credentials:
-                                logger.info(f"Retrieved Atlan credentials for project: {project_id}")
-                                return {
-                                    "type": "atlan",
-                                    "configuration": credentials
-                                }
-
-                    logger.warning(f"No {provider_type} analytics source found for project: {project_id}")
-                    return None
-
+            data_sources = await self.fetch_data_sources(project_id)
         except Exception as e:
             logger.error(f"Error fetching credentials for project {project_id}: {str(e)}")
             return None
 
+        return self.extract_credentials(project_id, data_sources, provider_type)
+
+    def extract_credentials(self, project_id: str, data_sources: List[Dict[str, Any]],
+                            provider_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract credentials for a provider type from an already fetched data source list.
+
+        Args:
+            project_id: Project identifier (used for logging)
+            data_sources: Data source configurations as returned by the backend API
+            provider_type: Provider type (looker, redash, openapi, airflow, dbt, datahub, datazone, s3)
+
+        Returns:
+            Dictionary containing service credentials or None if not found
+        """
+        try:
+            # Find analytics source matching the specified provider type
+            for source in data_sources:
+                source_type = source.get("type")
+
+                # Only look for the specified provider type
+                if source_type != provider_type:
+                    continue
+
+                if source_type == "looker":
+                    credentials = self._extract_looker_credentials(source)
+                    if credentials:
+                        logger.info(f"Retrieved Looker credentials for project: {project_id}")
+                        return {
+                            "type": "looker",
+                            "configuration": credentials
+                        }
+                elif source_type == "redash":
+                    credentials = self._extract_redash_credentials(source)
+                    if credentials:
+                        logger.info(f"Retrieved Redash credentials for project: {project_id}")
+                        return {
+                            "type": "redash",
+                            "configuration": credentials
+                        }
+                elif source_type == "openapi":
+                    credentials = self._extract_openapi_credentials(source)
+                    if credentials:
+                        logger.info(f"Retrieved OpenAPI credentials for project: {project_id}")
+                        return {
+                            "type": "openapi",
+                            "configuration": credentials
+                        }
+                elif source_type == "dbt":
+                    credentials = self._extract_dbt_credentials(source)
+                    if credentials:
+                        logger.info(f"Retrieved dbt Cloud credentials for project: {project_id}")
+                        return {
+                            "type": "dbt",
+                            "configuration": credentials
+                        }
+                elif source_type == "datahub":
+                    credentials = self._extract_datahub_credentials(source)
+                    if credentials:
+                        logger.info(f"Retrieved DataHub credentials for project: {project_id}")
+                        return {
+                            "type": "datahub",
+                            "configuration": credentials
+                        }
+                elif source_type == "airflow":
+                    credentials = self._extract_airflow_credentials(source)
+                    if credentials:
+                        logger.info(f"Retrieved Airflow credentials for project: {project_id}")
+                        return {
+                            "type": "airflow",
+                            "configuration": credentials
+                        }
+                elif source_type == "datazone":
+                    credentials = self._extract_datazone_credentials(source)
+                    if credentials:
+                        logger.info(f"Retrieved DataZone credentials for project: {project_id}")
+                        return {
+                            "type": "datazone",
+                            "configuration": credentials
+                        }
+                elif source_type == "s3":
+                    credentials = self._extract_s3_credentials(source)
+                    if credentials:
+                        logger.info(f"Retrieved S3 credentials for project: {project_id}")
+                        return {
+                            "type": "s3",
+                            "configuration": credentials
+                        }
+                elif source_type == "jira":
+                    credentials = self._extract_jira_credentials(source)
+                    if credentials:
+                        logger.info(f"Retrieved Jira credentials for project: {project_id}")
+                        return {
+                            "type": "jira",
+                            "configuration": credentials
+                        }
+                elif source_type == "azure_blob_storage":
+                    credentials = self._extract_azure_blob_storage_credentials(source)
+                    if credentials:
+                        logger.info(f"Retrieved Azure Blob Storage credentials for project: {project_id}")
+                        return {
+                            "type": "azure_blob_storage",
+                            "configuration": credentials
+                        }
+                elif source_type == "azure_data_factory":
+                    credentials = self._extract_azure_data_factory_credentials(source)
+                    if credentials:
+                        logger.info(f"Retrieved Azure Data Factory credentials for project: {project_id}")
+                        return {
+                            "type": "azure_data_factory",
+                            "configuration": credentials
+                        }
+                elif source_type == "atlan":
+                    credentials = self._extract_atlan_credentials(source)
+                    if credentials:
+                        logger.info(f"Retrieved Atlan credentials for project: {project_id}")
+                        return {
+                            "type": "atlan",
+                            "configuration": credentials
+                        }
+
+            logger.warning(f"No {provider_type} analytics source found for project: {project_id}")
+            return None
+
+        except Exception as e:
+            logger.error(f"Error extracting credentials for project {project_id}: {str(e)}")
+            return None
+
     def _extract_looker_credentials(self, analytics_source: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Extract Looker credentials from analytics source configuration.
@@ -599,6 +665,43 @@ class CredentialFetcher:
             logger.error(f"Error extracting Atlan credentials: {str(e)}")
             return None
 
+    async def fetch_data_sources(self, project_id: str) -> List[Dict[str, Any]]:
+        """
+        Fetch all data sources for a project, raising on failure.
+
+        Unlike get_all_data_sources, errors are propagated so callers that cache
+        the result can tell an empty project apart from a failed request.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            List of data source configurations
+
+        Raises:
+            RuntimeError: If the backend API returns a non-200 response
+        """
+        url = f"{self.api_base_url}/projects/{project_id}/data-sources"
+        logger.info(f"Fetching data sources from: {url}")
+
+        session = await self._get_session()
+        self._requests += 1
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    raise RuntimeError(f"Failed to get data sources for project {project_id}. "
+                                       f"Status: {response.status}, Error: {error_text}")
+
+                data = await response.json()
+                data_sources = data.get("data_sources", [])
+                logger.info(f"Retrieved {len(data_sources)} data sources for project {project_id}")
+                logger.debug(f"Data source types: {[ds.get('type') for ds in data_sources]}")
+                return data_sources
+        except Exception:
+            self._request_errors += 1
+            raise
+
     async def get_all_data_sources(self, project_id: str) -> List[Dict[str, Any]]:
         """
         Get all data sources for a project.
@@ -610,23 +713,7 @@ class CredentialFetcher:
             List of data source configurations
         """
         try:
-            url = f"{self.api_base_url}/projects/{project_id}/data-sources"
-            logger.info(f"Fetching data sources from: {url}")
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Failed to get data sources for project {project_id}. "
-                                   f"Status: {response.status}, Error: {error_text}")
-                        return []
-
-                    data = await response.json()
-                    data_sources = data.get("data_sources", [])
-                    logger.info(f"Retrieved {len(data_sources)} data sources for project {project_id}")
-                    logger.debug(f"Data source types: {[ds.get('type') for ds in data_sources]}")
-                    return data_sources
-
+            return await self.fetch_data_sources(project_id)
         except Exception as e:
             logger.error(f"Error fetching data sources for project {project_id}: {str(e)}", exc_info=True)
             return []
@@ -0,0 +1,143 @@
+"""
+Data source registry for project integrations.
+
+Caches the backend API's data source list per project with a TTL and coalesces
+concurrent lookups so that a burst of tool calls for one project results in a
+single backend request.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from credential_fetcher import CredentialFetcher
+
+logger = logging.getLogger(__name__)
+
+
+class DataSourceRegistry:
+    """TTL-cached, single-flight view of each project's data sources."""
+
+    def __init__(self, credential_fetcher: CredentialFetcher, ttl_seconds: int = 60):
+        self.credential_fetcher = credential_fetcher
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._generations: Dict[str, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._fetch_errors = 0
+
+    async def get_data_sources(self, project_id: str) -> List[Dict[str, Any]]:
+        """
+        Get all data sources for a project, served from cache when fresh.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            List of data source configurations (empty if the lookup failed)
+        """
+        entry = self._entries.get(project_id)
+        if entry:
+            if time.monotonic() < entry['expires_at']:
+                self._hits += 1
+                return entry['data_sources']
+            del self._entries[project_id]
+
+        task = self._inflight.get(project_id)
+        if task is None:
+            self._misses += 1
+            task = asyncio.create_task(self._load(project_id, self._generations.get(project_id, 0)))
+            self._inflight[project_id] = task
+            task.add_done_callback(lambda t, pid=project_id: self._clear_inflight(pid, t))
+        else:
+            self._coalesced += 1
+
+        try:
+            # Shield so one cancelled caller does not abort the fetch for the others
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching data sources for project {project_id}: {e}")
+            return []
+
+    async def get_credentials(self, project_id: str, provider_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Get credentials for a provider type using the cached data source list.
+
+        Args:
+            project_id: Project identifier
+            provider_type: Provider type
+
+        Returns:
+            Dictionary containing credentials or None if not found
+        """
+        data_sources = await self.get_data_sources(project_id)
+        return self.credential_fetcher.extract_credentials(project_id, data_sources, provider_type)
+
+    def invalidate(self, project_id: Optional[str] = None) -> int:
+        """
+        Drop cached data sources for one project, or for all projects.
+
+        Fetches already in flight are detached so their (possibly stale)
+        results are not stored.
+
+        Returns:
+            Number of projects invalidated
+        """
+        project_ids = [project_id] if project_id else list(set(self._entries) | set(self._inflight))
+        for pid in project_ids:
+            self._entries.pop(pid, None)
+            self._inflight.pop(pid, None)
+            self._generations[pid] = self._generations.get(pid, 0) + 1
+
+        logger.info(f"Invalidated data source cache for {len(project_ids)} project(s)")
+        return len(project_ids)
+
+    async def _load(self, project_id: str, generation: int) -> List[Dict[str, Any]]:
+        """Fetch data sources from the backend and store them if still current."""
+        try:
+            data_sources = await self.credential_fetcher.fetch_data_sources(project_id)
+        except Exception:
+            self._fetch_errors += 1
+            raise
+
+        if self._generations.get(project_id, 0) == generation:
+            now = time.monotonic()
+            self._purge_expired(now)
+            self._entries[project_id] = {
+                'data_sources': data_sources,
+                'expires_at': now + self.ttl_seconds
+            }
+        return data_sources
+
+    def _purge_expired(self, now: float) -> None:
+        """Drop expired entries so projects no longer served don't stay cached forever."""
+        expired = [pid for pid, entry in self._entries.items() if now >= entry['expires_at']]
+        for pid in expired:
+            del self._entries[pid]
+
+    def _clear_inflight(self, project_id: str, task: asyncio.Task) -> None:
+        """Forget a finished fetch (assumes it is still the current one)."""
+        if self._inflight.get(project_id) is task:
+            del self._inflight[project_id]
+        if not task.cancelled():
+            # Mark the exception as retrieved; awaiting callers already saw it
+            task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get registry statistics."""
+        now = time.monotonic()
+        return {
+            'ttl_seconds': self.ttl_seconds,
+            'cached_projects': sum(1 for e in self._entries.values() if now < e['expires_at']),
+            'inflight_fetches': len(self._inflight),
+            'hits': self._hits,
+            'misses': self._misses,
+            'coalesced': self._coalesced,
+            'fetch_errors': self._fetch_errors
+        }
@@ -2,10 +2,16 @@
 S3 provider for AWS S3 operations.
 """
 
+import asyncio
+import base64
+import functools
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import boto3
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError, BotoCoreError
 
 from providers.base import ToolsProvider
@@ -13,11 +19,52 @@ from providers.base import ToolsProvider
 logger = logging.getLogger(__name__)
 
 
+# S3 returns at most 1000 keys per ListObjectsV2 page
+LIST_PAGE_SIZE = 1000
+
+
 class S3Provider(ToolsProvider):
     """
     AWS S3 provider for object storage operations.
+
+    boto3 is blocking, so every network call runs on a thread pool shared by all
+    S3 providers and sized to match the botocore connection pool.
     """
 
+    # Client settings, set by the server via configure()
+    max_pool_connections: int = 32
+    get_object_max_bytes: int = 1024 * 1024
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+
+    @classmethod
+    def configure(cls, max_pool_connections: int, get_object_max_bytes: int) -> None:
+        """
+        Set client settings for all S3 providers.
+
+        Args:
+            max_pool_connections: HTTP connections per client and threads in the shared pool
+            get_object_max_bytes: Default cap on bytes read by get_object
+        """
+        cls.max_pool_connections = max_pool_connections
+        cls.get_object_max_bytes = get_object_max_bytes
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=cls.max_pool_connections,
+                    thread_name_prefix="s3-client"
+                )
+            return cls._executor
+
+    async def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking boto3 call on the shared S3 thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), functools.partial(func, *args, **kwargs))
+
     def __init__(self):
         super().__init__()
         self.region: Optional[str] = None
@@ -39,58 +86,65 @@ class S3Provider(ToolsProvider):
         if not all([self.role_arn, self.external_id]):
             raise ValueError("Missing required S3 credentials: role_arn, external_id")
 
-        # Assume role with external ID
+        # Assume role with external ID (STS calls are blocking)
         try:
-            sts_client = boto3.client('sts')
-
-            logger.info(f"Attempting intermediary role pattern for: {self.role_arn}")
-
-            # Get current account ID to construct intermediary role ARN
-            caller_identity = sts_client.get_caller_identity()
-            account_id = caller_identity['Account']
-            intermediary_role_name = os.environ.get('CHICORY_CUSTOMER_ROLE', 'ChicoryCustomerRole')
-            intermediary_role_arn = f"arn:aws:iam::{account_id}:role/{intermediary_role_name}"
-
-            # Hop 1: Assume intermediary role in Chicory account
-            intermediary_assumed = sts_client.assume_role(
-                RoleArn=intermediary_role_arn,
-                RoleSessionName='chicory-intermediary-session'
-            )
-
-            intermediary_creds = intermediary_assumed['Credentials']
-
-            # Hop 2: Use intermediary role to assume customer role
-            intermediary_sts = boto3.client(
-                'sts',
-                aws_access_key_id=intermediary_creds['AccessKeyId'],
-                aws_secret_access_key=intermediary_creds['SecretAccessKey'],
-                aws_session_token=intermediary_creds['SessionToken']
-            )
-
-            final_assumed = intermediary_sts.assume_role(
-                RoleArn=self.role_arn,
-                RoleSessionName='chicory-mcp-session',
-                ExternalId=self.external_id
-            )
-
-            credentials = final_assumed['Credentials']
-            logger.info(f"Intermediary role assumption succeeded for: {self.role_arn}")
-
-            # Create S3 client with assumed role credentials
-            self.client = boto3.client(
-                's3',
-                region_name=self.region,
-                aws_access_key_id=credentials['AccessKeyId'],
-                aws_secret_access_key=credentials['SecretAccessKey'],
-                aws_session_token=credentials['SessionToken']
-            )
-
+            self.client = await self._run(self._create_client)
             logger.info(f"S3 provider initialized successfully for region: {self.region}")
 
         except (ClientError, BotoCoreError) as e:
             logger.error(f"Failed to initialize S3 client: {e}")
             raise
 
+    def _create_client(self) -> Any:
+        """Assume the customer role and build a pooled S3 client (runs on the S3 thread pool)."""
+        sts_client = boto3.client('sts')
+
+        logger.info(f"Attempting intermediary role pattern for: {self.role_arn}")
+
+        # Get current account ID to construct intermediary role ARN
+        caller_identity = sts_client.get_caller_identity()
+        account_id = caller_identity['Account']
+        intermediary_role_name = os.environ.get('CHICORY_CUSTOMER_ROLE', 'ChicoryCustomerRole')
+        intermediary_role_arn = f"arn:aws:iam::{account_id}:role/{intermediary_role_name}"
+
+        # Hop 1: Assume intermediary role in Chicory account
+        intermediary_assumed = sts_client.assume_role(
+            RoleArn=intermediary_role_arn,
+            RoleSessionName='chicory-intermediary-session'
+        )
+
+        intermediary_creds = intermediary_assumed['Credentials']
+
+        # Hop 2: Use intermediary role to assume customer role
+        intermediary_sts = boto3.client(
+            'sts',
+            aws_access_key_id=intermediary_creds['AccessKeyId'],
+            aws_secret_access_key=intermediary_creds['SecretAccessKey'],
+            aws_session_token=intermediary_creds['SessionToken']
+        )
+
+        final_assumed = intermediary_sts.assume_role(
+            RoleArn=self.role_arn,
+            RoleSessionName='chicory-mcp-session',
+            ExternalId=self.external_id
+        )
+
+        credentials = final_assumed['Credentials']
+        logger.info(f"Intermediary role assumption succeeded for: {self.role_arn}")
+
+        # Create S3 client with assumed role credentials and a connection pool sized for concurrent calls
+        return boto3.client(
+            's3',
+            region_name=self.region,
+            aws_access_key_id=credentials['AccessKeyId'],
+            aws_secret_access_key=credentials['SecretAccessKey'],
+            aws_session_token=credentials['SessionToken'],
+            config=BotoConfig(
+                max_pool_connections=self.max_pool_connections,
+                retries={'max_attempts': 5, 'mode': 'adaptive'}
+            )
+        )
+
     def _handle_error(self, operation: str, error: Exception) -> Dict[str, Any]:
         """Handle AWS errors and return standardized error response."""
         error_msg = str(error)
@@ -103,7 +157,7 @@ class S3Provider(ToolsProvider):
         self._ensure_initialized()
 
         try:
-            response = self.client.list_buckets()
+            response = await self._run(self.client.list_buckets)
 
             buckets = response.get('Buckets', [])
             return {
@@ -115,16 +169,61 @@ class S3Provider(ToolsProvider):
         except (ClientError, BotoCoreError) as e:
             return self._handle_error("list_buckets", e)
 
+    async def iter_object_pages(self, bucket_name: str, prefix: str = "", delimiter: str = "",
+                                max_keys: Optional[int] = None,
+                                continuation_token: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream ListObjectsV2 pages for a bucket, following continuation tokens.
+
+        Args:
+            bucket_name: Name of the S3 bucket
+            prefix: Prefix to filter objects
+            delimiter: Delimiter for grouping keys
+            max_keys: Stop after this many keys (objects plus common prefixes); None lists everything
+            continuation_token: Token to resume a previous listing
+
+        Yields:
+            Raw ListObjectsV2 responses, one per page
+        """
+        self._ensure_initialized()
+
+        params = {'Bucket': bucket_name}
+        if prefix:
+            params['Prefix'] = prefix
+        if delimiter:
+            params['Delimiter'] = delimiter
+
+        remaining = max_keys
+        while remaining is None or remaining > 0:
+            params['MaxKeys'] = LIST_PAGE_SIZE if remaining is None else min(remaining, LIST_PAGE_SIZE)
+            if continuation_token:
+                params['ContinuationToken'] = continuation_token
+
+            page = await self._run(self.client.list_objects_v2, **params)
+            yield page
+
+            continuation_token = page.get('NextContinuationToken')
+            if not page.get('IsTruncated') or not continuation_token:
+                return
+            if remaining is not None:
+                remaining -= len(page.get('Contents', [])) + len(page.get('CommonPrefixes', []))
+
     async def list_objects(self, bucket_name: str, prefix: str = "",
-                          max_keys: int = 1000, delimiter: str = "") -> Dict[str, Any]:
+                          max_keys: int = 1000, delimiter: str = "",
+                          continuation_token: Optional[str] = None) -> Dict[str, Any]:
         """
         List objects in an S3 bucket.
 
+        Pages are fetched until max_keys entries (objects plus common prefixes)
+        are collected or the listing ends, so max_keys may exceed S3's 1000 keys
+        per request.
+
         Args:
             bucket_name: Name of the S3 bucket
             prefix: Prefix to filter objects
             max_keys: Maximum number of objects to return
             delimiter: Delimiter for grouping keys (e.g., '/' for folder structure)
+            continuation_token: Token from a previous truncated listing to resume from
 
         Returns:
             Dictionary containing list of objects and metadata
@@ -132,43 +231,49 @@ class S3Provider(ToolsProvider):
         self._log_operation("list_objects", bucket_name=bucket_name, prefix=prefix)
         self._ensure_initialized()
 
-        try:
-            params = {
-                'Bucket': bucket_name,
-                'MaxKeys': max_keys
-            }
-
-            if prefix:
-                params['Prefix'] = prefix
-
-            if delimiter:
-                params['Delimiter'] = delimiter
-
-            response = self.client.list_objects_v2(**params)
+        contents: List[Dict[str, Any]] = []
+        common_prefixes: List[Dict[str, Any]] = []
+        is_truncated = False
+        next_token = None
+        pages = 0
 
-            contents = response.get('Contents', [])
-            common_prefixes = response.get('CommonPrefixes', [])
+        try:
+            async for page in self.iter_object_pages(bucket_name, prefix, delimiter,
+                                                     max_keys=max(max_keys, 1),
+                                                     continuation_token=continuation_token):
+                pages += 1
+                contents.extend(page.get('Contents', []))
+                common_prefixes.extend(page.get('CommonPrefixes', []))
+                is_truncated = page.get('IsTruncated', False)
+                next_token = page.get('NextContinuationToken')
 
             return {
                 "objects": contents,
                 "count": len(contents),
                 "common_prefixes": common_prefixes,
-                "is_truncated": response.get('IsTruncated', False),
-                "next_continuation_token": response.get('NextContinuationToken'),
-                "prefix": response.get('Prefix', ''),
-                "delimiter": response.get('Delimiter', '')
+                "is_truncated": is_truncated,
+                "next_continuation_token": next_token if is_truncated else None,
+                "pages": pages,
+                "prefix": prefix,
+                "delimiter": delimiter
             }
 
         except (ClientError, BotoCoreError) as e:
             return self._handle_error("list_objects", e)
 
-    async def get_object(self, bucket_name: str, object_key: str) -> Dict[str, Any]:
+    async def get_object(self, bucket_name: str, object_key: str,
+                         max_bytes: Optional[int] = None, offset: int = 0) -> Dict[str, Any]:
         """
         Get an object from S3.
 
+        Only the requested byte range is downloaded, so large objects are read
+        in bounded slices rather than loaded whole.
+
         Args:
             bucket_name: Name of the S3 bucket
             object_key: Key of the object to retrieve
+            max_bytes: Maximum bytes to read (defaults to, and is capped at, the configured limit)
+            offset: Byte offset to start reading from
 
         Returns:
             Dictionary containing object data and metadata
@@ -176,27 +281,38 @@ class S3Provider(ToolsProvider):
         self._log_operation("get_object", bucket_name=bucket_name, object_key=object_key)
         self._ensure_initialized()
 
+        # Callers may ask for less than the configured cap, never more
+        if not max_bytes or max_bytes <= 0:
+            max_bytes = self.get_object_max_bytes
+        else:
+            max_bytes = min(max_bytes, self.get_object_max_bytes)
+        offset = max(offset, 0)
+
         try:
-            response = self.client.get_object(Bucket=bucket_name, Key=object_key)
+            response, body = await self._run(self._get_object_range, bucket_name, object_key, offset, max_bytes)
 
-            # Read the body content
-            body = response['Body'].read()
+            total_size = self._object_size(response, offset, len(body))
+            truncated = total_size is not None and offset + len(body) < total_size
 
             # Try to decode as UTF-8 text, otherwise return base64
-            try:
-                content = body.decode('utf-8')
+            content = self._decode_text(body, partial=truncated or offset > 0)
+            if content is not None:
                 content_type = 'text'
-            except UnicodeDecodeError:
-                import base64
+            else:
                 content = base64.b64encode(body).decode('utf-8')
                 content_type = 'base64'
 
             return {
                 "content": content,
                 "content_type": content_type,
+                "offset": offset,
+                "bytes_read": len(body),
+                "total_size": total_size,
+                "truncated": truncated,
                 "metadata": {
                     "content_type": response.get('ContentType'),
                     "content_length": response.get('ContentLength'),
+                    "content_range": response.get('ContentRange'),
                     "last_modified": str(response.get('LastModified')),
                     "etag": response.get('ETag'),
                     "version_id": response.get('VersionId'),
@@ -207,6 +323,61 @@ class S3Provider(ToolsProvider):
         except (ClientError, BotoCoreError) as e:
             return self._handle_error("get_object", e)
 
+    def _get_object_range(self, bucket_name: str, object_key: str,
+                          offset: int, max_bytes: int) -> Any:
+        """Download one byte range of an object (runs on the S3 thread pool)."""
+        try:
+            response = self.client.get_object(
+                Bucket=bucket_name,
+                Key=object_key,
+                Range=f"bytes={offset}-{offset + max_bytes - 1}"
+            )
+        except ClientError as e:
+            # Empty objects and offsets past the end reject any range
+            if e.response.get('Error', {}).get('Code') != 'InvalidRange':
+                raise
+            response = self.client.head_object(Bucket=bucket_name, Key=object_key)
+            return response, b''
+
+        stream = response['Body']
+        try:
+            return response, stream.read(max_bytes)
+        finally:
+            stream.close()
+
+    @staticmethod
+    def _object_size(response: Dict[str, Any], offset: int, bytes_read: int) -> Optional[int]:
+        """Total object size from a ranged GET (Content-Range) or HEAD response."""
+        content_range = response.get('ContentRange')
+        if content_range and '/' in content_range:
+            total = content_range.rsplit('/', 1)[1]
+            return int(total) if total.isdigit() else None
+        if 'Body' not in response:
+            return response.get('ContentLength')
+        # No Content-Range: the server returned the whole object
+        return offset + bytes_read
+
+    @staticmethod
+    def _decode_text(body: bytes, partial: bool) -> Optional[str]:
+        """
+        Decode UTF-8, tolerating a multi-byte character cut at the edges of a range.
+
+        Returns None if the bytes are not text.
+        """
+        try:
+            return body.decode('utf-8')
+        except UnicodeDecodeError:
+            if not partial:
+                return None
+        # A range boundary can split up to 3 continuation bytes at either end
+        for head in range(4):
+            for tail in range(4):
+                try:
+                    return body[head:len(body) - tail].decode('utf-8')
+                except UnicodeDecodeError:
+                    continue
+        return None
+
     async def get_object_metadata(self, bucket_name: str, object_key: str) -> Dict[str, Any]:
         """
         Get metadata for an S3 object without downloading the content.
@@ -222,7 +393,7 @@ class S3Provider(ToolsProvider):
         self._ensure_initialized()
 
         try:
-            response = self.client.head_object(Bucket=bucket_name, Key=object_key)
+            response = await self._run(self.client.head_object, Bucket=bucket_name, Key=object_key)
 
             return {
                 "metadata": {
@@ -266,7 +437,7 @@ class S3Provider(ToolsProvider):
                     'LocationConstraint': target_region
                 }
 
-            response = self.client.create_bucket(**params)
+            response = await self._run(self.client.create_bucket, **params)
 
             return {
                 "success": True,
@@ -301,7 +472,6 @@ class S3Provider(ToolsProvider):
 
         try:
             # Try to detect if content is base64 encoded
-            import base64
             try:
                 # If content looks like base64, decode it
                 if len(content) % 4 == 0 and all(c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=' for c in content[:100]):
@@ -325,7 +495,7 @@ class S3Provider(ToolsProvider):
             if metadata:
                 params['Metadata'] = metadata
 
-            response = self.client.put_object(**params)
+            response = await self._run(self.client.put_object, **params)
 
             return {
                 "success": True,
@@ -7,10 +7,11 @@ project-based credential management and connection caching.
 """
 
 import asyncio
+import functools
 import logging
 import os
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
 from datetime import datetime, timedelta
 
 from mcp.server.fastmcp import FastMCP
@@ -33,6 +34,7 @@ from providers.atlan import AtlanProvider
 from config import Config
 from cache_manager import ConnectionCacheManager
 from credential_fetcher import CredentialFetcher
+from data_source_registry import DataSourceRegistry
 from tools.jira_tools import *
 
 # Configure logging
@@ -48,7 +50,22 @@ cache_manager = ConnectionCacheManager(
     ttl_seconds=config.CONNECTION_CACHE_TTL,
     max_size=config.CONNECTION_CACHE_MAX_SIZE
 )
-credential_fetcher = CredentialFetcher(config.API_BASE_URL)
+credential_fetcher = CredentialFetcher(
+    config.API_BASE_URL,
+    pool_limit=config.BACKEND_HTTP_POOL_LIMIT,
+    pool_limit_per_host=config.BACKEND_HTTP_POOL_LIMIT_PER_HOST,
+    keepalive_timeout=config.BACKEND_HTTP_KEEPALIVE_TIMEOUT,
+    connect_timeout=config.BACKEND_HTTP_CONNECT_TIMEOUT,
+    total_timeout=config.BACKEND_HTTP_TOTAL_TIMEOUT
+)
+data_source_registry = DataSourceRegistry(
+    credential_fetcher,
+    ttl_seconds=config.DATA_SOURCE_CACHE_TTL
+)
+S3Provider.configure(
+    max_pool_connections=config.S3_MAX_POOL_CONNECTIONS,
+    get_object_max_bytes=config.S3_GET_OBJECT_MAX_BYTES
+)
 
 # Provider registry - store classes, not instances
 providers: Dict[str, type] = {
@@ -79,7 +96,7 @@ async def get_supported_tool_providers(project_id: str) -> List[str]:
         List of supported provider type names
     """
     try:
-        all_data_sources = await credential_fetcher.get_all_data_sources(project_id)
+        all_data_sources = await data_source_registry.get_data_sources(project_id)
         logger.info(f"Fetched {len(all_data_sources)} total data sources for project {project_id}")
         logger.debug(f"Data source types from API: {[ds.get('type') for ds in all_data_sources]}")
         logger.debug(f"Registered providers in server: {list(providers.keys())}")
@@ -119,122 +136,10 @@ async def get_available_tools_for_project(project_id: str) -> List[str]:
         List of available tool names
     """
     supported_providers = await get_supported_tool_providers(project_id)
-    available_tools = []
-    
-    # Map providers to their tools
-    tool_mappings = {
-        "looker": [
-            "looker_get_models_tool", "looker_get_explores_tool",
-            "looker_get_dimensions_tool", "looker_get_measures_tool",
-            "looker_get_filters_tool", "looker_query_tool",
-            "looker_query_sql_tool", "looker_get_looks_tool",
-            "looker_run_look_tool", "looker_query_url_tool"
-        ],
-        "redash": [
-            "redash_list_queries_tool", "redash_get_query_tool",
-            "redash_execute_query_tool", "redash_get_query_job_status_tool",
-            "redash_get_query_results_tool", "redash_refresh_query_tool",
-            "redash_list_dashboards_tool", "redash_get_dashboard_tool",
-            "redash_list_data_sources_tool", "redash_create_query_tool",
-            "redash_create_visualization_tool", "redash_create_dashboard_tool",
-            "redash_add_widget_tool", "redash_publish_dashboard_tool"
-        ],
-        "dbt": [
-            "dbt_list_projects_tool", "dbt_list_environments_tool",
-            "dbt_list_jobs_tool", "dbt_trigger_job_run_tool",
-            "dbt_get_job_run_tool", "dbt_list_job_runs_tool",
-            "dbt_cancel_job_run_tool", "dbt_list_models_tool",
-            "dbt_get_model_details_tool", "dbt_list_metrics_tool",
-            "dbt_query_metrics_tool", "dbt_execute_sql_tool"
-        ],
-        "datahub": [
-            "datahub_search_entities_tool", "datahub_get_entity_tool",
-            "datahub_list_datasets_tool", "datahub_list_dashboards_tool",
-            "datahub_list_charts_tool", "datahub_get_lineage_tool",
-            "datahub_list_platforms_tool", "datahub_list_tags_tool"
-        ],
-        "airflow": [
-            "airflow_list_dags_tool", "airflow_get_dag_tool",
-            "airflow_trigger_dag_tool", "airflow_get_dag_runs_tool",
-            "airflow_get_task_instances_tool", "airflow_get_task_logs_tool",
-            "airflow_pause_dag_tool", "airflow_unpause_dag_tool"
-        ],
-        "openapi": [
-            "openapi_get_spec_tool", "openapi_list_endpoints_tool",
-            "openapi_call_endpoint_tool", "openapi_get_endpoint_schema_tool"
-        ],
-        "datazone": [
-            "datazone_list_domains_tool", "datazone_get_domain_tool",
-            "datazone_list_projects_tool", "datazone_get_project_tool",
-            "datazone_search_listings_tool", "datazone_get_listing_tool",
-            "datazone_list_environments_tool", "datazone_get_environment_tool",
-            "datazone_get_asset_tool", "datazone_list_asset_revisions_tool",
-            "datazone_get_glossary_tool", "datazone_get_glossary_term_tool",
-            "datazone_create_form_type_tool", "datazone_get_form_type_tool",
-            "datazone_create_asset_type_tool", "datazone_get_asset_type_tool",
-            "datazone_list_asset_types_tool"
-        ],
-        "s3": [
-            "s3_list_buckets_tool", "s3_list_objects_tool",
-            "s3_get_object_tool", "s3_get_object_metadata_tool",
-            "s3_create_bucket_tool", "s3_put_object_tool",
-            "s3_generate_presigned_url_tool", "s3_generate_presigned_post_tool"
-        ],
-        "jira": [
-            "jira_search_issues_tool", "jira_get_issue_tool",
-            "jira_create_issue_tool", "jira_update_issue_tool",
-            "jira_transition_issue_tool", "jira_get_transitions_tool",
-            "jira_assign_issue_tool", "jira_list_projects_tool",
-            "jira_get_project_tool", "jira_get_issue_types_tool",
-            "jira_get_fields_tool", "jira_add_comment_tool",
-            "jira_get_comments_tool", "jira_upload_attachment_tool",
-            "jira_list_boards_tool", "jira_list_sprints_tool",
-            "jira_get_sprint_tool", "jira_get_backlog_tool"
-        ],
-        "azure_blob_storage": [
-            "azure_blob_list_containers_tool", "azure_blob_list_blobs_tool",
-            "azure_blob_get_blob_tool", "azure_blob_get_blob_metadata_tool",
-            "azure_blob_upload_blob_tool", "azure_blob_delete_blob_tool",
-            "azure_blob_generate_sas_url_tool", "azure_blob_get_container_properties_tool"
-        ],
-        "azure_data_factory": [
-            "azure_adf_list_pipelines_tool", "azure_adf_get_pipeline_tool",
-            "azure_adf_run_pipeline_tool", "azure_adf_get_pipeline_run_tool",
-            "azure_adf_list_pipeline_runs_tool", "azure_adf_list_datasets_tool",
-            "azure_adf_get_dataset_tool", "azure_adf_list_triggers_tool",
-            "azure_adf_get_trigger_tool", "azure_adf_list_linked_services_tool",
-            "azure_adf_get_linked_service_tool", "azure_adf_list_data_flows_tool",
-            "azure_adf_get_data_flow_tool", "azure_adf_list_integration_runtimes_tool",
-            "azure_adf_get_integration_runtime_tool", "azure_adf_get_factory_info_tool"
-        ],
-        "atlan": [
-            "atlan_search_assets_tool", "atlan_search_by_type_tool",
-            "atlan_get_asset_tool", "atlan_get_asset_by_qualified_name_tool",
-            "atlan_create_asset_tool", "atlan_update_asset_tool", "atlan_delete_asset_tool",
-            "atlan_update_asset_description_tool", "atlan_update_asset_owners_tool",
-            "atlan_get_lineage_tool",
-            "atlan_list_glossaries_tool", "atlan_get_glossary_tool",
-            "atlan_list_glossary_terms_tool", "atlan_get_glossary_term_tool",
-            "atlan_create_glossary_term_tool", "atlan_list_glossary_categories_tool",
-            "atlan_link_term_to_asset_tool",
-            "atlan_list_classifications_tool", "atlan_add_classification_tool",
-            "atlan_remove_classification_tool",
-            "atlan_list_tables_tool", "atlan_list_columns_tool",
-            "atlan_list_databases_tool", "atlan_list_schemas_tool",
-            "atlan_list_dashboards_tool", "atlan_list_dbt_models_tool",
-            "atlan_list_airflow_dags_tool", "atlan_list_kafka_topics_tool",
-            "atlan_list_s3_objects_tool",
-            "atlan_update_custom_metadata_tool", "atlan_get_custom_metadata_types_tool",
-            "atlan_certify_asset_tool", "atlan_bulk_update_assets_tool"
-        ]
-    }
-
-    for provider in supported_providers:
-        if provider in tool_mappings:
-            available_tools.extend(tool_mappings[provider])
+    available_tools, _, _ = _tools_for_providers(tuple(supported_providers))
     
     logger.info(f"Available tools for project {project_id}: {len(available_tools)} tools from {len(supported_providers)} providers")
-    return available_tools
+    return list(available_tools)
 
 
 async def get_tools_client(project_id: str, provider_name: Optional[str] = None) -> ToolsProvider:
@@ -261,7 +166,7 @@ async def get_tools_client(project_id: str, provider_name: Optional[str] = None)
     if provider_name is None:
         logger.info(f"Auto-detecting provider type for project: {project_id}")
         # Get all data sources to find the first available provider
-        all_data_sources = await credential_fetcher.get_all_data_sources(project_id)
+        all_data_sources = await data_source_registry.get_data_sources(project_id)
         for ds in all_data_sources:
             ds_type = ds.get("type")
             if ds_type in providers:
@@ -274,7 +179,7 @@ async def get_tools_client(project_id: str, provider_name: Optional[str] = None)
 
     # Fetch credentials for the specified provider type
     logger.info(f"Fetching credentials for project: {project_id}, provider: {provider_name}")
-    credentials = await credential_fetcher.get_credentials(project_id, provider_name)
+    credentials = await data_source_registry.get_credentials(project_id, provider_name)
     if not credentials:
         raise ValueError(f"No {provider_name} credentials found for project: {project_id}")
 
@@ -2215,7 +2120,8 @@ async def s3_list_buckets_tool(project_id: str) -> str:
 
 
 async def s3_list_objects_tool(project_id: str, bucket_name: str, prefix: str = "",
-                               max_keys: int = 1000, delimiter: str = "") -> str:
+                               max_keys: int = 1000, delimiter: str = "",
+                               continuation_token: str = "") -> str:
     """
     List objects in an S3 bucket.
 
@@ -2223,8 +2129,9 @@ async def s3_list_objects_tool(project_id: str, bucket_name: str, prefix: str =
         project_id: Project ID for credential lookup
         bucket_name: Name of the S3 bucket
         prefix: Prefix to filter objects (optional)
-        max_keys: Maximum number of objects to return (default: 1000)
+        max_keys: Maximum number of objects to return, fetched across pages (default: 1000)
         delimiter: Delimiter for grouping keys (optional, e.g., '/' for folder structure)
+        continuation_token: Token from a previous truncated listing to continue from (optional)
 
     Returns:
         List of S3 objects formatted as a string
@@ -2238,7 +2145,8 @@ async def s3_list_objects_tool(project_id: str, bucket_name: str, prefix: str =
             bucket_name=bucket_name,
             prefix=prefix,
             max_keys=max_keys,
-            delimiter=delimiter
+            delimiter=delimiter,
+            continuation_token=continuation_token or None
         )
 
         if "error" in result:
@@ -2253,7 +2161,8 @@ async def s3_list_objects_tool(project_id: str, bucket_name: str, prefix: str =
         if prefix:
             output += f"Prefix: {prefix}\n"
         if is_truncated:
-            output += "Note: Results are truncated. Use pagination for more results.\n"
+            output += "Note: Results are truncated. Pass continuation_token to list more.\n"
+            output += f"Continuation Token: {result.get('next_continuation_token')}\n"
         output += "\n"
 
         if common_prefixes:
@@ -2278,7 +2187,8 @@ async def s3_list_objects_tool(project_id: str, bucket_name: str, prefix: str =
         return f"Error: {str(e)}"
 
 
-async def s3_get_object_tool(project_id: str, bucket_name: str, object_key: str) -> str:
+async def s3_get_object_tool(project_id: str, bucket_name: str, object_key: str,
+                             max_bytes: int = 0, offset: int = 0) -> str:
     """
     Get an object from S3.
 
@@ -2286,6 +2196,8 @@ async def s3_get_object_tool(project_id: str, bucket_name: str, object_key: str)
         project_id: Project ID for credential lookup
         bucket_name: Name of the S3 bucket
         object_key: Key of the object to retrieve
+        max_bytes: Maximum bytes to read (optional, defaults to S3_GET_OBJECT_MAX_BYTES)
+        offset: Byte offset to start reading from (optional, default: 0)
 
     Returns:
         Object content and metadata formatted as a string
@@ -2295,7 +2207,12 @@ async def s3_get_object_tool(project_id: str, bucket_name: str, object_key: str)
         if not provider:
             return "Error: Could not get S3 provider for project"
 
-        result = await provider.get_object(bucket_name=bucket_name, object_key=object_key)
+        result = await provider.get_object(
+            bucket_name=bucket_name,
+            object_key=object_key,
+            max_bytes=max_bytes or None,
+            offset=offset
+        )
 
         if "error" in result:
             return f"Error getting object: {result['error']}"
@@ -2307,13 +2224,21 @@ async def s3_get_object_tool(project_id: str, bucket_name: str, object_key: str)
         output = f"S3 Object: s3://{bucket_name}/{object_key}\n\n"
         output += "Metadata:\n"
         output += f"  Content Type: {metadata.get('content_type', 'Unknown')}\n"
-        output += f"  Content Length: {metadata.get('content_length', 0)} bytes\n"
+        output += f"  Object Size: {result.get('total_size', 'Unknown')} bytes\n"
         output += f"  Last Modified: {metadata.get('last_modified', 'Unknown')}\n"
         output += f"  ETag: {metadata.get('etag', 'Unknown')}\n"
         if metadata.get('version_id'):
             output += f"  Version ID: {metadata.get('version_id')}\n"
         output += "\n"
 
+        bytes_read = result.get('bytes_read', 0)
+        start = result.get('offset', 0)
+        if result.get('truncated') or start:
+            output += f"Range: bytes {start}-{start + bytes_read - 1 if bytes_read else start} ({bytes_read} bytes read)\n"
+        if result.get('truncated'):
+            output += f"Note: Content is truncated. Pass offset={start + bytes_read} to read the next range.\n"
+        output += "\n"
+
         if content_type == 'base64':
             output += "Content (base64 encoded):\n"
             output += f"{content[:500]}...\n" if len(content) > 500 else f"{content}\n"
@@ -5853,6 +5778,2198 @@ async def airflow_unpause_dag_tool(project_id: str, dag_id: str) -> str:
 # PROJECT-SPECIFIC MCP ENDPOINT
 # =============================================================================
 
+# Tool registry - built once at import time so MCP requests do no per-call schema construction
+
+# Tools exposed for each provider type
+PROVIDER_TOOLS: Dict[str, List[str]] = {
+    "looker": [
+        "looker_get_models_tool", "looker_get_explores_tool",
+        "looker_get_dimensions_tool", "looker_get_measures_tool",
+        "looker_get_filters_tool", "looker_query_tool",
+        "looker_query_sql_tool", "looker_get_looks_tool",
+        "looker_run_look_tool", "looker_query_url_tool"
+    ],
+    "redash": [
+        "redash_list_queries_tool", "redash_get_query_tool",
+        "redash_execute_query_tool", "redash_get_query_job_status_tool",
+        "redash_get_query_results_tool", "redash_refresh_query_tool",
+        "redash_list_dashboards_tool", "redash_get_dashboard_tool",
+        "redash_list_data_sources_tool", "redash_create_query_tool",
+        "redash_create_visualization_tool", "redash_create_dashboard_tool",
+        "redash_add_widget_tool", "redash_publish_dashboard_tool"
+    ],
+    "dbt": [
+        "dbt_list_projects_tool", "dbt_list_environments_tool",
+        "dbt_list_jobs_tool", "dbt_trigger_job_run_tool",
+        "dbt_get_job_run_tool", "dbt_list_job_runs_tool",
+        "dbt_cancel_job_run_tool", "dbt_list_models_tool",
+        "dbt_get_model_details_tool", "dbt_list_metrics_tool",
+        "dbt_query_metrics_tool", "dbt_execute_sql_tool"
+    ],
+    "datahub": [
+        "datahub_search_entities_tool", "datahub_get_entity_tool",
+        "datahub_list_datasets_tool", "datahub_list_dashboards_tool",
+        "datahub_list_charts_tool", "datahub_get_lineage_tool",
+        "datahub_list_platforms_tool", "datahub_list_tags_tool"
+    ],
+    "airflow": [
+        "airflow_list_dags_tool", "airflow_get_dag_tool",
+        "airflow_trigger_dag_tool", "airflow_get_dag_runs_tool",
+        "airflow_get_task_instances_tool", "airflow_get_task_logs_tool",
+        "airflow_pause_dag_tool", "airflow_unpause_dag_tool"
+    ],
+    "openapi": [
+        "openapi_get_spec_tool", "openapi_list_endpoints_tool",
+        "openapi_call_endpoint_tool", "openapi_get_endpoint_schema_tool"
+    ],
+    "datazone": [
+        "datazone_list_domains_tool", "datazone_get_domain_tool",
+        "datazone_list_projects_tool", "datazone_get_project_tool",
+        "datazone_search_listings_tool", "datazone_get_listing_tool",
+        "datazone_list_environments_tool", "datazone_get_environment_tool",
+        "datazone_get_asset_tool", "datazone_list_asset_revisions_tool",
+        "datazone_get_glossary_tool", "datazone_get_glossary_term_tool",
+        "datazone_create_form_type_tool", "datazone_get_form_type_tool",
+        "datazone_create_asset_type_tool", "datazone_get_asset_type_tool",
+        "datazone_list_asset_types_tool"
+    ],
+    "s3": [
+        "s3_list_buckets_tool", "s3_list_objects_tool",
+        "s3_get_object_tool", "s3_get_object_metadata_tool",
+        "s3_create_bucket_tool", "s3_put_object_tool",
+        "s3_generate_presigned_url_tool", "s3_generate_presigned_post_tool"
+    ],
+    "jira": [
+        "jira_search_issues_tool", "jira_get_issue_tool",
+        "jira_create_issue_tool", "jira_update_issue_tool",
+        "jira_transition_issue_tool", "jira_get_transitions_tool",
+        "jira_assign_issue_tool", "jira_list_projects_tool",
+        "jira_get_project_tool", "jira_get_issue_types_tool",
+        "jira_get_fields_tool", "jira_add_comment_tool",
+        "jira_get_comments_tool", "jira_upload_attachment_tool",
+        "jira_list_boards_tool", "jira_list_sprints_tool",
+        "jira_get_sprint_tool", "jira_get_backlog_tool"
+    ],
+    "azure_blob_storage": [
+        "azure_blob_list_containers_tool", "azure_blob_list_blobs_tool",
+        "azure_blob_get_blob_tool", "azure_blob_get_blob_metadata_tool",
+        "azure_blob_upload_blob_tool", "azure_blob_delete_blob_tool",
+        "azure_blob_generate_sas_url_tool", "azure_blob_get_container_properties_tool"
+    ],
+    "azure_data_factory": [
+        "azure_adf_list_pipelines_tool", "azure_adf_get_pipeline_tool",
+        "azure_adf_run_pipeline_tool", "azure_adf_get_pipeline_run_tool",
+        "azure_adf_list_pipeline_runs_tool", "azure_adf_list_datasets_tool",
+        "azure_adf_get_dataset_tool", "azure_adf_list_triggers_tool",
+        "azure_adf_get_trigger_tool", "azure_adf_list_linked_services_tool",
+        "azure_adf_get_linked_service_tool", "azure_adf_list_data_flows_tool",
+        "azure_adf_get_data_flow_tool", "azure_adf_list_integration_runtimes_tool",
+        "azure_adf_get_integration_runtime_tool", "azure_adf_get_factory_info_tool"
+    ],
+    "atlan": [
+        "atlan_search_assets_tool", "atlan_search_by_type_tool",
+        "atlan_get_asset_tool", "atlan_get_asset_by_qualified_name_tool",
+        "atlan_create_asset_tool", "atlan_update_asset_tool", "atlan_delete_asset_tool",
+        "atlan_update_asset_description_tool", "atlan_update_asset_owners_tool",
+        "atlan_get_lineage_tool",
+        "atlan_list_glossaries_tool", "atlan_get_glossary_tool",
+        "atlan_list_glossary_terms_tool", "atlan_get_glossary_term_tool",
+        "atlan_create_glossary_term_tool", "atlan_list_glossary_categories_tool",
+        "atlan_link_term_to_asset_tool",
+        "atlan_list_classifications_tool", "atlan_add_classification_tool",
+        "atlan_remove_classification_tool",
+        "atlan_list_tables_tool", "atlan_list_columns_tool",
+        "atlan_list_databases_tool", "atlan_list_schemas_tool",
+        "atlan_list_dashboards_tool", "atlan_list_dbt_models_tool",
+        "atlan_list_airflow_dags_tool", "atlan_list_kafka_topics_tool",
+        "atlan_list_s3_objects_tool",
+        "atlan_update_custom_metadata_tool", "atlan_get_custom_metadata_types_tool",
+        "atlan_certify_asset_tool", "atlan_bulk_update_assets_tool"
+    ]
+}
+
+# Full MCP schema of every tool
+TOOL_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    # Looker tools
+    "looker_get_models_tool": {
+        "name": "looker_get_models_tool",
+        "description": "Get all Looker models available in the instance",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "looker_get_explores_tool": {
+        "name": "looker_get_explores_tool",
+        "description": "Get all explores for a specific Looker model",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "model_name": {"type": "string", "description": "Name of the Looker model"}
+            },
+            "required": ["model_name"]
+        }
+    },
+    "looker_get_dimensions_tool": {
+        "name": "looker_get_dimensions_tool",
+        "description": "Get all dimensions for a specific explore",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "model_name": {"type": "string", "description": "Name of the Looker model"},
+                "explore_name": {"type": "string", "description": "Name of the explore"}
+            },
+            "required": ["model_name", "explore_name"]
+        }
+    },
+    "looker_get_measures_tool": {
+        "name": "looker_get_measures_tool",
+        "description": "Get all measures for a specific explore",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "model_name": {"type": "string", "description": "Name of the Looker model"},
+                "explore_name": {"type": "string", "description": "Name of the explore"}
+            },
+            "required": ["model_name", "explore_name"]
+        }
+    },
+    "looker_get_filters_tool": {
+        "name": "looker_get_filters_tool",
+        "description": "Get all filters for a specific explore",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "model_name": {"type": "string", "description": "Name of the Looker model"},
+                "explore_name": {"type": "string", "description": "Name of the explore"}
+            },
+            "required": ["model_name", "explore_name"]
+        }
+    },
+    "looker_query_tool": {
+        "name": "looker_query_tool",
+        "description": "Execute a Looker query with dimensions, measures, and filters",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "model_name": {"type": "string", "description": "Name of the Looker model"},
+                "explore_name": {"type": "string", "description": "Name of the explore"},
+                "dimensions": {"type": "array", "items": {"type": "string"}, "description": "List of dimensions"},
+                "measures": {"type": "array", "items": {"type": "string"}, "description": "List of measures"},
+                "filters": {"type": "object", "description": "Filter conditions (optional)"},
+                "limit": {"type": "integer", "description": "Result limit", "default": 100}
+            },
+            "required": ["model_name", "explore_name", "dimensions", "measures"]
+        }
+    },
+    "looker_query_sql_tool": {
+        "name": "looker_query_sql_tool",
+        "description": "Execute raw SQL against Looker's database connection",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "sql": {"type": "string", "description": "SQL query to execute"}
+            },
+            "required": ["sql"]
+        }
+    },
+    "looker_get_looks_tool": {
+        "name": "looker_get_looks_tool",
+        "description": "Get all Looks (saved queries) in Looker",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "folder_id": {"type": "string", "description": "Optional folder ID to filter Looks"}
+            },
+            "required": []
+        }
+    },
+    "looker_run_look_tool": {
+        "name": "looker_run_look_tool",
+        "description": "Run a specific Look and get its results",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "look_id": {"type": "string", "description": "Look identifier"},
+                "limit": {"type": "integer", "description": "Result limit", "default": 100}
+            },
+            "required": ["look_id"]
+        }
+    },
+    "looker_query_url_tool": {
+        "name": "looker_query_url_tool",
+        "description": "Generate a Looker query URL",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "model_name": {"type": "string", "description": "Name of the Looker model"},
+                "explore_name": {"type": "string", "description": "Name of the explore"},
+                "dimensions": {"type": "array", "items": {"type": "string"}, "description": "List of dimensions"},
+                "measures": {"type": "array", "items": {"type": "string"}, "description": "List of measures"},
+                "filters": {"type": "object", "description": "Filter conditions (optional)"}
+            },
+            "required": ["model_name", "explore_name", "dimensions", "measures"]
+        }
+    },
+
+    # Redash tools
+    "redash_list_queries_tool": {
+        "name": "redash_list_queries_tool",
+        "description": "List all queries in Redash",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "page": {"type": "integer", "description": "Page number", "default": 1},
+                "page_size": {"type": "integer", "description": "Page size", "default": 25}
+            },
+            "required": []
+        }
+    },
+    "redash_get_query_tool": {
+        "name": "redash_get_query_tool",
+        "description": "Get details of a specific Redash query",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query_id": {"type": "string", "description": "Query identifier"}
+            },
+            "required": ["query_id"]
+        }
+    },
+    "redash_execute_query_tool": {
+        "name": "redash_execute_query_tool",
+        "description": "Execute a Redash query and get its results",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query_id": {"type": "string", "description": "Query identifier"},
+                "parameters": {"type": "object", "description": "Query parameters (optional)"}
+            },
+            "required": ["query_id"]
+        }
+    },
+    "redash_get_query_job_status_tool": {
+        "name": "redash_get_query_job_status_tool",
+        "description": "Get the status of a query execution job",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "job_id": {"type": "string", "description": "Job identifier"}
+            },
+            "required": ["job_id"]
+        }
+    },
+    "redash_get_query_results_tool": {
+        "name": "redash_get_query_results_tool",
+        "description": "Get the results of a completed query execution",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query_result_id": {"type": "string", "description": "Query result identifier"}
+            },
+            "required": ["query_result_id"]
+        }
+    },
+    "redash_refresh_query_tool": {
+        "name": "redash_refresh_query_tool",
+        "description": "Refresh a Redash query (execute with fresh data)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query_id": {"type": "string", "description": "Query identifier"}
+            },
+            "required": ["query_id"]
+        }
+    },
+    "redash_list_dashboards_tool": {
+        "name": "redash_list_dashboards_tool",
+        "description": "List all dashboards in Redash",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "page": {"type": "integer", "description": "Page number", "default": 1},
+                "page_size": {"type": "integer", "description": "Page size", "default": 25}
+            },
+            "required": []
+        }
+    },
+    "redash_get_dashboard_tool": {
+        "name": "redash_get_dashboard_tool",
+        "description": "Get details of a specific Redash dashboard",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "dashboard_id": {"type": "string", "description": "Dashboard identifier"}
+            },
+            "required": ["dashboard_id"]
+        }
+    },
+    "redash_list_data_sources_tool": {
+        "name": "redash_list_data_sources_tool",
+        "description": "List all data sources in Redash",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "redash_create_query_tool": {
+        "name": "redash_create_query_tool",
+        "description": "Create a new query in Redash",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "data_source_id": {"type": "string", "description": "Data source identifier"},
+                "name": {"type": "string", "description": "Query name"},
+                "query": {"type": "string", "description": "SQL query text"},
+                "description": {"type": "string", "description": "Query description (optional)", "default": ""},
+                "schedule": {"type": "object", "description": "Schedule configuration (optional)"}
+            },
+            "required": ["data_source_id", "name", "query"]
+        }
+    },
+    "redash_create_visualization_tool": {
+        "name": "redash_create_visualization_tool",
+        "description": "Create a new visualization for a query",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query_id": {"type": "string", "description": "Query identifier"},
+                "viz_type": {"type": "string", "description": "Visualization type (e.g., 'TABLE', 'CHART', 'COUNTER')"},
+                "name": {"type": "string", "description": "Visualization name"},
+                "options": {"type": "object", "description": "Visualization options (optional)"},
+                "description": {"type": "string", "description": "Visualization description (optional)", "default": ""}
+            },
+            "required": ["query_id", "viz_type", "name"]
+        }
+    },
+    "redash_create_dashboard_tool": {
+        "name": "redash_create_dashboard_tool",
+        "description": "Create a new dashboard in Redash",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Dashboard name"}
+            },
+            "required": ["name"]
+        }
+    },
+    "redash_add_widget_tool": {
+        "name": "redash_add_widget_tool",
+        "description": "Add a widget to a dashboard",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "dashboard_id": {"type": "string", "description": "Dashboard identifier"},
+                "visualization_id": {"type": "string", "description": "Visualization identifier (optional)"},
+                "text": {"type": "string", "description": "Text widget content (optional)"},
+                "width": {"type": "integer", "description": "Widget width", "default": 1},
+                "options": {"type": "object", "description": "Widget options (optional)"}
+            },
+            "required": ["dashboard_id"]
+        }
+    },
+    "redash_publish_dashboard_tool": {
+        "name": "redash_publish_dashboard_tool",
+        "description": "Publish a Redash dashboard to make it accessible",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "dashboard_id": {"type": "string", "description": "Dashboard identifier"}
+            },
+            "required": ["dashboard_id"]
+        }
+    },
+
+    # DataZone tools
+    "datazone_list_domains_tool": {
+        "name": "datazone_list_domains_tool",
+        "description": "List all AWS DataZone domains",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "max_results": {"type": "integer", "description": "Maximum number of results", "default": 25}
+            },
+            "required": []
+        }
+    },
+    "datazone_get_domain_tool": {
+        "name": "datazone_get_domain_tool",
+        "description": "Get details of a specific DataZone domain",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "domain_id": {"type": "string", "description": "Domain identifier"}
+            },
+            "required": ["domain_id"]
+        }
+    },
+    "datazone_list_projects_tool": {
+        "name": "datazone_list_projects_tool",
+        "description": "List all projects in a DataZone domain",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "domain_id": {"type": "string", "description": "DataZone domain identifier"},
+                "max_results": {"type": "integer", "description": "Maximum number of results", "default": 25}
+            },
+            "required": ["domain_id"]
+        }
+    },
+    "datazone_get_project_tool": {
+        "name": "datazone_get_project_tool",
+        "description": "Get details of a specific DataZone project",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "domain_id": {"type": "string", "description": "DataZone domain identifier"},
+                "datazone_project_id": {"type": "string", "description": "DataZone project identifier"}
+            },
+            "required": ["domain_id", "datazone_project_id"]
+        }
+    },
+    "datazone_search_listings_tool": {
+        "name": "datazone_search_listings_tool",
+        "description": "Search for data assets in DataZone catalog",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "domain_id": {"type": "string", "description": "DataZone domain identifier"},
+                "search_text": {"type": "string", "description": "Text to search for", "default": ""},
+                "max_results": {"type": "integer", "description": "Maximum number of results", "default": 25}
+            },
+            "required": ["domain_id"]
+        }
+    },
+    "datazone_get_listing_tool": {
+        "name": "datazone_get_listing_tool",
+        "description": "Get details of a specific data listing",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "domain_id": {"type": "string", "description": "DataZone domain identifier"},
+                "listing_id": {"type": "string", "description": "Listing identifier"}
+            },
+            "required": ["domain_id", "listing_id"]
+        }
+    },
+    "datazone_list_environments_tool": {
+        "name": "datazone_list_environments_tool",
+        "description": "List environments in a DataZone project",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "domain_id": {"type": "string", "description": "DataZone domain identifier"},
+                "datazone_project_id": {"type": "string", "description": "DataZone project identifier"},
+                "max_results": {"type": "integer", "description": "Maximum number of results", "default": 25}
+            },
+            "required": ["domain_id", "datazone_project_id"]
+        }
+    },
+    "datazone_get_environment_tool": {
+        "name": "datazone_get_environment_tool",
+        "description": "Get details of a specific environment",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "domain_id": {"type": "string", "description": "DataZone domain identifier"},
+                "environment_id": {"type": "string", "description": "Environment identifier"}
+            },
+            "required": ["domain_id", "environment_id"]
+        }
+    },
+    "datazone_get_asset_tool": {
+        "name": "datazone_get_asset_tool",
+        "description": "Get details of a specific data asset",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "domain_id": {"type": "string", "description": "DataZone domain identifier"},
+                "asset_id": {"type": "string", "description": "Asset identifier"}
+            },
+            "required": ["domain_id", "asset_id"]
+        }
+    },
+    "datazone_list_asset_revisions_tool": {
+        "name": "datazone_list_asset_revisions_tool",
+        "description": "List revisions of a data asset",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "domain_id": {"type": "string", "description": "DataZone domain identifier"},
+                "asset_id": {"type": "string", "description": "Asset identifier"},
+                "max_results": {"type": "integer", "description": "Maximum number of results", "default": 50}
+            },
+            "required": ["domain_id", "asset_id"]
+        }
+    },
+    "datazone_get_glossary_tool": {
+        "name": "datazone_get_glossary_tool",
+        "description": "Get details of a business glossary",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "domain_id": {"type": "string", "description": "DataZone domain identifier"},
+                "glossary_id": {"type": "string", "description": "Glossary identifier"}
+            },
+            "required": ["domain_id", "glossary_id"]
+        }
+    },
+    "datazone_get_glossary_term_tool": {
+        "name": "datazone_get_glossary_term_tool",
+        "description": "Get details of a glossary term",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "domain_id": {"type": "string", "description": "DataZone domain identifier"},
+                "term_id": {"type": "string", "description": "Glossary term identifier"}
+            },
+            "required": ["domain_id", "term_id"]
+        }
+    },
+    "datazone_create_form_type_tool": {
+        "name": "datazone_create_form_type_tool",
+        "description": "Create a new form type in DataZone",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "domain_id": {"type": "string", "description": "DataZone domain identifier"},
+                "name": {"type": "string", "description": "Name of the form type"},
+                "model": {"type": "string", "description": "JSON string representing the form model structure"},
+                "owning_project_id": {"type": "string", "description": "DataZone project ID that will own this form type"},
+                "description": {"type": "string", "description": "Description of the form type", "default": ""},
+                "status": {"type": "string", "description": "Status of the form type", "default": "ENABLED"}
+            },
+            "required": ["domain_id", "name", "model", "owning_project_id"]
+        }
+    },
+    "datazone_get_form_type_tool": {
+        "name": "datazone_get_form_type_tool",
+        "description": "Get details of a specific form type",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "domain_id": {"type": "string", "description": "DataZone domain identifier"},
+                "form_type_id": {"type": "string", "description": "Form type identifier"},
+                "revision": {"type": "string", "description": "Specific revision to retrieve", "default": ""}
+            },
+            "required": ["domain_id", "form_type_id"]
+        }
+    },
+    "datazone_create_asset_type_tool": {
+        "name": "datazone_create_asset_type_tool",
+        "description": "Create a new asset type in DataZone",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "domain_id": {"type": "string", "description": "DataZone domain identifier"},
+                "name": {"type": "string", "description": "Name of the asset type"},
+                "owning_project_id": {"type": "string", "description": "DataZone project ID that will own this asset type"},
+                "description": {"type": "string", "description": "Description of the asset type", "default": ""},
+                "forms_input": {"type": "string", "description": "JSON string representing forms configuration", "default": ""}
+            },
+            "required": ["domain_id", "name", "owning_project_id"]
+        }
+    },
+    "datazone_get_asset_type_tool": {
+        "name": "datazone_get_asset_type_tool",
+        "description": "Get details of a specific asset type",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "domain_id": {"type": "string", "description": "DataZone domain identifier"},
+                "asset_type_id": {"type": "string", "description": "Asset type identifier"},
+                "revision": {"type": "string", "description": "Specific revision to retrieve", "default": ""}
+            },
+            "required": ["domain_id", "asset_type_id"]
+        }
+    },
+    "datazone_list_asset_types_tool": {
+        "name": "datazone_list_asset_types_tool",
+        "description": "List asset types in a DataZone domain",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "domain_id": {"type": "string", "description": "DataZone domain identifier"},
+                "owning_project_id": {"type": "string", "description": "Filter by owning project ID", "default": ""},
+                "max_results": {"type": "integer", "description": "Maximum number of results", "default": 25}
+            },
+            "required": ["domain_id"]
+        }
+    },
+
+    # S3 tools
+    "s3_list_buckets_tool": {
+        "name": "s3_list_buckets_tool",
+        "description": "List all S3 buckets",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "s3_list_objects_tool": {
+        "name": "s3_list_objects_tool",
+        "description": "List objects in an S3 bucket",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "bucket_name": {"type": "string", "description": "Name of the S3 bucket"},
+                "prefix": {"type": "string", "description": "Prefix to filter objects", "default": ""},
+                "max_keys": {"type": "integer", "description": "Maximum number of objects to return", "default": 1000},
+                "delimiter": {"type": "string", "description": "Delimiter for grouping keys (e.g., '/' for folder structure)", "default": ""},
+                "continuation_token": {"type": "string", "description": "Token from a previous truncated listing to continue from", "default": ""}
+            },
+            "required": ["bucket_name"]
+        }
+    },
+    "s3_get_object_tool": {
+        "name": "s3_get_object_tool",
+        "description": "Get an object from S3 with its content and metadata",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "bucket_name": {"type": "string", "description": "Name of the S3 bucket"},
+                "object_key": {"type": "string", "description": "Key of the object to retrieve"},
+                "max_bytes": {"type": "integer", "description": "Maximum bytes to read (0 uses the server default)", "default": 0},
+                "offset": {"type": "integer", "description": "Byte offset to start reading from", "default": 0}
+            },
+            "required": ["bucket_name", "object_key"]
+        }
+    },
+    "s3_get_object_metadata_tool": {
+        "name": "s3_get_object_metadata_tool",
+        "description": "Get metadata for an S3 object without downloading the content",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "bucket_name": {"type": "string", "description": "Name of the S3 bucket"},
+                "object_key": {"type": "string", "description": "Key of the object"}
+            },
+            "required": ["bucket_name", "object_key"]
+        }
+    },
+    "s3_create_bucket_tool": {
+        "name": "s3_create_bucket_tool",
+        "description": "Create a new S3 bucket",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "bucket_name": {"type": "string", "description": "Name of the bucket to create"},
+                "region": {"type": "string", "description": "AWS region for the bucket (optional)", "default": ""}
+            },
+            "required": ["bucket_name"]
+        }
+    },
+    "s3_put_object_tool": {
+        "name": "s3_put_object_tool",
+        "description": "Upload an object to S3",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "bucket_name": {"type": "string", "description": "Name of the S3 bucket"},
+                "object_key": {"type": "string", "description": "Key for the object"},
+                "content": {"type": "string", "description": "Content to upload (text or base64 encoded)"},
+                "content_type": {"type": "string", "description": "MIME type of the content", "default": ""},
+                "storage_class": {"type": "string", "description": "Storage class (STANDARD, INTELLIGENT_TIERING, etc.)", "default": "STANDARD"}
+            },
+            "required": ["bucket_name", "object_key", "content"]
+        }
+    },
+    "s3_generate_presigned_url_tool": {
+        "name": "s3_generate_presigned_url_tool",
+        "description": "Generate a presigned URL for S3 object operations (get, put, delete)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "bucket_name": {"type": "string", "description": "Name of the S3 bucket"},
+                "object_key": {"type": "string", "description": "Key of the object"},
+                "operation": {"type": "string", "description": "S3 operation (get_object, put_object, delete_object)", "default": "get_object"},
+                "expiration": {"type": "integer", "description": "URL expiration time in seconds", "default": 3600},
+                "http_method": {"type": "string", "description": "HTTP method override (GET, PUT, DELETE)", "default": ""}
+            },
+            "required": ["bucket_name", "object_key"]
+        }
+    },
+    "s3_generate_presigned_post_tool": {
+        "name": "s3_generate_presigned_post_tool",
+        "description": "Generate presigned POST data for direct browser uploads to S3",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "bucket_name": {"type": "string", "description": "Name of the S3 bucket"},
+                "object_key": {"type": "string", "description": "Key for the object to be uploaded"},
+                "expiration": {"type": "integer", "description": "POST policy expiration time in seconds", "default": 3600}
+            },
+            "required": ["bucket_name", "object_key"]
+        }
+    },
+
+    # DBT Cloud tools
+    "dbt_list_projects_tool": {
+        "name": "dbt_list_projects_tool",
+        "description": "List all dbt Cloud projects in the account",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "dbt_list_environments_tool": {
+        "name": "dbt_list_environments_tool",
+        "description": "List all environments in a dbt Cloud project",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "dbt_project_id": {"type": "string", "description": "DBT project identifier (optional)"}
+            },
+            "required": []
+        }
+    },
+    "dbt_list_jobs_tool": {
+        "name": "dbt_list_jobs_tool",
+        "description": "List all jobs in a dbt Cloud project",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "dbt_project_id": {"type": "string", "description": "DBT project identifier (optional)"}
+            },
+            "required": []
+        }
+    },
+    "dbt_trigger_job_run_tool": {
+        "name": "dbt_trigger_job_run_tool",
+        "description": "Trigger a dbt Cloud job run with optional overrides",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "job_id": {"type": "string", "description": "Job identifier"},
+                "cause": {"type": "string", "description": "Reason for triggering the job", "default": "API trigger"},
+                "git_sha": {"type": "string", "description": "Git SHA to run against (optional)"},
+                "schema_override": {"type": "string", "description": "Schema override (optional)"},
+                "dbt_version_override": {"type": "string", "description": "dbt version override (optional)"},
+                "target_name_override": {"type": "string", "description": "Target name override (optional)"},
+                "generate_docs_override": {"type": "boolean", "description": "Generate docs override (optional)"},
+                "timeout_seconds_override": {"type": "integer", "description": "Timeout override in seconds (optional)"},
+                "steps_override": {"type": "array", "items": {"type": "string"}, "description": "List of steps to run (optional)"}
+            },
+            "required": ["job_id"]
+        }
+    },
+    "dbt_get_job_run_tool": {
+        "name": "dbt_get_job_run_tool",
+        "description": "Get details of a specific dbt Cloud job run",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "run_id": {"type": "string", "description": "Run identifier"},
+                "include_related": {"type": "array", "items": {"type": "string"}, "description": "Related data to include (optional)"}
+            },
+            "required": ["run_id"]
+        }
+    },
+    "dbt_list_job_runs_tool": {
+        "name": "dbt_list_job_runs_tool",
+        "description": "List job runs with optional filters",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "job_id": {"type": "string", "description": "Job identifier (optional)"},
+                "status": {"type": "string", "description": "Run status filter (optional)"},
+                "limit": {"type": "integer", "description": "Result limit", "default": 50}
+            },
+            "required": []
+        }
+    },
+    "dbt_cancel_job_run_tool": {
+        "name": "dbt_cancel_job_run_tool",
+        "description": "Cancel a running dbt Cloud job",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "run_id": {"type": "string", "description": "Run identifier"}
+            },
+            "required": ["run_id"]
+        }
+    },
+    "dbt_list_models_tool": {
+        "name": "dbt_list_models_tool",
+        "description": "List all models in a dbt project using Discovery API",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "environment_id": {"type": "string", "description": "Environment identifier (optional)"}
+            },
+            "required": []
+        }
+    },
+    "dbt_get_model_details_tool": {
+        "name": "dbt_get_model_details_tool",
+        "description": "Get detailed information about a specific dbt model",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "model_unique_id": {"type": "string", "description": "Model unique identifier"},
+                "environment_id": {"type": "string", "description": "Environment identifier (optional)"}
+            },
+            "required": ["model_unique_id"]
+        }
+    },
+    "dbt_list_metrics_tool": {
+        "name": "dbt_list_metrics_tool",
+        "description": "List all metrics using dbt Semantic Layer API",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "environment_id": {"type": "string", "description": "Environment identifier (optional)"}
+            },
+            "required": []
+        }
+    },
+    "dbt_query_metrics_tool": {
+        "name": "dbt_query_metrics_tool",
+        "description": "Query metrics using dbt Semantic Layer API",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "metrics": {"type": "array", "items": {"type": "string"}, "description": "List of metrics to query"},
+                "group_by": {"type": "array", "items": {"type": "string"}, "description": "Dimensions to group by (optional)"},
+                "where": {"type": "array", "items": {"type": "string"}, "description": "Filter conditions (optional)"},
+                "order_by": {"type": "array", "items": {"type": "string"}, "description": "Sort order (optional)"},
+                "limit": {"type": "integer", "description": "Result limit (optional)"},
+                "environment_id": {"type": "string", "description": "Environment identifier (optional)"}
+            },
+            "required": ["metrics"]
+        }
+    },
+    "dbt_execute_sql_tool": {
+        "name": "dbt_execute_sql_tool",
+        "description": "Execute SQL using dbt Cloud SQL API",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "sql": {"type": "string", "description": "SQL query to execute"},
+                "environment_id": {"type": "string", "description": "Environment identifier (optional)"}
+            },
+            "required": ["sql"]
+        }
+    },
+
+    # DataHub tools
+    "datahub_search_entities_tool": {
+        "name": "datahub_search_entities_tool",
+        "description": "Search for entities in DataHub",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search query string", "default": "*"},
+                "entity_types": {"type": "array", "items": {"type": "string"}, "description": "List of entity types to filter by (DATASET, CHART, DASHBOARD, etc.)"},
+                "start": {"type": "integer", "description": "Start index for pagination", "default": 0},
+                "count": {"type": "integer", "description": "Number of results per page", "default": 10}
+            },
+            "required": []
+        }
+    },
+    "datahub_get_entity_tool": {
+        "name": "datahub_get_entity_tool",
+        "description": "Get details of a specific DataHub entity by URN",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "urn": {"type": "string", "description": "Entity URN to retrieve"}
+            },
+            "required": ["urn"]
+        }
+    },
+    "datahub_get_lineage_tool": {
+        "name": "datahub_get_lineage_tool",
+        "description": "Get lineage information for a DataHub entity",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "urn": {"type": "string", "description": "Entity URN to get lineage for"},
+                "direction": {"type": "string", "description": "Lineage direction (UPSTREAM or DOWNSTREAM)", "default": "DOWNSTREAM"},
+                "start": {"type": "integer", "description": "Start index for pagination", "default": 0},
+                "count": {"type": "integer", "description": "Number of results per page", "default": 100}
+            },
+            "required": ["urn"]
+        }
+    },
+    "datahub_list_datasets_tool": {
+        "name": "datahub_list_datasets_tool",
+        "description": "List datasets in DataHub",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "platform": {"type": "string", "description": "Platform name to filter by (optional)"},
+                "start": {"type": "integer", "description": "Start index", "default": 0},
+                "count": {"type": "integer", "description": "Number of results", "default": 20}
+            },
+            "required": []
+        }
+    },
+    "datahub_list_dashboards_tool": {
+        "name": "datahub_list_dashboards_tool",
+        "description": "List dashboards in DataHub",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "start": {"type": "integer", "description": "Start index", "default": 0},
+                "count": {"type": "integer", "description": "Number of results", "default": 20}
+            },
+            "required": []
+        }
+    },
+    "datahub_list_charts_tool": {
+        "name": "datahub_list_charts_tool",
+        "description": "List charts in DataHub",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "start": {"type": "integer", "description": "Start index", "default": 0},
+                "count": {"type": "integer", "description": "Number of results", "default": 20}
+            },
+            "required": []
+        }
+    },
+    "datahub_list_platforms_tool": {
+        "name": "datahub_list_platforms_tool",
+        "description": "List all platforms in DataHub",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "datahub_list_tags_tool": {
+        "name": "datahub_list_tags_tool",
+        "description": "List all tags in DataHub",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "start": {"type": "integer", "description": "Start index", "default": 0},
+                "count": {"type": "integer", "description": "Number of results", "default": 20}
+            },
+            "required": []
+        }
+    },
+
+    # Airflow tools
+    "airflow_list_dags_tool": {
+        "name": "airflow_list_dags_tool",
+        "description": "List all DAGs in Airflow",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "limit": {"type": "integer", "description": "Result limit", "default": 100},
+                "offset": {"type": "integer", "description": "Offset for pagination", "default": 0},
+                "only_active": {"type": "boolean", "description": "Only active DAGs", "default": True}
+            },
+            "required": []
+        }
+    },
+    "airflow_get_dag_tool": {
+        "name": "airflow_get_dag_tool",
+        "description": "Get details of a specific DAG",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "dag_id": {"type": "string", "description": "DAG identifier"}
+            },
+            "required": ["dag_id"]
+        }
+    },
+    "airflow_trigger_dag_tool": {
+        "name": "airflow_trigger_dag_tool",
+        "description": "Trigger a DAG run",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "dag_id": {"type": "string", "description": "DAG identifier"},
+                "conf": {"type": "object", "description": "DAG run configuration (optional)"}
+            },
+            "required": ["dag_id"]
+        }
+    },
+    "airflow_get_dag_runs_tool": {
+        "name": "airflow_get_dag_runs_tool",
+        "description": "Get DAG runs for a specific DAG",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "dag_id": {"type": "string", "description": "DAG identifier"},
+                "limit": {"type": "integer", "description": "Result limit", "default": 25},
+                "offset": {"type": "integer", "description": "Offset for pagination", "default": 0}
+            },
+            "required": ["dag_id"]
+        }
+    },
+    "airflow_get_task_instances_tool": {
+        "name": "airflow_get_task_instances_tool",
+        "description": "Get task instances for a DAG run",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "dag_id": {"type": "string", "description": "DAG identifier"},
+                "dag_run_id": {"type": "string", "description": "DAG run identifier"}
+            },
+            "required": ["dag_id", "dag_run_id"]
+        }
+    },
+    "airflow_get_task_logs_tool": {
+        "name": "airflow_get_task_logs_tool",
+        "description": "Get logs for a task instance",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "dag_id": {"type": "string", "description": "DAG identifier"},
+                "dag_run_id": {"type": "string", "description": "DAG run identifier"},
+                "task_id": {"type": "string", "description": "Task identifier"},
+                "task_try_number": {"type": "integer", "description": "Task try number", "default": 1}
+            },
+            "required": ["dag_id", "dag_run_id", "task_id"]
+        }
+    },
+    "airflow_pause_dag_tool": {
+        "name": "airflow_pause_dag_tool",
+        "description": "Pause a DAG",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "dag_id": {"type": "string", "description": "DAG identifier"}
+            },
+            "required": ["dag_id"]
+        }
+    },
+    "airflow_unpause_dag_tool": {
+        "name": "airflow_unpause_dag_tool",
+        "description": "Unpause a DAG",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "dag_id": {"type": "string", "description": "DAG identifier"}
+            },
+            "required": ["dag_id"]
+        }
+    },
+
+    # OpenAPI tools
+    "openapi_get_spec_tool": {
+        "name": "openapi_get_spec_tool",
+        "description": "Get the OpenAPI specification for the configured API",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "openapi_list_endpoints_tool": {
+        "name": "openapi_list_endpoints_tool",
+        "description": "List all available API endpoints from OpenAPI spec",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "tag": {"type": "string", "description": "Optional tag to filter endpoints"}
+            },
+            "required": []
+        }
+    },
+    "openapi_call_endpoint_tool": {
+        "name": "openapi_call_endpoint_tool",
+        "description": "Call an API endpoint with specified parameters",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "method": {"type": "string", "description": "HTTP method (GET, POST, etc.)"},
+                "path": {"type": "string", "description": "API endpoint path"},
+                "parameters": {"type": "object", "description": "Request parameters (optional)"},
+                "data": {"type": "object", "description": "Request body (optional)"},
+                "headers": {"type": "object", "description": "Request headers (optional)"}
+            },
+            "required": ["method", "path"]
+        }
+    },
+    "openapi_get_endpoint_schema_tool": {
+        "name": "openapi_get_endpoint_schema_tool",
+        "description": "Get the schema definition for a specific endpoint",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "method": {"type": "string", "description": "HTTP method"},
+                "path": {"type": "string", "description": "API endpoint path"}
+            },
+            "required": ["method", "path"]
+        }
+    },
+
+    # Jira tools
+    "jira_search_issues_tool": {
+        "name": "jira_search_issues_tool",
+        "description": "Search for Jira issues using JQL (Jira Query Language)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "jql": {"type": "string", "description": "JQL query string"},
+                "max_results": {"type": "integer", "description": "Maximum number of results (default: 50)"}
+            },
+            "required": ["jql"]
+        }
+    },
+    "jira_get_issue_tool": {
+        "name": "jira_get_issue_tool",
+        "description": "Get details of a specific Jira issue",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "issue_key": {"type": "string", "description": "Issue key (e.g., 'PROJ-123')"}
+            },
+            "required": ["issue_key"]
+        }
+    },
+    "jira_create_issue_tool": {
+        "name": "jira_create_issue_tool",
+        "description": "Create a new Jira issue",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_key": {"type": "string", "description": "Project key"},
+                "summary": {"type": "string", "description": "Issue summary/title"},
+                "issue_type": {"type": "string", "description": "Issue type (e.g., 'Task', 'Bug', 'Story')"},
+                "description": {"type": "string", "description": "Issue description (optional)"},
+                "priority": {"type": "string", "description": "Priority (optional)"},
+                "assignee_account_id": {"type": "string", "description": "Assignee account ID (optional)"}
+            },
+            "required": ["project_key", "summary", "issue_type"]
+        }
+    },
+    "jira_update_issue_tool": {
+        "name": "jira_update_issue_tool",
+        "description": "Update an existing Jira issue",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "issue_key": {"type": "string", "description": "Issue key"},
+                "fields": {"type": "object", "description": "Fields to update"}
+            },
+            "required": ["issue_key", "fields"]
+        }
+    },
+    "jira_transition_issue_tool": {
+        "name": "jira_transition_issue_tool",
+        "description": "Transition a Jira issue to a new status",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "issue_key": {"type": "string", "description": "Issue key"},
+                "transition_id": {"type": "string", "description": "Transition ID"}
+            },
+            "required": ["issue_key", "transition_id"]
+        }
+    },
+    "jira_get_transitions_tool": {
+        "name": "jira_get_transitions_tool",
+        "description": "Get available transitions for a Jira issue",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "issue_key": {"type": "string", "description": "Issue key"}
+            },
+            "required": ["issue_key"]
+        }
+    },
+    "jira_assign_issue_tool": {
+        "name": "jira_assign_issue_tool",
+        "description": "Assign a Jira issue to a user",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "issue_key": {"type": "string", "description": "Issue key"},
+                "account_id": {"type": "string", "description": "Atlassian account ID"}
+            },
+            "required": ["issue_key", "account_id"]
+        }
+    },
+    "jira_list_projects_tool": {
+        "name": "jira_list_projects_tool",
+        "description": "List all Jira projects accessible to the user",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "jira_get_project_tool": {
+        "name": "jira_get_project_tool",
+        "description": "Get details of a specific Jira project",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_key": {"type": "string", "description": "Project key"}
+            },
+            "required": ["project_key"]
+        }
+    },
+    "jira_get_issue_types_tool": {
+        "name": "jira_get_issue_types_tool",
+        "description": "Get issue types for a Jira project",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_key": {"type": "string", "description": "Project key"}
+            },
+            "required": ["project_key"]
+        }
+    },
+    "jira_get_fields_tool": {
+        "name": "jira_get_fields_tool",
+        "description": "Get all fields (system and custom) in Jira",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "jira_add_comment_tool": {
+        "name": "jira_add_comment_tool",
+        "description": "Add a comment to a Jira issue",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "issue_key": {"type": "string", "description": "Issue key"},
+                "comment": {"type": "string", "description": "Comment text"}
+            },
+            "required": ["issue_key", "comment"]
+        }
+    },
+    "jira_get_comments_tool": {
+        "name": "jira_get_comments_tool",
+        "description": "Get all comments for a Jira issue",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "issue_key": {"type": "string", "description": "Issue key"}
+            },
+            "required": ["issue_key"]
+        }
+    },
+    "jira_upload_attachment_tool": {
+        "name": "jira_upload_attachment_tool",
+        "description": "Upload an attachment to a Jira issue",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "issue_key": {"type": "string", "description": "Issue key"},
+                "file_content": {"type": "string", "description": "File content (base64 encoded)"},
+                "filename": {"type": "string", "description": "Filename"}
+            },
+            "required": ["issue_key", "file_content", "filename"]
+        }
+    },
+    "jira_list_boards_tool": {
+        "name": "jira_list_boards_tool",
+        "description": "List all Jira boards, optionally filtered by project",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_key": {"type": "string", "description": "Optional project key to filter boards"}
+            },
+            "required": []
+        }
+    },
+    "jira_list_sprints_tool": {
+        "name": "jira_list_sprints_tool",
+        "description": "List all sprints for a Jira board",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "board_id": {"type": "integer", "description": "Board ID"}
+            },
+            "required": ["board_id"]
+        }
+    },
+    "jira_get_sprint_tool": {
+        "name": "jira_get_sprint_tool",
+        "description": "Get details of a specific Jira sprint",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "sprint_id": {"type": "integer", "description": "Sprint ID"}
+            },
+            "required": ["sprint_id"]
+        }
+    },
+    "jira_get_backlog_tool": {
+        "name": "jira_get_backlog_tool",
+        "description": "Get backlog issues for a Jira board",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "board_id": {"type": "integer", "description": "Board ID"},
+                "max_results": {"type": "integer", "description": "Maximum number of results (default: 50)"}
+            },
+            "required": ["board_id"]
+        }
+    },
+
+    # Azure Blob Storage tools
+    "azure_blob_list_containers_tool": {
+        "name": "azure_blob_list_containers_tool",
+        "description": "List all containers in the Azure Blob Storage account",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "max_results": {"type": "integer", "description": "Maximum number of containers to return", "default": 100}
+            },
+            "required": []
+        }
+    },
+    "azure_blob_list_blobs_tool": {
+        "name": "azure_blob_list_blobs_tool",
+        "description": "List blobs in an Azure Blob Storage container",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "container_name": {"type": "string", "description": "Name of the container"},
+                "prefix": {"type": "string", "description": "Prefix to filter blobs"},
+                "max_results": {"type": "integer", "description": "Maximum number of blobs to return", "default": 1000},
+                "delimiter": {"type": "string", "description": "Delimiter for virtual directory structure"}
+            },
+            "required": ["container_name"]
+        }
+    },
+    "azure_blob_get_blob_tool": {
+        "name": "azure_blob_get_blob_tool",
+        "description": "Get a blob from Azure Blob Storage container",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "container_name": {"type": "string", "description": "Name of the container"},
+                "blob_name": {"type": "string", "description": "Name of the blob to retrieve"}
+            },
+            "required": ["container_name", "blob_name"]
+        }
+    },
+    "azure_blob_get_blob_metadata_tool": {
+        "name": "azure_blob_get_blob_metadata_tool",
+        "description": "Get metadata for a blob without downloading the content",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "container_name": {"type": "string", "description": "Name of the container"},
+                "blob_name": {"type": "string", "description": "Name of the blob"}
+            },
+            "required": ["container_name", "blob_name"]
+        }
+    },
+    "azure_blob_upload_blob_tool": {
+        "name": "azure_blob_upload_blob_tool",
+        "description": "Upload a blob to Azure Blob Storage container",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "container_name": {"type": "string", "description": "Name of the container"},
+                "blob_name": {"type": "string", "description": "Name for the blob"},
+                "content": {"type": "string", "description": "Content to upload"},
+                "content_type": {"type": "string", "description": "MIME type of the content"},
+                "overwrite": {"type": "boolean", "description": "Whether to overwrite if blob exists", "default": True}
+            },
+            "required": ["container_name", "blob_name", "content"]
+        }
+    },
+    "azure_blob_delete_blob_tool": {
+        "name": "azure_blob_delete_blob_tool",
+        "description": "Delete a blob from Azure Blob Storage container",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "container_name": {"type": "string", "description": "Name of the container"},
+                "blob_name": {"type": "string", "description": "Name of the blob to delete"}
+            },
+            "required": ["container_name", "blob_name"]
+        }
+    },
+    "azure_blob_generate_sas_url_tool": {
+        "name": "azure_blob_generate_sas_url_tool",
+        "description": "Generate a SAS (Shared Access Signature) URL for a blob",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "container_name": {"type": "string", "description": "Name of the container"},
+                "blob_name": {"type": "string", "description": "Name of the blob"},
+                "expiry_hours": {"type": "integer", "description": "URL expiration time in hours", "default": 1},
+                "permission": {"type": "string", "description": "Permission string (r=read, w=write, d=delete)", "default": "r"}
+            },
+            "required": ["container_name", "blob_name"]
+        }
+    },
+    "azure_blob_get_container_properties_tool": {
+        "name": "azure_blob_get_container_properties_tool",
+        "description": "Get properties for an Azure Blob Storage container",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "container_name": {"type": "string", "description": "Name of the container"}
+            },
+            "required": ["container_name"]
+        }
+    },
+
+    # Azure Data Factory tools
+    "azure_adf_list_pipelines_tool": {
+        "name": "azure_adf_list_pipelines_tool",
+        "description": "List all pipelines in Azure Data Factory",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "azure_adf_get_pipeline_tool": {
+        "name": "azure_adf_get_pipeline_tool",
+        "description": "Get details of a specific pipeline in Azure Data Factory",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "pipeline_name": {"type": "string", "description": "Name of the pipeline"}
+            },
+            "required": ["pipeline_name"]
+        }
+    },
+    "azure_adf_run_pipeline_tool": {
+        "name": "azure_adf_run_pipeline_tool",
+        "description": "Run a pipeline in Azure Data Factory",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "pipeline_name": {"type": "string", "description": "Name of the pipeline"},
+                "parameters": {"type": "object", "description": "Optional parameters for the pipeline run"}
+            },
+            "required": ["pipeline_name"]
+        }
+    },
+    "azure_adf_get_pipeline_run_tool": {
+        "name": "azure_adf_get_pipeline_run_tool",
+        "description": "Get details of a pipeline run",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "run_id": {"type": "string", "description": "Pipeline run ID"}
+            },
+            "required": ["run_id"]
+        }
+    },
+    "azure_adf_list_pipeline_runs_tool": {
+        "name": "azure_adf_list_pipeline_runs_tool",
+        "description": "List pipeline runs in Azure Data Factory",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "pipeline_name": {"type": "string", "description": "Optional: filter by pipeline name"},
+                "days_back": {"type": "integer", "description": "Number of days to look back", "default": 7}
+            },
+            "required": []
+        }
+    },
+    "azure_adf_list_datasets_tool": {
+        "name": "azure_adf_list_datasets_tool",
+        "description": "List all datasets in Azure Data Factory",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "azure_adf_get_dataset_tool": {
+        "name": "azure_adf_get_dataset_tool",
+        "description": "Get details of a specific dataset",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "dataset_name": {"type": "string", "description": "Name of the dataset"}
+            },
+            "required": ["dataset_name"]
+        }
+    },
+    "azure_adf_list_triggers_tool": {
+        "name": "azure_adf_list_triggers_tool",
+        "description": "List all triggers in Azure Data Factory",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "azure_adf_get_trigger_tool": {
+        "name": "azure_adf_get_trigger_tool",
+        "description": "Get details of a specific trigger",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "trigger_name": {"type": "string", "description": "Name of the trigger"}
+            },
+            "required": ["trigger_name"]
+        }
+    },
+    "azure_adf_list_linked_services_tool": {
+        "name": "azure_adf_list_linked_services_tool",
+        "description": "List all linked services in Azure Data Factory",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "azure_adf_get_linked_service_tool": {
+        "name": "azure_adf_get_linked_service_tool",
+        "description": "Get details of a specific linked service",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "service_name": {"type": "string", "description": "Name of the linked service"}
+            },
+            "required": ["service_name"]
+        }
+    },
+    "azure_adf_list_data_flows_tool": {
+        "name": "azure_adf_list_data_flows_tool",
+        "description": "List all data flows in Azure Data Factory",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "azure_adf_get_data_flow_tool": {
+        "name": "azure_adf_get_data_flow_tool",
+        "description": "Get details of a specific data flow",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "data_flow_name": {"type": "string", "description": "Name of the data flow"}
+            },
+            "required": ["data_flow_name"]
+        }
+    },
+    "azure_adf_list_integration_runtimes_tool": {
+        "name": "azure_adf_list_integration_runtimes_tool",
+        "description": "List all integration runtimes in Azure Data Factory",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "azure_adf_get_integration_runtime_tool": {
+        "name": "azure_adf_get_integration_runtime_tool",
+        "description": "Get details of a specific integration runtime",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "runtime_name": {"type": "string", "description": "Name of the integration runtime"}
+            },
+            "required": ["runtime_name"]
+        }
+    },
+    "azure_adf_get_factory_info_tool": {
+        "name": "azure_adf_get_factory_info_tool",
+        "description": "Get information about the Azure Data Factory instance",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    # Atlan tools
+    "atlan_search_assets_tool": {
+        "name": "atlan_search_assets_tool",
+        "description": "Search for assets in Atlan data catalog using Elasticsearch query syntax",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search query (Elasticsearch syntax)", "default": "*"},
+                "asset_types": {"type": "array", "items": {"type": "string"}, "description": "Asset types to filter (Table, Column, Dashboard, etc.)"},
+                "from_": {"type": "integer", "description": "Pagination offset", "default": 0},
+                "size": {"type": "integer", "description": "Number of results", "default": 25}
+            },
+            "required": []
+        }
+    },
+    "atlan_search_by_type_tool": {
+        "name": "atlan_search_by_type_tool",
+        "description": "Search for all assets of a specific type in Atlan",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "type_name": {"type": "string", "description": "Asset type name (Table, Column, Dashboard, etc.)"},
+                "from_": {"type": "integer", "description": "Pagination offset", "default": 0},
+                "size": {"type": "integer", "description": "Number of results", "default": 25}
+            },
+            "required": ["type_name"]
+        }
+    },
+    "atlan_get_asset_tool": {
+        "name": "atlan_get_asset_tool",
+        "description": "Get detailed information about a specific asset by GUID",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "guid": {"type": "string", "description": "Asset GUID"}
+            },
+            "required": ["guid"]
+        }
+    },
+    "atlan_get_asset_by_qualified_name_tool": {
+        "name": "atlan_get_asset_by_qualified_name_tool",
+        "description": "Get asset by type and qualified name",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "type_name": {"type": "string", "description": "Asset type name"},
+                "qualified_name": {"type": "string", "description": "Asset qualified name"}
+            },
+            "required": ["type_name", "qualified_name"]
+        }
+    },
+    "atlan_create_asset_tool": {
+        "name": "atlan_create_asset_tool",
+        "description": "Create a new asset in Atlan",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "type_name": {"type": "string", "description": "Asset type (Table, Column, etc.)"},
+                "name": {"type": "string", "description": "Asset display name"},
+                "qualified_name": {"type": "string", "description": "Unique qualified name"},
+                "description": {"type": "string", "description": "Asset description"}
+            },
+            "required": ["type_name", "name", "qualified_name"]
+        }
+    },
+    "atlan_update_asset_tool": {
+        "name": "atlan_update_asset_tool",
+        "description": "Update an existing asset in Atlan",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "guid": {"type": "string", "description": "Asset GUID"},
+                "attributes": {"type": "object", "description": "Attributes to update"}
+            },
+            "required": ["guid", "attributes"]
+        }
+    },
+    "atlan_delete_asset_tool": {
+        "name": "atlan_delete_asset_tool",
+        "description": "Delete an asset from Atlan (soft or hard delete)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "guid": {"type": "string", "description": "Asset GUID"},
+                "hard_delete": {"type": "boolean", "description": "Permanently delete", "default": False}
+            },
+            "required": ["guid"]
+        }
+    },
+    "atlan_update_asset_description_tool": {
+        "name": "atlan_update_asset_description_tool",
+        "description": "Update the description of an asset",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "guid": {"type": "string", "description": "Asset GUID"},
+                "description": {"type": "string", "description": "New description"}
+            },
+            "required": ["guid", "description"]
+        }
+    },
+    "atlan_update_asset_owners_tool": {
+        "name": "atlan_update_asset_owners_tool",
+        "description": "Update the owners of an asset",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "guid": {"type": "string", "description": "Asset GUID"},
+                "owner_users": {"type": "array", "items": {"type": "string"}, "description": "Owner usernames"},
+                "owner_groups": {"type": "array", "items": {"type": "string"}, "description": "Owner group names"}
+            },
+            "required": ["guid"]
+        }
+    },
+    "atlan_get_lineage_tool": {
+        "name": "atlan_get_lineage_tool",
+        "description": "Get lineage information for an asset",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "guid": {"type": "string", "description": "Asset GUID"},
+                "direction": {"type": "string", "description": "UPSTREAM, DOWNSTREAM, or BOTH", "default": "BOTH"},
+                "depth": {"type": "integer", "description": "Lineage depth (1-10)", "default": 3}
+            },
+            "required": ["guid"]
+        }
+    },
+    "atlan_list_glossaries_tool": {
+        "name": "atlan_list_glossaries_tool",
+        "description": "List all glossaries in Atlan",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "from_": {"type": "integer", "default": 0},
+                "size": {"type": "integer", "default": 25}
+            },
+            "required": []
+        }
+    },
+    "atlan_get_glossary_tool": {
+        "name": "atlan_get_glossary_tool",
+        "description": "Get a specific glossary by GUID",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "guid": {"type": "string", "description": "Glossary GUID"}
+            },
+            "required": ["guid"]
+        }
+    },
+    "atlan_list_glossary_terms_tool": {
+        "name": "atlan_list_glossary_terms_tool",
+        "description": "List glossary terms, optionally filtered by glossary",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "glossary_guid": {"type": "string", "description": "Glossary GUID to filter by"},
+                "from_": {"type": "integer", "default": 0},
+                "size": {"type": "integer", "default": 25}
+            },
+            "required": []
+        }
+    },
+    "atlan_get_glossary_term_tool": {
+        "name": "atlan_get_glossary_term_tool",
+        "description": "Get a specific glossary term by GUID",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "guid": {"type": "string", "description": "Term GUID"}
+            },
+            "required": ["guid"]
+        }
+    },
+    "atlan_create_glossary_term_tool": {
+        "name": "atlan_create_glossary_term_tool",
+        "description": "Create a new glossary term",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Term name"},
+                "glossary_guid": {"type": "string", "description": "Parent glossary GUID"},
+                "description": {"type": "string", "description": "Term description"},
+                "short_description": {"type": "string", "description": "Short description"}
+            },
+            "required": ["name", "glossary_guid"]
+        }
+    },
+    "atlan_list_glossary_categories_tool": {
+        "name": "atlan_list_glossary_categories_tool",
+        "description": "List glossary categories",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "glossary_guid": {"type": "string", "description": "Glossary GUID to filter by"},
+                "from_": {"type": "integer", "default": 0},
+                "size": {"type": "integer", "default": 25}
+            },
+            "required": []
+        }
+    },
+    "atlan_link_term_to_asset_tool": {
+        "name": "atlan_link_term_to_asset_tool",
+        "description": "Link a glossary term to an asset",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "term_guid": {"type": "string", "description": "Glossary term GUID"},
+                "asset_guid": {"type": "string", "description": "Asset GUID to link to"}
+            },
+            "required": ["term_guid", "asset_guid"]
+        }
+    },
+    "atlan_list_classifications_tool": {
+        "name": "atlan_list_classifications_tool",
+        "description": "List all classification types (tags) in Atlan",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "atlan_add_classification_tool": {
+        "name": "atlan_add_classification_tool",
+        "description": "Add a classification (tag) to an asset",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "guid": {"type": "string", "description": "Asset GUID"},
+                "classification_name": {"type": "string", "description": "Classification type name"}
+            },
+            "required": ["guid", "classification_name"]
+        }
+    },
+    "atlan_remove_classification_tool": {
+        "name": "atlan_remove_classification_tool",
+        "description": "Remove a classification from an asset",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "guid": {"type": "string", "description": "Asset GUID"},
+                "classification_name": {"type": "string", "description": "Classification type name"}
+            },
+            "required": ["guid", "classification_name"]
+        }
+    },
+    "atlan_list_tables_tool": {
+        "name": "atlan_list_tables_tool",
+        "description": "List all table assets in Atlan",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "from_": {"type": "integer", "default": 0},
+                "size": {"type": "integer", "default": 25}
+            },
+            "required": []
+        }
+    },
+    "atlan_list_columns_tool": {
+        "name": "atlan_list_columns_tool",
+        "description": "List columns, optionally filtered by parent table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "table_guid": {"type": "string", "description": "Parent table GUID"},
+                "from_": {"type": "integer", "default": 0},
+                "size": {"type": "integer", "default": 25}
+            },
+            "required": []
+        }
+    },
+    "atlan_list_databases_tool": {
+        "name": "atlan_list_databases_tool",
+        "description": "List all database assets",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "from_": {"type": "integer", "default": 0},
+                "size": {"type": "integer", "default": 25}
+            },
+            "required": []
+        }
+    },
+    "atlan_list_schemas_tool": {
+        "name": "atlan_list_schemas_tool",
+        "description": "List all schema assets",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "from_": {"type": "integer", "default": 0},
+                "size": {"type": "integer", "default": 25}
+            },
+            "required": []
+        }
+    },
+    "atlan_list_dashboards_tool": {
+        "name": "atlan_list_dashboards_tool",
+        "description": "List all BI dashboard assets (Tableau, Looker, PowerBI, etc.)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "from_": {"type": "integer", "default": 0},
+                "size": {"type": "integer", "default": 25}
+            },
+            "required": []
+        }
+    },
+    "atlan_list_dbt_models_tool": {
+        "name": "atlan_list_dbt_models_tool",
+        "description": "List dbt model assets",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "from_": {"type": "integer", "default": 0},
+                "size": {"type": "integer", "default": 25}
+            },
+            "required": []
+        }
+    },
+    "atlan_list_airflow_dags_tool": {
+        "name": "atlan_list_airflow_dags_tool",
+        "description": "List Airflow DAG assets",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "from_": {"type": "integer", "default": 0},
+                "size": {"type": "integer", "default": 25}
+            },
+            "required": []
+        }
+    },
+    "atlan_list_kafka_topics_tool": {
+        "name": "atlan_list_kafka_topics_tool",
+        "description": "List Kafka topic assets",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "from_": {"type": "integer", "default": 0},
+                "size": {"type": "integer", "default": 25}
+            },
+            "required": []
+        }
+    },
+    "atlan_list_s3_objects_tool": {
+        "name": "atlan_list_s3_objects_tool",
+        "description": "List S3 and cloud storage assets",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "from_": {"type": "integer", "default": 0},
+                "size": {"type": "integer", "default": 25}
+            },
+            "required": []
+        }
+    },
+    "atlan_update_custom_metadata_tool": {
+        "name": "atlan_update_custom_metadata_tool",
+        "description": "Update custom metadata on an asset",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "guid": {"type": "string", "description": "Asset GUID"},
+                "custom_metadata_name": {"type": "string", "description": "Custom metadata type name"},
+                "attributes": {"type": "object", "description": "Attribute values to set"}
+            },
+            "required": ["guid", "custom_metadata_name", "attributes"]
+        }
+    },
+    "atlan_get_custom_metadata_types_tool": {
+        "name": "atlan_get_custom_metadata_types_tool",
+        "description": "Get all custom metadata type definitions",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    "atlan_certify_asset_tool": {
+        "name": "atlan_certify_asset_tool",
+        "description": "Certify an asset with a status",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "guid": {"type": "string", "description": "Asset GUID"},
+                "status": {"type": "string", "description": "VERIFIED, DEPRECATED, or DRAFT", "default": "VERIFIED"},
+                "message": {"type": "string", "description": "Certification message"}
+            },
+            "required": ["guid"]
+        }
+    },
+    "atlan_bulk_update_assets_tool": {
+        "name": "atlan_bulk_update_assets_tool",
+        "description": "Update multiple assets in a single request",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "entities": {"type": "array", "items": {"type": "object"}, "description": "Array of entity objects to update"}
+            },
+            "required": ["entities"]
+        }
+    }
+}
+
+# Dispatch table from tool name to implementation
+TOOL_FUNCTIONS: Dict[str, Callable[..., Awaitable[str]]] = {
+    # Looker tools
+    "looker_get_models_tool": looker_get_models_tool,
+    "looker_get_explores_tool": looker_get_explores_tool,
+    "looker_get_dimensions_tool": looker_get_dimensions_tool,
+    "looker_get_measures_tool": looker_get_measures_tool,
+    "looker_get_filters_tool": looker_get_filters_tool,
+    "looker_query_tool": looker_query_tool,
+    "looker_query_sql_tool": looker_query_sql_tool,
+    "looker_get_looks_tool": looker_get_looks_tool,
+    "looker_run_look_tool": looker_run_look_tool,
+    "looker_query_url_tool": looker_query_url_tool,
+    # Redash tools
+    "redash_list_queries_tool": redash_list_queries_tool,
+    "redash_get_query_tool": redash_get_query_tool,
+    "redash_execute_query_tool": redash_execute_query_tool,
+    "redash_get_query_job_status_tool": redash_get_query_job_status_tool,
+    "redash_get_query_results_tool": redash_get_query_results_tool,
+    "redash_refresh_query_tool": redash_refresh_query_tool,
+    "redash_list_dashboards_tool": redash_list_dashboards_tool,
+    "redash_get_dashboard_tool": redash_get_dashboard_tool,
+    "redash_list_data_sources_tool": redash_list_data_sources_tool,
+    "redash_create_query_tool": redash_create_query_tool,
+    "redash_create_visualization_tool": redash_create_visualization_tool,
+    "redash_create_dashboard_tool": redash_create_dashboard_tool,
+    "redash_add_widget_tool": redash_add_widget_tool,
+    "redash_publish_dashboard_tool": redash_publish_dashboard_tool,
+    # DataZone tools
+    "datazone_list_domains_tool": datazone_list_domains_tool,
+    "datazone_get_domain_tool": datazone_get_domain_tool,
+    "datazone_list_projects_tool": datazone_list_projects_tool,
+    "datazone_get_project_tool": datazone_get_project_tool,
+    "datazone_search_listings_tool": datazone_search_listings_tool,
+    "datazone_get_listing_tool": datazone_get_listing_tool,
+    "datazone_list_environments_tool": datazone_list_environments_tool,
+    "datazone_get_environment_tool": datazone_get_environment_tool,
+    "datazone_get_asset_tool": datazone_get_asset_tool,
+    "datazone_list_asset_revisions_tool": datazone_list_asset_revisions_tool,
+    "datazone_get_glossary_tool": datazone_get_glossary_tool,
+    "datazone_get_glossary_term_tool": datazone_get_glossary_term_tool,
+    "datazone_create_form_type_tool": datazone_create_form_type_tool,
+    "datazone_get_form_type_tool": datazone_get_form_type_tool,
+    "datazone_create_asset_type_tool": datazone_create_asset_type_tool,
+    "datazone_get_asset_type_tool": datazone_get_asset_type_tool,
+    "datazone_list_asset_types_tool": datazone_list_asset_types_tool,
+    # S3 tools
+    "s3_list_buckets_tool": s3_list_buckets_tool,
+    "s3_list_objects_tool": s3_list_objects_tool,
+    "s3_get_object_tool": s3_get_object_tool,
+    "s3_get_object_metadata_tool": s3_get_object_metadata_tool,
+    "s3_create_bucket_tool": s3_create_bucket_tool,
+    "s3_put_object_tool": s3_put_object_tool,
+    "s3_generate_presigned_url_tool": s3_generate_presigned_url_tool,
+    "s3_generate_presigned_post_tool": s3_generate_presigned_post_tool,
+    # DBT tools
+    "dbt_list_projects_tool": dbt_list_projects_tool,
+    "dbt_list_environments_tool": dbt_list_environments_tool,
+    "dbt_list_jobs_tool": dbt_list_jobs_tool,
+    "dbt_trigger_job_run_tool": dbt_trigger_job_run_tool,
+    "dbt_get_job_run_tool": dbt_get_job_run_tool,
+    "dbt_list_job_runs_tool": dbt_list_job_runs_tool,
+    "dbt_cancel_job_run_tool": dbt_cancel_job_run_tool,
+    "dbt_list_models_tool": dbt_list_models_tool,
+    "dbt_get_model_details_tool": dbt_get_model_details_tool,
+    "dbt_list_metrics_tool": dbt_list_metrics_tool,
+    "dbt_query_metrics_tool": dbt_query_metrics_tool,
+    "dbt_execute_sql_tool": dbt_execute_sql_tool,
+    # DataHub tools
+    "datahub_search_entities_tool": datahub_search_entities_tool,
+    "datahub_get_entity_tool": datahub_get_entity_tool,
+    "datahub_list_datasets_tool": datahub_list_datasets_tool,
+    "datahub_list_dashboards_tool": datahub_list_dashboards_tool,
+    "datahub_list_charts_tool": datahub_list_charts_tool,
+    "datahub_get_lineage_tool": datahub_get_lineage_tool,
+    "datahub_list_platforms_tool": datahub_list_platforms_tool,
+    "datahub_list_tags_tool": datahub_list_tags_tool,
+    # Atlan tools
+    "atlan_search_assets_tool": atlan_search_assets_tool,
+    "atlan_search_by_type_tool": atlan_search_by_type_tool,
+    "atlan_get_asset_tool": atlan_get_asset_tool,
+    "atlan_get_asset_by_qualified_name_tool": atlan_get_asset_by_qualified_name_tool,
+    "atlan_create_asset_tool": atlan_create_asset_tool,
+    "atlan_update_asset_tool": atlan_update_asset_tool,
+    "atlan_delete_asset_tool": atlan_delete_asset_tool,
+    "atlan_update_asset_description_tool": atlan_update_asset_description_tool,
+    "atlan_update_asset_owners_tool": atlan_update_asset_owners_tool,
+    "atlan_get_lineage_tool": atlan_get_lineage_tool,
+    "atlan_list_glossaries_tool": atlan_list_glossaries_tool,
+    "atlan_get_glossary_tool": atlan_get_glossary_tool,
+    "atlan_list_glossary_terms_tool": atlan_list_glossary_terms_tool,
+    "atlan_get_glossary_term_tool": atlan_get_glossary_term_tool,
+    "atlan_create_glossary_term_tool": atlan_create_glossary_term_tool,
+    "atlan_list_glossary_categories_tool": atlan_list_glossary_categories_tool,
+    "atlan_link_term_to_asset_tool": atlan_link_term_to_asset_tool,
+    "atlan_list_classifications_tool": atlan_list_classifications_tool,
+    "atlan_add_classification_tool": atlan_add_classification_tool,
+    "atlan_remove_classification_tool": atlan_remove_classification_tool,
+    "atlan_list_tables_tool": atlan_list_tables_tool,
+    "atlan_list_columns_tool": atlan_list_columns_tool,
+    "atlan_list_databases_tool": atlan_list_databases_tool,
+    "atlan_list_schemas_tool": atlan_list_schemas_tool,
+    "atlan_list_dashboards_tool": atlan_list_dashboards_tool,
+    "atlan_list_dbt_models_tool": atlan_list_dbt_models_tool,
+    "atlan_list_airflow_dags_tool": atlan_list_airflow_dags_tool,
+    "atlan_list_kafka_topics_tool": atlan_list_kafka_topics_tool,
+    "atlan_list_s3_objects_tool": atlan_list_s3_objects_tool,
+    "atlan_update_custom_metadata_tool": atlan_update_custom_metadata_tool,
+    "atlan_get_custom_metadata_types_tool": atlan_get_custom_metadata_types_tool,
+    "atlan_certify_asset_tool": atlan_certify_asset_tool,
+    "atlan_bulk_update_assets_tool": atlan_bulk_update_assets_tool,
+    # Airflow tools
+    "airflow_list_dags_tool": airflow_list_dags_tool,
+    "airflow_get_dag_tool": airflow_get_dag_tool,
+    "airflow_trigger_dag_tool": airflow_trigger_dag_tool,
+    "airflow_get_dag_runs_tool": airflow_get_dag_runs_tool,
+    "airflow_get_task_instances_tool": airflow_get_task_instances_tool,
+    "airflow_get_task_logs_tool": airflow_get_task_logs_tool,
+    "airflow_pause_dag_tool": airflow_pause_dag_tool,
+    "airflow_unpause_dag_tool": airflow_unpause_dag_tool,
+    # OpenAPI tools
+    "openapi_get_spec_tool": openapi_get_spec_tool,
+    "openapi_list_endpoints_tool": openapi_list_endpoints_tool,
+    "openapi_call_endpoint_tool": openapi_call_endpoint_tool,
+    "openapi_get_endpoint_schema_tool": openapi_get_endpoint_schema_tool,
+    # Jira tools
+    "jira_search_issues_tool": jira_search_issues_tool,
+    "jira_get_issue_tool": jira_get_issue_tool,
+    "jira_create_issue_tool": jira_create_issue_tool,
+    "jira_update_issue_tool": jira_update_issue_tool,
+    "jira_transition_issue_tool": jira_transition_issue_tool,
+    "jira_get_transitions_tool": jira_get_transitions_tool,
+    "jira_assign_issue_tool": jira_assign_issue_tool,
+    "jira_list_projects_tool": jira_list_projects_tool,
+    "jira_get_project_tool": jira_get_project_tool,
+    "jira_get_issue_types_tool": jira_get_issue_types_tool,
+    "jira_get_fields_tool": jira_get_fields_tool,
+    "jira_add_comment_tool": jira_add_comment_tool,
+    "jira_get_comments_tool": jira_get_comments_tool,
+    "jira_upload_attachment_tool": jira_upload_attachment_tool,
+    "jira_list_boards_tool": jira_list_boards_tool,
+    "jira_list_sprints_tool": jira_list_sprints_tool,
+    "jira_get_sprint_tool": jira_get_sprint_tool,
+    "jira_get_backlog_tool": jira_get_backlog_tool,
+    # Azure Blob Storage tools
+    "azure_blob_list_containers_tool": azure_blob_list_containers_tool,
+    "azure_blob_list_blobs_tool": azure_blob_list_blobs_tool,
+    "azure_blob_get_blob_tool": azure_blob_get_blob_tool,
+    "azure_blob_get_blob_metadata_tool": azure_blob_get_blob_metadata_tool,
+    "azure_blob_upload_blob_tool": azure_blob_upload_blob_tool,
+    "azure_blob_delete_blob_tool": azure_blob_delete_blob_tool,
+    "azure_blob_generate_sas_url_tool": azure_blob_generate_sas_url_tool,
+    "azure_blob_get_container_properties_tool": azure_blob_get_container_properties_tool,
+    # Azure Data Factory tools
+    "azure_adf_list_pipelines_tool": azure_adf_list_pipelines_tool,
+    "azure_adf_get_pipeline_tool": azure_adf_get_pipeline_tool,
+    "azure_adf_run_pipeline_tool": azure_adf_run_pipeline_tool,
+    "azure_adf_get_pipeline_run_tool": azure_adf_get_pipeline_run_tool,
+    "azure_adf_list_pipeline_runs_tool": azure_adf_list_pipeline_runs_tool,
+    "azure_adf_list_datasets_tool": azure_adf_list_datasets_tool,
+    "azure_adf_get_dataset_tool": azure_adf_get_dataset_tool,
+    "azure_adf_list_triggers_tool": azure_adf_list_triggers_tool,
+    "azure_adf_get_trigger_tool": azure_adf_get_trigger_tool,
+    "azure_adf_list_linked_services_tool": azure_adf_list_linked_services_tool,
+    "azure_adf_get_linked_service_tool": azure_adf_get_linked_service_tool,
+    "azure_adf_list_data_flows_tool": azure_adf_list_data_flows_tool,
+    "azure_adf_get_data_flow_tool": azure_adf_get_data_flow_tool,
+    "azure_adf_list_integration_runtimes_tool": azure_adf_list_integration_runtimes_tool,
+    "azure_adf_get_integration_runtime_tool": azure_adf_get_integration_runtime_tool,
+    "azure_adf_get_factory_info_tool": azure_adf_get_factory_info_tool
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _tools_for_providers(providers: Tuple[str, ...]) -> Tuple[Tuple[str, ...], FrozenSet[str], Tuple[Dict[str, Any], ...]]:
+    """
+    Resolve the tools available for a set of supported providers.
+    
+    Memoized per provider tuple, so tools/list and tools/call only do lookups.
+    
+    Returns:
+        Tuple of (tool names in display order, tool name set, tool schemas)
+    """
+    tool_names = tuple(name for provider in providers for name in PROVIDER_TOOLS.get(provider, []))
+    return tool_names, frozenset(tool_names), tuple(TOOL_SCHEMAS[name] for name in tool_names if name in TOOL_SCHEMAS)
+
+
 @mcp.custom_route("/mcp/{project_id}", methods=["GET", "POST"])
 async def project_mcp_endpoint(request: Request) -> JSONResponse:
     """
@@ -5872,7 +7989,7 @@ async def project_mcp_endpoint(request: Request) -> JSONResponse:
         
         # Get supported providers and available tools for the project
         supported_providers = await get_supported_tool_providers(project_id)
-        available_tool_names = await get_available_tools_for_project(project_id)
+        available_tool_names, available_tool_set, available_tool_schemas = _tools_for_providers(tuple(supported_providers))
         
         # Handle MCP protocol requests
         if request.method == "POST":
@@ -5903,1911 +8020,12 @@ async def project_mcp_endpoint(request: Request) -> JSONResponse:
                     return JSONResponse(content={}, status_code=200)
                 
                 elif method == "tools/list":
-                    # Return only tools available for this project
-                    tools = []
-                    
-                    # Define full tool schemas for supported tools
-                    all_tool_schemas = {
-                        # Looker tools
-                        "looker_get_models_tool": {
-                            "name": "looker_get_models_tool",
-                            "description": "Get all Looker models available in the instance",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        "looker_get_explores_tool": {
-                            "name": "looker_get_explores_tool",
-                            "description": "Get all explores for a specific Looker model",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "model_name": {"type": "string", "description": "Name of the Looker model"}
-                                },
-                                "required": ["model_name"]
-                            }
-                        },
-                        "looker_get_dimensions_tool": {
-                            "name": "looker_get_dimensions_tool",
-                            "description": "Get all dimensions for a specific explore",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "model_name": {"type": "string", "description": "Name of the Looker model"},
-                                    "explore_name": {"type": "string", "description": "Name of the explore"}
-                                },
-                                "required": ["model_name", "explore_name"]
-                            }
-                        },
-                        "looker_get_measures_tool": {
-                            "name": "looker_get_measures_tool",
-                            "description": "Get all measures for a specific explore",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "model_name": {"type": "string", "description": "Name of the Looker model"},
-                                    "explore_name": {"type": "string", "description": "Name of the explore"}
-                                },
-                                "required": ["model_name", "explore_name"]
-                            }
-                        },
-                        "looker_get_filters_tool": {
-                            "name": "looker_get_filters_tool",
-                            "description": "Get all filters for a specific explore",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "model_name": {"type": "string", "description": "Name of the Looker model"},
-                                    "explore_name": {"type": "string", "description": "Name of the explore"}
-                                },
-                                "required": ["model_name", "explore_name"]
-                            }
-                        },
-                        "looker_query_tool": {
-                            "name": "looker_query_tool",
-                            "description": "Execute a Looker query with dimensions, measures, and filters",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "model_name": {"type": "string", "description": "Name of the Looker model"},
-                                    "explore_name": {"type": "string", "description": "Name of the explore"},
-                                    "dimensions": {"type": "array", "items": {"type": "string"}, "description": "List of dimensions"},
-                                    "measures": {"type": "array", "items": {"type": "string"}, "description": "List of measures"},
-                                    "filters": {"type": "object", "description": "Filter conditions (optional)"},
-                                    "limit": {"type": "integer", "description": "Result limit", "default": 100}
-                                },
-                                "required": ["model_name", "explore_name", "dimensions", "measures"]
-                            }
-                        },
-                        "looker_query_sql_tool": {
-                            "name": "looker_query_sql_tool",
-                            "description": "Execute raw SQL against Looker's database connection",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "sql": {"type": "string", "description": "SQL query to execute"}
-                                },
-                                "required": ["sql"]
-                            }
-                        },
-                        "looker_get_looks_tool": {
-                            "name": "looker_get_looks_tool",
-                            "description": "Get all Looks (saved queries) in Looker",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "folder_id": {"type": "string", "description": "Optional folder ID to filter Looks"}
-                                },
-                                "required": []
-                            }
-                        },
-                        "looker_run_look_tool": {
-                            "name": "looker_run_look_tool",
-                            "description": "Run a specific Look and get its results",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "look_id": {"type": "string", "description": "Look identifier"},
-                                    "limit": {"type": "integer", "description": "Result limit", "default": 100}
-                                },
-                                "required": ["look_id"]
-                            }
-                        },
-                        "looker_query_url_tool": {
-                            "name": "looker_query_url_tool",
-                            "description": "Generate a Looker query URL",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "model_name": {"type": "string", "description": "Name of the Looker model"},
-                                    "explore_name": {"type": "string", "description": "Name of the explore"},
-                                    "dimensions": {"type": "array", "items": {"type": "string"}, "description": "List of dimensions"},
-                                    "measures": {"type": "array", "items": {"type": "string"}, "description": "List of measures"},
-                                    "filters": {"type": "object", "description": "Filter conditions (optional)"}
-                                },
-                                "required": ["model_name", "explore_name", "dimensions", "measures"]
-                            }
-                        },
-                        
-                        # Redash tools
-                        "redash_list_queries_tool": {
-                            "name": "redash_list_queries_tool",
-                            "description": "List all queries in Redash",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "page": {"type": "integer", "description": "Page number", "default": 1},
-                                    "page_size": {"type": "integer", "description": "Page size", "default": 25}
-                                },
-                                "required": []
-                            }
-                        },
-                        "redash_get_query_tool": {
-                            "name": "redash_get_query_tool",
-                            "description": "Get details of a specific Redash query",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query_id": {"type": "string", "description": "Query identifier"}
-                                },
-                                "required": ["query_id"]
-                            }
-                        },
-                        "redash_execute_query_tool": {
-                            "name": "redash_execute_query_tool",
-                            "description": "Execute a Redash query and get its results",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query_id": {"type": "string", "description": "Query identifier"},
-                                    "parameters": {"type": "object", "description": "Query parameters (optional)"}
-                                },
-                                "required": ["query_id"]
-                            }
-                        },
-                        "redash_get_query_job_status_tool": {
-                            "name": "redash_get_query_job_status_tool",
-                            "description": "Get the status of a query execution job",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "job_id": {"type": "string", "description": "Job identifier"}
-                                },
-                                "required": ["job_id"]
-                            }
-                        },
-                        "redash_get_query_results_tool": {
-                            "name": "redash_get_query_results_tool",
-                            "description": "Get the results of a completed query execution",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query_result_id": {"type": "string", "description": "Query result identifier"}
-                                },
-                                "required": ["query_result_id"]
-                            }
-                        },
-                        "redash_refresh_query_tool": {
-                            "name": "redash_refresh_query_tool",
-                            "description": "Refresh a Redash query (execute with fresh data)",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query_id": {"type": "string", "description": "Query identifier"}
-                                },
-                                "required": ["query_id"]
-                            }
-                        },
-                        "redash_list_dashboards_tool": {
-                            "name": "redash_list_dashboards_tool",
-                            "description": "List all dashboards in Redash",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "page": {"type": "integer", "description": "Page number", "default": 1},
-                                    "page_size": {"type": "integer", "description": "Page size", "default": 25}
-                                },
-                                "required": []
-                            }
-                        },
-                        "redash_get_dashboard_tool": {
-                            "name": "redash_get_dashboard_tool",
-                            "description": "Get details of a specific Redash dashboard",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "dashboard_id": {"type": "string", "description": "Dashboard identifier"}
-                                },
-                                "required": ["dashboard_id"]
-                            }
-                        },
-                        "redash_list_data_sources_tool": {
-                            "name": "redash_list_data_sources_tool",
-                            "description": "List all data sources in Redash",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        "redash_create_query_tool": {
-                            "name": "redash_create_query_tool",
-                            "description": "Create a new query in Redash",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "data_source_id": {"type": "string", "description": "Data source identifier"},
-                                    "name": {"type": "string", "description": "Query name"},
-                                    "query": {"type": "string", "description": "SQL query text"},
-                                    "description": {"type": "string", "description": "Query description (optional)", "default": ""},
-                                    "schedule": {"type": "object", "description": "Schedule configuration (optional)"}
-                                },
-                                "required": ["data_source_id", "name", "query"]
-                            }
-                        },
-                        "redash_create_visualization_tool": {
-                            "name": "redash_create_visualization_tool",
-                            "description": "Create a new visualization for a query",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query_id": {"type": "string", "description": "Query identifier"},
-                                    "viz_type": {"type": "string", "description": "Visualization type (e.g., 'TABLE', 'CHART', 'COUNTER')"},
-                                    "name": {"type": "string", "description": "Visualization name"},
-                                    "options": {"type": "object", "description": "Visualization options (optional)"},
-                                    "description": {"type": "string", "description": "Visualization description (optional)", "default": ""}
-                                },
-                                "required": ["query_id", "viz_type", "name"]
-                            }
-                        },
-                        "redash_create_dashboard_tool": {
-                            "name": "redash_create_dashboard_tool",
-                            "description": "Create a new dashboard in Redash",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Dashboard name"}
-                                },
-                                "required": ["name"]
-                            }
-                        },
-                        "redash_add_widget_tool": {
-                            "name": "redash_add_widget_tool",
-                            "description": "Add a widget to a dashboard",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "dashboard_id": {"type": "string", "description": "Dashboard identifier"},
-                                    "visualization_id": {"type": "string", "description": "Visualization identifier (optional)"},
-                                    "text": {"type": "string", "description": "Text widget content (optional)"},
-                                    "width": {"type": "integer", "description": "Widget width", "default": 1},
-                                    "options": {"type": "object", "description": "Widget options (optional)"}
-                                },
-                                "required": ["dashboard_id"]
-                            }
-                        },
-                        "redash_publish_dashboard_tool": {
-                            "name": "redash_publish_dashboard_tool",
-                            "description": "Publish a Redash dashboard to make it accessible",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "dashboard_id": {"type": "string", "description": "Dashboard identifier"}
-                                },
-                                "required": ["dashboard_id"]
-                            }
-                        },
-
-                        # DataZone tools
-                        "datazone_list_domains_tool": {
-                            "name": "datazone_list_domains_tool",
-                            "description": "List all AWS DataZone domains",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "max_results": {"type": "integer", "description": "Maximum number of results", "default": 25}
-                                },
-                                "required": []
-                            }
-                        },
-                        "datazone_get_domain_tool": {
-                            "name": "datazone_get_domain_tool",
-                            "description": "Get details of a specific DataZone domain",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "domain_id": {"type": "string", "description": "Domain identifier"}
-                                },
-                                "required": ["domain_id"]
-                            }
-                        },
-                        "datazone_list_projects_tool": {
-                            "name": "datazone_list_projects_tool",
-                            "description": "List all projects in a DataZone domain",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "domain_id": {"type": "string", "description": "DataZone domain identifier"},
-                                    "max_results": {"type": "integer", "description": "Maximum number of results", "default": 25}
-                                },
-                                "required": ["domain_id"]
-                            }
-                        },
-                        "datazone_get_project_tool": {
-                            "name": "datazone_get_project_tool",
-                            "description": "Get details of a specific DataZone project",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "domain_id": {"type": "string", "description": "DataZone domain identifier"},
-                                    "datazone_project_id": {"type": "string", "description": "DataZone project identifier"}
-                                },
-                                "required": ["domain_id", "datazone_project_id"]
-                            }
-                        },
-                        "datazone_search_listings_tool": {
-                            "name": "datazone_search_listings_tool",
-                            "description": "Search for data assets in DataZone catalog",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "domain_id": {"type": "string", "description": "DataZone domain identifier"},
-                                    "search_text": {"type": "string", "description": "Text to search for", "default": ""},
-                                    "max_results": {"type": "integer", "description": "Maximum number of results", "default": 25}
-                                },
-                                "required": ["domain_id"]
-                            }
-                        },
-                        "datazone_get_listing_tool": {
-                            "name": "datazone_get_listing_tool",
-                            "description": "Get details of a specific data listing",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "domain_id": {"type": "string", "description": "DataZone domain identifier"},
-                                    "listing_id": {"type": "string", "description": "Listing identifier"}
-                                },
-                                "required": ["domain_id", "listing_id"]
-                            }
-                        },
-                        "datazone_list_environments_tool": {
-                            "name": "datazone_list_environments_tool",
-                            "description": "List environments in a DataZone project",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "domain_id": {"type": "string", "description": "DataZone domain identifier"},
-                                    "datazone_project_id": {"type": "string", "description": "DataZone project identifier"},
-                                    "max_results": {"type": "integer", "description": "Maximum number of results", "default": 25}
-                                },
-                                "required": ["domain_id", "datazone_project_id"]
-                            }
-                        },
-                        "datazone_get_environment_tool": {
-                            "name": "datazone_get_environment_tool",
-                            "description": "Get details of a specific environment",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "domain_id": {"type": "string", "description": "DataZone domain identifier"},
-                                    "environment_id": {"type": "string", "description": "Environment identifier"}
-                                },
-                                "required": ["domain_id", "environment_id"]
-                            }
-                        },
-                        "datazone_get_asset_tool": {
-                            "name": "datazone_get_asset_tool",
-                            "description": "Get details of a specific data asset",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "domain_id": {"type": "string", "description": "DataZone domain identifier"},
-                                    "asset_id": {"type": "string", "description": "Asset identifier"}
-                                },
-                                "required": ["domain_id", "asset_id"]
-                            }
-                        },
-                        "datazone_list_asset_revisions_tool": {
-                            "name": "datazone_list_asset_revisions_tool",
-                            "description": "List revisions of a data asset",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "domain_id": {"type": "string", "description": "DataZone domain identifier"},
-                                    "asset_id": {"type": "string", "description": "Asset identifier"},
-                                    "max_results": {"type": "integer", "description": "Maximum number of results", "default": 50}
-                                },
-                                "required": ["domain_id", "asset_id"]
-                            }
-                        },
-                        "datazone_get_glossary_tool": {
-                            "name": "datazone_get_glossary_tool",
-                            "description": "Get details of a business glossary",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "domain_id": {"type": "string", "description": "DataZone domain identifier"},
-                                    "glossary_id": {"type": "string", "description": "Glossary identifier"}
-                                },
-                                "required": ["domain_id", "glossary_id"]
-                            }
-                        },
-                        "datazone_get_glossary_term_tool": {
-                            "name": "datazone_get_glossary_term_tool",
-                            "description": "Get details of a glossary term",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "domain_id": {"type": "string", "description": "DataZone domain identifier"},
-                                    "term_id": {"type": "string", "description": "Glossary term identifier"}
-                                },
-                                "required": ["domain_id", "term_id"]
-                            }
-                        },
-                        "datazone_create_form_type_tool": {
-                            "name": "datazone_create_form_type_tool",
-                            "description": "Create a new form type in DataZone",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "domain_id": {"type": "string", "description": "DataZone domain identifier"},
-                                    "name": {"type": "string", "description": "Name of the form type"},
-                                    "model": {"type": "string", "description": "JSON string representing the form model structure"},
-                                    "owning_project_id": {"type": "string", "description": "DataZone project ID that will own this form type"},
-                                    "description": {"type": "string", "description": "Description of the form type", "default": ""},
-                                    "status": {"type": "string", "description": "Status of the form type", "default": "ENABLED"}
-                                },
-                                "required": ["domain_id", "name", "model", "owning_project_id"]
-                            }
-                        },
-                        "datazone_get_form_type_tool": {
-                            "name": "datazone_get_form_type_tool",
-                            "description": "Get details of a specific form type",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "domain_id": {"type": "string", "description": "DataZone domain identifier"},
-                                    "form_type_id": {"type": "string", "description": "Form type identifier"},
-                                    "revision": {"type": "string", "description": "Specific revision to retrieve", "default": ""}
-                                },
-                                "required": ["domain_id", "form_type_id"]
-                            }
-                        },
-                        "datazone_create_asset_type_tool": {
-                            "name": "datazone_create_asset_type_tool",
-                            "description": "Create a new asset type in DataZone",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "domain_id": {"type": "string", "description": "DataZone domain identifier"},
-                                    "name": {"type": "string", "description": "Name of the asset type"},
-                                    "owning_project_id": {"type": "string", "description": "DataZone project ID that will own this asset type"},
-                                    "description": {"type": "string", "description": "Description of the asset type", "default": ""},
-                                    "forms_input": {"type": "string", "description": "JSON string representing forms configuration", "default": ""}
-                                },
-                                "required": ["domain_id", "name", "owning_project_id"]
-                            }
-                        },
-                        "datazone_get_asset_type_tool": {
-                            "name": "datazone_get_asset_type_tool",
-                            "description": "Get details of a specific asset type",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "domain_id": {"type": "string", "description": "DataZone domain identifier"},
-                                    "asset_type_id": {"type": "string", "description": "Asset type identifier"},
-                                    "revision": {"type": "string", "description": "Specific revision to retrieve", "default": ""}
-                                },
-                                "required": ["domain_id", "asset_type_id"]
-                            }
-                        },
-                        "datazone_list_asset_types_tool": {
-                            "name": "datazone_list_asset_types_tool",
-                            "description": "List asset types in a DataZone domain",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "domain_id": {"type": "string", "description": "DataZone domain identifier"},
-                                    "owning_project_id": {"type": "string", "description": "Filter by owning project ID", "default": ""},
-                                    "max_results": {"type": "integer", "description": "Maximum number of results", "default": 25}
-                                },
-                                "required": ["domain_id"]
-                            }
-                        },
-
-                        # S3 tools
-                        "s3_list_buckets_tool": {
-                            "name": "s3_list_buckets_tool",
-                            "description": "List all S3 buckets",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        "s3_list_objects_tool": {
-                            "name": "s3_list_objects_tool",
-                            "description": "List objects in an S3 bucket",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "bucket_name": {"type": "string", "description": "Name of the S3 bucket"},
-                                    "prefix": {"type": "string", "description": "Prefix to filter objects", "default": ""},
-                                    "max_keys": {"type": "integer", "description": "Maximum number of objects to return", "default": 1000},
-                                    "delimiter": {"type": "string", "description": "Delimiter for grouping keys (e.g., '/' for folder structure)", "default": ""}
-                                },
-                                "required": ["bucket_name"]
-                            }
-                        },
-                        "s3_get_object_tool": {
-                            "name": "s3_get_object_tool",
-                            "description": "Get an object from S3 with its content and metadata",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "bucket_name": {"type": "string", "description": "Name of the S3 bucket"},
-                                    "object_key": {"type": "string", "description": "Key of the object to retrieve"}
-                                },
-                                "required": ["bucket_name", "object_key"]
-                            }
-                        },
-                        "s3_get_object_metadata_tool": {
-                            "name": "s3_get_object_metadata_tool",
-                            "description": "Get metadata for an S3 object without downloading the content",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "bucket_name": {"type": "string", "description": "Name of the S3 bucket"},
-                                    "object_key": {"type": "string", "description": "Key of the object"}
-                                },
-                                "required": ["bucket_name", "object_key"]
-                            }
-                        },
-                        "s3_create_bucket_tool": {
-                            "name": "s3_create_bucket_tool",
-                            "description": "Create a new S3 bucket",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "bucket_name": {"type": "string", "description": "Name of the bucket to create"},
-                                    "region": {"type": "string", "description": "AWS region for the bucket (optional)", "default": ""}
-                                },
-                                "required": ["bucket_name"]
-                            }
-                        },
-                        "s3_put_object_tool": {
-                            "name": "s3_put_object_tool",
-                            "description": "Upload an object to S3",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "bucket_name": {"type": "string", "description": "Name of the S3 bucket"},
-                                    "object_key": {"type": "string", "description": "Key for the object"},
-                                    "content": {"type": "string", "description": "Content to upload (text or base64 encoded)"},
-                                    "content_type": {"type": "string", "description": "MIME type of the content", "default": ""},
-                                    "storage_class": {"type": "string", "description": "Storage class (STANDARD, INTELLIGENT_TIERING, etc.)", "default": "STANDARD"}
-                                },
-                                "required": ["bucket_name", "object_key", "content"]
-                            }
-                        },
-                        "s3_generate_presigned_url_tool": {
-                            "name": "s3_generate_presigned_url_tool",
-                            "description": "Generate a presigned URL for S3 object operations (get, put, delete)",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "bucket_name": {"type": "string", "description": "Name of the S3 bucket"},
-                                    "object_key": {"type": "string", "description": "Key of the object"},
-                                    "operation": {"type": "string", "description": "S3 operation (get_object, put_object, delete_object)", "default": "get_object"},
-                                    "expiration": {"type": "integer", "description": "URL expiration time in seconds", "default": 3600},
-                                    "http_method": {"type": "string", "description": "HTTP method override (GET, PUT, DELETE)", "default": ""}
-                                },
-                                "required": ["bucket_name", "object_key"]
-                            }
-                        },
-                        "s3_generate_presigned_post_tool": {
-                            "name": "s3_generate_presigned_post_tool",
-                            "description": "Generate presigned POST data for direct browser uploads to S3",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "bucket_name": {"type": "string", "description": "Name of the S3 bucket"},
-                                    "object_key": {"type": "string", "description": "Key for the object to be uploaded"},
-                                    "expiration": {"type": "integer", "description": "POST policy expiration time in seconds", "default": 3600}
-                                },
-                                "required": ["bucket_name", "object_key"]
-                            }
-                        },
-
-                        # DBT Cloud tools
-                        "dbt_list_projects_tool": {
-                            "name": "dbt_list_projects_tool",
-                            "description": "List all dbt Cloud projects in the account",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        "dbt_list_environments_tool": {
-                            "name": "dbt_list_environments_tool",
-                            "description": "List all environments in a dbt Cloud project",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "dbt_project_id": {"type": "string", "description": "DBT project identifier (optional)"}
-                                },
-                                "required": []
-                            }
-                        },
-                        "dbt_list_jobs_tool": {
-                            "name": "dbt_list_jobs_tool",
-                            "description": "List all jobs in a dbt Cloud project",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "dbt_project_id": {"type": "string", "description": "DBT project identifier (optional)"}
-                                },
-                                "required": []
-                            }
-                        },
-                        "dbt_trigger_job_run_tool": {
-                            "name": "dbt_trigger_job_run_tool",
-                            "description": "Trigger a dbt Cloud job run with optional overrides",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "job_id": {"type": "string", "description": "Job identifier"},
-                                    "cause": {"type": "string", "description": "Reason for triggering the job", "default": "API trigger"},
-                                    "git_sha": {"type": "string", "description": "Git SHA to run against (optional)"},
-                                    "schema_override": {"type": "string", "description": "Schema override (optional)"},
-                                    "dbt_version_override": {"type": "string", "description": "dbt version override (optional)"},
-                                    "target_name_override": {"type": "string", "description": "Target name override (optional)"},
-                                    "generate_docs_override": {"type": "boolean", "description": "Generate docs override (optional)"},
-                                    "timeout_seconds_override": {"type": "integer", "description": "Timeout override in seconds (optional)"},
-                                    "steps_override": {"type": "array", "items": {"type": "string"}, "description": "List of steps to run (optional)"}
-                                },
-                                "required": ["job_id"]
-                            }
-                        },
-                        "dbt_get_job_run_tool": {
-                            "name": "dbt_get_job_run_tool",
-                            "description": "Get details of a specific dbt Cloud job run",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "run_id": {"type": "string", "description": "Run identifier"},
-                                    "include_related": {"type": "array", "items": {"type": "string"}, "description": "Related data to include (optional)"}
-                                },
-                                "required": ["run_id"]
-                            }
-                        },
-                        "dbt_list_job_runs_tool": {
-                            "name": "dbt_list_job_runs_tool",
-                            "description": "List job runs with optional filters",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "job_id": {"type": "string", "description": "Job identifier (optional)"},
-                                    "status": {"type": "string", "description": "Run status filter (optional)"},
-                                    "limit": {"type": "integer", "description": "Result limit", "default": 50}
-                                },
-                                "required": []
-                            }
-                        },
-                        "dbt_cancel_job_run_tool": {
-                            "name": "dbt_cancel_job_run_tool",
-                            "description": "Cancel a running dbt Cloud job",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "run_id": {"type": "string", "description": "Run identifier"}
-                                },
-                                "required": ["run_id"]
-                            }
-                        },
-                        "dbt_list_models_tool": {
-                            "name": "dbt_list_models_tool",
-                            "description": "List all models in a dbt project using Discovery API",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "environment_id": {"type": "string", "description": "Environment identifier (optional)"}
-                                },
-                                "required": []
-                            }
-                        },
-                        "dbt_get_model_details_tool": {
-                            "name": "dbt_get_model_details_tool",
-                            "description": "Get detailed information about a specific dbt model",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "model_unique_id": {"type": "string", "description": "Model unique identifier"},
-                                    "environment_id": {"type": "string", "description": "Environment identifier (optional)"}
-                                },
-                                "required": ["model_unique_id"]
-                            }
-                        },
-                        "dbt_list_metrics_tool": {
-                            "name": "dbt_list_metrics_tool",
-                            "description": "List all metrics using dbt Semantic Layer API",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "environment_id": {"type": "string", "description": "Environment identifier (optional)"}
-                                },
-                                "required": []
-                            }
-                        },
-                        "dbt_query_metrics_tool": {
-                            "name": "dbt_query_metrics_tool",
-                            "description": "Query metrics using dbt Semantic Layer API",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "metrics": {"type": "array", "items": {"type": "string"}, "description": "List of metrics to query"},
-                                    "group_by": {"type": "array", "items": {"type": "string"}, "description": "Dimensions to group by (optional)"},
-                                    "where": {"type": "array", "items": {"type": "string"}, "description": "Filter conditions (optional)"},
-                                    "order_by": {"type": "array", "items": {"type": "string"}, "description": "Sort order (optional)"},
-                                    "limit": {"type": "integer", "description": "Result limit (optional)"},
-                                    "environment_id": {"type": "string", "description": "Environment identifier (optional)"}
-                                },
-                                "required": ["metrics"]
-                            }
-                        },
-                        "dbt_execute_sql_tool": {
-                            "name": "dbt_execute_sql_tool",
-                            "description": "Execute SQL using dbt Cloud SQL API",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "sql": {"type": "string", "description": "SQL query to execute"},
-                                    "environment_id": {"type": "string", "description": "Environment identifier (optional)"}
-                                },
-                                "required": ["sql"]
-                            }
-                        },
-                        
-                        # DataHub tools
-                        "datahub_search_entities_tool": {
-                            "name": "datahub_search_entities_tool",
-                            "description": "Search for entities in DataHub",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query": {"type": "string", "description": "Search query string", "default": "*"},
-                                    "entity_types": {"type": "array", "items": {"type": "string"}, "description": "List of entity types to filter by (DATASET, CHART, DASHBOARD, etc.)"},
-                                    "start": {"type": "integer", "description": "Start index for pagination", "default": 0},
-                                    "count": {"type": "integer", "description": "Number of results per page", "default": 10}
-                                },
-                                "required": []
-                            }
-                        },
-                        "datahub_get_entity_tool": {
-                            "name": "datahub_get_entity_tool",
-                            "description": "Get details of a specific DataHub entity by URN",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "urn": {"type": "string", "description": "Entity URN to retrieve"}
-                                },
-                                "required": ["urn"]
-                            }
-                        },
-                        "datahub_get_lineage_tool": {
-                            "name": "datahub_get_lineage_tool",
-                            "description": "Get lineage information for a DataHub entity",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "urn": {"type": "string", "description": "Entity URN to get lineage for"},
-                                    "direction": {"type": "string", "description": "Lineage direction (UPSTREAM or DOWNSTREAM)", "default": "DOWNSTREAM"},
-                                    "start": {"type": "integer", "description": "Start index for pagination", "default": 0},
-                                    "count": {"type": "integer", "description": "Number of results per page", "default": 100}
-                                },
-                                "required": ["urn"]
-                            }
-                        },
-                        "datahub_list_datasets_tool": {
-                            "name": "datahub_list_datasets_tool",
-                            "description": "List datasets in DataHub",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "platform": {"type": "string", "description": "Platform name to filter by (optional)"},
-                                    "start": {"type": "integer", "description": "Start index", "default": 0},
-                                    "count": {"type": "integer", "description": "Number of results", "default": 20}
-                                },
-                                "required": []
-                            }
-                        },
-                        "datahub_list_dashboards_tool": {
-                            "name": "datahub_list_dashboards_tool",
-                            "description": "List dashboards in DataHub",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "start": {"type": "integer", "description": "Start index", "default": 0},
-                                    "count": {"type": "integer", "description": "Number of results", "default": 20}
-                                },
-                                "required": []
-                            }
-                        },
-                        "datahub_list_charts_tool": {
-                            "name": "datahub_list_charts_tool",
-                            "description": "List charts in DataHub",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "start": {"type": "integer", "description": "Start index", "default": 0},
-                                    "count": {"type": "integer", "description": "Number of results", "default": 20}
-                                },
-                                "required": []
-                            }
-                        },
-                        "datahub_list_platforms_tool": {
-                            "name": "datahub_list_platforms_tool",
-                            "description": "List all platforms in DataHub",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        "datahub_list_tags_tool": {
-                            "name": "datahub_list_tags_tool",
-                            "description": "List all tags in DataHub",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "start": {"type": "integer", "description": "Start index", "default": 0},
-                                    "count": {"type": "integer", "description": "Number of results", "default": 20}
-                                },
-                                "required": []
-                            }
-                        },
-                        
-                        # Airflow tools
-                        "airflow_list_dags_tool": {
-                            "name": "airflow_list_dags_tool",
-                            "description": "List all DAGs in Airflow",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "limit": {"type": "integer", "description": "Result limit", "default": 100},
-                                    "offset": {"type": "integer", "description": "Offset for pagination", "default": 0},
-                                    "only_active": {"type": "boolean", "description": "Only active DAGs", "default": True}
-                                },
-                                "required": []
-                            }
-                        },
-                        "airflow_get_dag_tool": {
-                            "name": "airflow_get_dag_tool",
-                            "description": "Get details of a specific DAG",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "dag_id": {"type": "string", "description": "DAG identifier"}
-                                },
-                                "required": ["dag_id"]
-                            }
-                        },
-                        "airflow_trigger_dag_tool": {
-                            "name": "airflow_trigger_dag_tool",
-                            "description": "Trigger a DAG run",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "dag_id": {"type": "string", "description": "DAG identifier"},
-                                    "conf": {"type": "object", "description": "DAG run configuration (optional)"}
-                                },
-                                "required": ["dag_id"]
-                            }
-                        },
-                        "airflow_get_dag_runs_tool": {
-                            "name": "airflow_get_dag_runs_tool",
-                            "description": "Get DAG runs for a specific DAG",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "dag_id": {"type": "string", "description": "DAG identifier"},
-                                    "limit": {"type": "integer", "description": "Result limit", "default": 25},
-                                    "offset": {"type": "integer", "description": "Offset for pagination", "default": 0}
-                                },
-                                "required": ["dag_id"]
-                            }
-                        },
-                        "airflow_get_task_instances_tool": {
-                            "name": "airflow_get_task_instances_tool",
-                            "description": "Get task instances for a DAG run",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "dag_id": {"type": "string", "description": "DAG identifier"},
-                                    "dag_run_id": {"type": "string", "description": "DAG run identifier"}
-                                },
-                                "required": ["dag_id", "dag_run_id"]
-                            }
-                        },
-                        "airflow_get_task_logs_tool": {
-                            "name": "airflow_get_task_logs_tool",
-                            "description": "Get logs for a task instance",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "dag_id": {"type": "string", "description": "DAG identifier"},
-                                    "dag_run_id": {"type": "string", "description": "DAG run identifier"},
-                                    "task_id": {"type": "string", "description": "Task identifier"},
-                                    "task_try_number": {"type": "integer", "description": "Task try number", "default": 1}
-                                },
-                                "required": ["dag_id", "dag_run_id", "task_id"]
-                            }
-                        },
-                        "airflow_pause_dag_tool": {
-                            "name": "airflow_pause_dag_tool",
-                            "description": "Pause a DAG",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "dag_id": {"type": "string", "description": "DAG identifier"}
-                                },
-                                "required": ["dag_id"]
-                            }
-                        },
-                        "airflow_unpause_dag_tool": {
-                            "name": "airflow_unpause_dag_tool",
-                            "description": "Unpause a DAG",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "dag_id": {"type": "string", "description": "DAG identifier"}
-                                },
-                                "required": ["dag_id"]
-                            }
-                        },
-                        
-                        # OpenAPI tools
-                        "openapi_get_spec_tool": {
-                            "name": "openapi_get_spec_tool",
-                            "description": "Get the OpenAPI specification for the configured API",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        "openapi_list_endpoints_tool": {
-                            "name": "openapi_list_endpoints_tool",
-                            "description": "List all available API endpoints from OpenAPI spec",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "tag": {"type": "string", "description": "Optional tag to filter endpoints"}
-                                },
-                                "required": []
-                            }
-                        },
-                        "openapi_call_endpoint_tool": {
-                            "name": "openapi_call_endpoint_tool",
-                            "description": "Call an API endpoint with specified parameters",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "method": {"type": "string", "description": "HTTP method (GET, POST, etc.)"},
-                                    "path": {"type": "string", "description": "API endpoint path"},
-                                    "parameters": {"type": "object", "description": "Request parameters (optional)"},
-                                    "data": {"type": "object", "description": "Request body (optional)"},
-                                    "headers": {"type": "object", "description": "Request headers (optional)"}
-                                },
-                                "required": ["method", "path"]
-                            }
-                        },
-                        "openapi_get_endpoint_schema_tool": {
-                            "name": "openapi_get_endpoint_schema_tool",
-                            "description": "Get the schema definition for a specific endpoint",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "method": {"type": "string", "description": "HTTP method"},
-                                    "path": {"type": "string", "description": "API endpoint path"}
-                                },
-                                "required": ["method", "path"]
-                            }
-                        },
-
-                        # Jira tools
-                        "jira_search_issues_tool": {
-                            "name": "jira_search_issues_tool",
-                            "description": "Search for Jira issues using JQL (Jira Query Language)",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "jql": {"type": "string", "description": "JQL query string"},
-                                    "max_results": {"type": "integer", "description": "Maximum number of results (default: 50)"}
-                                },
-                                "required": ["jql"]
-                            }
-                        },
-                        "jira_get_issue_tool": {
-                            "name": "jira_get_issue_tool",
-                            "description": "Get details of a specific Jira issue",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "issue_key": {"type": "string", "description": "Issue key (e.g., 'PROJ-123')"}
-                                },
-                                "required": ["issue_key"]
-                            }
-                        },
-                        "jira_create_issue_tool": {
-                            "name": "jira_create_issue_tool",
-                            "description": "Create a new Jira issue",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "project_key": {"type": "string", "description": "Project key"},
-                                    "summary": {"type": "string", "description": "Issue summary/title"},
-                                    "issue_type": {"type": "string", "description": "Issue type (e.g., 'Task', 'Bug', 'Story')"},
-                                    "description": {"type": "string", "description": "Issue description (optional)"},
-                                    "priority": {"type": "string", "description": "Priority (optional)"},
-                                    "assignee_account_id": {"type": "string", "description": "Assignee account ID (optional)"}
-                                },
-                                "required": ["project_key", "summary", "issue_type"]
-                            }
-                        },
-                        "jira_update_issue_tool": {
-                            "name": "jira_update_issue_tool",
-                            "description": "Update an existing Jira issue",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "issue_key": {"type": "string", "description": "Issue key"},
-                                    "fields": {"type": "object", "description": "Fields to update"}
-                                },
-                                "required": ["issue_key", "fields"]
-                            }
-                        },
-                        "jira_transition_issue_tool": {
-                            "name": "jira_transition_issue_tool",
-                            "description": "Transition a Jira issue to a new status",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "issue_key": {"type": "string", "description": "Issue key"},
-                                    "transition_id": {"type": "string", "description": "Transition ID"}
-                                },
-                                "required": ["issue_key", "transition_id"]
-                            }
-                        },
-                        "jira_get_transitions_tool": {
-                            "name": "jira_get_transitions_tool",
-                            "description": "Get available transitions for a Jira issue",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "issue_key": {"type": "string", "description": "Issue key"}
-                                },
-                                "required": ["issue_key"]
-                            }
-                        },
-                        "jira_assign_issue_tool": {
-                            "name": "jira_assign_issue_tool",
-                            "description": "Assign a Jira issue to a user",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "issue_key": {"type": "string", "description": "Issue key"},
-                                    "account_id": {"type": "string", "description": "Atlassian account ID"}
-                                },
-                                "required": ["issue_key", "account_id"]
-                            }
-                        },
-                        "jira_list_projects_tool": {
-                            "name": "jira_list_projects_tool",
-                            "description": "List all Jira projects accessible to the user",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        "jira_get_project_tool": {
-                            "name": "jira_get_project_tool",
-                            "description": "Get details of a specific Jira project",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "project_key": {"type": "string", "description": "Project key"}
-                                },
-                                "required": ["project_key"]
-                            }
-                        },
-                        "jira_get_issue_types_tool": {
-                            "name": "jira_get_issue_types_tool",
-                            "description": "Get issue types for a Jira project",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "project_key": {"type": "string", "description": "Project key"}
-                                },
-                                "required": ["project_key"]
-                            }
-                        },
-                        "jira_get_fields_tool": {
-                            "name": "jira_get_fields_tool",
-                            "description": "Get all fields (system and custom) in Jira",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        "jira_add_comment_tool": {
-                            "name": "jira_add_comment_tool",
-                            "description": "Add a comment to a Jira issue",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "issue_key": {"type": "string", "description": "Issue key"},
-                                    "comment": {"type": "string", "description": "Comment text"}
-                                },
-                                "required": ["issue_key", "comment"]
-                            }
-                        },
-                        "jira_get_comments_tool": {
-                            "name": "jira_get_comments_tool",
-                            "description": "Get all comments for a Jira issue",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "issue_key": {"type": "string", "description": "Issue key"}
-                                },
-                                "required": ["issue_key"]
-                            }
-                        },
-                        "jira_upload_attachment_tool": {
-                            "name": "jira_upload_attachment_tool",
-                            "description": "Upload an attachment to a Jira issue",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "issue_key": {"type": "string", "description": "Issue key"},
-                                    "file_content": {"type": "string", "description": "File content (base64 encoded)"},
-                                    "filename": {"type": "string", "description": "Filename"}
-                                },
-                                "required": ["issue_key", "file_content", "filename"]
-                            }
-                        },
-                        "jira_list_boards_tool": {
-                            "name": "jira_list_boards_tool",
-                            "description": "List all Jira boards, optionally filtered by project",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "project_key": {"type": "string", "description": "Optional project key to filter boards"}
-                                },
-                                "required": []
-                            }
-                        },
-                        "jira_list_sprints_tool": {
-                            "name": "jira_list_sprints_tool",
-                            "description": "List all sprints for a Jira board",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "board_id": {"type": "integer", "description": "Board ID"}
-                                },
-                                "required": ["board_id"]
-                            }
-                        },
-                        "jira_get_sprint_tool": {
-                            "name": "jira_get_sprint_tool",
-                            "description": "Get details of a specific Jira sprint",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "sprint_id": {"type": "integer", "description": "Sprint ID"}
-                                },
-                                "required": ["sprint_id"]
-                            }
-                        },
-                        "jira_get_backlog_tool": {
-                            "name": "jira_get_backlog_tool",
-                            "description": "Get backlog issues for a Jira board",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "board_id": {"type": "integer", "description": "Board ID"},
-                                    "max_results": {"type": "integer", "description": "Maximum number of results (default: 50)"}
-                                },
-                                "required": ["board_id"]
-                            }
-                        },
-
-                        # Azure Blob Storage tools
-                        "azure_blob_list_containers_tool": {
-                            "name": "azure_blob_list_containers_tool",
-                            "description": "List all containers in the Azure Blob Storage account",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "max_results": {"type": "integer", "description": "Maximum number of containers to return", "default": 100}
-                                },
-                                "required": []
-                            }
-                        },
-                        "azure_blob_list_blobs_tool": {
-                            "name": "azure_blob_list_blobs_tool",
-                            "description": "List blobs in an Azure Blob Storage container",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "container_name": {"type": "string", "description": "Name of the container"},
-                                    "prefix": {"type": "string", "description": "Prefix to filter blobs"},
-                                    "max_results": {"type": "integer", "description": "Maximum number of blobs to return", "default": 1000},
-                                    "delimiter": {"type": "string", "description": "Delimiter for virtual directory structure"}
-                                },
-                                "required": ["container_name"]
-                            }
-                        },
-                        "azure_blob_get_blob_tool": {
-                            "name": "azure_blob_get_blob_tool",
-                            "description": "Get a blob from Azure Blob Storage container",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "container_name": {"type": "string", "description": "Name of the container"},
-                                    "blob_name": {"type": "string", "description": "Name of the blob to retrieve"}
-                                },
-                                "required": ["container_name", "blob_name"]
-                            }
-                        },
-                        "azure_blob_get_blob_metadata_tool": {
-                            "name": "azure_blob_get_blob_metadata_tool",
-                            "description": "Get metadata for a blob without downloading the content",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "container_name": {"type": "string", "description": "Name of the container"},
-                                    "blob_name": {"type": "string", "description": "Name of the blob"}
-                                },
-                                "required": ["container_name", "blob_name"]
-                            }
-                        },
-                        "azure_blob_upload_blob_tool": {
-                            "name": "azure_blob_upload_blob_tool",
-                            "description": "Upload a blob to Azure Blob Storage container",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "container_name": {"type": "string", "description": "Name of the container"},
-                                    "blob_name": {"type": "string", "description": "Name for the blob"},
-                                    "content": {"type": "string", "description": "Content to upload"},
-                                    "content_type": {"type": "string", "description": "MIME type of the content"},
-                                    "overwrite": {"type": "boolean", "description": "Whether to overwrite if blob exists", "default": True}
-                                },
-                                "required": ["container_name", "blob_name", "content"]
-                            }
-                        },
-                        "azure_blob_delete_blob_tool": {
-                            "name": "azure_blob_delete_blob_tool",
-                            "description": "Delete a blob from Azure Blob Storage container",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "container_name": {"type": "string", "description": "Name of the container"},
-                                    "blob_name": {"type": "string", "description": "Name of the blob to delete"}
-                                },
-                                "required": ["container_name", "blob_name"]
-                            }
-                        },
-                        "azure_blob_generate_sas_url_tool": {
-                            "name": "azure_blob_generate_sas_url_tool",
-                            "description": "Generate a SAS (Shared Access Signature) URL for a blob",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "container_name": {"type": "string", "description": "Name of the container"},
-                                    "blob_name": {"type": "string", "description": "Name of the blob"},
-                                    "expiry_hours": {"type": "integer", "description": "URL expiration time in hours", "default": 1},
-                                    "permission": {"type": "string", "description": "Permission string (r=read, w=write, d=delete)", "default": "r"}
-                                },
-                                "required": ["container_name", "blob_name"]
-                            }
-                        },
-                        "azure_blob_get_container_properties_tool": {
-                            "name": "azure_blob_get_container_properties_tool",
-                            "description": "Get properties for an Azure Blob Storage container",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "container_name": {"type": "string", "description": "Name of the container"}
-                                },
-                                "required": ["container_name"]
-                            }
-                        },
-
-                        # Azure Data Factory tools
-                        "azure_adf_list_pipelines_tool": {
-                            "name": "azure_adf_list_pipelines_tool",
-                            "description": "List all pipelines in Azure Data Factory",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        "azure_adf_get_pipeline_tool": {
-                            "name": "azure_adf_get_pipeline_tool",
-                            "description": "Get details of a specific pipeline in Azure Data Factory",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "pipeline_name": {"type": "string", "description": "Name of the pipeline"}
-                                },
-                                "required": ["pipeline_name"]
-                            }
-                        },
-                        "azure_adf_run_pipeline_tool": {
-                            "name": "azure_adf_run_pipeline_tool",
-                            "description": "Run a pipeline in Azure Data Factory",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "pipeline_name": {"type": "string", "description": "Name of the pipeline"},
-                                    "parameters": {"type": "object", "description": "Optional parameters for the pipeline run"}
-                                },
-                                "required": ["pipeline_name"]
-                            }
-                        },
-                        "azure_adf_get_pipeline_run_tool": {
-                            "name": "azure_adf_get_pipeline_run_tool",
-                            "description": "Get details of a pipeline run",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "run_id": {"type": "string", "description": "Pipeline run ID"}
-                                },
-                                "required": ["run_id"]
-                            }
-                        },
-                        "azure_adf_list_pipeline_runs_tool": {
-                            "name": "azure_adf_list_pipeline_runs_tool",
-                            "description": "List pipeline runs in Azure Data Factory",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "pipeline_name": {"type": "string", "description": "Optional: filter by pipeline name"},
-                                    "days_back": {"type": "integer", "description": "Number of days to look back", "default": 7}
-                                },
-                                "required": []
-                            }
-                        },
-                        "azure_adf_list_datasets_tool": {
-                            "name": "azure_adf_list_datasets_tool",
-                            "description": "List all datasets in Azure Data Factory",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        "azure_adf_get_dataset_tool": {
-                            "name": "azure_adf_get_dataset_tool",
-                            "description": "Get details of a specific dataset",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "dataset_name": {"type": "string", "description": "Name of the dataset"}
-                                },
-                                "required": ["dataset_name"]
-                            }
-                        },
-                        "azure_adf_list_triggers_tool": {
-                            "name": "azure_adf_list_triggers_tool",
-                            "description": "List all triggers in Azure Data Factory",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        "azure_adf_get_trigger_tool": {
-                            "name": "azure_adf_get_trigger_tool",
-                            "description": "Get details of a specific trigger",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "trigger_name": {"type": "string", "description": "Name of the trigger"}
-                                },
-                                "required": ["trigger_name"]
-                            }
-                        },
-                        "azure_adf_list_linked_services_tool": {
-                            "name": "azure_adf_list_linked_services_tool",
-                            "description": "List all linked services in Azure Data Factory",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        "azure_adf_get_linked_service_tool": {
-                            "name": "azure_adf_get_linked_service_tool",
-                            "description": "Get details of a specific linked service",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "service_name": {"type": "string", "description": "Name of the linked service"}
-                                },
-                                "required": ["service_name"]
-                            }
-                        },
-                        "azure_adf_list_data_flows_tool": {
-                            "name": "azure_adf_list_data_flows_tool",
-                            "description": "List all data flows in Azure Data Factory",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        "azure_adf_get_data_flow_tool": {
-                            "name": "azure_adf_get_data_flow_tool",
-                            "description": "Get details of a specific data flow",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "data_flow_name": {"type": "string", "description": "Name of the data flow"}
-                                },
-                                "required": ["data_flow_name"]
-                            }
-                        },
-                        "azure_adf_list_integration_runtimes_tool": {
-                            "name": "azure_adf_list_integration_runtimes_tool",
-                            "description": "List all integration runtimes in Azure Data Factory",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        "azure_adf_get_integration_runtime_tool": {
-                            "name": "azure_adf_get_integration_runtime_tool",
-                            "description": "Get details of a specific integration runtime",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "runtime_name": {"type": "string", "description": "Name of the integration runtime"}
-                                },
-                                "required": ["runtime_name"]
-                            }
-                        },
-                        "azure_adf_get_factory_info_tool": {
-                            "name": "azure_adf_get_factory_info_tool",
-                            "description": "Get information about the Azure Data Factory instance",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        # Atlan tools
-                        "atlan_search_assets_tool": {
-                            "name": "atlan_search_assets_tool",
-                            "description": "Search for assets in Atlan data catalog using Elasticsearch query syntax",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "query": {"type": "string", "description": "Search query (Elasticsearch syntax)", "default": "*"},
-                                    "asset_types": {"type": "array", "items": {"type": "string"}, "description": "Asset types to filter (Table, Column, Dashboard, etc.)"},
-                                    "from_": {"type": "integer", "description": "Pagination offset", "default": 0},
-                                    "size": {"type": "integer", "description": "Number of results", "default": 25}
-                                },
-                                "required": []
-                            }
-                        },
-                        "atlan_search_by_type_tool": {
-                            "name": "atlan_search_by_type_tool",
-                            "description": "Search for all assets of a specific type in Atlan",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "type_name": {"type": "string", "description": "Asset type name (Table, Column, Dashboard, etc.)"},
-                                    "from_": {"type": "integer", "description": "Pagination offset", "default": 0},
-                                    "size": {"type": "integer", "description": "Number of results", "default": 25}
-                                },
-                                "required": ["type_name"]
-                            }
-                        },
-                        "atlan_get_asset_tool": {
-                            "name": "atlan_get_asset_tool",
-                            "description": "Get detailed information about a specific asset by GUID",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "guid": {"type": "string", "description": "Asset GUID"}
-                                },
-                                "required": ["guid"]
-                            }
-                        },
-                        "atlan_get_asset_by_qualified_name_tool": {
-                            "name": "atlan_get_asset_by_qualified_name_tool",
-                            "description": "Get asset by type and qualified name",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "type_name": {"type": "string", "description": "Asset type name"},
-                                    "qualified_name": {"type": "string", "description": "Asset qualified name"}
-                                },
-                                "required": ["type_name", "qualified_name"]
-                            }
-                        },
-                        "atlan_create_asset_tool": {
-                            "name": "atlan_create_asset_tool",
-                            "description": "Create a new asset in Atlan",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "type_name": {"type": "string", "description": "Asset type (Table, Column, etc.)"},
-                                    "name": {"type": "string", "description": "Asset display name"},
-                                    "qualified_name": {"type": "string", "description": "Unique qualified name"},
-                                    "description": {"type": "string", "description": "Asset description"}
-                                },
-                                "required": ["type_name", "name", "qualified_name"]
-                            }
-                        },
-                        "atlan_update_asset_tool": {
-                            "name": "atlan_update_asset_tool",
-                            "description": "Update an existing asset in Atlan",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "guid": {"type": "string", "description": "Asset GUID"},
-                                    "attributes": {"type": "object", "description": "Attributes to update"}
-                                },
-                                "required": ["guid", "attributes"]
-                            }
-                        },
-                        "atlan_delete_asset_tool": {
-                            "name": "atlan_delete_asset_tool",
-                            "description": "Delete an asset from Atlan (soft or hard delete)",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "guid": {"type": "string", "description": "Asset GUID"},
-                                    "hard_delete": {"type": "boolean", "description": "Permanently delete", "default": False}
-                                },
-                                "required": ["guid"]
-                            }
-                        },
-                        "atlan_update_asset_description_tool": {
-                            "name": "atlan_update_asset_description_tool",
-                            "description": "Update the description of an asset",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "guid": {"type": "string", "description": "Asset GUID"},
-                                    "description": {"type": "string", "description": "New description"}
-                                },
-                                "required": ["guid", "description"]
-                            }
-                        },
-                        "atlan_update_asset_owners_tool": {
-                            "name": "atlan_update_asset_owners_tool",
-                            "description": "Update the owners of an asset",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "guid": {"type": "string", "description": "Asset GUID"},
-                                    "owner_users": {"type": "array", "items": {"type": "string"}, "description": "Owner usernames"},
-                                    "owner_groups": {"type": "array", "items": {"type": "string"}, "description": "Owner group names"}
-                                },
-                                "required": ["guid"]
-                            }
-                        },
-                        "atlan_get_lineage_tool": {
-                            "name": "atlan_get_lineage_tool",
-                            "description": "Get lineage information for an asset",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "guid": {"type": "string", "description": "Asset GUID"},
-                                    "direction": {"type": "string", "description": "UPSTREAM, DOWNSTREAM, or BOTH", "default": "BOTH"},
-                                    "depth": {"type": "integer", "description": "Lineage depth (1-10)", "default": 3}
-                                },
-                                "required": ["guid"]
-                            }
-                        },
-                        "atlan_list_glossaries_tool": {
-                            "name": "atlan_list_glossaries_tool",
-                            "description": "List all glossaries in Atlan",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "from_": {"type": "integer", "default": 0},
-                                    "size": {"type": "integer", "default": 25}
-                                },
-                                "required": []
-                            }
-                        },
-                        "atlan_get_glossary_tool": {
-                            "name": "atlan_get_glossary_tool",
-                            "description": "Get a specific glossary by GUID",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "guid": {"type": "string", "description": "Glossary GUID"}
-                                },
-                                "required": ["guid"]
-                            }
-                        },
-                        "atlan_list_glossary_terms_tool": {
-                            "name": "atlan_list_glossary_terms_tool",
-                            "description": "List glossary terms, optionally filtered by glossary",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "glossary_guid": {"type": "string", "description": "Glossary GUID to filter by"},
-                                    "from_": {"type": "integer", "default": 0},
-                                    "size": {"type": "integer", "default": 25}
-                                },
-                                "required": []
-                            }
-                        },
-                        "atlan_get_glossary_term_tool": {
-                            "name": "atlan_get_glossary_term_tool",
-                            "description": "Get a specific glossary term by GUID",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "guid": {"type": "string", "description": "Term GUID"}
-                                },
-                                "required": ["guid"]
-                            }
-                        },
-                        "atlan_create_glossary_term_tool": {
-                            "name": "atlan_create_glossary_term_tool",
-                            "description": "Create a new glossary term",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "name": {"type": "string", "description": "Term name"},
-                                    "glossary_guid": {"type": "string", "description": "Parent glossary GUID"},
-                                    "description": {"type": "string", "description": "Term description"},
-                                    "short_description": {"type": "string", "description": "Short description"}
-                                },
-                                "required": ["name", "glossary_guid"]
-                            }
-                        },
-                        "atlan_list_glossary_categories_tool": {
-                            "name": "atlan_list_glossary_categories_tool",
-                            "description": "List glossary categories",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "glossary_guid": {"type": "string", "description": "Glossary GUID to filter by"},
-                                    "from_": {"type": "integer", "default": 0},
-                                    "size": {"type": "integer", "default": 25}
-                                },
-                                "required": []
-                            }
-                        },
-                        "atlan_link_term_to_asset_tool": {
-                            "name": "atlan_link_term_to_asset_tool",
-                            "description": "Link a glossary term to an asset",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "term_guid": {"type": "string", "description": "Glossary term GUID"},
-                                    "asset_guid": {"type": "string", "description": "Asset GUID to link to"}
-                                },
-                                "required": ["term_guid", "asset_guid"]
-                            }
-                        },
-                        "atlan_list_classifications_tool": {
-                            "name": "atlan_list_classifications_tool",
-                            "description": "List all classification types (tags) in Atlan",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        "atlan_add_classification_tool": {
-                            "name": "atlan_add_classification_tool",
-                            "description": "Add a classification (tag) to an asset",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "guid": {"type": "string", "description": "Asset GUID"},
-                                    "classification_name": {"type": "string", "description": "Classification type name"}
-                                },
-                                "required": ["guid", "classification_name"]
-                            }
-                        },
-                        "atlan_remove_classification_tool": {
-                            "name": "atlan_remove_classification_tool",
-                            "description": "Remove a classification from an asset",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "guid": {"type": "string", "description": "Asset GUID"},
-                                    "classification_name": {"type": "string", "description": "Classification type name"}
-                                },
-                                "required": ["guid", "classification_name"]
-                            }
-                        },
-                        "atlan_list_tables_tool": {
-                            "name": "atlan_list_tables_tool",
-                            "description": "List all table assets in Atlan",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "from_": {"type": "integer", "default": 0},
-                                    "size": {"type": "integer", "default": 25}
-                                },
-                                "required": []
-                            }
-                        },
-                        "atlan_list_columns_tool": {
-                            "name": "atlan_list_columns_tool",
-                            "description": "List columns, optionally filtered by parent table",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "table_guid": {"type": "string", "description": "Parent table GUID"},
-                                    "from_": {"type": "integer", "default": 0},
-                                    "size": {"type": "integer", "default": 25}
-                                },
-                                "required": []
-                            }
-                        },
-                        "atlan_list_databases_tool": {
-                            "name": "atlan_list_databases_tool",
-                            "description": "List all database assets",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "from_": {"type": "integer", "default": 0},
-                                    "size": {"type": "integer", "default": 25}
-                                },
-                                "required": []
-                            }
-                        },
-                        "atlan_list_schemas_tool": {
-                            "name": "atlan_list_schemas_tool",
-                            "description": "List all schema assets",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "from_": {"type": "integer", "default": 0},
-                                    "size": {"type": "integer", "default": 25}
-                                },
-                                "required": []
-                            }
-                        },
-                        "atlan_list_dashboards_tool": {
-                            "name": "atlan_list_dashboards_tool",
-                            "description": "List all BI dashboard assets (Tableau, Looker, PowerBI, etc.)",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "from_": {"type": "integer", "default": 0},
-                                    "size": {"type": "integer", "default": 25}
-                                },
-                                "required": []
-                            }
-                        },
-                        "atlan_list_dbt_models_tool": {
-                            "name": "atlan_list_dbt_models_tool",
-                            "description": "List dbt model assets",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "from_": {"type": "integer", "default": 0},
-                                    "size": {"type": "integer", "default": 25}
-                                },
-                                "required": []
-                            }
-                        },
-                        "atlan_list_airflow_dags_tool": {
-                            "name": "atlan_list_airflow_dags_tool",
-                            "description": "List Airflow DAG assets",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "from_": {"type": "integer", "default": 0},
-                                    "size": {"type": "integer", "default": 25}
-                                },
-                                "required": []
-                            }
-                        },
-                        "atlan_list_kafka_topics_tool": {
-                            "name": "atlan_list_kafka_topics_tool",
-                            "description": "List Kafka topic assets",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "from_": {"type": "integer", "default": 0},
-                                    "size": {"type": "integer", "default": 25}
-                                },
-                                "required": []
-                            }
-                        },
-                        "atlan_list_s3_objects_tool": {
-                            "name": "atlan_list_s3_objects_tool",
-                            "description": "List S3 and cloud storage assets",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "from_": {"type": "integer", "default": 0},
-                                    "size": {"type": "integer", "default": 25}
-                                },
-                                "required": []
-                            }
-                        },
-                        "atlan_update_custom_metadata_tool": {
-                            "name": "atlan_update_custom_metadata_tool",
-                            "description": "Update custom metadata on an asset",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "guid": {"type": "string", "description": "Asset GUID"},
-                                    "custom_metadata_name": {"type": "string", "description": "Custom metadata type name"},
-                                    "attributes": {"type": "object", "description": "Attribute values to set"}
-                                },
-                                "required": ["guid", "custom_metadata_name", "attributes"]
-                            }
-                        },
-                        "atlan_get_custom_metadata_types_tool": {
-                            "name": "atlan_get_custom_metadata_types_tool",
-                            "description": "Get all custom metadata type definitions",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {},
-                                "required": []
-                            }
-                        },
-                        "atlan_certify_asset_tool": {
-                            "name": "atlan_certify_asset_tool",
-                            "description": "Certify an asset with a status",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "guid": {"type": "string", "description": "Asset GUID"},
-                                    "status": {"type": "string", "description": "VERIFIED, DEPRECATED, or DRAFT", "default": "VERIFIED"},
-                                    "message": {"type": "string", "description": "Certification message"}
-                                },
-                                "required": ["guid"]
-                            }
-                        },
-                        "atlan_bulk_update_assets_tool": {
-                            "name": "atlan_bulk_update_assets_tool",
-                            "description": "Update multiple assets in a single request",
-                            "inputSchema": {
-                                "type": "object",
-                                "properties": {
-                                    "entities": {"type": "array", "items": {"type": "object"}, "description": "Array of entity objects to update"}
-                                },
-                                "required": ["entities"]
-                            }
-                        }
-                    }
-
-                    # Only include tools that are available for this project
-                    for tool_name in available_tool_names:
-                        if tool_name in all_tool_schemas:
-                            tools.append(all_tool_schemas[tool_name])
-                    
+                    # Return only tools available for this project (precomputed per provider set)
                     return JSONResponse(content={
                         "jsonrpc": "2.0",
                         "id": body.get("id"),
                         "result": {
-                            "tools": tools
+                            "tools": available_tool_schemas
                         }
                     })
                 
@@ -7817,194 +8035,22 @@ async def project_mcp_endpoint(request: Request) -> JSONResponse:
                     tool_name = params.get("name")
                     tool_arguments = params.get("arguments", {})
                     
-                    if tool_name not in available_tool_names:
+                    if tool_name not in available_tool_set:
                         return JSONResponse(content={
                             "jsonrpc": "2.0",
                             "id": body.get("id"),
                             "error": {
                                 "code": -32601,
-                                "message": f"Tool '{tool_name}' is not available for project '{project_id}'. Available tools: {available_tool_names}"
+                                "message": f"Tool '{tool_name}' is not available for project '{project_id}'. Available tools: {list(available_tool_names)}"
                             }
                         })
                     
                     # Inject project_id into tool arguments
                     tool_arguments["project_id"] = project_id
                     
-                    # Map tool names to their actual functions
-                    tool_functions = {
-                        # Looker tools
-                        "looker_get_models_tool": looker_get_models_tool,
-                        "looker_get_explores_tool": looker_get_explores_tool,
-                        "looker_get_dimensions_tool": looker_get_dimensions_tool,
-                        "looker_get_measures_tool": looker_get_measures_tool,
-                        "looker_get_filters_tool": looker_get_filters_tool,
-                        "looker_query_tool": looker_query_tool,
-                        "looker_query_sql_tool": looker_query_sql_tool,
-                        "looker_get_looks_tool": looker_get_looks_tool,
-                        "looker_run_look_tool": looker_run_look_tool,
-                        "looker_query_url_tool": looker_query_url_tool,
-                        # Redash tools
-                        "redash_list_queries_tool": redash_list_queries_tool,
-                        "redash_get_query_tool": redash_get_query_tool,
-                        "redash_execute_query_tool": redash_execute_query_tool,
-                        "redash_get_query_job_status_tool": redash_get_query_job_status_tool,
-                        "redash_get_query_results_tool": redash_get_query_results_tool,
-                        "redash_refresh_query_tool": redash_refresh_query_tool,
-                        "redash_list_dashboards_tool": redash_list_dashboards_tool,
-                        "redash_get_dashboard_tool": redash_get_dashboard_tool,
-                        "redash_list_data_sources_tool": redash_list_data_sources_tool,
-                        "redash_create_query_tool": redash_create_query_tool,
-                        "redash_create_visualization_tool": redash_create_visualization_tool,
-                        "redash_create_dashboard_tool": redash_create_dashboard_tool,
-                        "redash_add_widget_tool": redash_add_widget_tool,
-                        "redash_publish_dashboard_tool": redash_publish_dashboard_tool,
-                        # DataZone tools
-                        "datazone_list_domains_tool": datazone_list_domains_tool,
-                        "datazone_get_domain_tool": datazone_get_domain_tool,
-                        "datazone_list_projects_tool": datazone_list_projects_tool,
-                        "datazone_get_project_tool": datazone_get_project_tool,
-                        "datazone_search_listings_tool": datazone_search_listings_tool,
-                        "datazone_get_listing_tool": datazone_get_listing_tool,
-                        "datazone_list_environments_tool": datazone_list_environments_tool,
-                        "datazone_get_environment_tool": datazone_get_environment_tool,
-                        "datazone_get_asset_tool": datazone_get_asset_tool,
-                        "datazone_list_asset_revisions_tool": datazone_list_asset_revisions_tool,
-                        "datazone_get_glossary_tool": datazone_get_glossary_tool,
-                        "datazone_get_glossary_term_tool": datazone_get_glossary_term_tool,
-                        "datazone_create_form_type_tool": datazone_create_form_type_tool,
-                        "datazone_get_form_type_tool": datazone_get_form_type_tool,
-                        "datazone_create_asset_type_tool": datazone_create_asset_type_tool,
-                        "datazone_get_asset_type_tool": datazone_get_asset_type_tool,
-                        "datazone_list_asset_types_tool": datazone_list_asset_types_tool,
-                        # S3 tools
-                        "s3_list_buckets_tool": s3_list_buckets_tool,
-                        "s3_list_objects_tool": s3_list_objects_tool,
-                        "s3_get_object_tool": s3_get_object_tool,
-                        "s3_get_object_metadata_tool": s3_get_object_metadata_tool,
-                        "s3_create_bucket_tool": s3_create_bucket_tool,
-                        "s3_put_object_tool": s3_put_object_tool,
-                        "s3_generate_presigned_url_tool": s3_generate_presigned_url_tool,
-                        "s3_generate_presigned_post_tool": s3_generate_presigned_post_tool,
-                        # DBT tools
-                        "dbt_list_projects_tool": dbt_list_projects_tool,
-                        "dbt_list_environments_tool": dbt_list_environments_tool,
-                        "dbt_list_jobs_tool": dbt_list_jobs_tool,
-                        "dbt_trigger_job_run_tool": dbt_trigger_job_run_tool,
-                        "dbt_get_job_run_tool": dbt_get_job_run_tool,
-                        "dbt_list_job_runs_tool": dbt_list_job_runs_tool,
-                        "dbt_cancel_job_run_tool": dbt_cancel_job_run_tool,
-                        "dbt_list_models_tool": dbt_list_models_tool,
-                        "dbt_get_model_details_tool": dbt_get_model_details_tool,
-                        "dbt_list_metrics_tool": dbt_list_metrics_tool,
-                        "dbt_query_metrics_tool": dbt_query_metrics_tool,
-                        "dbt_execute_sql_tool": dbt_execute_sql_tool,
-                        # DataHub tools
-                        "datahub_search_entities_tool": datahub_search_entities_tool,
-                        "datahub_get_entity_tool": datahub_get_entity_tool,
-                        "datahub_list_datasets_tool": datahub_list_datasets_tool,
-                        "datahub_list_dashboards_tool": datahub_list_dashboards_tool,
-                        "datahub_list_charts_tool": datahub_list_charts_tool,
-                        "datahub_get_lineage_tool": datahub_get_lineage_tool,
-                        "datahub_list_platforms_tool": datahub_list_platforms_tool,
-                        "datahub_list_tags_tool": datahub_list_tags_tool,
-                        # Atlan tools
-                        "atlan_search_assets_tool": atlan_search_assets_tool,
-                        "atlan_search_by_type_tool": atlan_search_by_type_tool,
-                        "atlan_get_asset_tool": atlan_get_asset_tool,
-                        "atlan_get_asset_by_qualified_name_tool": atlan_get_asset_by_qualified_name_tool,
-                        "atlan_create_asset_tool": atlan_create_asset_tool,
-                        "atlan_update_asset_tool": atlan_update_asset_tool,
-                        "atlan_delete_asset_tool": atlan_delete_asset_tool,
-                        "atlan_update_asset_description_tool": atlan_update_asset_description_tool,
-                        "atlan_update_asset_owners_tool": atlan_update_asset_owners_tool,
-                        "atlan_get_lineage_tool": atlan_get_lineage_tool,
-                        "atlan_list_glossaries_tool": atlan_list_glossaries_tool,
-                        "atlan_get_glossary_tool": atlan_get_glossary_tool,
-                        "atlan_list_glossary_terms_tool": atlan_list_glossary_terms_tool,
-                        "atlan_get_glossary_term_tool": atlan_get_glossary_term_tool,
-                        "atlan_create_glossary_term_tool": atlan_create_glossary_term_tool,
-                        "atlan_list_glossary_categories_tool": atlan_list_glossary_categories_tool,
-                        "atlan_link_term_to_asset_tool": atlan_link_term_to_asset_tool,
-                        "atlan_list_classifications_tool": atlan_list_classifications_tool,
-                        "atlan_add_classification_tool": atlan_add_classification_tool,
-                        "atlan_remove_classification_tool": atlan_remove_classification_tool,
-                        "atlan_list_tables_tool": atlan_list_tables_tool,
-                        "atlan_list_columns_tool": atlan_list_columns_tool,
-                        "atlan_list_databases_tool": atlan_list_databases_tool,
-                        "atlan_list_schemas_tool": atlan_list_schemas_tool,
-                        "atlan_list_dashboards_tool": atlan_list_dashboards_tool,
-                        "atlan_list_dbt_models_tool": atlan_list_dbt_models_tool,
-                        "atlan_list_airflow_dags_tool": atlan_list_airflow_dags_tool,
-                        "atlan_list_kafka_topics_tool": atlan_list_kafka_topics_tool,
-                        "atlan_list_s3_objects_tool": atlan_list_s3_objects_tool,
-                        "atlan_update_custom_metadata_tool": atlan_update_custom_metadata_tool,
-                        "atlan_get_custom_metadata_types_tool": atlan_get_custom_metadata_types_tool,
-                        "atlan_certify_asset_tool": atlan_certify_asset_tool,
-                        "atlan_bulk_update_assets_tool": atlan_bulk_update_assets_tool,
-                        # Airflow tools
-                        "airflow_list_dags_tool": airflow_list_dags_tool,
-                        "airflow_get_dag_tool": airflow_get_dag_tool,
-                        "airflow_trigger_dag_tool": airflow_trigger_dag_tool,
-                        "airflow_get_dag_runs_tool": airflow_get_dag_runs_tool,
-                        "airflow_get_task_instances_tool": airflow_get_task_instances_tool,
-                        "airflow_get_task_logs_tool": airflow_get_task_logs_tool,
-                        "airflow_pause_dag_tool": airflow_pause_dag_tool,
-                        "airflow_unpause_dag_tool": airflow_unpause_dag_tool,
-                        # OpenAPI tools
-                        "openapi_get_spec_tool": openapi_get_spec_tool,
-                        "openapi_list_endpoints_tool": openapi_list_endpoints_tool,
-                        "openapi_call_endpoint_tool": openapi_call_endpoint_tool,
-                        "openapi_get_endpoint_schema_tool": openapi_get_endpoint_schema_tool,
-                        # Jira tools
-                        "jira_search_issues_tool": jira_search_issues_tool,
-                        "jira_get_issue_tool": jira_get_issue_tool,
-                        "jira_create_issue_tool": jira_create_issue_tool,
-                        "jira_update_issue_tool": jira_update_issue_tool,
-                        "jira_transition_issue_tool": jira_transition_issue_tool,
-                        "jira_get_transitions_tool": jira_get_transitions_tool,
-                        "jira_assign_issue_tool": jira_assign_issue_tool,
-                        "jira_list_projects_tool": jira_list_projects_tool,
-                        "jira_get_project_tool": jira_get_project_tool,
-                        "jira_get_issue_types_tool": jira_get_issue_types_tool,
-                        "jira_get_fields_tool": jira_get_fields_tool,
-                        "jira_add_comment_tool": jira_add_comment_tool,
-                        "jira_get_comments_tool": jira_get_comments_tool,
-                        "jira_upload_attachment_tool": jira_upload_attachment_tool,
-                        "jira_list_boards_tool": jira_list_boards_tool,
-                        "jira_list_sprints_tool": jira_list_sprints_tool,
-                        "jira_get_sprint_tool": jira_get_sprint_tool,
-                        "jira_get_backlog_tool": jira_get_backlog_tool,
-                        # Azure Blob Storage tools
-                        "azure_blob_list_containers_tool": azure_blob_list_containers_tool,
-                        "azure_blob_list_blobs_tool": azure_blob_list_blobs_tool,
-                        "azure_blob_get_blob_tool": azure_blob_get_blob_tool,
-                        "azure_blob_get_blob_metadata_tool": azure_blob_get_blob_metadata_tool,
-                        "azure_blob_upload_blob_tool": azure_blob_upload_blob_tool,
-                        "azure_blob_delete_blob_tool": azure_blob_delete_blob_tool,
-                        "azure_blob_generate_sas_url_tool": azure_blob_generate_sas_url_tool,
-                        "azure_blob_get_container_properties_tool": azure_blob_get_container_properties_tool,
-                        # Azure Data Factory tools
-                        "azure_adf_list_pipelines_tool": azure_adf_list_pipelines_tool,
-                        "azure_adf_get_pipeline_tool": azure_adf_get_pipeline_tool,
-                        "azure_adf_run_pipeline_tool": azure_adf_run_pipeline_tool,
-                        "azure_adf_get_pipeline_run_tool": azure_adf_get_pipeline_run_tool,
-                        "azure_adf_list_pipeline_runs_tool": azure_adf_list_pipeline_runs_tool,
-                        "azure_adf_list_datasets_tool": azure_adf_list_datasets_tool,
-                        "azure_adf_get_dataset_tool": azure_adf_get_dataset_tool,
-                        "azure_adf_list_triggers_tool": azure_adf_list_triggers_tool,
-                        "azure_adf_get_trigger_tool": azure_adf_get_trigger_tool,
-                        "azure_adf_list_linked_services_tool": azure_adf_list_linked_services_tool,
-                        "azure_adf_get_linked_service_tool": azure_adf_get_linked_service_tool,
-                        "azure_adf_list_data_flows_tool": azure_adf_list_data_flows_tool,
-                        "azure_adf_get_data_flow_tool": azure_adf_get_data_flow_tool,
-                        "azure_adf_list_integration_runtimes_tool": azure_adf_list_integration_runtimes_tool,
-                        "azure_adf_get_integration_runtime_tool": azure_adf_get_integration_runtime_tool,
-                        "azure_adf_get_factory_info_tool": azure_adf_get_factory_info_tool
-                    }
-
                     # Execute the tool
                     try:
-                        tool_func = tool_functions.get(tool_name)
+                        tool_func = TOOL_FUNCTIONS.get(tool_name)
                         if not tool_func:
                             return JSONResponse(content={
                                 "jsonrpc": "2.0",
@@ -8078,7 +8124,7 @@ async def project_mcp_endpoint(request: Request) -> JSONResponse:
             return JSONResponse(content={
                 "project_id": project_id,
                 "supported_providers": supported_providers,
-                "available_tools": available_tool_names,
+                "available_tools": list(available_tool_names),
                 "total_tools": len(available_tool_names),
                 "mcp_endpoint": f"/mcp/{project_id}"
             })
@@ -8113,7 +8159,9 @@ async def health_endpoint(request: Request) -> JSONResponse:
             "components": {
                 "cache_manager": "active" if cache_manager else "inactive",
                 "credential_fetcher": "active" if credential_fetcher else "inactive"
-            }
+            },
+            "data_source_registry": data_source_registry.get_stats(),
+            "backend_http_pool": credential_fetcher.get_pool_stats()
         }
 
         return JSONResponse(content=status, status_code=200)
@@ -8128,27 +8176,51 @@ async def health_endpoint(request: Request) -> JSONResponse:
         return JSONResponse(content=error_status, status_code=503)
 
 
+@mcp.custom_route("/cache/invalidate/{project_id}", methods=["POST"])
+async def invalidate_project_cache_endpoint(request: Request) -> JSONResponse:
+    """
+    Invalidate cached data sources and provider connections for a project.
+
+    Called by backend-api whenever a project's data sources are created,
+    updated or deleted so that new credentials take effect immediately.
+    """
+    project_id = request.path_params.get("project_id")
+    if not project_id:
+        return JSONResponse(
+            content={"error": "project_id path parameter is required"},
+            status_code=400
+        )
+
+    data_source_registry.invalidate(project_id)
+    removed_connections = cache_manager.remove_project(project_id)
+
+    logger.info(f"Invalidated caches for project {project_id} ({removed_connections} connections removed)")
+    return JSONResponse(content={
+        "project_id": project_id,
+        "invalidated": True,
+        "removed_connections": removed_connections
+    })
+
+
 async def cleanup():
     """Cleanup resources on server shutdown."""
     logger.info("Cleaning up tools connections...")
     cache_manager.cleanup()
+    await credential_fetcher.close()
     logger.info("Cleanup completed")
 
 
-if __name__ == "__main__":
-    # Setup cleanup on shutdown
-    import signal
-
-
-    def signal_handler(signum, frame):
-        logger.info("Received shutdown signal")
-        asyncio.create_task(cleanup())
-
+async def main():
+    """Run the server, with the shared backend HTTP session open for its whole life."""
+    await credential_fetcher.start()
+    try:
+        # Run the FastMCP server with HTTP transport (streamable); uvicorn handles SIGINT/SIGTERM
+        await mcp.run_streamable_http_async()
+    finally:
+        logger.info("Shutting down")
+        await cleanup()
 
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
 
+if __name__ == "__main__":
     logger.info("Starting Tools MCP Server on 0.0.0.0:8080")
-
-    # Run the FastMCP server with HTTP transport (streamable)
-    mcp.run(transport="streamable-http")
+    asyncio.run(main())
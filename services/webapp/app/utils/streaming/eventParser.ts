@@ -10,6 +10,10 @@ import type { MessageChunkPayload } from './eventTypes';
 // Key: tool_use_id, Value: { taskId, toolName, input }
 const pendingToolUses = new Map<string, { taskId: string; toolName: string; input: Record<string, any> }>();
 
+// Task content rebuilt from message_chunk deltas
+// Key: taskId, Value: content received so far
+const taskContents = new Map<string, string>();
+
 /**
  * Parse SSE events and emit to the event bus
  */
@@ -57,6 +61,7 @@ export function parseSSEEvent(event: MessageEvent, taskId: string, agentId: stri
 }
 
 function handleMessageStart(taskId: string, agentId: string, data: any): void {
+  taskContents.delete(taskId);
   streamEventBus.emit(StreamEventType.MESSAGE_START, {
     taskId,
     role: 'assistant'
@@ -64,10 +69,18 @@ function handleMessageStart(taskId: string, agentId: string, data: any): void {
 }
 
 function handleMessageChunk(taskId: string, agentId: string, data: any): void {
-  // Parse the nested JSON in content_chunk
-  if (data.content_chunk) {
+  // Chunks carry a delta (content_delta applied at offset); older servers send the full content_chunk
+  let content: string | undefined = data.content_chunk;
+  if (typeof data.offset === 'number') {
+    const previous = taskContents.get(taskId) || '';
+    content = previous.slice(0, data.offset) + (data.content_delta || '');
+    taskContents.set(taskId, content);
+  }
+
+  // Parse the nested JSON in the task content
+  if (content) {
     try {
-      const chunkContent = JSON.parse(data.content_chunk);
+      const chunkContent = JSON.parse(content);
       const responseText = chunkContent?.response;
       const statusText = chunkContent?.status;
 
@@ -94,6 +107,8 @@ function handleMessageChunk(taskId: string, agentId: string, data: any): void {
 }
 
 function handleMessageComplete(taskId: string, agentId: string, data: any): void {
+  taskContents.delete(taskId);
+
   // Skip message_content - don't emit FINAL_RESPONSE
   // if (data && data.message_content && data.message_content.response) {
   //   // Emit final response that replaces everything
@@ -203,6 +218,7 @@ function handleClaudeCodeMessage(taskId: string, agentId: string, data: any): vo
 }
 
 function handleStreamComplete(taskId: string, agentId: string): void {
+  taskContents.delete(taskId);
   streamEventBus.emit(StreamEventType.MESSAGE_COMPLETE, { taskId });
   streamEventBus.emit(StreamEventType.STREAM_END, { taskId, agentId });
 
@@ -215,6 +231,7 @@ function handleStreamComplete(taskId: string, agentId: string): void {
 }
 
 function handleTaskTimeout(taskId: string, agentId: string, data: any): void {
+  taskContents.delete(taskId);
   const message = getTimeoutMessage(data);
 
   streamEventBus.emit(StreamEventType.TASK_TIMEOUT, {